@@ -0,0 +1,121 @@
+"""
+에이전트 생성 시간/RSS 측정(그래프 프로세스 공유 vs 에이전트별 컴파일).
+
+실행:
+    cd packages/backend && LITELLM_LOCAL_MODEL_COST_MAP=True \
+        PYTHONPATH=src:benchmarks python benchmarks/agent_startup_bench.py
+
+- 모드마다 별도 프로세스에서 FakeProviderClient로 에이전트 N개를 만들고(seed memory 포함)
+  에이전트당 생성 시간과 RSS 증가량을 보고한다.
+- per_agent 모드는 에이전트마다 그래프 캐시를 비워 이전 동작(에이전트별 컴파일)을 재현한다.
+"""
+
+import argparse
+import datetime
+import json
+import os
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+PERSONA_DIR = Path(__file__).resolve().parents[1] / "persona"
+PERSONA_NAMES = ["Jiho", "Sujin"]
+
+
+def _rss_kib() -> int:
+    for line in Path("/proc/self/status").read_text().splitlines():
+        if line.startswith("VmRSS:"):
+            return int(line.split()[1])
+    return 0
+
+
+def _measure(*, agents: int, mode: str, backend: str) -> dict[str, object]:
+    from fake_provider import FakeProviderClient
+
+    from agents.graph_support import clear_shared_graphs, shared_graph_count
+    from agents.persona_loader import PersonaLoader, apply_persona_to_brain
+    from agents.sim_agent import SimAgent
+    from agents.world_factory import _build_agent
+
+    client = FakeProviderClient()
+    loader = PersonaLoader(PERSONA_DIR)
+    personas = [loader.load(name) for name in PERSONA_NAMES]
+    now = datetime.datetime(2026, 1, 1, 9, 0)
+    compiled = 0
+
+    def build(index: int) -> SimAgent:
+        nonlocal compiled
+        if mode == "per_agent":
+            clear_shared_graphs()
+        before = shared_graph_count()
+        persona = personas[index % len(personas)]
+        agent = _build_agent(persona, client, "fake")
+        apply_persona_to_brain(brain=agent.brain, persona=persona, now=now)
+        compiled += shared_graph_count() - before
+        return agent
+
+    rss_before = _rss_kib()
+    started = time.perf_counter()
+    built = [build(0)]
+    first_ms = (time.perf_counter() - started) * 1000
+    built.extend(build(index) for index in range(1, agents))
+    total_ms = (time.perf_counter() - started) * 1000
+    rss_after = _rss_kib()
+
+    rest = max(agents - 1, 1)
+    return {
+        "backend": backend,
+        "agents": len(built),
+        "graph_compilations": compiled,
+        "first_agent_ms": round(first_ms, 3),
+        "ms_per_agent_after_first": round((total_ms - first_ms) / rest, 3),
+        "total_ms": round(total_ms, 3),
+        "rss_kib_per_agent": round((rss_after - rss_before) / len(built), 1),
+    }
+
+
+def run(*, agents: int, backend: str) -> dict[str, object]:
+    results: dict[str, object] = {}
+    for mode in ["per_agent", "shared"]:
+        completed = subprocess.run(
+            [
+                sys.executable,
+                __file__,
+                "--agents",
+                str(agents),
+                "--backend",
+                backend,
+                "--child-mode",
+                mode,
+            ],
+            check=True,
+            capture_output=True,
+            text=True,
+        )
+        results[mode] = json.loads(completed.stdout)
+    return results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--agents", type=int, default=100)
+    parser.add_argument(
+        "--backend", choices=["langgraph", "compiled"], default="langgraph"
+    )
+    parser.add_argument("--child-mode", choices=["per_agent", "shared"])
+    args = parser.parse_args()
+    if args.child_mode is not None:
+        # 그래프 모듈 import 전에 backend를 정한다.
+        os.environ["GRAPH_BACKEND"] = args.backend
+        print(
+            json.dumps(
+                _measure(agents=args.agents, mode=args.child_mode, backend=args.backend)
+            )
+        )
+        return
+    print(json.dumps(run(agents=args.agents, backend=args.backend), indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,144 @@
+"""
+월드가 자라는 동안 체크포인트 delta 쓰기 시간과 base 스냅샷 쓰기 시간 비교, 재개 비용.
+
+실행:
+    cd packages/backend && LITELLM_LOCAL_MODEL_COST_MAP=True \\
+        PYTHONPATH=src:benchmarks python benchmarks/checkpoint_bench.py
+
+- tick마다 delta를 쓰고, --report-every tick마다 구간 평균 delta 시간/크기와 그 시점의
+  base 스냅샷(compaction) 시간/크기를 기록한다. 메모리 수가 늘어도 delta는 tick 사이
+  변경량에만 비례하고, base는 전체 메모리 수에 비례해야 한다.
+- 진행한 대화는 세션 history째 delta에 들어가므로 history_window로 세션 크기를 묶는다.
+- 마지막에 같은 체크포인트로 런타임을 다시 만들어 재개 시간과 LLM/임베딩 호출 수를 잰다.
+"""
+
+import argparse
+import datetime
+import json
+import tempfile
+import time
+from pathlib import Path
+
+from fake_provider import FakeProviderClient
+from world_scaling_bench import write_personas
+
+from world.runtime import WorldRuntime, WorldRuntimeConfig, build_world_runtime
+
+START = datetime.datetime(2026, 3, 4, 9, 0, 0)
+HISTORY_WINDOW = 32
+
+
+def _build(
+    client: FakeProviderClient,
+    *,
+    persona_dir: Path,
+    persona_names: list[str],
+    checkpoint_path: Path,
+) -> WorldRuntime:
+    return build_world_runtime(
+        config=WorldRuntimeConfig(
+            agent_persona_names=persona_names,
+            base_url=None,
+            api_key=None,
+            llm_model="fake",
+            embedding_model="fake",
+            timeout_seconds=1.0,
+            persona_dir=str(persona_dir),
+            dialogue_target_turns=10_000,
+            suppress_repeated_replies=False,
+            history_window=HISTORY_WINDOW,
+            checkpoint_path=str(checkpoint_path),
+        ),
+        llm_client=client,
+        now=START,
+    )
+
+
+def _memory_count(runtime: WorldRuntime) -> int:
+    return sum(
+        len(agent.memory_service.memory_stream.memory_ids()) for agent in runtime.agents
+    )
+
+
+def run(*, agents: int, ticks: int, report_every: int) -> dict[str, object]:
+    with tempfile.TemporaryDirectory() as temp_dir:
+        persona_dir = Path(temp_dir) / "personas"
+        persona_dir.mkdir()
+        persona_names = write_personas(persona_dir, agents)
+        checkpoint_path = Path(temp_dir) / "world.ckpt"
+        runtime = _build(
+            FakeProviderClient(),
+            persona_dir=persona_dir,
+            persona_names=persona_names,
+            checkpoint_path=checkpoint_path,
+        )
+        rows: list[dict[str, object]] = []
+        delta_ms: list[float] = []
+        delta_bytes: list[int] = []
+        try:
+            for tick in range(1, ticks + 1):
+                _ = runtime.tick()
+                stats = runtime.state().checkpoint
+                assert stats is not None
+                delta_ms.append(stats.last_write_ms)
+                delta_bytes.append(stats.last_delta_bytes)
+                if tick % report_every:
+                    continue
+                compacted = runtime.compact_checkpoint()
+                rows.append(
+                    {
+                        "tick": tick,
+                        "memories": _memory_count(runtime),
+                        "mean_delta_ms": round(sum(delta_ms) / len(delta_ms), 3),
+                        "mean_delta_kb": round(
+                            sum(delta_bytes) / len(delta_bytes) / 1024, 1
+                        ),
+                        "base_ms": round(compacted.last_base_ms, 3),
+                        "base_kb": round(checkpoint_path.stat().st_size / 1024, 1),
+                    }
+                )
+                delta_ms, delta_bytes = [], []
+        finally:
+            runtime.close()
+
+        client = FakeProviderClient()
+        started = time.perf_counter()
+        resumed = _build(
+            client,
+            persona_dir=persona_dir,
+            persona_names=persona_names,
+            checkpoint_path=checkpoint_path,
+        )
+        resume_seconds = time.perf_counter() - started
+        resumed_turn = resumed.turn
+        resumed.close()
+    return {
+        "agents": agents,
+        "ticks": ticks,
+        "rows": rows,
+        "resume": {
+            "seconds": round(resume_seconds, 3),
+            "turn": resumed_turn,
+            "generate_calls": client.generate_calls,
+            "embed_calls": client.embed_calls,
+        },
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--agents", type=int, default=16)
+    parser.add_argument("--ticks", type=int, default=200)
+    parser.add_argument("--report-every", type=int, default=50)
+    args = parser.parse_args()
+    print(
+        json.dumps(
+            run(agents=args.agents, ticks=args.ticks, report_every=args.report_every),
+            ensure_ascii=False,
+            indent=2,
+        )
+    )
+
+
+if __name__ == "__main__":
+    main()
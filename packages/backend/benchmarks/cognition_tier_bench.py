@@ -0,0 +1,108 @@
+"""
+인지 tier별 LLM/임베딩 호출 수 비교.
+
+실행:
+    cd packages/backend && LITELLM_LOCAL_MODEL_COST_MAP=True \\
+        PYTHONPATH=src:benchmarks python benchmarks/cognition_tier_bench.py
+
+- 같은 에이전트/tick 수로 기본 tier만 바꿔 실행하고, 클라이언트 포커스는 첫 대화의
+  두 에이전트에 둔다(포커스 에이전트는 항상 full).
+- FakeProviderClient 호출 수로 tick당 generate/embed 비용을 보고한다. persona seed 기억을
+  넣는 시작 비용은 빼고 센다.
+- background tier는 기억을 임베딩 없이 쌓아 두므로(deferred_observations) embed 호출도
+  포커스된 full 에이전트 몫만 남아야 한다.
+"""
+
+import argparse
+import json
+import tempfile
+from pathlib import Path
+from typing import cast, get_args
+
+from fake_provider import FakeProviderClient
+from world_scaling_bench import write_personas
+
+from agents.brain import CognitionTier
+from world.runtime import WorldRuntimeConfig, build_world_runtime
+
+
+def _run_tier(
+    *,
+    persona_dir: Path,
+    persona_names: list[str],
+    tier: CognitionTier,
+    ticks: int,
+    focused: int,
+) -> dict[str, object]:
+    client = FakeProviderClient()
+    runtime = build_world_runtime(
+        config=WorldRuntimeConfig(
+            agent_persona_names=persona_names,
+            base_url=None,
+            api_key=None,
+            llm_model="fake",
+            embedding_model="fake",
+            timeout_seconds=1.0,
+            persona_dir=str(persona_dir),
+            dialogue_target_turns=10_000,
+            suppress_repeated_replies=False,
+            cognition_tier=tier,
+        ),
+        llm_client=client,
+    )
+    startup_generate_calls = client.generate_calls
+    startup_embed_calls = client.embed_calls
+    try:
+        _ = runtime.set_focus([agent.name for agent in runtime.agents[:focused]])
+        for _ in range(ticks):
+            _ = runtime.tick()
+    finally:
+        runtime.close()
+    return {
+        "turns": runtime.turn,
+        "generate_calls_per_tick": round(
+            (client.generate_calls - startup_generate_calls) / ticks, 1
+        ),
+        "embed_calls_per_tick": round(
+            (client.embed_calls - startup_embed_calls) / ticks, 1
+        ),
+        "deferred_observations": sum(
+            len(agent.brain.brain_graph.deferred_observations)
+            for agent in runtime.agents
+        ),
+    }
+
+
+def run(*, agents: int, ticks: int, focused: int) -> dict[str, object]:
+    with tempfile.TemporaryDirectory() as temp_dir:
+        persona_dir = Path(temp_dir)
+        persona_names = write_personas(persona_dir, agents)
+        tiers = {
+            tier: _run_tier(
+                persona_dir=persona_dir,
+                persona_names=persona_names,
+                tier=cast(CognitionTier, tier),
+                ticks=ticks,
+                focused=focused,
+            )
+            for tier in get_args(CognitionTier)
+        }
+    return {"agents": agents, "focused": focused, "ticks": ticks, "tiers": tiers}
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--agents", type=int, default=16)
+    parser.add_argument("--ticks", type=int, default=10)
+    parser.add_argument("--focused", type=int, default=2)
+    args = parser.parse_args()
+    print(
+        json.dumps(
+            run(agents=args.agents, ticks=args.ticks, focused=args.focused),
+            indent=2,
+        )
+    )
+
+
+if __name__ == "__main__":
+    main()
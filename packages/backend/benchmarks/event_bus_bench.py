@@ -0,0 +1,93 @@
+"""
+발화 전달 범위별(world vs perception) 임베딩/LLM 호출 수 비교.
+
+실행:
+    cd packages/backend && LITELLM_LOCAL_MODEL_COST_MAP=True \\
+        PYTHONPATH=src:benchmarks python benchmarks/event_bus_bench.py
+
+- 두 모드 모두 좌표 월드를 켜고 같은 배치(대화 묶음마다 landmark 하나)로 실행한다.
+- world는 발화마다 런타임 전원에게 observation을 쓰고, perception은 대화 참가자와
+  지각 반경 안의 에이전트에게만 쓰며 임베딩 공유와 배치 중요도 채점을 적용한다.
+"""
+
+import argparse
+import json
+import tempfile
+from pathlib import Path
+
+from fake_provider import FakeProviderClient
+from world_scaling_bench import write_personas
+
+from world.runtime import WorldRuntimeConfig, build_world_runtime
+
+
+def _run_scope(
+    *, persona_dir: Path, persona_names: list[str], scope: str, ticks: int
+) -> dict[str, object]:
+    client = FakeProviderClient()
+    runtime = build_world_runtime(
+        config=WorldRuntimeConfig(
+            agent_persona_names=persona_names,
+            base_url=None,
+            api_key=None,
+            llm_model="fake",
+            embedding_model="fake",
+            timeout_seconds=1.0,
+            persona_dir=str(persona_dir),
+            dialogue_target_turns=10_000,
+            suppress_repeated_replies=False,
+            broadcast_scope="world" if scope == "world" else "perception",
+            spatial_world=True,
+        ),
+        llm_client=client,
+    )
+    try:
+        # 첫 tick은 계획 생성이 섞이므로 측정에서 뺀다.
+        _ = runtime.tick()
+        generate_before = client.generate_calls
+        embed_before = client.embed_calls
+        for _ in range(ticks):
+            _ = runtime.tick()
+        fan_out = runtime.state().fan_out
+    finally:
+        runtime.close()
+    row: dict[str, object] = {
+        "scope": scope,
+        "generate_calls_per_tick": round(
+            (client.generate_calls - generate_before) / ticks, 1
+        ),
+        "embed_calls_per_tick": round((client.embed_calls - embed_before) / ticks, 1),
+    }
+    if scope == "perception":
+        row["mean_recipients"] = round(fan_out.mean_recipients, 2)
+        row["out_of_range"] = fan_out.out_of_range
+        row["importance_batches"] = fan_out.importance_batches
+    return row
+
+
+def run(*, agents: int, ticks: int) -> dict[str, object]:
+    with tempfile.TemporaryDirectory() as temp_dir:
+        persona_dir = Path(temp_dir)
+        persona_names = write_personas(persona_dir, agents)
+        rows = [
+            _run_scope(
+                persona_dir=persona_dir,
+                persona_names=persona_names,
+                scope=scope,
+                ticks=ticks,
+            )
+            for scope in ("world", "perception")
+        ]
+    return {"agents": agents, "ticks": ticks, "modes": rows}
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--agents", type=int, default=16)
+    parser.add_argument("--ticks", type=int, default=5)
+    args = parser.parse_args()
+    print(json.dumps(run(agents=args.agents, ticks=args.ticks), indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,137 @@
+"""
+every_tick과 event 스케줄링의 시뮬레이션 1시간당 LLM 호출 수 비교.
+
+실행:
+    cd packages/backend && LITELLM_LOCAL_MODEL_COST_MAP=True \\
+        PYTHONPATH=src:benchmarks python benchmarks/event_scheduler_bench.py
+
+- FakeProviderClient(speak_every=N)로 대부분의 턴에서 말하지 않는 조용한 마을을 흉내낸다.
+- 시뮬레이션 1시간(3600 / turn_time_step_seconds tick) 동안 정해진 에이전트에게
+  사건을 --events개 주입한다. 두 모드에 같은 사건 순서를 쓴다.
+- every_tick은 tick마다 모든 대화의 화자가 perceive → 검색 → LLM 파이프라인을 돌고,
+  event는 발화/사건/계획 경계로 깨어난 에이전트의 대화만 진행한다.
+"""
+
+import argparse
+import datetime
+import json
+import tempfile
+import time
+from pathlib import Path
+
+from fake_provider import FakeProviderClient
+from world_scaling_bench import write_personas
+
+from world.event_scheduler import StepScheduling
+from world.runtime import WorldRuntimeConfig, build_world_runtime
+
+TURN_TIME_STEP_SECONDS = 45
+START = datetime.datetime(2026, 3, 4, 9, 0, 0)
+
+
+def _run_mode(
+    *,
+    persona_dir: Path,
+    persona_names: list[str],
+    step_scheduling: StepScheduling,
+    hours: int,
+    events_per_hour: int,
+    speak_every: int,
+) -> dict[str, object]:
+    client = FakeProviderClient(speak_every=speak_every)
+    runtime = build_world_runtime(
+        config=WorldRuntimeConfig(
+            agent_persona_names=persona_names,
+            base_url=None,
+            api_key=None,
+            llm_model="fake",
+            embedding_model="fake",
+            timeout_seconds=1.0,
+            persona_dir=str(persona_dir),
+            dialogue_target_turns=10_000,
+            suppress_repeated_replies=False,
+            turn_time_step_seconds=TURN_TIME_STEP_SECONDS,
+            step_scheduling=step_scheduling,
+        ),
+        llm_client=client,
+        now=START,
+    )
+    ticks = hours * 3600 // TURN_TIME_STEP_SECONDS
+    event_every = max(1, ticks // max(1, events_per_hour * hours))
+    names = [agent.name for agent in runtime.agents]
+    turns = 0
+    try:
+        started = time.perf_counter()
+        for tick in range(ticks):
+            if events_per_hour and tick % event_every == event_every - 1:
+                _ = runtime.inject_event(
+                    content="광장에서 작은 공연이 시작됐다.",
+                    agent_names=[names[tick % len(names)]],
+                    importance=5,
+                )
+            turns += len(runtime.tick().steps)
+        elapsed = time.perf_counter() - started
+        stats = runtime.state().event_scheduler
+    finally:
+        runtime.close()
+    return {
+        "ticks": ticks,
+        "conversation_steps": turns,
+        "generate_calls_per_hour": round(client.generate_calls / hours, 1),
+        "embed_calls_per_hour": round(client.embed_calls / hours, 1),
+        "wall_seconds": round(elapsed, 2),
+        "plan_boundaries": stats.plan_boundaries,
+        "idle_conversations": stats.idle_conversations,
+    }
+
+
+def run(
+    *, agents: int, hours: int, events_per_hour: int, speak_every: int
+) -> dict[str, object]:
+    with tempfile.TemporaryDirectory() as temp_dir:
+        persona_dir = Path(temp_dir)
+        persona_names = write_personas(persona_dir, agents)
+        modes = {
+            mode: _run_mode(
+                persona_dir=persona_dir,
+                persona_names=persona_names,
+                step_scheduling=mode,
+                hours=hours,
+                events_per_hour=events_per_hour,
+                speak_every=speak_every,
+            )
+            for mode in ("every_tick", "event")
+        }
+    baseline = float(str(modes["every_tick"]["generate_calls_per_hour"]))
+    event = float(str(modes["event"]["generate_calls_per_hour"]))
+    return {
+        "agents": agents,
+        "events_per_hour": events_per_hour,
+        "speak_every": speak_every,
+        "modes": modes,
+        "generate_call_reduction": round(baseline / event, 1) if event else None,
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--agents", type=int, default=16)
+    parser.add_argument("--hours", type=int, default=1)
+    parser.add_argument("--events", type=int, default=4)
+    parser.add_argument("--speak-every", type=int, default=10)
+    args = parser.parse_args()
+    print(
+        json.dumps(
+            run(
+                agents=args.agents,
+                hours=args.hours,
+                events_per_hour=args.events,
+                speak_every=args.speak_every,
+            ),
+            indent=2,
+        )
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,109 @@
+"""
+벤치마크용 결정적 ProviderClient.
+
+- generate: reaction/importance/reflection 파서가 모두 읽을 수 있는 JSON 하나를 돌려준다.
+- embed: 문자 trigram을 crc32로 해싱한 bag-of-ngrams 벡터. 같은 텍스트는 같은 벡터,
+  겹치는 표현이 많을수록 cosine이 높아 retrieval 품질 비교에 쓸 수 있다.
+- latency_seconds로 네트워크 지연을 흉내낼 수 있다.
+- malformed_every=N이면 N번째 generate마다 잘린 JSON을 돌려준다(파싱 실패 주입).
+- speak_every=N이면 N번째 generate에서만 should_react=True다(대부분 조용한 마을).
+"""
+
+import json
+import threading
+import time
+import zlib
+
+import numpy as np
+
+from llm.clients.types import LlmGenerateOptions
+from settings import EMBEDDING_DIMENSION
+
+UTTERANCES = [
+    "오늘 디카페인 블렌드는 어땠어요?",
+    "도서관 일은 거의 끝났어요, 잠깐 들렀어요.",
+    "새 원두 향이 정말 좋네요.",
+    "다음 주에 시음회를 열어 보면 어때요?",
+    "요즘 손님들이 어떤 메뉴를 많이 찾나요?",
+    "저녁에는 산책하면서 생각을 정리해요.",
+    "그럼 이번 주말에 다시 이야기해요.",
+    "추천해 준 책은 벌써 반쯤 읽었어요.",
+]
+
+
+class FakeProviderClient:
+    def __init__(
+        self,
+        *,
+        latency_seconds: float = 0.0,
+        malformed_every: int = 0,
+        speak_every: int = 1,
+    ):
+        self.latency_seconds: float = latency_seconds
+        self.malformed_every: int = malformed_every
+        self.speak_every: int = speak_every
+        self.generate_calls: int = 0
+        self.embed_calls: int = 0
+        self._lock: threading.Lock = threading.Lock()
+
+    def generate(
+        self,
+        *,
+        prompt: str,
+        system: str | None = None,
+        options: LlmGenerateOptions | None = None,
+        format_json: bool = False,
+    ) -> str:
+        _ = options
+        _ = format_json
+        with self._lock:
+            self.generate_calls += 1
+            call_index = self.generate_calls
+        if self.latency_seconds:
+            time.sleep(self.latency_seconds)
+        seed = zlib.crc32(f"{system or ''}{prompt}".encode())
+        payload = json.dumps(
+            {
+                "should_react": call_index % self.speak_every == 0,
+                "reason": "fake_provider",
+                "utterance": UTTERANCES[(seed + call_index) % len(UTTERANCES)],
+                "end_dialogue": False,
+                "importance": 1 + seed % 9,
+                "questions": [],
+                "insights": [],
+            },
+            ensure_ascii=False,
+        )
+        if self.malformed_every and call_index % self.malformed_every == 0:
+            return payload[: len(payload) // 3]
+        return payload
+
+    def embed(
+        self,
+        *,
+        model: str | None = None,
+        input: str,
+        truncate: bool = True,
+        keep_alive: str = "30m",
+        expected_dimension: int | None = None,
+    ) -> list[float]:
+        _ = model
+        _ = truncate
+        _ = keep_alive
+        with self._lock:
+            self.embed_calls += 1
+        if self.latency_seconds:
+            time.sleep(self.latency_seconds)
+        return hashed_ngram_embedding(
+            input, dimension=expected_dimension or EMBEDDING_DIMENSION
+        ).tolist()
+
+
+def hashed_ngram_embedding(text: str, *, dimension: int) -> np.ndarray:
+    vector = np.zeros(dimension, dtype=np.float32)
+    normalized = " ".join(text.lower().split())
+    for index in range(max(len(normalized) - 2, 1)):
+        gram = normalized[index : index + 3]
+        vector[zlib.crc32(gram.encode()) % dimension] += 1.0
+    norm = float(np.linalg.norm(vector))
+    return vector / norm if norm else vector
@@ -0,0 +1,162 @@
+"""
+LangGraph StateGraph vs. agents.graph_executor 경량 실행기 마이크로벤치마크.
+
+실행:
+    cd packages/backend && PYTHONPATH=src python benchmarks/graph_executor_bench.py
+
+- reaction 그래프(stub LLM)와 retry 루프가 있는 합성 그래프의 invoke 오버헤드를 비교한다.
+- compile 시간도 함께 측정한다(에이전트마다 그래프를 만드는 현재 구조 기준).
+"""
+
+import argparse
+import datetime
+import json
+import statistics
+import time
+from collections.abc import Callable
+from typing import Literal, Protocol, cast
+
+from typing_extensions import TypedDict
+
+from agents.agent import AgentIdentity, AgentProfile, ExtendedPersona, FixedPersona
+from agents.graph_support import (
+    GRAPH_END,
+    GRAPH_START,
+    GraphBackend,
+    resolve_state_graph_factory,
+)
+from agents.reaction import ReactionDecisionInput, ReactionGraphRunner
+
+BACKENDS: list[GraphBackend] = ["langgraph", "compiled"]
+
+
+class LoopState(TypedDict):
+    count: int
+    status: Literal["retry", "done"]
+
+
+class LoopGraphInvoker(Protocol):
+    def invoke(self, input: LoopState) -> LoopState: ...
+
+
+class CycleGenerationClient:
+    def __init__(self, responses: list[str]):
+        self.responses: list[str] = responses
+        self.calls: int = 0
+
+    def generate(self, **_: object) -> str:
+        response = self.responses[self.calls % len(self.responses)]
+        self.calls += 1
+        return response
+
+
+def _reaction_input() -> ReactionDecisionInput:
+    return ReactionDecisionInput(
+        agent_identity=AgentIdentity(id="jiho", name="Jiho Park", age=29, traits=[]),
+        current_time=datetime.datetime(2026, 2, 27, 14, 0, 0),
+        observation_content="Jiho encountered Sujin near the cafe.",
+        dialogue_history=[],
+        profile=AgentProfile(
+            fixed=FixedPersona(identity_stable_set=["Jiho helps neighbors."]),
+            extended=ExtendedPersona(
+                lifestyle_and_routine=[], current_plan_context=["Finish workbook."]
+            ),
+        ),
+        retrieved_memories=[],
+        language="ko",
+    )
+
+
+def _build_loop_graph(backend: GraphBackend, *, loop_length: int) -> LoopGraphInvoker:
+    factory = cast(type, resolve_state_graph_factory(backend))
+    builder = factory(LoopState)
+
+    def step(state: LoopState) -> dict[str, object]:
+        count = state["count"] + 1
+        return {"count": count, "status": "done" if count >= loop_length else "retry"}
+
+    builder.add_node("prepare", lambda state: {})
+    builder.add_node("step", step)
+    builder.add_edge(GRAPH_START, "prepare")
+    builder.add_edge("prepare", "step")
+    builder.add_conditional_edges(
+        "step",
+        lambda state: state["status"],
+        {"retry": "step", "done": GRAPH_END},
+    )
+    return cast(LoopGraphInvoker, builder.compile())
+
+
+def _measure(fn: Callable[[], object], *, iterations: int) -> dict[str, float]:
+    samples: list[float] = []
+    for _ in range(iterations):
+        started = time.perf_counter()
+        fn()
+        samples.append((time.perf_counter() - started) * 1_000_000)
+    samples.sort()
+    return {
+        "mean_us": round(statistics.fmean(samples), 2),
+        "p50_us": round(samples[len(samples) // 2], 2),
+        "p95_us": round(samples[int(len(samples) * 0.95) - 1], 2),
+    }
+
+
+def _bench_backend(
+    backend: GraphBackend,
+    *,
+    iterations: int,
+    responses: list[str],
+    reaction_input: ReactionDecisionInput,
+) -> dict[str, dict[str, float]]:
+    loop_graph = _build_loop_graph(backend, loop_length=8)
+    runner = ReactionGraphRunner(
+        generation_client=CycleGenerationClient(responses),
+        embedding_encoder=None,
+        graph_backend=backend,
+    )
+    return {
+        "compile_reaction": _measure(
+            lambda: ReactionGraphRunner(
+                generation_client=CycleGenerationClient(responses),
+                embedding_encoder=None,
+                graph_backend=backend,
+            ),
+            iterations=max(iterations // 10, 10),
+        ),
+        "invoke_loop_graph": _measure(
+            lambda: loop_graph.invoke(LoopState(count=0, status="retry")),
+            iterations=iterations,
+        ),
+        "invoke_reaction_graph": _measure(
+            lambda: runner.decide_reaction(reaction_input),
+            iterations=iterations,
+        ),
+    }
+
+
+def run(iterations: int) -> dict[str, dict[str, dict[str, float]]]:
+    responses = [
+        json.dumps({"should_react": True, "reason": "react"}),
+        json.dumps({"utterance": "좋아요, 더 들려주세요.", "reason": "respond"}),
+    ]
+    reaction_input = _reaction_input()
+    return {
+        backend: _bench_backend(
+            backend,
+            iterations=iterations,
+            responses=responses,
+            reaction_input=reaction_input,
+        )
+        for backend in BACKENDS
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--iterations", type=int, default=500)
+    args = parser.parse_args()
+    print(json.dumps(run(args.iterations), indent=2, ensure_ascii=False))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,107 @@
+"""
+모듈 cold import 비용 감사(`python -X importtime` 리포트).
+
+실행:
+    cd packages/backend && LITELLM_LOCAL_MODEL_COST_MAP=True \
+        PYTHONPATH=src:benchmarks python benchmarks/import_time_audit.py
+
+- 대상 모듈마다 새 인터프리터에서 `-X importtime`으로 import하고, 누적 import 시간,
+  최상위 패키지별 self 시간 합, self 시간 상위 모듈을 보고한다.
+- HEAVY_MODULES 중 import 시점에 함께 로드된 것을 표시한다. 이들은 실제 사용 시점에
+  지연 로드되어야 한다(tests/test_import_budget.py가 같은 조건을 검사한다).
+"""
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+from dataclasses import dataclass
+from pathlib import Path
+
+SRC_DIR = Path(__file__).resolve().parents[1] / "src"
+DEFAULT_TARGETS = ["world.runtime", "api.main", "agents.world_factory", "llm"]
+HEAVY_MODULES = ["litellm", "langgraph", "sqlalchemy", "pgvector", "psycopg"]
+
+
+@dataclass(frozen=True)
+class ImportRecord:
+    module: str
+    self_us: int
+    cumulative_us: int
+    depth: int
+
+
+def _run_importtime(target: str) -> tuple[list[ImportRecord], list[str]]:
+    env = {**os.environ, "PYTHONPATH": str(SRC_DIR)}
+    env.setdefault("LITELLM_LOCAL_MODEL_COST_MAP", "True")
+    probe = (
+        f"import sys, json, {target}; "
+        f"print(json.dumps([m for m in {HEAVY_MODULES!r} if m in sys.modules]))"
+    )
+    completed = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", probe],
+        check=True,
+        capture_output=True,
+        text=True,
+        env=env,
+    )
+    records: list[ImportRecord] = []
+    for line in completed.stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_us, cumulative_us, name = line.removeprefix("import time:").split("|")
+        records.append(
+            ImportRecord(
+                module=name.strip(),
+                self_us=int(self_us),
+                cumulative_us=int(cumulative_us),
+                depth=(len(name) - len(name.lstrip())) // 2,
+            )
+        )
+    return records, json.loads(completed.stdout.strip().splitlines()[-1])
+
+
+def audit(target: str, *, top: int) -> dict[str, object]:
+    records, heavy_loaded = _run_importtime(target)
+    # 대상 모듈 자신의 레코드는 마지막 depth 0 항목이다(하위 패키지가 먼저 기록된다).
+    target_record = next(
+        record
+        for record in reversed(records)
+        if record.depth == 0 and record.module == target
+    )
+    by_package: dict[str, int] = {}
+    for record in records:
+        package = record.module.split(".")[0]
+        by_package[package] = by_package.get(package, 0) + record.self_us
+    return {
+        "cumulative_ms": round(target_record.cumulative_us / 1000, 1),
+        "modules_imported": len(records),
+        "heavy_modules_loaded": heavy_loaded,
+        "top_packages_ms": {
+            package: round(us / 1000, 1)
+            for package, us in sorted(by_package.items(), key=lambda x: -x[1])[:top]
+        },
+        "top_self_ms": {
+            record.module: round(record.self_us / 1000, 1)
+            for record in sorted(records, key=lambda r: -r.self_us)[:top]
+        },
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("targets", nargs="*", default=DEFAULT_TARGETS)
+    parser.add_argument("--top", type=int, default=10)
+    args = parser.parse_args()
+    print(
+        json.dumps(
+            {target: audit(target, top=args.top) for target in args.targets},
+            indent=2,
+            ensure_ascii=False,
+        )
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,103 @@
+"""
+two-stage vs fused reaction 모드(REACTION_MODE) 비교.
+
+실행:
+    cd packages/backend && LITELLM_LOCAL_MODEL_COST_MAP=True \
+        PYTHONPATH=src:benchmarks python benchmarks/reaction_mode_bench.py
+
+- FakeProviderClient(latency_seconds, malformed_every)로 provider 지연과 파싱 실패를 주입한다.
+- 모드별 trace를 build_reaction_mode_metrics로 묶어 parse-failure rate, fallback rate,
+  평균 generate 호출 수/latency와 decide_reaction wall time을 보고한다.
+"""
+
+import argparse
+import datetime
+import json
+import statistics
+import time
+from dataclasses import asdict
+from typing import Literal
+
+from fake_provider import UTTERANCES, FakeProviderClient
+
+from agents.agent import AgentIdentity, AgentProfile, ExtendedPersona, FixedPersona
+from agents.reaction import ReactionDecisionInput, ReactionMode
+from agents.reaction.graph import ReactionGraphRunner
+from llm.governance import build_reaction_mode_metrics
+
+MODES: list[ReactionMode] = ["two_stage", "fused"]
+
+
+def _input(turn: int, language: Literal["ko", "en"] = "ko") -> ReactionDecisionInput:
+    return ReactionDecisionInput(
+        agent_identity=AgentIdentity(
+            id="jiho", name="Jiho Park", age=29, traits=["kind"]
+        ),
+        current_time=datetime.datetime(2026, 2, 27, 14, 0, 0)
+        + datetime.timedelta(seconds=45 * turn),
+        observation_content=f"Heard Sujin's latest utterance (turn {turn}).",
+        dialogue_history=[(UTTERANCES[turn % len(UTTERANCES)], "")],
+        profile=AgentProfile(
+            fixed=FixedPersona(identity_stable_set=["Jiho helps neighbors."]),
+            extended=ExtendedPersona(
+                lifestyle_and_routine=["Morning library routine."],
+                current_plan_context=["Finish workbook."],
+            ),
+        ),
+        retrieved_memories=[],
+        language=language,
+    )
+
+
+def _run_mode(
+    mode: ReactionMode, *, turns: int, latency_ms: float, malformed_every: int
+) -> dict[str, object]:
+    client = FakeProviderClient(
+        latency_seconds=latency_ms / 1000, malformed_every=malformed_every
+    )
+    runner = ReactionGraphRunner(
+        generation_client=client,
+        embedding_encoder=None,
+        graph_backend="compiled",
+        reaction_mode=mode,
+    )
+    traces = []
+    wall_ms: list[float] = []
+    for turn in range(turns):
+        started = time.perf_counter()
+        decision = runner.decide_reaction(_input(turn))
+        wall_ms.append((time.perf_counter() - started) * 1000)
+        traces.append(decision.trace)
+
+    metrics = build_reaction_mode_metrics(traces)[mode]
+    return {
+        **asdict(metrics),
+        "wall_ms_mean": round(statistics.fmean(wall_ms), 3),
+        "wall_ms_median": round(statistics.median(wall_ms), 3),
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--turns", type=int, default=100)
+    parser.add_argument("--latency-ms", type=float, default=20.0)
+    parser.add_argument("--malformed-every", type=int, default=10)
+    args = parser.parse_args()
+    print(
+        json.dumps(
+            {
+                mode: _run_mode(
+                    mode,
+                    turns=args.turns,
+                    latency_ms=args.latency_ms,
+                    malformed_every=args.malformed_every,
+                )
+                for mode in MODES
+            },
+            indent=2,
+        )
+    )
+
+
+if __name__ == "__main__":
+    main()
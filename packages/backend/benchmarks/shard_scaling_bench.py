@@ -0,0 +1,125 @@
+"""
+shard 수(worker 프로세스 수)에 따른 LLM 외 step 비용 확장성 측정.
+
+실행:
+    cd packages/backend && LITELLM_LOCAL_MODEL_COST_MAP=True \
+        PYTHONPATH=src:benchmarks python benchmarks/shard_scaling_bench.py
+
+- FakeProviderClient(지연 0)를 써서 step 비용 전부가 검색/guardrail/프롬프트/파싱/
+  그래프 실행 같은 CPU 작업이 되게 한다.
+- 같은 에이전트 수를 shard 1, 2, 4...개로 나눠 실행하고 turns/s와 1-shard 대비
+  speedup을 보고한다. 사용 가능한 코어 수까지는 거의 선형으로 늘어야 한다.
+- --broadcast world이면 모든 발화가 다른 shard로도 중계되어 채널 비용이 포함된다.
+"""
+
+import argparse
+import json
+import os
+import tempfile
+import time
+from functools import partial
+from pathlib import Path
+
+from fake_provider import FakeProviderClient
+from world_scaling_bench import write_personas
+
+from world.runtime import WorldRuntimeConfig
+from world.sharding import ShardedWorldRuntime
+
+
+def _run_mode(
+    *,
+    persona_dir: Path,
+    persona_names: list[str],
+    shards: int,
+    ticks: int,
+    broadcast_scope: str,
+) -> dict[str, object]:
+    runtime = ShardedWorldRuntime(
+        config=WorldRuntimeConfig(
+            agent_persona_names=persona_names,
+            base_url=None,
+            api_key=None,
+            llm_model="fake",
+            embedding_model="fake",
+            timeout_seconds=1.0,
+            persona_dir=str(persona_dir),
+            dialogue_target_turns=10_000,
+            suppress_repeated_replies=False,
+            broadcast_scope="world" if broadcast_scope == "world" else "conversation",
+        ),
+        shards=shards,
+        llm_client_factory=partial(FakeProviderClient),
+    )
+    shard_count = runtime.shards
+    try:
+        # 첫 tick은 graph 컴파일/캐시 워밍업이 섞이므로 측정에서 뺀다.
+        _ = runtime.tick()
+        busy_ms = [0.0] * shard_count
+        turns = 0
+        started = time.perf_counter()
+        for _ in range(ticks):
+            result = runtime.tick()
+            turns += result.turns
+            for report in result.shards:
+                busy_ms[report.shard_index] += report.busy_ms
+        elapsed = time.perf_counter() - started
+    finally:
+        runtime.close()
+    return {
+        "shards": shard_count,
+        "turns": turns,
+        "turns_per_second": round(turns / elapsed, 2),
+        "tick_ms_mean": round(elapsed / ticks * 1000, 2),
+        "shard_busy_ms_mean": round(sum(busy_ms) / len(busy_ms) / ticks, 2),
+        "cross_shard_messages": runtime.cross_shard_messages,
+    }
+
+
+def run(
+    *, agents: int, shard_counts: list[int], ticks: int, broadcast_scope: str
+) -> dict[str, object]:
+    rows: list[dict[str, object]] = []
+    with tempfile.TemporaryDirectory() as temp_dir:
+        persona_dir = Path(temp_dir)
+        persona_names = write_personas(persona_dir, agents)
+        for shards in shard_counts:
+            rows.append(
+                _run_mode(
+                    persona_dir=persona_dir,
+                    persona_names=persona_names,
+                    shards=shards,
+                    ticks=ticks,
+                    broadcast_scope=broadcast_scope,
+                )
+            )
+    baseline = float(str(rows[0]["turns_per_second"]))
+    for row in rows:
+        row["speedup"] = round(float(str(row["turns_per_second"])) / baseline, 2)
+    return {"available_cores": len(os.sched_getaffinity(0)), "modes": rows}
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--agents", type=int, default=16)
+    parser.add_argument("--shards", type=int, nargs="+", default=[1, 2, 4])
+    parser.add_argument("--ticks", type=int, default=10)
+    parser.add_argument(
+        "--broadcast", choices=["conversation", "world"], default="conversation"
+    )
+    args = parser.parse_args()
+    print(
+        json.dumps(
+            run(
+                agents=args.agents,
+                shard_counts=args.shards,
+                ticks=args.ticks,
+                broadcast_scope=args.broadcast,
+            ),
+            indent=2,
+        )
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,89 @@
+"""
+spatial hash 조우/지각 질의 비용과 전수 비교(O(N²)) 비용 비교.
+
+실행:
+    cd packages/backend && PYTHONPATH=src python benchmarks/spatial_hash_bench.py
+
+- 에이전트 밀도를 일정하게 유지하며(에이전트당 면적 고정) 수를 늘린다.
+- tick마다 모든 에이전트를 조금씩 움직이고 조우 쌍 검사와 에이전트별 지각 질의를 한 번씩 한다.
+"""
+
+import argparse
+import json
+import math
+import random
+import time
+
+from world.spatial import Position, SpatialWorld
+
+
+def _brute_force_pairs(
+    positions: dict[str, Position], radius: float
+) -> set[tuple[str, str]]:
+    names = sorted(positions)
+    return {
+        (first, second)
+        for index, first in enumerate(names)
+        for second in names[index + 1 :]
+        if positions[first].distance_to(positions[second]) <= radius
+    }
+
+
+def run(
+    *, agent_counts: list[int], ticks: int, radius: float
+) -> list[dict[str, object]]:
+    rows: list[dict[str, object]] = []
+    for agents in agent_counts:
+        rng = random.Random(agents)
+        side = math.sqrt(agents) * radius * 2
+        world = SpatialWorld(perception_radius=radius)
+        positions = {
+            f"agent-{index}": Position(rng.uniform(0, side), rng.uniform(0, side))
+            for index in range(agents)
+        }
+        for name, position in positions.items():
+            world.place(name, position)
+
+        grid_seconds = 0.0
+        brute_seconds = 0.0
+        for _ in range(ticks):
+            for name, position in positions.items():
+                positions[name] = Position(
+                    position.x + rng.uniform(-1, 1), position.y + rng.uniform(-1, 1)
+                )
+                world.place(name, positions[name])
+            started = time.perf_counter()
+            _ = world.detect_encounters()
+            for name in positions:
+                _ = world.nearby_agents(name)
+            grid_seconds += time.perf_counter() - started
+
+            started = time.perf_counter()
+            _ = _brute_force_pairs(positions, radius)
+            brute_seconds += time.perf_counter() - started
+        rows.append(
+            {
+                "agents": agents,
+                "grid_tick_ms": round(grid_seconds / ticks * 1000, 2),
+                "brute_force_pairs_ms": round(brute_seconds / ticks * 1000, 2),
+            }
+        )
+    return rows
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--agents", type=int, nargs="+", default=[100, 300, 1000])
+    parser.add_argument("--ticks", type=int, default=5)
+    parser.add_argument("--radius", type=float, default=10.0)
+    args = parser.parse_args()
+    print(
+        json.dumps(
+            run(agent_counts=args.agents, ticks=args.ticks, radius=args.radius),
+            indent=2,
+        )
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,106 @@
+"""
+다음 화자 speculative prefetch(WORLD_SPECULATIVE_PREFETCH) 효과 측정.
+
+실행:
+    cd packages/backend && LITELLM_LOCAL_MODEL_COST_MAP=True \
+        PYTHONPATH=src:benchmarks python benchmarks/speculative_prefetch_bench.py
+
+- FakeProviderClient(latency_seconds)로 provider 지연을 흉내내고, tick 사이에
+  스케줄러 간격(--gap-ms)만큼 쉰다. prefetch는 이 간격 동안 다음 턴을 미리 계산한다.
+- 모드별로 step 자체에 걸린 시간(간격 제외), hit rate, 턴당 절약 시간을 보고한다.
+"""
+
+import argparse
+import json
+import statistics
+import time
+from pathlib import Path
+
+from fake_provider import FakeProviderClient
+
+from world.runtime import WorldRuntime, WorldRuntimeConfig, build_world_runtime
+
+PERSONA_DIR = Path(__file__).resolve().parents[1] / "persona"
+
+
+def _build_runtime(
+    client: FakeProviderClient, *, speculative_prefetch: bool
+) -> WorldRuntime:
+    return build_world_runtime(
+        config=WorldRuntimeConfig(
+            agent_persona_names=["Jiho", "Sujin"],
+            base_url=None,
+            api_key=None,
+            llm_model="fake",
+            embedding_model="fake",
+            timeout_seconds=1.0,
+            persona_dir=str(PERSONA_DIR),
+            dialogue_target_turns=10_000,
+            suppress_repeated_replies=False,
+            speculative_prefetch=speculative_prefetch,
+        ),
+        llm_client=client,
+    )
+
+
+def _run_mode(
+    *, ticks: int, latency_ms: float, gap_ms: float, speculative_prefetch: bool
+) -> dict[str, object]:
+    client = FakeProviderClient(latency_seconds=latency_ms / 1000)
+    runtime = _build_runtime(client, speculative_prefetch=speculative_prefetch)
+    step_ms: list[float] = []
+    try:
+        for _ in range(ticks):
+            started = time.perf_counter()
+            runtime.tick()
+            step_ms.append((time.perf_counter() - started) * 1000)
+            time.sleep(gap_ms / 1000)
+    finally:
+        runtime.close()
+
+    result: dict[str, object] = {
+        "step_ms_mean": round(statistics.fmean(step_ms), 3),
+        "step_ms_median": round(statistics.median(step_ms), 3),
+    }
+    if speculative_prefetch:
+        stats = runtime.speculation_stats
+        result.update(
+            {
+                "hit_rate": round(stats.hit_rate, 4),
+                "retrieval_hits": stats.retrieval_hits,
+                "discarded": stats.discarded,
+                "failed": stats.failed,
+                "saved_ms_per_turn": round(stats.saved_ms_per_turn, 3),
+            }
+        )
+    return result
+
+
+def run(*, ticks: int, latency_ms: float, gap_ms: float) -> dict[str, object]:
+    return {
+        mode: _run_mode(
+            ticks=ticks,
+            latency_ms=latency_ms,
+            gap_ms=gap_ms,
+            speculative_prefetch=speculative_prefetch,
+        )
+        for mode, speculative_prefetch in [("serial", False), ("prefetch", True)]
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--ticks", type=int, default=30)
+    parser.add_argument("--latency-ms", type=float, default=20.0)
+    parser.add_argument("--gap-ms", type=float, default=100.0)
+    args = parser.parse_args()
+    print(
+        json.dumps(
+            run(ticks=args.ticks, latency_ms=args.latency_ms, gap_ms=args.gap_ms),
+            indent=2,
+        )
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,182 @@
+"""
+tick 임베딩 공유(WORLD_SHARE_TICK_EMBEDDINGS) 효과 측정.
+
+실행:
+    cd packages/backend && LITELLM_LOCAL_MODEL_COST_MAP=True \
+        PYTHONPATH=src:benchmarks python benchmarks/tick_embedding_bench.py
+
+- FakeProviderClient로 2-에이전트 월드를 공유 off/on으로 각각 돌려 tick당 embed 호출 수를 비교한다.
+- 공유 on 실행에서는 매 검색마다 "정확한 검색 쿼리 임베딩" 기준 top-k와
+  "인지 observation 임베딩 재사용" 기준 top-k를 읽기 전용으로 함께 계산해
+  overlap@k / top-1 일치율로 검색 품질 영향을 보고한다.
+"""
+
+import argparse
+import datetime
+import json
+import time
+from collections.abc import Callable
+from pathlib import Path
+
+import numpy as np
+from fake_provider import FakeProviderClient, hashed_ngram_embedding
+
+from agents.memory.memory_manager import MemoryManager
+from agents.memory.memory_object import MemoryObject
+from llm.embedding_context import active_tick_embeddings
+from settings import EMBEDDING_DIMENSION
+from world.runtime import WorldRuntime, WorldRuntimeConfig, build_world_runtime
+
+PERSONA_DIR = Path(__file__).resolve().parents[1] / "persona"
+
+
+class RetrievalProbe:
+    def __init__(self, *, top_k: int):
+        self.top_k: int = top_k
+        self.samples: int = 0
+        self.overlap_sum: float = 0.0
+        self.top1_matches: int = 0
+
+    def wrap(self, memory_manager: MemoryManager) -> None:
+        original = memory_manager.get_retrieval_memories
+
+        def probed(
+            query: str,
+            *,
+            current_time: datetime.datetime,
+            top_k: int = 3,
+        ) -> list[MemoryObject]:
+            tick_embeddings = active_tick_embeddings()
+            if tick_embeddings is not None:
+                shared_text = tick_embeddings.resolve(query)
+                if shared_text != query:
+                    self._compare(
+                        memory_manager,
+                        exact=_embed(query),
+                        shared=_embed(shared_text),
+                        current_time=current_time,
+                    )
+            return original(query, current_time=current_time, top_k=top_k)
+
+        memory_manager.get_retrieval_memories = probed  # type: ignore[method-assign]
+
+    def _compare(
+        self,
+        memory_manager: MemoryManager,
+        *,
+        exact: np.ndarray,
+        shared: np.ndarray,
+        current_time: datetime.datetime,
+    ) -> None:
+        exact_ids = _top_ids(memory_manager, exact, current_time, self.top_k)
+        shared_ids = _top_ids(memory_manager, shared, current_time, self.top_k)
+        if not exact_ids:
+            return
+        self.samples += 1
+        self.overlap_sum += len(set(exact_ids) & set(shared_ids)) / len(exact_ids)
+        self.top1_matches += int(exact_ids[0] == shared_ids[0])
+
+    def report(self) -> dict[str, float]:
+        if not self.samples:
+            return {"samples": 0}
+        return {
+            "samples": self.samples,
+            f"overlap_at_{self.top_k}": round(self.overlap_sum / self.samples, 4),
+            "top1_agreement": round(self.top1_matches / self.samples, 4),
+        }
+
+
+def _embed(text: str) -> np.ndarray:
+    return hashed_ngram_embedding(text, dimension=EMBEDDING_DIMENSION)
+
+
+def _top_ids(
+    memory_manager: MemoryManager,
+    query_embedding: np.ndarray,
+    current_time: datetime.datetime,
+    top_k: int,
+) -> list[int]:
+    stream = memory_manager.memory_stream
+    scores = stream._calculate_retrieval_scores(
+        stream.memories, query_embedding, current_time
+    )
+    scores.sort(key=lambda x: (x[1], x[0].created_at), reverse=True)
+    return [memory.id for memory, _ in scores[:top_k]]
+
+
+def _build_runtime(
+    client: FakeProviderClient, *, share_tick_embeddings: bool
+) -> WorldRuntime:
+    return build_world_runtime(
+        config=WorldRuntimeConfig(
+            agent_persona_names=["Jiho", "Sujin"],
+            base_url=None,
+            api_key=None,
+            llm_model="fake",
+            embedding_model="fake",
+            timeout_seconds=1.0,
+            persona_dir=str(PERSONA_DIR),
+            dialogue_target_turns=10_000,
+            suppress_repeated_replies=False,
+            share_tick_embeddings=share_tick_embeddings,
+        ),
+        llm_client=client,
+    )
+
+
+def _run_mode(
+    *, ticks: int, share_tick_embeddings: bool, top_k: int
+) -> dict[str, object]:
+    client = FakeProviderClient()
+    runtime = _build_runtime(client, share_tick_embeddings=share_tick_embeddings)
+    probe = RetrievalProbe(top_k=top_k)
+    for agent in runtime.agents:
+        probe.wrap(agent.brain.memory_manager)
+
+    baseline_embeds = client.embed_calls
+    baseline_generates = client.generate_calls
+    saved_calls = 0
+    started = time.perf_counter()
+    for _ in range(ticks):
+        step_result = runtime.tick()
+        if step_result.embedding_stats is not None:
+            saved_calls += step_result.embedding_stats.saved_calls
+    elapsed = time.perf_counter() - started
+
+    result: dict[str, object] = {
+        "embed_calls_per_tick": round(
+            (client.embed_calls - baseline_embeds) / ticks, 3
+        ),
+        "generate_calls_per_tick": round(
+            (client.generate_calls - baseline_generates) / ticks, 3
+        ),
+        "saved_embed_calls_per_tick": round(saved_calls / ticks, 3),
+        "ms_per_tick": round(elapsed * 1000 / ticks, 3),
+    }
+    if share_tick_embeddings:
+        result["retrieval_quality"] = probe.report()
+    return result
+
+
+def run(*, ticks: int, top_k: int) -> dict[str, object]:
+    modes: dict[str, Callable[[], dict[str, object]]] = {
+        "per_call": lambda: _run_mode(
+            ticks=ticks, share_tick_embeddings=False, top_k=top_k
+        ),
+        "shared_tick": lambda: _run_mode(
+            ticks=ticks, share_tick_embeddings=True, top_k=top_k
+        ),
+    }
+    return {name: fn() for name, fn in modes.items()}
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--ticks", type=int, default=40)
+    parser.add_argument("--top-k", type=int, default=3)
+    args = parser.parse_args()
+    print(json.dumps(run(ticks=args.ticks, top_k=args.top_k), indent=2))
+
+
+if __name__ == "__main__":
+    main()
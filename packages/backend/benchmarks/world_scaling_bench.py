@@ -0,0 +1,140 @@
+"""
+에이전트 수에 따른 N-agent WorldRuntime 처리량(turns/s) 측정.
+
+실행:
+    cd packages/backend && LITELLM_LOCAL_MODEL_COST_MAP=True \
+        PYTHONPATH=src:benchmarks python benchmarks/world_scaling_bench.py
+
+- Jiho/Sujin 페르소나를 복제해 이름이 다른 에이전트 N명을 만들고 2인 대화로 묶는다.
+- FakeProviderClient(latency_seconds)로 provider 지연을 흉내낸다. 대화 step은
+  서로 독립이므로 step_workers만큼 지연이 겹쳐 처리량이 에이전트 수에 비례해 늘어야 한다.
+- 에이전트 수마다 serial(step_workers=1)과 pooled(--workers) 처리량을 보고한다.
+"""
+
+import argparse
+import json
+import tempfile
+import time
+from pathlib import Path
+
+from fake_provider import FakeProviderClient
+
+from world.runtime import WorldRuntime, WorldRuntimeConfig, build_world_runtime
+
+PERSONA_DIR = Path(__file__).resolve().parents[1] / "persona"
+TEMPLATE_PERSONAS = ["Jiho", "Sujin"]
+
+
+def write_personas(directory: Path, count: int) -> list[str]:
+    """템플릿 페르소나를 복제해 id/이름이 겹치지 않는 페르소나 파일 count개를 만든다."""
+    names: list[str] = []
+    for index in range(count):
+        template = TEMPLATE_PERSONAS[index % len(TEMPLATE_PERSONAS)]
+        payload = json.loads((PERSONA_DIR / f"{template}.json").read_text("utf-8"))
+        persona_name = f"{template}{index:03d}"
+        payload["agent"]["agent_id"] = persona_name.lower()
+        payload["agent"]["name"] = f"{payload['agent']['name']} {index:03d}"
+        (directory / f"{persona_name}.json").write_text(
+            json.dumps(payload, ensure_ascii=False), encoding="utf-8"
+        )
+        names.append(persona_name)
+    return names
+
+
+def _build_runtime(
+    client: FakeProviderClient,
+    *,
+    persona_dir: Path,
+    persona_names: list[str],
+    step_workers: int,
+) -> WorldRuntime:
+    return build_world_runtime(
+        config=WorldRuntimeConfig(
+            agent_persona_names=persona_names,
+            base_url=None,
+            api_key=None,
+            llm_model="fake",
+            embedding_model="fake",
+            timeout_seconds=1.0,
+            persona_dir=str(persona_dir),
+            dialogue_target_turns=10_000,
+            suppress_repeated_replies=False,
+            step_workers=step_workers,
+        ),
+        llm_client=client,
+    )
+
+
+def _run_mode(
+    *,
+    persona_dir: Path,
+    persona_names: list[str],
+    ticks: int,
+    latency_ms: float,
+    step_workers: int,
+) -> dict[str, object]:
+    client = FakeProviderClient(latency_seconds=latency_ms / 1000)
+    runtime = _build_runtime(
+        client,
+        persona_dir=persona_dir,
+        persona_names=persona_names,
+        step_workers=step_workers,
+    )
+    try:
+        started = time.perf_counter()
+        for _ in range(ticks):
+            runtime.tick()
+        elapsed = time.perf_counter() - started
+    finally:
+        runtime.close()
+    return {
+        "turns": runtime.turn,
+        "turns_per_second": round(runtime.turn / elapsed, 2),
+        "tick_ms_mean": round(elapsed / ticks * 1000, 2),
+        "generate_calls": client.generate_calls,
+    }
+
+
+def run(
+    *, agent_counts: list[int], ticks: int, latency_ms: float, workers: int
+) -> list[dict[str, object]]:
+    rows: list[dict[str, object]] = []
+    with tempfile.TemporaryDirectory() as temp_dir:
+        persona_dir = Path(temp_dir)
+        all_names = write_personas(persona_dir, max(agent_counts))
+        for count in agent_counts:
+            row: dict[str, object] = {"agents": count}
+            for mode, step_workers in [("serial", 1), ("pooled", workers)]:
+                row[mode] = _run_mode(
+                    persona_dir=persona_dir,
+                    persona_names=all_names[:count],
+                    ticks=ticks,
+                    latency_ms=latency_ms,
+                    step_workers=step_workers,
+                )
+            rows.append(row)
+    return rows
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--agents", type=int, nargs="+", default=[2, 4, 8, 16, 32])
+    parser.add_argument("--ticks", type=int, default=5)
+    parser.add_argument("--latency-ms", type=float, default=20.0)
+    parser.add_argument("--workers", type=int, default=16)
+    args = parser.parse_args()
+    print(
+        json.dumps(
+            run(
+                agent_counts=args.agents,
+                ticks=args.ticks,
+                latency_ms=args.latency_ms,
+                workers=args.workers,
+            ),
+            indent=2,
+        )
+    )
+
+
+if __name__ == "__main__":
+    main()
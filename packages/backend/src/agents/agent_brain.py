@@ -1,10 +1,16 @@
 import datetime
 
 from agents.agent import AgentIdentity, AgentProfile
-from agents.planning import Planner
+from agents.planning import DayPlanItem, PlanEngine, Planner, PlanStore
 from llm.llm_gateway import LlmGateway
 
-from .brain import ActionLoopInput, ActionLoopResult, AgentBrainGraphRunner
+from .brain import (
+    ActionLoopInput,
+    ActionLoopResult,
+    AgentBrainGraphRunner,
+    BrainSpeculation,
+    CognitionTier,
+)
 from .memory.memory_manager import MemoryManager, ObservationContext
 from .reflection import ReflectionGraphRunner
 
@@ -20,11 +26,14 @@ class AgentBrain:
         reflection_graph: ReflectionGraphRunner,
         llm_gateway: LlmGateway,
         planner: Planner | None = None,
+        plan_store: PlanStore | None = None,
+        plan_engine: PlanEngine | None = None,
     ):
         self.memory_manager: MemoryManager = memory_manager
         self.reflection_graph: ReflectionGraphRunner = reflection_graph
         self.llm_gateway: LlmGateway = llm_gateway
         self.agent_identity: AgentIdentity = agent_identity
+        self.plan_engine: PlanEngine | None = plan_engine
         self.brain_graph: AgentBrainGraphRunner = AgentBrainGraphRunner(
             agent_identity=agent_identity,
             memory_manager=memory_manager,
@@ -33,6 +42,58 @@ class AgentBrain:
             llm_gateway=llm_gateway,
             observation_writer=self.queue_observation,
             planner=planner,
+            plan_store=plan_store,
+            plan_engine=plan_engine,
+        )
+
+    @property
+    def plan_store(self) -> PlanStore | None:
+        return self.brain_graph.plan_store
+
+    @property
+    def cognition_tier(self) -> CognitionTier:
+        return self.brain_graph.cognition_tier
+
+    def set_cognition_tier(self, tier: CognitionTier) -> None:
+        """인지 충실도를 바꾼다. 진행 중인 턴은 시작할 때의 tier로 끝난다."""
+        self.brain_graph.cognition_tier = tier
+
+    def close(self) -> None:
+        if self.plan_engine is not None:
+            self.plan_engine.close()
+
+    def replan_from(
+        self,
+        *,
+        now: datetime.datetime,
+        profile: AgentProfile,
+        reason: str,
+    ) -> list[DayPlanItem]:
+        """now 이후 하루 계획만 다시 세운다. 이전 구간과 유효한 전개는 보존된다."""
+        return self.brain_graph.replan_from(now=now, profile=profile, reason=reason)
+
+    def follow_plan(
+        self,
+        *,
+        now: datetime.datetime,
+        profile: AgentProfile,
+    ) -> datetime.datetime | None:
+        """저장된 계획으로 현재 행동만 갱신하고(LLM 호출 없음) 다음 계획 경계 시각을 반환한다."""
+        return self.brain_graph.follow_plan(now=now, profile=profile)
+
+    def observation_context(
+        self,
+        *,
+        profile: AgentProfile,
+        current_plan: str | None = None,
+    ) -> ObservationContext:
+        """observation 저장/중요도 채점에 쓰는 에이전트 관점 맥락. current_plan이 없으면 현재 계획을 쓴다."""
+        if current_plan is None and profile.extended.current_plan_context:
+            current_plan = profile.extended.current_plan_context[0]
+        return ObservationContext(
+            agent_name=self.agent_identity.name,
+            identity_stable_set=profile.fixed.identity_stable_set,
+            current_plan=current_plan,
         )
 
     def queue_observation(
@@ -44,20 +105,22 @@ class AgentBrain:
         current_plan: str | None = None,
         importance: int | None = None,
     ) -> None:
-        if current_plan is not None:
-            final_current_plan = current_plan
-        elif profile.extended.current_plan_context:
-            final_current_plan = profile.extended.current_plan_context[0]
-        else:
-            final_current_plan = None
+        context = self.observation_context(profile=profile, current_plan=current_plan)
+        if self.cognition_tier == "background":
+            _ = self.brain_graph.defer_observation(
+                content=content, now=now, context=context, importance=importance
+            )
+            return
+        # 쌓아 둔 기억보다 나중 기억이 먼저 들어가지 않게 한다.
+        _ = self.brain_graph.flush_deferred_observations()
+        if importance is None and self.cognition_tier != "full":
+            importance = self.brain_graph.score_importance(
+                content=content, context=context, tier=self.cognition_tier
+            )
         memory = self.memory_manager.create_observation_from_text(
             content=content,
             now=now,
-            context=ObservationContext(
-                agent_name=self.agent_identity.name,
-                identity_stable_set=profile.fixed.identity_stable_set,
-                current_plan=final_current_plan,
-            ),
+            context=context,
             importance=importance,
         )
         self.reflection_graph.record_observation_importance(
@@ -87,10 +150,18 @@ class AgentBrain:
             importance=memory.importance
         )
 
-    def action_loop(self, input: ActionLoopInput) -> ActionLoopResult:
+    def speculate(self, input: ActionLoopInput) -> BrainSpeculation:
+        return self.brain_graph.speculate(input)
+
+    def action_loop(
+        self,
+        input: ActionLoopInput,
+        *,
+        speculation: BrainSpeculation | None = None,
+    ) -> ActionLoopResult:
         # 1. 현재 상황을 인지한다. 인지할때 월드에서 현재 상황을 조회해서 주입한다.
         # 2. 인지된 정보들을 observation으로 메모리에 저장 (reflection 조건 충족 시 reflection도 함께 저장)
         # 3. 상황판단을 한다.
         # 4. 상황판단에 따라 반응을 결정한다.
         # 5. 반응에 때라 구체적인 행동 및 출력을 한다.
-        return self.brain_graph.run(input)
+        return self.brain_graph.run(input, speculation=speculation)
@@ -1,10 +1,23 @@
 from .graph import AgentBrainGraphRunner
-from .types import ActionLoopInput, ActionLoopResult, DetermineContext, Observation
+from .types import (
+    ActionLoopInput,
+    ActionLoopResult,
+    BrainSpeculation,
+    CognitionTier,
+    DeferredObservation,
+    DetermineContext,
+    Observation,
+    SpeculationOutcome,
+)
 
 __all__ = [
     "ActionLoopInput",
     "ActionLoopResult",
     "AgentBrainGraphRunner",
+    "BrainSpeculation",
+    "CognitionTier",
+    "DeferredObservation",
     "DetermineContext",
     "Observation",
+    "SpeculationOutcome",
 ]
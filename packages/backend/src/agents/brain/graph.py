@@ -1,4 +1,6 @@
 import datetime
+import time
+from dataclasses import replace
 from importlib import import_module
 from typing import Literal, Protocol, cast
 
@@ -7,19 +9,43 @@ from typing_extensions import TypedDict
 
 from agents.agent import AgentIdentity, AgentProfile
 from agents.memory.memory_object import MemoryObject
-from agents.planning.models import DayPlanBroadStrokesRequest, DayPlanItem
+from agents.planning.engine import PlanEngine
+from agents.planning.models import (
+    DayPlanBroadStrokesRequest,
+    DayPlanItem,
+    DayReplanRequest,
+)
+from agents.planning.store import PlanStore, frozen_prefix
 from agents.reaction import ReactionDecision, ReactionDecisionInput
+from llm.embedding_context import share_tick_embedding
 from llm.embedding_encoder import EmbeddingEncodingContext
+from llm.importance_scorer import (
+    HeuristicImportanceScorer,
+    ImportanceScoringContext,
+    clamp_importance,
+)
 
 from ..decision_diagnostics import build_action_diagnostics
 from ..graph_support import (
     GRAPH_END,
     GRAPH_START,
-    GRAPH_STATE_FACTORY,
+    GraphBackend,
     require_state_value,
+    resolve_state_graph_factory,
+    runner_action,
+    shared_graph,
 )
 from ..memory.memory_manager import ObservationContext
-from .types import ActionLoopInput, ActionLoopResult, DetermineContext, Observation
+from .types import (
+    ActionLoopInput,
+    ActionLoopResult,
+    BrainSpeculation,
+    CognitionTier,
+    DeferredObservation,
+    DetermineContext,
+    Observation,
+    SpeculationOutcome,
+)
 
 
 class PromptBuildersModule(Protocol):
@@ -33,6 +59,11 @@ class PromptBuildersModule(Protocol):
     ) -> str: ...
 
 
+PROMPT_BUILDERS = cast(
+    PromptBuildersModule, cast(object, import_module("agents.prompt_builders"))
+)
+
+
 class ObservationWriter(Protocol):
     def __call__(
         self,
@@ -60,12 +91,20 @@ class ObservationMemoryManager(Protocol):
         importance: int | None,
     ) -> MemoryObject: ...
 
+    def score_observation_importance(
+        self,
+        *,
+        content: str,
+        context: ObservationContext,
+    ) -> int: ...
+
     def get_retrieval_memories(
         self,
         *,
         query: str,
         current_time: datetime.datetime,
         top_k: int = 3,
+        query_embedding: np.ndarray | None = None,
     ) -> list[MemoryObject]: ...
 
 
@@ -87,6 +126,11 @@ class PlanningRunner(Protocol):
         request: DayPlanBroadStrokesRequest,
     ) -> list[DayPlanItem]: ...
 
+    def replan_day(
+        self,
+        request: DayReplanRequest,
+    ) -> list[DayPlanItem]: ...
+
 
 class AgentBrainGraphBuilder(Protocol):
     def add_node(self, node: str, action: object) -> None: ...
@@ -113,7 +157,11 @@ class StateGraphFactory(Protocol):
     ) -> AgentBrainGraphBuilder: ...
 
 
-STATE_GRAPH = cast(StateGraphFactory, GRAPH_STATE_FACTORY)
+def _state_graph(backend: GraphBackend | None, graph_name: str) -> StateGraphFactory:
+    return cast(
+        StateGraphFactory,
+        resolve_state_graph_factory(backend, graph_name=graph_name),
+    )
 
 
 class AgentBrainGraphState(TypedDict):
@@ -123,6 +171,10 @@ class AgentBrainGraphState(TypedDict):
     determine_context: DetermineContext | None
     reaction_decision: ReactionDecision | None
     result: ActionLoopResult | None
+    speculation: BrainSpeculation | None
+    speculation_outcome: SpeculationOutcome | None
+    cognition_tier: CognitionTier
+    runner: "AgentBrainGraphRunner"
 
 
 class AgentBrainGraphRunner:
@@ -136,6 +188,10 @@ class AgentBrainGraphRunner:
         llm_gateway: ReactionGateway,
         observation_writer: ObservationWriter,
         planner: PlanningRunner | None = None,
+        plan_store: PlanStore | None = None,
+        plan_engine: PlanEngine | None = None,
+        graph_backend: GraphBackend | None = None,
+        cognition_tier: CognitionTier = "full",
     ):
         self.agent_identity: AgentIdentity = agent_identity
         self.memory_manager: ObservationMemoryManager = memory_manager
@@ -144,9 +200,30 @@ class AgentBrainGraphRunner:
         self.llm_gateway: ReactionGateway = llm_gateway
         self.observation_writer: ObservationWriter = observation_writer
         self.planner: PlanningRunner | None = planner
-        self.graph: AgentBrainGraphInvoker = self._build_graph()
+        self.plan_engine: PlanEngine | None = plan_engine
+        self.plan_store: PlanStore | None = plan_store or (
+            plan_engine.plan_store if plan_engine is not None else None
+        )
+        self.graph_backend: GraphBackend | None = graph_backend
+        self.cognition_tier: CognitionTier = cognition_tier
+        self.heuristic_importance: HeuristicImportanceScorer = (
+            HeuristicImportanceScorer()
+        )
+        self.deferred_observations: list[DeferredObservation] = []
+        self.deferred_flushes: int = 0
+        """deferred_observations를 메모리 스트림으로 옮긴 횟수(체크포인트 delta용)."""
+        self.graph: AgentBrainGraphInvoker = shared_graph(
+            "brain", graph_backend, self._build_graph
+        )
 
-    def run(self, input: ActionLoopInput) -> ActionLoopResult:
+    def run(
+        self,
+        input: ActionLoopInput,
+        *,
+        speculation: BrainSpeculation | None = None,
+    ) -> ActionLoopResult:
+        if self.cognition_tier != "background":
+            _ = self.flush_deferred_observations()
         final_state = self.graph.invoke(
             AgentBrainGraphState(
                 input=input,
@@ -155,63 +232,235 @@ class AgentBrainGraphRunner:
                 determine_context=None,
                 reaction_decision=None,
                 result=None,
+                speculation=speculation,
+                speculation_outcome=None,
+                # 실행 중 tier가 바뀌어도 한 턴은 시작 시점의 tier로 끝낸다.
+                cognition_tier=self.cognition_tier,
+                runner=self,
             )
         )
         return require_state_value(final_state["result"], key="result")
 
-    def _build_graph(self) -> AgentBrainGraphInvoker:
-        builder = STATE_GRAPH(AgentBrainGraphState)
-        builder.add_node("ensure_plan_context", self._ensure_plan_context)
+    def defer_observation(
+        self,
+        *,
+        content: str,
+        now: datetime.datetime,
+        context: ObservationContext,
+        importance: int | None = None,
+    ) -> DeferredObservation:
+        """
+        background tier의 기억 추가. 임베딩 없이 휴리스틱 중요도만 매겨 쌓아 둔다.
+        - importance가 없으면 휴리스틱으로 매긴다.
+        - background 에이전트는 검색하지 않으므로 벡터가 당장 필요 없다.
+        - reflection 누적값은 지금 반영하고, 임베딩은 flush_deferred_observations에서 한다.
+        """
+        deferred = DeferredObservation(
+            content=content,
+            now=now,
+            context=context,
+            importance=clamp_importance(importance)
+            if importance is not None
+            else self.score_importance(
+                content=content, context=context, tier="background"
+            ),
+        )
+        self.deferred_observations.append(deferred)
+        self.reflection_graph.record_observation_importance(
+            importance=deferred.importance
+        )
+        return deferred
+
+    def flush_deferred_observations(self) -> int:
+        """쌓아 둔 observation을 시간 순서대로 임베딩해 메모리에 넣고 그 수를 반환한다."""
+        if not self.deferred_observations:
+            return 0
+        deferred, self.deferred_observations = self.deferred_observations, []
+        self.deferred_flushes += 1
+        for observation in deferred:
+            _ = self.memory_manager.create_observation(
+                content=observation.content,
+                now=observation.now,
+                embedding=self.embedding_encoder.encode(
+                    EmbeddingEncodingContext(text=observation.content)
+                ),
+                context=observation.context,
+                importance=observation.importance,
+            )
+        return len(deferred)
+
+    def speculate(self, input: ActionLoopInput) -> BrainSpeculation:
+        """
+        예측한 다음 턴 입력으로 perceive 임베딩/중요도/검색 쿼리 임베딩을 미리 계산한다.
+        - 메모리/reflection 상태는 변경하지 않으므로 백그라운드 스레드에서 실행해도 된다.
+        - 결과는 run(speculation=...)에서 실제 입력과 일치할 때만 사용된다.
+        """
+        started = time.perf_counter()
+        content, current_plan = self._observation_content(input)
+        embedding = self.embedding_encoder.encode(
+            EmbeddingEncodingContext(text=content)
+        )
+        context = self._observation_context(input, current_plan)
+        importance = self.score_importance(
+            content=content, context=context, tier=self.cognition_tier
+        )
+        observed = time.perf_counter()
+
+        retrieval_query = self._build_retrieval_query(input, content)
+        retrieval_query_embedding = self.embedding_encoder.encode(
+            EmbeddingEncodingContext(text=retrieval_query)
+        )
+        return BrainSpeculation(
+            observation_content=content,
+            observation_context=context,
+            observation_embedding=embedding,
+            importance=importance,
+            retrieval_query=retrieval_query,
+            retrieval_query_embedding=retrieval_query_embedding,
+            observation_ms=(observed - started) * 1000,
+            retrieval_ms=(time.perf_counter() - observed) * 1000,
+        )
+
+    def replan_from(
+        self,
+        *,
+        now: datetime.datetime,
+        profile: AgentProfile,
+        reason: str,
+    ) -> list[DayPlanItem]:
+        """
+        사건으로 계획이 바뀌었을 때 now 이후 하루 계획만 다시 생성한다.
+        - now 이전 항목과 여전히 유효한 시간/분 단위 전개는 그대로 둔다.
+        - 저장된 오늘 계획이 없거나 재계획에 실패하면 기존 계획을 그대로 반환한다.
+        """
+        if self.planner is None or self.plan_store is None:
+            return []
+        now = now.replace(second=0, microsecond=0)
+        stored = self.plan_store.get(self.agent_identity.id, now.date())
+        if stored is None:
+            return []
+
+        items = self.planner.replan_day(
+            DayReplanRequest(
+                day_request=self._day_plan_request(now, profile),
+                now=now,
+                frozen_items=frozen_prefix(stored.day_items, now),
+                reason=reason,
+            )
+        )
+        if not items:
+            return stored.day_items
+        plan = self.plan_store.replan_from(
+            self.agent_identity.id, now.date(), now, items
+        )
+        profile.extended.current_plan_context = [
+            item.action_content for item in items[:2]
+        ]
+        return plan.day_items
+
+    def follow_plan(
+        self,
+        *,
+        now: datetime.datetime,
+        profile: AgentProfile,
+    ) -> datetime.datetime | None:
+        """
+        저장된 계획만으로 now의 현재/다음 행동을 current_plan_context에 반영하고 다음 계획
+        경계 시각을 반환한다.
+        - LLM을 호출하지 않는다. 아직 전개되지 않은 구간은 전개된 상위 계층 항목을 따른다.
+        - 오늘 계획이 아직 없으면 None을 반환한다.
+        """
+        if self.plan_store is None:
+            return None
+        stored = self.plan_store.get(self.agent_identity.id, now.date())
+        if stored is None:
+            return None
+        current = stored.active_items(now)
+        upcoming = stored.next_items(now)
+        actions = [
+            item.action_content
+            for item in (
+                current.minute or current.hourly or current.day,
+                upcoming.minute or upcoming.hourly or upcoming.day,
+            )
+            if item is not None
+        ]
+        if actions:
+            profile.extended.current_plan_context = actions
+        return stored.next_boundary(now)
+
+    def score_importance(
+        self,
+        *,
+        content: str,
+        context: ObservationContext,
+        tier: CognitionTier,
+    ) -> int:
+        """full tier만 LLM으로 중요도를 매기고, 나머지 tier는 휴리스틱으로 매긴다."""
+        if tier == "full":
+            return self.memory_manager.score_observation_importance(
+                content=content, context=context
+            )
+        return self.heuristic_importance.score(
+            ImportanceScoringContext(
+                observation=content,
+                agent_name=context.agent_name,
+                identity_stable_set=context.identity_stable_set,
+                current_plan=context.current_plan,
+            )
+        )
+
+    @staticmethod
+    def _build_graph(backend: GraphBackend) -> AgentBrainGraphInvoker:
+        builder = _state_graph(backend, "brain")(AgentBrainGraphState)
+        builder.add_node("ensure_plan_context", runner_action("_ensure_plan_context"))
         # 1. 현재 상황을 인지한다. 인지할때 월드에서 현재 상황을 조회해서 주입한다.
-        builder.add_node("perceive", self._perceive)
+        builder.add_node("perceive", runner_action("_perceive"))
         # 2. 인지된 정보들을 observation으로 메모리에 저장 (reflection 조건 충족 시 reflection도 함께 저장)
-        builder.add_node("persist_observation", self._persist_observation)
+        builder.add_node("persist_observation", runner_action("_persist_observation"))
         # 2-1. reflection 조건 충족 시 reflection graph를 실행한다.
-        builder.add_node("run_reflection", self._run_reflection)
+        builder.add_node("run_reflection", runner_action("_run_reflection"))
         # 3. 상황판단을 한다.
-        builder.add_node("determine_context", self._determine_context)
+        builder.add_node("determine_context", runner_action("_determine_context"))
         # 4. 상황판단에 따라 반응을 결정한다.
-        builder.add_node("decide_reaction", self._decide_reaction)
+        builder.add_node("decide_reaction", runner_action("_decide_reaction"))
         # 5. 반응에 때라 구체적인 행동 및 출력을 한다.
-        builder.add_node("finalize_action", self._finalize_action)
+        builder.add_node("finalize_action", runner_action("_finalize_action"))
+        # background tier는 기억만 남기고 계획대로 행동한다.
+        builder.add_node("follow_plan_only", runner_action("_follow_plan_only"))
 
         builder.add_edge(GRAPH_START, "ensure_plan_context")
         builder.add_edge("ensure_plan_context", "perceive")
         builder.add_edge("perceive", "persist_observation")
         builder.add_conditional_edges(
             "persist_observation",
-            self._route_after_persist_observation,
+            runner_action("_route_after_persist_observation"),
             {
                 "run_reflection": "run_reflection",
                 "determine_context": "determine_context",
+                "follow_plan_only": "follow_plan_only",
             },
         )
         builder.add_edge("run_reflection", "determine_context")
         builder.add_edge("determine_context", "decide_reaction")
         builder.add_edge("decide_reaction", "finalize_action")
         builder.add_edge("finalize_action", GRAPH_END)
+        builder.add_edge("follow_plan_only", GRAPH_END)
         return builder.compile()
 
     def _ensure_plan_context(self, state: AgentBrainGraphState) -> dict[str, object]:
         input = state["input"]
-        if input.profile.extended.current_plan_context or self.planner is None:
+        if state["cognition_tier"] == "background":
+            _ = self.follow_plan(now=input.current_time, profile=input.profile)
+            return {}
+        if self.planner is None:
+            return {}
+        if self.plan_engine is not None:
+            return self._refresh_plan_context(input, self.planner, self.plan_engine)
+        if input.profile.extended.current_plan_context:
             return {}
 
-        persona_background = " | ".join(input.profile.extended.lifestyle_and_routine)
-        if not persona_background.strip():
-            persona_background = "No background summary available."
-
-        day_plan_items = self.planner.generate_day_plan(
-            DayPlanBroadStrokesRequest(
-                agent_name=self.agent_identity.name,
-                age=self.agent_identity.age,
-                innate_traits=list(self.agent_identity.traits),
-                persona_background=persona_background,
-                yesterday_date=input.current_time - datetime.timedelta(days=1),
-                yesterday_summary="No recorded activity summary.",
-                today_date=input.current_time,
-            )
-        )
+        day_plan_items = self._load_or_generate_day_plan(input, self.planner)
         if not day_plan_items:
             return {}
 
@@ -220,8 +469,107 @@ class AgentBrainGraphRunner:
         ]
         return {}
 
-    def _perceive(self, state: AgentBrainGraphState) -> dict[str, Observation]:
+    def _refresh_plan_context(
+        self,
+        input: ActionLoopInput,
+        planner: PlanningRunner,
+        plan_engine: PlanEngine,
+    ) -> dict[str, object]:
+        """매 tick 현재/다음 계획 항목으로 current_plan_context를 갱신한다."""
+        if not self._load_or_generate_day_plan(input, planner):
+            return {}
+        lookup = plan_engine.lookup(input.current_time)
+        actions = [
+            action
+            for action in (lookup.current_action, lookup.next_action)
+            if action is not None
+        ]
+        if actions:
+            input.profile.extended.current_plan_context = actions
+        return {}
+
+    def _load_or_generate_day_plan(
+        self, input: ActionLoopInput, planner: PlanningRunner
+    ) -> list[DayPlanItem]:
+        """저장된 오늘 계획이 있으면 재사용하고, 없을 때만 생성해 저장한다."""
+        today = input.current_time.date()
+        if self.plan_store is not None:
+            stored = self.plan_store.get(self.agent_identity.id, today)
+            if stored is not None:
+                return stored.day_items
+
+        day_plan_items = planner.generate_day_plan(
+            self._day_plan_request(input.current_time, input.profile)
+        )
+        if day_plan_items and self.plan_store is not None:
+            self.plan_store.put_day_plan(self.agent_identity.id, today, day_plan_items)
+        return day_plan_items
+
+    def _day_plan_request(
+        self, current_time: datetime.datetime, profile: AgentProfile
+    ) -> DayPlanBroadStrokesRequest:
+        persona_background = " | ".join(profile.extended.lifestyle_and_routine)
+        if not persona_background.strip():
+            persona_background = "No background summary available."
+        return DayPlanBroadStrokesRequest(
+            agent_name=self.agent_identity.name,
+            age=self.agent_identity.age,
+            innate_traits=list(self.agent_identity.traits),
+            persona_background=persona_background,
+            yesterday_date=current_time - datetime.timedelta(days=1),
+            yesterday_summary="No recorded activity summary.",
+            today_date=current_time,
+        )
+
+    def _perceive(self, state: AgentBrainGraphState) -> dict[str, object]:
         input = state["input"]
+        content, current_plan = self._observation_content(input)
+        if state["cognition_tier"] == "background":
+            _ = self.defer_observation(
+                content=content,
+                now=input.current_time,
+                context=self._observation_context(input, current_plan),
+            )
+            return {}
+
+        speculation = state["speculation"]
+        if speculation is not None:
+            observation_hit = (
+                speculation.observation_content == content
+                and speculation.observation_context
+                == self._observation_context(input, current_plan)
+            )
+            outcome = SpeculationOutcome(
+                observation_hit=observation_hit,
+                retrieval_hit=False,
+                reused_ms=speculation.observation_ms if observation_hit else 0.0,
+            )
+            if observation_hit:
+                return {
+                    "observation": Observation(
+                        content=content,
+                        now=input.current_time,
+                        embedding=speculation.observation_embedding,
+                        agent_name=self.agent_identity.name,
+                        current_plan=current_plan,
+                        importance=speculation.importance,
+                    ),
+                    "speculation_outcome": outcome,
+                }
+            return {
+                "observation": self._encode_observation(
+                    input, content, current_plan, state["cognition_tier"]
+                ),
+                "speculation_outcome": outcome,
+            }
+
+        return {
+            "observation": self._encode_observation(
+                input, content, current_plan, state["cognition_tier"]
+            )
+        }
+
+    def _observation_content(self, input: ActionLoopInput) -> tuple[str, str | None]:
         current_plan = (
             input.profile.extended.current_plan_context[0]
             if input.profile.extended.current_plan_context
@@ -246,22 +594,47 @@ class AgentBrainGraphRunner:
         else:
             lines.append("events=none")
 
-        content = "\n".join(lines)
+        return "\n".join(lines), current_plan
+
+    def _observation_context(
+        self, input: ActionLoopInput, current_plan: str | None
+    ) -> ObservationContext:
+        return ObservationContext(
+            agent_name=self.agent_identity.name,
+            identity_stable_set=input.profile.fixed.identity_stable_set,
+            current_plan=current_plan,
+        )
+
+    def _encode_observation(
+        self,
+        input: ActionLoopInput,
+        content: str,
+        current_plan: str | None,
+        tier: CognitionTier,
+    ) -> Observation:
         embedding = self.embedding_encoder.encode(
             EmbeddingEncodingContext(text=content)
         )
-        return {
-            "observation": Observation(
+        return Observation(
+            content=content,
+            now=input.current_time,
+            embedding=embedding,
+            agent_name=self.agent_identity.name,
+            current_plan=current_plan,
+            # full tier는 persist 단계에서 LLM으로 채점한다.
+            importance=None
+            if tier == "full"
+            else self.score_importance(
                 content=content,
-                now=input.current_time,
-                embedding=embedding,
-                agent_name=self.agent_identity.name,
-                current_plan=current_plan,
-                importance=None,
-            )
-        }
+                context=self._observation_context(input, current_plan),
+                tier=tier,
+            ),
+        )
 
     def _persist_observation(self, state: AgentBrainGraphState) -> dict[str, bool]:
+        if state["cognition_tier"] == "background":
+            # perceive에서 임베딩 없이 쌓아 두었다.
+            return {"should_reflect": False}
         observation = require_state_value(state["observation"], key="observation")
         input = state["input"]
 
@@ -269,11 +642,7 @@ class AgentBrainGraphRunner:
             content=observation.content,
             now=observation.now,
             embedding=observation.embedding,
-            context=ObservationContext(
-                agent_name=observation.agent_name,
-                identity_stable_set=input.profile.fixed.identity_stable_set,
-                current_plan=observation.current_plan,
-            ),
+            context=self._observation_context(input, observation.current_plan),
             importance=observation.importance,
         )
         self.reflection_graph.record_observation_importance(
@@ -283,7 +652,9 @@ class AgentBrainGraphRunner:
 
     def _route_after_persist_observation(
         self, state: AgentBrainGraphState
-    ) -> Literal["run_reflection", "determine_context"]:
+    ) -> Literal["run_reflection", "determine_context", "follow_plan_only"]:
+        if state["cognition_tier"] == "background":
+            return "follow_plan_only"
         if state["should_reflect"]:
             return "run_reflection"
         return "determine_context"
@@ -293,27 +664,38 @@ class AgentBrainGraphRunner:
         self.reflection_graph.reflect(now=input.current_time)
         return {"should_reflect": False}
 
-    def _determine_context(
-        self, state: AgentBrainGraphState
-    ) -> dict[str, DetermineContext]:
+    def _determine_context(self, state: AgentBrainGraphState) -> dict[str, object]:
         observation = require_state_value(state["observation"], key="observation")
         input = state["input"]
 
-        prompt_builders_module = cast(
-            PromptBuildersModule,
-            cast(object, import_module("agents.prompt_builders")),
-        )
-        retrieval_query = prompt_builders_module.build_retrieval_query(
-            agent_identity=self.agent_identity,
-            observation_content=observation.content,
-            dialogue_history=input.dialogue_history,
-            profile=input.profile,
-        )
+        retrieval_query = self._build_retrieval_query(input, observation.content)
+        # tick 임베딩 공유가 켜져 있으면 검색 쿼리는 인지 observation 벡터를 재사용한다.
+        share_tick_embedding(retrieval_query, observation.content)
+
+        update: dict[str, object] = {}
+        query_embedding: np.ndarray | None = None
+        speculation = state["speculation"]
+        outcome = state["speculation_outcome"]
+        if (
+            speculation is not None
+            and outcome is not None
+            and speculation.retrieval_query == retrieval_query
+        ):
+            # 검색 쿼리가 예측과 같으면 쿼리 임베딩만 재사용하고 순위는 현재 메모리로 계산한다.
+            query_embedding = speculation.retrieval_query_embedding
+            update["speculation_outcome"] = replace(
+                outcome,
+                retrieval_hit=True,
+                reused_ms=outcome.reused_ms + speculation.retrieval_ms,
+            )
+
         retrieved_memories = self.memory_manager.get_retrieval_memories(
             query=retrieval_query,
             current_time=input.current_time,
+            query_embedding=query_embedding,
         )
         return {
+            **update,
             "determine_context": DetermineContext(
                 observation=observation,
                 dialogue_history=input.dialogue_history,
@@ -321,9 +703,19 @@ class AgentBrainGraphRunner:
                 profile=input.profile,
                 retrieved_memories=retrieved_memories,
                 language=input.language,
-            )
+            ),
         }
 
+    def _build_retrieval_query(
+        self, input: ActionLoopInput, observation_content: str
+    ) -> str:
+        return PROMPT_BUILDERS.build_retrieval_query(
+            agent_identity=self.agent_identity,
+            observation_content=observation_content,
+            dialogue_history=input.dialogue_history,
+            profile=input.profile,
+        )
+
     def _decide_reaction(
         self, state: AgentBrainGraphState
     ) -> dict[str, ReactionDecision]:
@@ -342,10 +734,30 @@ class AgentBrainGraphRunner:
                     retrieved_memories=determine_context.retrieved_memories,
                     dialogue_arc=determine_context.dialogue_arc,
                     language=determine_context.language,
+                    reaction_mode=(
+                        "fused" if state["cognition_tier"] == "reduced" else None
+                    ),
+                    semantic_retries=state["cognition_tier"] == "full",
                 )
             )
         }
 
+    def _follow_plan_only(
+        self, state: AgentBrainGraphState
+    ) -> dict[str, ActionLoopResult]:
+        input = state["input"]
+        return {
+            "result": ActionLoopResult(
+                current_time=input.current_time,
+                talk=None,
+                utterance=None,
+                speak_decision=False,
+                action_intent="continue_current_plan",
+                silent_reason="background_tier",
+                speculation=state["speculation_outcome"],
+            )
+        }
+
     def _finalize_action(
         self, state: AgentBrainGraphState
     ) -> dict[str, ActionLoopResult]:
@@ -367,6 +779,7 @@ class AgentBrainGraphRunner:
             action_intent = "react_without_utterance"
 
         if should_speak and talk is not None:
+            share_tick_embedding(f"I decided to react: {talk}", talk)
             self.observation_writer(
                 content=f"I decided to react: {talk}",
                 now=input.current_time,
@@ -398,5 +811,6 @@ class AgentBrainGraphRunner:
                     action_intent=action_intent,
                     silent_reason=silent_reason,
                 ),
+                speculation=state["speculation_outcome"],
             )
         }
@@ -5,11 +5,21 @@ from typing import Literal
 import numpy as np
 
 from agents.agent import AgentProfile
+from agents.memory.memory_manager import ObservationContext
 from agents.memory.memory_object import MemoryObject
 from agents.reaction import DialogueArc, ReactionDecisionTrace
 
 from ..decision_diagnostics import ActionDiagnostics
 
+CognitionTier = Literal["full", "reduced", "background"]
+"""
+에이전트 인지 충실도.
+- full: LLM 중요도, two-stage/fused reaction, guardrail 재시도 전부.
+- reduced: 휴리스틱 중요도, fused reaction, 의미 유사도 재시도 없음.
+- background: 계획 따라가기와 휴리스틱 중요도 기억 추가만(LLM/임베딩 호출 없음).
+  기억은 텍스트로만 쌓아 두었다가 tier가 올라갈 때 임베딩해 메모리 스트림에 넣는다.
+"""
+
 
 @dataclass(frozen=True)
 class Observation:
@@ -21,6 +31,43 @@ class Observation:
     importance: int | None
 
 
+@dataclass(frozen=True)
+class DeferredObservation:
+    """background tier에서 임베딩 없이 쌓아 둔 observation."""
+
+    content: str
+    now: datetime.datetime
+    context: ObservationContext
+    importance: int
+    """휴리스틱으로 매긴 중요도. reflection 누적값에는 쌓을 때 이미 반영했다."""
+
+
+@dataclass(frozen=True)
+class BrainSpeculation:
+    """다음 턴 입력을 예측해 미리 계산해 둔 perceive/중요도/검색 쿼리 결과."""
+
+    observation_content: str
+    observation_context: ObservationContext
+    observation_embedding: np.ndarray
+    importance: int
+    retrieval_query: str
+    retrieval_query_embedding: np.ndarray
+    observation_ms: float
+    """observation 임베딩 + 중요도 산정에 걸린 시간(ms)."""
+    retrieval_ms: float
+    """검색 쿼리 생성 + 임베딩에 걸린 시간(ms)."""
+
+
+@dataclass(frozen=True)
+class SpeculationOutcome:
+    observation_hit: bool
+    """예측한 observation이 실제 입력과 일치해 임베딩/중요도를 재사용했는지 여부."""
+    retrieval_hit: bool
+    """예측한 검색 쿼리가 실제와 일치해 쿼리 임베딩을 재사용했는지 여부."""
+    reused_ms: float = 0.0
+    """재사용으로 이번 턴에서 생략된 계산 시간(ms)."""
+
+
 @dataclass(frozen=True)
 class DetermineContext:
     observation: Observation
@@ -65,3 +112,5 @@ class ActionLoopResult:
     """LLM governance에서 생성한 reaction 추적 정보."""
     diagnostics: ActionDiagnostics | None = None
     """행동 판단 관측용 진단 정보."""
+    speculation: SpeculationOutcome | None = None
+    """미리 계산된 턴 결과를 받았을 때의 재사용 결과. 받지 않았으면 None."""
@@ -0,0 +1,158 @@
+from collections.abc import Callable, Mapping
+from typing import cast
+
+from .graph_support import GRAPH_END, GRAPH_START
+
+DEFAULT_RECURSION_LIMIT = 25
+
+NodeAction = Callable[[dict[str, object]], Mapping[str, object] | None]
+RoutePath = Callable[[dict[str, object]], object]
+
+
+class GraphRecursionError(RecursionError):
+    """recursion_limit 이상의 노드를 실행해도 GRAPH_END에 도달하지 못했을 때 발생한다."""
+
+
+class _ConditionalRoute:
+    __slots__ = ("path", "path_map")
+
+    def __init__(self, path: RoutePath, path_map: dict[str, object] | None):
+        self.path: RoutePath = path
+        self.path_map: dict[str, object] | None = path_map
+
+    def resolve(self, state: dict[str, object]) -> object:
+        key = self.path(state)
+        if self.path_map is None:
+            return key
+        try:
+            return self.path_map[cast(str, key)]
+        except KeyError as exc:
+            raise ValueError(
+                f"Conditional route returned unknown key: {key!r}"
+            ) from exc
+
+
+class CompiledStateGraph:
+    """
+    LangGraph StateGraph와 같은 builder 프로토콜(add_node/add_edge/add_conditional_edges/compile)을
+    제공하는 경량 실행기.
+
+    - 이 저장소 그래프가 쓰는 부분집합만 지원한다: 단일 진입점, 노드당 하나의 후속 edge 또는
+      conditional edge, 부분 dict 반환 후 last-value 병합.
+    - LangGraph와 같이 state schema에 없는 키는 병합하지 않고 버린다.
+    - compile 시 라우팅 테이블을 만들어 invoke는 dict 조회와 함수 호출만 수행한다.
+    """
+
+    def __init__(self, state_schema: type):
+        self.state_schema: type = state_schema
+        self._nodes: dict[str, NodeAction] = {}
+        self._edges: dict[object, object] = {}
+        self._conditional_edges: dict[str, _ConditionalRoute] = {}
+
+    def add_node(self, node: str, action: object) -> None:
+        if node in self._nodes:
+            raise ValueError(f"Node already exists: {node}")
+        if node in (GRAPH_START, GRAPH_END):
+            raise ValueError(f"Node name is reserved: {node}")
+        self._nodes[node] = cast(NodeAction, action)
+
+    def add_edge(self, start_key: object, end_key: object) -> None:
+        if start_key in self._edges or start_key in self._conditional_edges:
+            raise ValueError(f"Node already has an outgoing edge: {start_key}")
+        self._edges[start_key] = end_key
+
+    def add_conditional_edges(
+        self,
+        source: str,
+        path: object,
+        path_map: dict[str, object] | None = None,
+    ) -> None:
+        if source in self._edges or source in self._conditional_edges:
+            raise ValueError(f"Node already has an outgoing edge: {source}")
+        self._conditional_edges[source] = _ConditionalRoute(
+            cast(RoutePath, path), path_map
+        )
+
+    def compile(self) -> "CompiledGraph":
+        entry = self._edges.get(GRAPH_START)
+        if entry is None:
+            raise ValueError("Graph must have an edge from GRAPH_START")
+
+        targets = [entry, *self._edges.values()]
+        for route in self._conditional_edges.values():
+            if route.path_map is not None:
+                targets.extend(route.path_map.values())
+        for target in targets:
+            if target != GRAPH_END and target not in self._nodes:
+                raise ValueError(f"Edge points to unknown node: {target}")
+        for source in [*self._edges, *self._conditional_edges]:
+            if source != GRAPH_START and source not in self._nodes:
+                raise ValueError(f"Edge starts from unknown node: {source}")
+
+        routes: dict[str, object | _ConditionalRoute] = {}
+        for node in self._nodes:
+            if node in self._conditional_edges:
+                routes[node] = self._conditional_edges[node]
+            elif node in self._edges:
+                routes[node] = self._edges[node]
+            else:
+                raise ValueError(f"Node has no outgoing edge: {node}")
+
+        return CompiledGraph(
+            entry=cast(str, entry),
+            nodes=dict(self._nodes),
+            routes=routes,
+            state_keys=frozenset(_state_keys(self.state_schema)),
+        )
+
+
+class CompiledGraph:
+    def __init__(
+        self,
+        *,
+        entry: str,
+        nodes: dict[str, NodeAction],
+        routes: dict[str, object | _ConditionalRoute],
+        state_keys: frozenset[str],
+        recursion_limit: int = DEFAULT_RECURSION_LIMIT,
+    ):
+        self.entry: str = entry
+        self.nodes: dict[str, NodeAction] = nodes
+        self.routes: dict[str, object | _ConditionalRoute] = routes
+        self.state_keys: frozenset[str] = state_keys
+        self.recursion_limit: int = recursion_limit
+
+    def invoke(self, input: Mapping[str, object]) -> dict[str, object]:
+        state = dict(input)
+        node: object = self.entry
+        steps = 0
+        while node != GRAPH_END:
+            steps += 1
+            if steps > self.recursion_limit:
+                raise GraphRecursionError(
+                    f"Recursion limit of {self.recursion_limit} reached "
+                    "without hitting a stop condition"
+                )
+            name = cast(str, node)
+            update = self.nodes[name](dict(state))
+            if update:
+                if update.keys() <= self.state_keys:
+                    state.update(update)
+                else:
+                    state.update(
+                        (key, value)
+                        for key, value in update.items()
+                        if key in self.state_keys
+                    )
+            route = self.routes[name]
+            node = (
+                route.resolve(state) if isinstance(route, _ConditionalRoute) else route
+            )
+        return state
+
+
+def _state_keys(state_schema: type) -> set[str]:
+    keys: set[str] = set()
+    for klass in reversed(state_schema.__mro__):
+        keys.update(getattr(klass, "__annotations__", {}))
+    return keys
@@ -1,16 +1,169 @@
+import threading
+from collections.abc import Callable, Mapping
+from functools import cache
 from importlib import import_module
-from typing import TypeVar, cast
+from typing import Literal, Protocol, TypeVar, cast
 
-LANGGRAPH_GRAPH_MODULE = import_module("langgraph.graph")
-GRAPH_START = cast(object, getattr(LANGGRAPH_GRAPH_MODULE, "START"))
-GRAPH_END = cast(object, getattr(LANGGRAPH_GRAPH_MODULE, "END"))
+from settings import GRAPH_BACKEND
+from utils.instrumentation import active_profile, instrument_node
 
+GRAPH_START: object = "__start__"
+"""langgraph.graph.START와 같은 값. 그래프 정의만으로 langgraph를 import하지 않는다."""
+GRAPH_END: object = "__end__"
+"""langgraph.graph.END와 같은 값."""
 
+
+@cache
 def _load_state_factory() -> object:
-    return cast(object, getattr(LANGGRAPH_GRAPH_MODULE, "StateGraph"))
+    """LangGraph StateGraph는 langgraph backend로 그래프를 처음 만들 때 불러온다."""
+    return cast(object, getattr(import_module("langgraph.graph"), "StateGraph"))
+
+
+GraphBackend = Literal["langgraph", "compiled"]
+
+
+class _GraphInvoker(Protocol):
+    def invoke(self, input: object) -> object: ...
+
+
+class _GraphBuilder(Protocol):
+    def add_node(self, node: str, action: object) -> None: ...
+
+    def add_edge(self, start_key: object, end_key: object) -> None: ...
+
+    def add_conditional_edges(
+        self,
+        source: str,
+        path: object,
+        path_map: dict[str, object],
+    ) -> None: ...
+
+    def compile(self) -> _GraphInvoker: ...
+
+
+class _InstrumentedGraph:
+    def __init__(self, graph: _GraphInvoker):
+        self.graph: _GraphInvoker = graph
+
+    def invoke(self, input: object) -> object:
+        profile = active_profile()
+        if profile is None:
+            return self.graph.invoke(input)
+        with profile.graph_run():
+            return self.graph.invoke(input)
+
+
+class _InstrumentedGraphBuilder:
+    """노드 action을 utils.instrumentation 계측으로 감싸는 builder 래퍼."""
+
+    def __init__(self, builder: _GraphBuilder, graph_name: str):
+        self.builder: _GraphBuilder = builder
+        self.graph_name: str = graph_name
+
+    def add_node(self, node: str, action: object) -> None:
+        self.builder.add_node(
+            node,
+            instrument_node(self.graph_name, node, cast(Callable[..., object], action)),
+        )
+
+    def add_edge(self, start_key: object, end_key: object) -> None:
+        self.builder.add_edge(start_key, end_key)
+
+    def add_conditional_edges(
+        self,
+        source: str,
+        path: object,
+        path_map: dict[str, object],
+    ) -> None:
+        self.builder.add_conditional_edges(source, path, path_map)
+
+    def compile(self) -> _InstrumentedGraph:
+        return _InstrumentedGraph(self.builder.compile())
+
+
+def resolve_state_graph_factory(
+    backend: GraphBackend | None = None,
+    *,
+    graph_name: str | None = None,
+) -> object:
+    """
+    그래프 builder factory를 반환한다.
+    - "langgraph": LangGraph StateGraph
+    - "compiled": 같은 builder 프로토콜의 경량 실행기(agents.graph_executor)
+    - None이면 settings.GRAPH_BACKEND를 따른다.
+    - graph_name이 주어지면 노드별 latency/LLM 호출 계측 래퍼를 씌운다.
+    """
+    selected = backend or GRAPH_BACKEND
+    if selected == "compiled":
+        from .graph_executor import CompiledStateGraph
+
+        factory = cast(Callable[[type], _GraphBuilder], CompiledStateGraph)
+    else:
+        factory = cast(Callable[[type], _GraphBuilder], _load_state_factory())
+    if graph_name is None:
+        return factory
+
+    def instrumented_factory(state_schema: type) -> _InstrumentedGraphBuilder:
+        return _InstrumentedGraphBuilder(factory(state_schema), graph_name)
+
+    return instrumented_factory
+
+
+GRAPH_RUNNER_KEY = "runner"
+"""공유 그래프의 노드가 에이전트별 의존성(runner)을 꺼내는 state 키."""
+
+_SHARED_GRAPHS: dict[tuple[str, str], object] = {}
+_SHARED_GRAPHS_LOCK = threading.Lock()
+
+TGraph = TypeVar("TGraph")
+
+
+def runner_action(method_name: str) -> Callable[[Mapping[str, object]], object]:
+    """
+    state[GRAPH_RUNNER_KEY]에 담긴 runner의 메서드를 호출하는 노드/라우터를 만든다.
+    - bound method 대신 사용해 컴파일된 그래프가 특정 에이전트에 묶이지 않게 한다.
+    """
+
+    def action(state: Mapping[str, object]) -> object:
+        method = cast(
+            Callable[[Mapping[str, object]], object],
+            getattr(state[GRAPH_RUNNER_KEY], method_name),
+        )
+        return method(state)
+
+    action.__name__ = method_name
+    return action
+
+
+def shared_graph(
+    graph_name: str,
+    backend: GraphBackend | None,
+    build: Callable[[GraphBackend], TGraph],
+) -> TGraph:
+    """
+    (graph_name, backend)마다 프로세스에서 한 번만 컴파일한 그래프를 반환한다.
+    - build는 runner_action 노드만 사용해야 한다(에이전트 간 공유).
+    - 계측 래퍼는 호출 시점의 profile을 보므로 공유해도 된다.
+    """
+    selected: GraphBackend = backend or GRAPH_BACKEND
+    key = (graph_name, selected)
+    with _SHARED_GRAPHS_LOCK:
+        graph = _SHARED_GRAPHS.get(key)
+        if graph is None:
+            graph = build(selected)
+            _SHARED_GRAPHS[key] = graph
+    return cast(TGraph, graph)
+
+
+def shared_graph_count() -> int:
+    return len(_SHARED_GRAPHS)
+
 
+def clear_shared_graphs() -> None:
+    """캐시된 그래프를 비운다. 이미 만들어진 runner는 기존 그래프를 계속 쓴다."""
+    with _SHARED_GRAPHS_LOCK:
+        _SHARED_GRAPHS.clear()
 
-GRAPH_STATE_FACTORY = _load_state_factory()
 
 TStateValue = TypeVar("TStateValue")
 
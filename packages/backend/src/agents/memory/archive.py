@@ -0,0 +1,65 @@
+import datetime
+import json
+from pathlib import Path
+from typing import cast
+
+from .memory_object import MemoryObject, memory_from_record, memory_to_record
+
+
+class MemoryArchive:
+    """
+    hot retrieval 대상에서 빠진 메모리를 디스크에 보관하는 cold tier.
+
+    - append-only JSON lines 파일 하나에 메모리 레코드를 누적한다.
+    - 각 레코드는 압축한 SUMMARY 노드 ID(summary_id)와 보관 시각(archived_at)을 함께 가진다.
+    """
+
+    def __init__(self, path: str | Path):
+        self.path: Path = Path(path)
+        self._archived_count: int | None = None
+
+    @property
+    def archived_count(self) -> int:
+        if self._archived_count is None:
+            self._archived_count = sum(1 for _ in self._iter_records())
+        return self._archived_count
+
+    def append(
+        self,
+        memories: list[MemoryObject],
+        *,
+        summary_id: int | None,
+        archived_at: datetime.datetime,
+    ) -> None:
+        if not memories:
+            return
+
+        archived_count = self.archived_count
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with self.path.open("a", encoding="utf-8") as archive_file:
+            for memory in memories:
+                record = memory_to_record(memory)
+                record["summary_id"] = summary_id
+                record["archived_at"] = archived_at.isoformat()
+                archive_file.write(json.dumps(record, ensure_ascii=False) + "\n")
+
+        self._archived_count = archived_count + len(memories)
+
+    def load(self, memory_ids: set[int] | None = None) -> list[MemoryObject]:
+        """보관된 메모리를 복원한다. memory_ids가 주어지면 해당 ID만 반환한다."""
+        memories: list[MemoryObject] = []
+        for record in self._iter_records():
+            if memory_ids is not None and record.get("id") not in memory_ids:
+                continue
+            memories.append(memory_from_record(record))
+        return memories
+
+    def _iter_records(self):
+        if not self.path.exists():
+            return
+        with self.path.open(encoding="utf-8") as archive_file:
+            for line in archive_file:
+                stripped = line.strip()
+                if not stripped:
+                    continue
+                yield cast(dict[str, object], json.loads(stripped))
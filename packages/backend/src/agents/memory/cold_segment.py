@@ -0,0 +1,97 @@
+from dataclasses import dataclass, replace
+from pathlib import Path
+
+import numpy as np
+
+from .memory_object import MemoryObject
+
+
+@dataclass(frozen=True)
+class MemoryTierConfig:
+    """MemoryStream hot/cold 2-tier 구성 설정."""
+
+    segment_dir: str | Path
+    """cold segment 임베딩(.npy)을 저장할 디렉터리."""
+    hot_capacity: int = 500
+    """hot tier(RAM)에 유지할 최대 메모리 수. 초과 시 cold segment로 내린다."""
+    segment_size: int = 250
+    """한 번에 봉인(seal)할 cold segment의 최대 메모리 수."""
+    hot_importance_floor: int = 7
+    """이 중요도 이상인 메모리는 hot tier에 고정한다."""
+    cold_relevance_bound: float = 0.5
+    """hot tier의 최대 relevance(cosine)가 이 값보다 낮을 때만 cold segment를 검색한다."""
+
+
+@dataclass(frozen=True)
+class MemoryTierStats:
+    hot_count: int
+    """hot tier(RAM)에 있는 메모리 수."""
+    cold_count: int
+    """cold segment에 있는 메모리 수."""
+    cold_segment_count: int
+    """살아있는 cold segment 수."""
+    demotions: int
+    """hot -> cold로 내려간 누적 메모리 수."""
+    promotions: int
+    """검색 결과로 cold -> hot으로 올라온 누적 메모리 수."""
+    cold_searches: int
+    """cold segment까지 검색한 누적 retrieve 횟수."""
+    hot_only_searches: int
+    """hot tier만 검색한 누적 retrieve 횟수."""
+
+
+class ColdSegment:
+    """
+    봉인된 cold memory 묶음.
+    임베딩은 .npy 파일에 기록한 뒤 memory-map으로 열어 RAM에 올리지 않는다.
+    """
+
+    def __init__(self, *, path: Path, memories: list[MemoryObject]):
+        if not memories:
+            raise ValueError("ColdSegment requires at least one memory")
+
+        self.path: Path = path
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        np.save(
+            self.path,
+            np.stack([np.asarray(m.embedding, dtype=np.float32) for m in memories]),
+        )
+        self.embeddings: np.ndarray = np.load(self.path, mmap_mode="r")
+        self._memories_by_id: dict[int, MemoryObject] = {
+            memory.id: replace(memory, embedding=self.embeddings[row])
+            for row, memory in enumerate(memories)
+        }
+
+    @property
+    def live_count(self) -> int:
+        return len(self._memories_by_id)
+
+    def contains(self, memory_id: int) -> bool:
+        return memory_id in self._memories_by_id
+
+    def get(self, memory_id: int) -> MemoryObject | None:
+        return self._memories_by_id.get(memory_id)
+
+    def memory_ids(self) -> set[int]:
+        return set(self._memories_by_id)
+
+    def live_memories(self) -> list[MemoryObject]:
+        return list(self._memories_by_id.values())
+
+    def take(self, memory_id: int) -> MemoryObject:
+        """segment에서 메모리를 꺼내 임베딩을 RAM으로 복사한 hot 메모리로 반환한다."""
+        memory = self._memories_by_id.pop(memory_id)
+        memory.embedding = np.array(memory.embedding, dtype=np.float32)
+        return memory
+
+    def discard(self, memory_ids: set[int]) -> list[MemoryObject]:
+        return [
+            self.take(memory_id)
+            for memory_id in list(self._memories_by_id)
+            if memory_id in memory_ids
+        ]
+
+    def release(self) -> None:
+        """살아있는 메모리가 없는 segment의 mmap과 파일을 정리한다."""
+        del self.embeddings
+        self.path.unlink(missing_ok=True)
@@ -0,0 +1,182 @@
+import datetime
+from dataclasses import dataclass
+from typing import Protocol
+
+import numpy as np
+
+from .archive import MemoryArchive
+from .memory_object import MemoryObject, NodeType
+from .memory_stream import MemoryStream
+
+
+@dataclass(frozen=True)
+class ConsolidationConfig:
+    """오래된 관찰을 요약 노드로 압축하는 정책 설정."""
+
+    check_interval: int = 50
+    """몇 개의 관찰이 추가될 때마다 압축을 시도할지."""
+    min_age_hours: float = 24.0
+    """압축 후보가 되기 위한 최소 경과 시간(created_at 기준)."""
+    max_importance: int = 3
+    """압축 후보가 되기 위한 최대 중요도."""
+    min_hours_since_access: float = 12.0
+    """압축 후보가 되기 위해 마지막 검색 이후 지나야 하는 최소 시간."""
+    similarity_threshold: float = 0.85
+    """같은 클러스터로 묶기 위한 클러스터 중심과의 최소 cosine similarity."""
+    max_time_gap_hours: float = 6.0
+    """같은 클러스터 안에서 인접한 관찰 간 허용되는 최대 시간 간격."""
+    min_cluster_size: int = 3
+    """요약 노드로 교체하기 위한 최소 클러스터 크기."""
+    max_cluster_size: int = 20
+    """하나의 요약 노드가 압축할 수 있는 최대 관찰 수."""
+
+
+@dataclass(frozen=True)
+class ConsolidationResult:
+    summary_ids: list[int]
+    """이번 압축에서 새로 만든 SUMMARY 노드 ID 목록."""
+    archived_count: int
+    """hot stream에서 cold archive로 이동한 관찰 수."""
+
+
+class ClusterSummarizer(Protocol):
+    def summarize(self, memories: list[MemoryObject]) -> str: ...
+
+
+class ExtractiveClusterSummarizer:
+    """LLM 호출 없이 클러스터 대표 관찰과 기간으로 요약 문장을 만든다."""
+
+    def summarize(self, memories: list[MemoryObject]) -> str:
+        representative = max(
+            memories, key=lambda m: (m.importance, m.last_accessed_at, m.created_at)
+        )
+        start = min(m.created_at for m in memories)
+        end = max(m.created_at for m in memories)
+        return (
+            f"[{start.isoformat()} ~ {end.isoformat()}] "
+            f"{len(memories)}개의 유사한 관찰 요약: {representative.content}"
+        )
+
+
+class MemoryConsolidator:
+    """
+    오래되고 중요도가 낮으며 거의 검색되지 않은 관찰을 시간 순서로 클러스터링해
+    SUMMARY 노드 하나로 교체하고, 원본은 MemoryArchive(cold tier)로 옮긴다.
+
+    - 클러스터링은 created_at 순서의 단일 패스로 수행해 O(n)으로 유지한다.
+    - SUMMARY 임베딩은 원본 임베딩 평균, 중요도는 원본 최대값을 사용해 추가 LLM 호출이 없다.
+    """
+
+    def __init__(
+        self,
+        *,
+        archive: MemoryArchive,
+        config: ConsolidationConfig | None = None,
+        summarizer: ClusterSummarizer | None = None,
+    ):
+        self.archive: MemoryArchive = archive
+        self.config: ConsolidationConfig = config or ConsolidationConfig()
+        self.summarizer: ClusterSummarizer = summarizer or ExtractiveClusterSummarizer()
+        self._observations_since_check: int = 0
+        self.total_summaries: int = 0
+        self.total_archived: int = 0
+
+    def record_observation(self) -> bool:
+        """관찰 추가를 기록하고, 압축을 시도할 시점이면 True를 반환한다."""
+        self._observations_since_check += 1
+        return self._observations_since_check >= self.config.check_interval
+
+    def consolidate(
+        self,
+        memory_stream: MemoryStream,
+        *,
+        now: datetime.datetime,
+    ) -> ConsolidationResult:
+        self._observations_since_check = 0
+        clusters = self._build_clusters(self._candidates(memory_stream, now=now))
+
+        summary_ids: list[int] = []
+        archived_count = 0
+        for cluster in clusters:
+            summary = memory_stream.add_memory(
+                node_type=NodeType.SUMMARY,
+                citations=[m.id for m in cluster],
+                content=self.summarizer.summarize(cluster),
+                now=max(m.created_at for m in cluster),
+                importance=max(m.importance for m in cluster),
+                embedding=self._centroid(cluster),
+            )
+            summary.last_accessed_at = max(m.last_accessed_at for m in cluster)
+
+            archived = memory_stream.remove_memories({m.id for m in cluster})
+            self.archive.append(archived, summary_id=summary.id, archived_at=now)
+            summary_ids.append(summary.id)
+            archived_count += len(archived)
+
+        self.total_summaries += len(summary_ids)
+        self.total_archived += archived_count
+        return ConsolidationResult(
+            summary_ids=summary_ids,
+            archived_count=archived_count,
+        )
+
+    def _candidates(
+        self,
+        memory_stream: MemoryStream,
+        *,
+        now: datetime.datetime,
+    ) -> list[MemoryObject]:
+        config = self.config
+        created_before = now - datetime.timedelta(hours=config.min_age_hours)
+        accessed_before = now - datetime.timedelta(hours=config.min_hours_since_access)
+        candidates = [
+            m
+            for m in memory_stream.memories
+            if m.node_type == NodeType.OBSERVATION
+            and m.importance <= config.max_importance
+            and m.created_at <= created_before
+            and m.last_accessed_at <= accessed_before
+        ]
+        candidates.sort(key=lambda m: (m.created_at, m.id))
+        return candidates
+
+    def _build_clusters(
+        self, candidates: list[MemoryObject]
+    ) -> list[list[MemoryObject]]:
+        config = self.config
+        max_gap = datetime.timedelta(hours=config.max_time_gap_hours)
+        clusters: list[list[MemoryObject]] = []
+        current: list[MemoryObject] = []
+        centroid_sum: np.ndarray | None = None
+
+        for memory in candidates:
+            unit = _unit(memory.embedding)
+            if current and centroid_sum is not None:
+                within_gap = memory.created_at - current[-1].created_at <= max_gap
+                centroid = _unit(centroid_sum)
+                similar = float(np.dot(centroid, unit)) >= config.similarity_threshold
+                if within_gap and similar and len(current) < config.max_cluster_size:
+                    current.append(memory)
+                    centroid_sum = centroid_sum + unit
+                    continue
+                if len(current) >= config.min_cluster_size:
+                    clusters.append(current)
+            current = [memory]
+            centroid_sum = unit
+
+        if len(current) >= config.min_cluster_size:
+            clusters.append(current)
+        return clusters
+
+    @staticmethod
+    def _centroid(cluster: list[MemoryObject]) -> np.ndarray:
+        return _unit(np.mean([_unit(m.embedding) for m in cluster], axis=0)).astype(
+            np.float32
+        )
+
+
+def _unit(vector: np.ndarray) -> np.ndarray:
+    norm = float(np.linalg.norm(vector))
+    if norm == 0:
+        return np.asarray(vector, dtype=float)
+    return np.asarray(vector, dtype=float) / norm
@@ -8,6 +8,7 @@ from llm import ImportanceScorer, ImportanceScoringContext, clamp_importance
 from llm.embedding_encoder import EmbeddingEncodingContext
 from llm.llm_gateway import InsightWithCitation
 
+from .consolidation import ConsolidationResult, MemoryConsolidator
 from .memory_object import MemoryObject, NodeType
 from .memory_stream import MemoryStream
 
@@ -31,6 +32,18 @@ class ReflectionContext:
     current_plan: str | None = None
 
 
+@dataclass(frozen=True)
+class ReflectionWriteResult:
+    memory: MemoryObject
+    """저장되었거나 병합 대상이 된 REFLECTION 메모리."""
+    merged: bool
+    """기존 REFLECTION 노드에 병합되었는지 여부."""
+    similarity: float
+    """병합 판단에 사용한 최대 cosine similarity (정확히 같은 문장이면 1.0)."""
+    saved_llm_calls: int = 0
+    """병합으로 생략된 LLM 호출 수 (임베딩/중요도 산정)."""
+
+
 class EmbeddingEncoder(Protocol):
     def encode(self, context: EmbeddingEncodingContext) -> np.ndarray: ...
 
@@ -42,10 +55,13 @@ class MemoryManager:
         memory_stream: MemoryStream,
         importance_scorer: ImportanceScorer,
         embedding_encoder: EmbeddingEncoder,
+        consolidator: MemoryConsolidator | None = None,
     ):
         self.memory_stream: MemoryStream = memory_stream
         self.importance_scorer: ImportanceScorer = importance_scorer
         self.embedding_encoder: EmbeddingEncoder = embedding_encoder
+        self.consolidator: MemoryConsolidator | None = consolidator
+        self.last_consolidation: ConsolidationResult | None = None
 
     def get_recent_memories(
         self,
@@ -67,19 +83,68 @@ class MemoryManager:
             sorted_memories = sorted_memories[:limit]
         return sorted_memories
 
+    def get_memories_since(
+        self,
+        *,
+        after_memory_id: int | None,
+        limit: int | None = None,
+    ) -> list[MemoryObject]:
+        """
+        after_memory_id 이후에 추가된 메모리를 최신순으로 반환한다.
+        - after_memory_id가 None이면 전체 메모리를 대상으로 한다.
+        - 기존 관찰을 압축한 SUMMARY 노드는 새 경험이 아니므로 제외한다.
+        - limit이 주어지면 상위 limit개까지만 반환한다.
+        """
+        memories = [
+            m
+            for m in self.memory_stream.memories
+            if m.node_type != NodeType.SUMMARY
+            and (after_memory_id is None or m.id > after_memory_id)
+        ]
+
+        sorted_memories = sorted(memories, key=lambda x: x.created_at, reverse=True)
+        if limit is not None:
+            sorted_memories = sorted_memories[:limit]
+        return sorted_memories
+
+    def get_top_reflections(
+        self,
+        *,
+        limit: int,
+        max_memory_id: int | None = None,
+    ) -> list[MemoryObject]:
+        """
+        REFLECTION 메모리를 중요도 내림차순(동점 시 최신 created_at 우선)으로 반환한다.
+        - max_memory_id가 주어지면 해당 ID 이하의 메모리만 대상으로 한다.
+        """
+        if limit < 1:
+            return []
+
+        reflections = [
+            m
+            for m in self.memory_stream.memories
+            if m.node_type == NodeType.REFLECTION
+            and (max_memory_id is None or m.id <= max_memory_id)
+        ]
+        reflections.sort(key=lambda x: (x.importance, x.created_at), reverse=True)
+        return reflections[:limit]
+
     def get_retrieval_memories(
         self,
         query: str,
         *,
         current_time: datetime.datetime,
         top_k: int = 3,
+        query_embedding: np.ndarray | None = None,
     ) -> list[MemoryObject]:
         """
         검색 쿼리를 기반으로 관련 메모리를 반환한다.
+        - query_embedding을 주면 쿼리를 다시 임베딩하지 않는다(미리 계산된 턴 재사용).
         """
-        query_embedding = self.embedding_encoder.encode(
-            EmbeddingEncodingContext(text=query)
-        )
+        if query_embedding is None:
+            query_embedding = self.embedding_encoder.encode(
+                EmbeddingEncodingContext(text=query)
+            )
 
         return self.memory_stream.retrieve(
             query_embedding=query_embedding,
@@ -98,16 +163,12 @@ class MemoryManager:
     ) -> MemoryObject:
         final_importance = importance
         if final_importance is None:
-            scoring_context = ImportanceScoringContext(
-                observation=content,
-                agent_name=context.agent_name,
-                identity_stable_set=context.identity_stable_set,
-                current_plan=context.current_plan,
+            final_importance = self.score_observation_importance(
+                content=content, context=context
             )
-            final_importance = self.importance_scorer.score(scoring_context)
         final_importance = clamp_importance(final_importance)
 
-        self.memory_stream.add_memory(
+        memory = self.memory_stream.add_memory(
             node_type=NodeType.OBSERVATION,
             citations=None,
             content=content,
@@ -116,7 +177,29 @@ class MemoryManager:
             embedding=embedding,
         )
 
-        return self.memory_stream.memories[-1]
+        if self.consolidator is not None and self.consolidator.record_observation():
+            self.last_consolidation = self.consolidator.consolidate(
+                self.memory_stream, now=now
+            )
+
+        return memory
+
+    def score_observation_importance(
+        self,
+        *,
+        content: str,
+        context: ObservationContext,
+    ) -> int:
+        return clamp_importance(
+            self.importance_scorer.score(
+                ImportanceScoringContext(
+                    observation=content,
+                    agent_name=context.agent_name,
+                    identity_stable_set=context.identity_stable_set,
+                    current_plan=context.current_plan,
+                )
+            )
+        )
 
     def create_observation_from_text(
         self,
@@ -148,7 +231,78 @@ class MemoryManager:
         embedding = self.embedding_encoder.encode(
             EmbeddingEncodingContext(text=insight.context)
         )
+        return self._add_reflection(
+            insight,
+            now=now,
+            context=context,
+            embedding=embedding,
+            importance=importance,
+        )
 
+    def write_reflection(
+        self,
+        insight: InsightWithCitation,
+        *,
+        now: datetime.datetime,
+        context: ReflectionContext,
+        dedup_threshold: float,
+        importance: int | None = None,
+    ) -> ReflectionWriteResult:
+        """
+        insight를 REFLECTION으로 저장하되, 기존 REFLECTION과 거의 같으면 병합한다.
+
+        - 정규화된 문장이 같은 REFLECTION이 있으면 임베딩 없이 바로 병합
+        - 그 외에는 임베딩 후 cosine similarity >= dedup_threshold인 노드에 병합
+        - 병합 시 citations는 합집합, last_accessed_at은 now로 갱신
+        """
+        exact_match = self._find_reflection_by_content(insight.context)
+        if exact_match is not None:
+            self._merge_reflection(exact_match, insight=insight, now=now)
+            return ReflectionWriteResult(
+                memory=exact_match,
+                merged=True,
+                similarity=1.0,
+                saved_llm_calls=1 + (1 if importance is None else 0),
+            )
+
+        embedding = self.embedding_encoder.encode(
+            EmbeddingEncodingContext(text=insight.context)
+        )
+        nearest = self.memory_stream.most_similar(
+            embedding, node_type=NodeType.REFLECTION
+        )
+        if nearest is not None and nearest[1] >= dedup_threshold:
+            existing, similarity = nearest
+            self._merge_reflection(existing, insight=insight, now=now)
+            return ReflectionWriteResult(
+                memory=existing,
+                merged=True,
+                similarity=similarity,
+                saved_llm_calls=1 if importance is None else 0,
+            )
+
+        memory = self._add_reflection(
+            insight,
+            now=now,
+            context=context,
+            embedding=embedding,
+            importance=importance,
+        )
+        return ReflectionWriteResult(
+            memory=memory,
+            merged=False,
+            similarity=nearest[1] if nearest is not None else 0.0,
+        )
+
+    def _add_reflection(
+        self,
+        insight: InsightWithCitation,
+        *,
+        now: datetime.datetime,
+        context: ReflectionContext,
+        embedding: np.ndarray,
+        importance: int | None,
+    ) -> MemoryObject:
         final_importance = importance
         if final_importance is None:
             scoring_context = ImportanceScoringContext(
@@ -160,22 +314,48 @@ class MemoryManager:
             final_importance = self.importance_scorer.score(scoring_context)
         final_importance = clamp_importance(final_importance)
 
-        known_memory_ids = {memory.id for memory in self.memory_stream.memories}
+        return self.memory_stream.add_memory(
+            node_type=NodeType.REFLECTION,
+            citations=self._filter_citations(insight.citation_memory_ids),
+            content=insight.context,
+            now=now,
+            importance=final_importance,
+            embedding=embedding,
+        )
+
+    def _filter_citations(self, citation_memory_ids: list[int]) -> list[int]:
+        known_memory_ids = self.memory_stream.memory_ids()
         filtered_citations: list[int] = []
-        for citation_memory_id in insight.citation_memory_ids:
+        for citation_memory_id in citation_memory_ids:
             if citation_memory_id not in known_memory_ids:
                 continue
             if citation_memory_id in filtered_citations:
                 continue
             filtered_citations.append(citation_memory_id)
+        return filtered_citations
 
-        self.memory_stream.add_memory(
-            node_type=NodeType.REFLECTION,
-            citations=filtered_citations,
-            content=insight.context,
-            now=now,
-            importance=final_importance,
-            embedding=embedding,
-        )
+    def _find_reflection_by_content(self, content: str) -> MemoryObject | None:
+        normalized = " ".join(content.split()).lower()
+        for memory in reversed(self.memory_stream.memories):
+            if memory.node_type != NodeType.REFLECTION:
+                continue
+            if " ".join(memory.content.split()).lower() == normalized:
+                return memory
+        return None
 
-        return self.memory_stream.memories[-1]
+    def _merge_reflection(
+        self,
+        memory: MemoryObject,
+        *,
+        insight: InsightWithCitation,
+        now: datetime.datetime,
+    ) -> None:
+        merged_citations = list(memory.citations or [])
+        for citation_memory_id in self._filter_citations(insight.citation_memory_ids):
+            if citation_memory_id == memory.id:
+                continue
+            if citation_memory_id not in merged_citations:
+                merged_citations.append(citation_memory_id)
+        memory.citations = merged_citations
+        memory.last_accessed_at = max(memory.last_accessed_at, now)
+        self.memory_stream.mark_changed(memory.id)
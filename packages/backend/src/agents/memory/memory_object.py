@@ -1,7 +1,8 @@
+import base64
 import datetime
 from dataclasses import dataclass
 from enum import Enum
-from typing import List, Optional
+from typing import List, Optional, cast
 
 import numpy as np
 
@@ -13,6 +14,8 @@ class NodeType(Enum):
     """ 성찰한 내용 """
     PLAN = "PLAN"
     """ 계획 """
+    SUMMARY = "SUMMARY"
+    """ 오래된 관찰 묶음을 압축한 요약 """
 
 
 @dataclass
@@ -26,10 +29,10 @@ class MemoryObject:
     """고유 식별자"""
 
     node_type: NodeType
-    """노드 타입(OBSERVATION, REFLECTION, PLAN)"""
+    """노드 타입(OBSERVATION, REFLECTION, PLAN, SUMMARY)"""
 
     citations: Optional[List[int]]
-    """인용된 메모리 ID 목록, OBSERVATION은 항상 None"""
+    """인용된 메모리 ID 목록, OBSERVATION은 항상 None (SUMMARY는 압축된 원본 ID 목록)"""
 
     content: str
     """메모리 내용 (자연어)"""
@@ -45,3 +48,43 @@ class MemoryObject:
 
     embedding: np.ndarray
     """content의 임베딩 벡터 (Relevance 계산용)"""
+
+
+def memory_to_record(memory: MemoryObject) -> dict[str, object]:
+    """MemoryObject를 JSON 직렬화 가능한 dict로 변환한다. 임베딩은 float32 base64로 저장."""
+    embedding = np.asarray(memory.embedding, dtype=np.float32)
+    return {
+        "id": memory.id,
+        "node_type": memory.node_type.value,
+        "citations": list(memory.citations) if memory.citations is not None else None,
+        "content": memory.content,
+        "created_at": memory.created_at.isoformat(),
+        "last_accessed_at": memory.last_accessed_at.isoformat(),
+        "importance": memory.importance,
+        "embedding": base64.b64encode(embedding.tobytes()).decode("ascii"),
+    }
+
+
+def memory_from_record(record: dict[str, object]) -> MemoryObject:
+    """memory_to_record 결과를 MemoryObject로 복원한다."""
+    raw_citations = record.get("citations")
+    citations = (
+        [int(cast(int, value)) for value in cast(list[object], raw_citations)]
+        if isinstance(raw_citations, list)
+        else None
+    )
+    embedding = np.frombuffer(
+        base64.b64decode(str(record["embedding"])), dtype=np.float32
+    ).copy()
+    return MemoryObject(
+        id=int(cast(int, record["id"])),
+        node_type=NodeType(str(record["node_type"])),
+        citations=citations,
+        content=str(record["content"]),
+        created_at=datetime.datetime.fromisoformat(str(record["created_at"])),
+        last_accessed_at=datetime.datetime.fromisoformat(
+            str(record["last_accessed_at"])
+        ),
+        importance=int(cast(int, record["importance"])),
+        embedding=embedding,
+    )
@@ -1,20 +1,59 @@
+import bisect
 import datetime
+from dataclasses import dataclass
+from pathlib import Path
 from typing import List, Optional
 
 import numpy as np
 from settings import EMBEDDING_DIMENSION
 from utils.math import cosine_similarity, validate_embedding_dimension
 
+from .cold_segment import ColdSegment, MemoryTierConfig, MemoryTierStats
 from .memory_object import MemoryObject, NodeType
 
 
+@dataclass(frozen=True)
+class MemoryStreamChanges:
+    """직전 drain_changes 이후 스트림 변경분(체크포인트 delta용)."""
+
+    upserted: list[MemoryObject]
+    """새로 추가됐거나 병합으로 필드가 바뀐 메모리(id 오름차순)."""
+    accessed: list[MemoryObject]
+    """검색으로 last_accessed_at만 바뀐 메모리(id 오름차순). 임베딩을 다시 쓰지 않아도 된다."""
+    removed: list[int]
+    """스트림에서 제거된 메모리 ID."""
+    next_id: int
+    """다음에 발급할 메모리 ID."""
+
+
 class MemoryStream:
     """
     MemoryStream은 관찰과 생각을 시간 순서대로 저장하는 구조입니다. 각 기억은 MemoryObject로 표현되며, 중요도와 임베딩을 포함합니다.
+
+    tier_config가 주어지면 hot/cold 2-tier로 동작한다.
+    - `memories`는 RAM에 있는 hot tier이며, hot_capacity를 넘으면 중요도가 낮고
+      오래 접근되지 않은 메모리를 봉인된 cold segment(mmap된 .npy)로 내린다.
+    - retrieve는 hot tier의 최대 relevance가 cold_relevance_bound보다 낮거나
+      hot 후보가 top_k보다 적을 때만 cold segment를 함께 검색한다.
+    - cold에서 검색된 메모리는 hot tier로 다시 올라온다.
+
+    추가/변경/제거된 메모리 ID를 따로 모아 두므로 drain_changes는 전체 메모리 수가 아니라
+    그 사이 변경 수에 비례하는 비용으로 체크포인트 delta를 만든다.
     """
 
-    def __init__(self):
+    def __init__(self, tier_config: MemoryTierConfig | None = None):
         self.memories: list[MemoryObject] = []
+        self._next_id: int = 0
+        self.tier_config: MemoryTierConfig | None = tier_config
+        self._cold_segments: list[ColdSegment] = []
+        self._sealed_segment_count: int = 0
+        self._demotions: int = 0
+        self._promotions: int = 0
+        self._cold_searches: int = 0
+        self._hot_only_searches: int = 0
+        self._changed_ids: set[int] = set()
+        self._removed_ids: set[int] = set()
+        self._accessed_ids: set[int] = set()
 
     def add_memory(
         self,
@@ -24,13 +63,13 @@ class MemoryStream:
         now: datetime.datetime,
         importance: int,
         embedding: np.ndarray,
-    ):
+    ) -> MemoryObject:
         """
-        새로운 관찰(Observation)이나 생각(Reflection)을 스트림에 추가한다.
+        새로운 관찰(Observation)이나 생각(Reflection)을 스트림에 추가하고 추가된 메모리를 반환한다.
         """
         validate_embedding_dimension(embedding, expected_dimension=EMBEDDING_DIMENSION)
         new_memory = MemoryObject(
-            id=len(self.memories),
+            id=self._next_id,
             node_type=node_type,
             citations=citations,
             content=content,
@@ -40,6 +79,101 @@ class MemoryStream:
             embedding=embedding,
         )
         self.memories.append(new_memory)
+        self._next_id += 1
+        self._changed_ids.add(new_memory.id)
+        _ = self._demote_if_needed(keep=new_memory)
+        return new_memory
+
+    def remove_memories(self, memory_ids: set[int]) -> list[MemoryObject]:
+        """
+        memory_ids에 해당하는 메모리를 스트림에서 제거하고 제거된 메모리를 반환한다.
+        - 제거 후에도 새 메모리 ID는 재사용되지 않는다.
+        """
+        removed = [m for m in self.memories if m.id in memory_ids]
+        if removed:
+            self.memories = [m for m in self.memories if m.id not in memory_ids]
+        for segment in self._cold_segments:
+            removed.extend(segment.discard(memory_ids))
+        self._release_empty_segments()
+        removed_ids = {m.id for m in removed}
+        self._changed_ids -= removed_ids
+        self._accessed_ids -= removed_ids
+        self._removed_ids |= removed_ids
+        return removed
+
+    def memory_ids(self) -> set[int]:
+        """hot/cold tier 전체의 메모리 ID 집합을 반환한다."""
+        ids = {m.id for m in self.memories}
+        for segment in self._cold_segments:
+            ids |= segment.memory_ids()
+        return ids
+
+    @property
+    def next_id(self) -> int:
+        return self._next_id
+
+    def mark_changed(self, memory_id: int) -> None:
+        """스트림 밖에서 메모리 필드를 바꿨을 때 호출해 다음 drain_changes에 포함한다."""
+        self._changed_ids.add(memory_id)
+
+    def drain_changes(self) -> MemoryStreamChanges:
+        """직전 호출 이후 변경분을 반환하고 변경 기록을 비운다."""
+        changes = MemoryStreamChanges(
+            upserted=self._existing(self._changed_ids),
+            accessed=self._existing(self._accessed_ids - self._changed_ids),
+            removed=sorted(self._removed_ids),
+            next_id=self._next_id,
+        )
+        self._changed_ids = set()
+        self._removed_ids = set()
+        self._accessed_ids = set()
+        return changes
+
+    def get_memory(self, memory_id: int) -> MemoryObject | None:
+        """hot tier(id 오름차순)는 이분 탐색으로, 없으면 cold segment에서 찾는다."""
+        index = bisect.bisect_left(self.memories, memory_id, key=lambda m: m.id)
+        if index < len(self.memories) and self.memories[index].id == memory_id:
+            return self.memories[index]
+        for segment in self._cold_segments:
+            memory = segment.get(memory_id)
+            if memory is not None:
+                return memory
+        return None
+
+    def all_memories(self) -> list[MemoryObject]:
+        """hot/cold tier 전체 메모리를 id 오름차순으로 반환한다."""
+        memories = list(self.memories)
+        for segment in self._cold_segments:
+            memories.extend(segment.live_memories())
+        return sorted(memories, key=lambda m: m.id)
+
+    def restore(self, memories: list[MemoryObject], *, next_id: int) -> None:
+        """
+        체크포인트의 메모리로 스트림을 교체한다(임베딩 재계산 없음).
+        - tier_config가 있으면 hot_capacity 안으로 들어올 때까지 cold segment로 내린다.
+        - 복원 자체는 변경으로 기록하지 않는다.
+        """
+        for segment in self._cold_segments:
+            segment.release()
+        self._cold_segments = []
+        self.memories = sorted(memories, key=lambda m: m.id)
+        self._next_id = max(next_id, max((m.id + 1 for m in memories), default=0))
+        while self._demote_if_needed(keep=None):
+            pass
+        self._changed_ids = set()
+        self._removed_ids = set()
+        self._accessed_ids = set()
+
+    def tier_stats(self) -> MemoryTierStats:
+        return MemoryTierStats(
+            hot_count=len(self.memories),
+            cold_count=sum(segment.live_count for segment in self._cold_segments),
+            cold_segment_count=len(self._cold_segments),
+            demotions=self._demotions,
+            promotions=self._promotions,
+            cold_searches=self._cold_searches,
+            hot_only_searches=self._hot_only_searches,
+        )
 
     def retrieve(
         self,
@@ -55,25 +189,96 @@ class MemoryStream:
         - 반환된 memory의 last_accessed_at은 current_time으로 갱신
         """
 
+        candidates = self.memories
+        raw_relevancies = [
+            self._calculate_relevance_score(m, query_embedding) for m in candidates
+        ]
+        cold_memory_ids: set[int] = set()
+        if self._cold_segments:
+            if self._should_search_cold(raw_relevancies, top_k):
+                self._cold_searches += 1
+                cold_memories = [
+                    m
+                    for segment in self._cold_segments
+                    for m in segment.live_memories()
+                ]
+                cold_memory_ids = {m.id for m in cold_memories}
+                candidates = candidates + cold_memories
+                raw_relevancies = raw_relevancies + [
+                    self._calculate_relevance_score(m, query_embedding)
+                    for m in cold_memories
+                ]
+            else:
+                self._hot_only_searches += 1
+
         scores = self._calculate_retrieval_scores(
-            self.memories, query_embedding, current_time
+            candidates, query_embedding, current_time, raw_relevancies=raw_relevancies
         )
 
         sorted_scores = sorted(
             scores, key=lambda x: (x[1], x[0].created_at), reverse=True
         )
-        top_memories = sorted_scores[:top_k]
+        top_memories = [memory for memory, _ in sorted_scores[:top_k]]
+        top_memories = [
+            self._promote(memory) if memory.id in cold_memory_ids else memory
+            for memory in top_memories
+        ]
 
-        for memory, _ in top_memories:
+        for memory in top_memories:
             memory.last_accessed_at = current_time
+            self._accessed_ids.add(memory.id)
+
+        return top_memories
+
+    def most_similar(
+        self,
+        query_embedding: np.ndarray,
+        *,
+        node_type: NodeType | None = None,
+    ) -> tuple[MemoryObject, float] | None:
+        """
+        query_embedding과 cosine similarity가 가장 높은 메모리와 그 유사도를 반환한다.
 
-        return [memory for memory, _ in top_memories]
+        - node_type이 주어지면 해당 타입의 메모리만 후보로 사용
+        - hot tier만 검색한다 (중복 판별용으로 최근/고중요도 메모리면 충분)
+        - 후보가 없거나 query_embedding 차원이 맞지 않으면 None
+        """
+        candidates = [
+            m for m in self.memories if node_type is None or m.node_type == node_type
+        ]
+        if not candidates:
+            return None
+
+        try:
+            validate_embedding_dimension(
+                query_embedding, expected_dimension=EMBEDDING_DIMENSION
+            )
+        except ValueError:
+            return None
+
+        query_norm = float(np.linalg.norm(query_embedding))
+        if query_norm == 0:
+            return None
+
+        matrix = np.stack([m.embedding for m in candidates])
+        norms = np.linalg.norm(matrix, axis=1)
+        dots = matrix @ query_embedding
+        similarities = np.divide(
+            dots,
+            norms * query_norm,
+            out=np.zeros_like(dots, dtype=float),
+            where=norms != 0,
+        )
+        best_index = int(np.argmax(similarities))
+        return candidates[best_index], float(similarities[best_index])
 
     def _calculate_retrieval_scores(
         self,
         memories: list[MemoryObject],
         query_embedding: np.ndarray,
         current_time: datetime.datetime,
+        *,
+        raw_relevancies: list[float] | None = None,
     ) -> list[tuple[MemoryObject, float]]:
         """
         memories의 retrieval score를 계산한다.
@@ -94,9 +299,10 @@ class MemoryStream:
             self._calculate_recency_score(m, current_time) for m in memories
         ]
         raw_importances = [float(m.importance) for m in memories]
-        raw_relevancies = [
-            self._calculate_relevance_score(m, query_embedding) for m in memories
-        ]
+        if raw_relevancies is None:
+            raw_relevancies = [
+                self._calculate_relevance_score(m, query_embedding) for m in memories
+            ]
 
         min_rec, max_rec = min(raw_recencies), max(raw_recencies)
         min_imp, max_imp = min(raw_importances), max(raw_importances)
@@ -113,6 +319,83 @@ class MemoryStream:
 
         return results
 
+    def _should_search_cold(self, hot_relevancies: list[float], top_k: int) -> bool:
+        assert self.tier_config is not None
+        if len(hot_relevancies) < top_k:
+            return True
+        return max(hot_relevancies) < self.tier_config.cold_relevance_bound
+
+    def _existing(self, memory_ids: set[int]) -> list[MemoryObject]:
+        return [
+            memory
+            for memory_id in sorted(memory_ids)
+            if (memory := self.get_memory(memory_id)) is not None
+        ]
+
+    def _demote_if_needed(self, *, keep: MemoryObject | None) -> bool:
+        """
+        hot tier가 hot_capacity를 넘으면 중요도가 hot_importance_floor 미만이고
+        가장 오래 접근되지 않은 메모리부터 segment_size개를 cold segment로 봉인한다.
+        - 방금 추가된 메모리(keep)는 내리지 않는다.
+        - 내릴 수 있는 메모리가 segment_size개 모일 때까지는 봉인하지 않는다. hot tier가
+          고중요도 메모리로 차 있을 때 작은 segment(.npy + mmap)가 끝없이 늘지 않게 한다.
+        - segment를 봉인했으면 True를 반환한다.
+        """
+        config = self.tier_config
+        if config is None or len(self.memories) <= config.hot_capacity:
+            return False
+
+        eligible = [
+            m
+            for m in self.memories
+            if m is not keep and m.importance < config.hot_importance_floor
+        ]
+        if len(eligible) < config.segment_size:
+            return False
+        eligible.sort(key=lambda m: (m.last_accessed_at, m.id))
+        demoted = eligible[: config.segment_size]
+        demoted.sort(key=lambda m: m.id)
+        demoted_ids = {m.id for m in demoted}
+
+        self._cold_segments.append(
+            ColdSegment(path=self._next_segment_path(config), memories=demoted)
+        )
+        self._demotions += len(demoted)
+        self.memories = [m for m in self.memories if m.id not in demoted_ids]
+        return True
+
+    def _next_segment_path(self, config: MemoryTierConfig) -> Path:
+        """이전 실행이 남긴 segment 파일을 덮어쓰지 않도록 비어 있는 번호를 고른다."""
+        while True:
+            path = (
+                Path(config.segment_dir)
+                / f"segment-{self._sealed_segment_count:05d}.npy"
+            )
+            self._sealed_segment_count += 1
+            if not path.exists():
+                return path
+
+    def _promote(self, memory: MemoryObject) -> MemoryObject:
+        for segment in self._cold_segments:
+            if segment.contains(memory.id):
+                promoted = segment.take(memory.id)
+                break
+        else:
+            return memory
+        self._promotions += 1
+        self.memories.append(promoted)
+        self.memories.sort(key=lambda m: m.id)
+        self._release_empty_segments()
+        return promoted
+
+    def _release_empty_segments(self) -> None:
+        empty = [segment for segment in self._cold_segments if segment.live_count == 0]
+        if not empty:
+            return
+        for segment in empty:
+            segment.release()
+        self._cold_segments = [s for s in self._cold_segments if s.live_count > 0]
+
     def _calculate_recency_score(
         self, memory: MemoryObject, current_time: datetime.datetime
     ) -> float:
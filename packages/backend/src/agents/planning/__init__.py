@@ -1,25 +1,44 @@
+from .engine import PlanEngine, PlanEngineStats, PlanExpander, PlanLookup
 from .graph import PlanningGraphRunner
 from .models import (
     DayPlan,
     DayPlanBroadStrokes,
     DayPlanBroadStrokesRequest,
     DayPlanItem,
+    DayReplanRequest,
     HourlyPlan,
     HourlyPlanItem,
     MinutePlan,
     MinutePlanItem,
 )
 from .planner import Planner
+from .store import (
+    ActivePlanItems,
+    PlanStore,
+    StoredDayPlan,
+    plan_from_record,
+    plan_to_record,
+)
 
 __all__ = [
+    "ActivePlanItems",
     "DayPlan",
     "DayPlanBroadStrokes",
     "DayPlanBroadStrokesRequest",
     "DayPlanItem",
+    "DayReplanRequest",
     "HourlyPlan",
     "HourlyPlanItem",
     "MinutePlan",
     "MinutePlanItem",
+    "PlanEngine",
+    "PlanEngineStats",
+    "PlanExpander",
+    "PlanLookup",
+    "PlanStore",
     "Planner",
     "PlanningGraphRunner",
+    "StoredDayPlan",
+    "plan_from_record",
+    "plan_to_record",
 ]
@@ -0,0 +1,293 @@
+"""
+하루 계획을 필요한 구간만 시간/분 단위로 전개하는 계획 엔진.
+
+- lookup(when)은 지금 진행 중인 day 항목만 hourly로, 진행 중인 hourly 항목만
+  minute으로 전개한다(동기). 하루 전체를 미리 전개하지 않는다.
+- 다음 day/hourly 항목의 전개는 백그라운드 스레드에서 미리 수행한다. 그 구간에
+  도달했을 때 아직 계산 중이면 기다렸다가 결과를 쓴다.
+- 전개 결과는 PlanStore에 저장되어 재시작 후에도 다시 생성하지 않는다.
+- 전개가 provider 오류로 실패하면 failures만 세고 상위 계층 항목으로 진행한다.
+  다음 lookup에서 같은 구간을 다시 시도한다.
+"""
+
+import datetime
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from contextlib import suppress
+from dataclasses import dataclass, replace
+from typing import Literal, Protocol, cast
+
+from .models import DayPlanItem, HourlyPlanItem, MinutePlanItem
+from .store import (
+    ActivePlanItems,
+    PlanStore,
+    StoredDayPlan,
+)
+
+PlanLevel = Literal["hourly", "minute"]
+
+_EXPANSION_ERRORS = (RuntimeError, TimeoutError, ValueError)
+"""전개 실패로 보고 상위 계층 항목으로 넘어가는 provider 오류."""
+
+
+class PlanExpander(Protocol):
+    def generate_hourly_plan(
+        self,
+        *,
+        agent_name: str,
+        current_time: datetime.datetime,
+        day_plan_item: DayPlanItem,
+    ) -> list[HourlyPlanItem]: ...
+
+    def generate_minute_plan(
+        self,
+        *,
+        agent_name: str,
+        current_time: datetime.datetime,
+        hourly_plan_item: HourlyPlanItem,
+    ) -> list[MinutePlanItem]: ...
+
+
+@dataclass(frozen=True)
+class PlanLookup:
+    current: ActivePlanItems
+    """when에 진행 중인 항목."""
+    next: ActivePlanItems
+    """계층별로 when 이후 처음 시작하는 항목."""
+
+    @property
+    def current_action(self) -> str | None:
+        item = self.current.minute or self.current.hourly or self.current.day
+        return item.action_content if item is not None else None
+
+    @property
+    def next_action(self) -> str | None:
+        item = self.next.minute or self.next.hourly or self.next.day
+        return item.action_content if item is not None else None
+
+
+@dataclass(frozen=True)
+class PlanEngineStats:
+    hourly_expansions: int = 0
+    """hourly 전개 LLM 호출 수."""
+    minute_expansions: int = 0
+    """minute 전개 LLM 호출 수."""
+    prefetch_scheduled: int = 0
+    """백그라운드로 시작한 다음 구간 전개 수."""
+    prefetch_waits: int = 0
+    """lookup이 진행 중인 백그라운드 전개를 기다린 횟수."""
+    failures: int = 0
+    """예외로 끝난 전개 수."""
+
+
+_ParentItem = DayPlanItem | HourlyPlanItem
+_WindowKey = tuple[PlanLevel, _ParentItem]
+
+
+def _window_key(level: PlanLevel, parent: _ParentItem) -> _WindowKey:
+    # 구간뿐 아니라 항목 내용까지 키에 넣어, 재계획으로 바뀐 같은 구간을 다시 전개한다.
+    return (level, parent)
+
+
+def _starts_within(item: HourlyPlanItem | MinutePlanItem, parent: _ParentItem) -> bool:
+    return parent.start_time <= item.start_time < parent.end_time
+
+
+def _within(
+    items: list[HourlyPlanItem] | list[MinutePlanItem], parent: _ParentItem
+) -> bool:
+    return any(_starts_within(item, parent) for item in items)
+
+
+class PlanEngine:
+    def __init__(
+        self,
+        *,
+        expander: PlanExpander,
+        plan_store: PlanStore,
+        agent_id: str,
+        agent_name: str,
+        prefetch: bool = True,
+    ):
+        self.expander: PlanExpander = expander
+        self.plan_store: PlanStore = plan_store
+        self.agent_id: str = agent_id
+        self.agent_name: str = agent_name
+        self._executor: ThreadPoolExecutor | None = (
+            ThreadPoolExecutor(max_workers=1, thread_name_prefix="plan-prefetch")
+            if prefetch
+            else None
+        )
+        self._lock: threading.Lock = threading.Lock()
+        self._expanded: set[_WindowKey] = set()
+        self._pending: dict[_WindowKey, Future[None]] = {}
+        self._stats: PlanEngineStats = PlanEngineStats()
+        self._current_date: datetime.date | None = None
+
+    @property
+    def stats(self) -> PlanEngineStats:
+        return self._stats
+
+    def lookup(self, when: datetime.datetime) -> PlanLookup:
+        if when.date() != self._current_date:
+            self._prune_before(when.date())
+        plan = self.plan_store.get(self.agent_id, when.date())
+        if plan is None:
+            empty = ActivePlanItems(day=None, hourly=None, minute=None)
+            return PlanLookup(current=empty, next=empty)
+
+        day_item = plan.active_items(when).day
+        if day_item is not None:
+            plan = self._ensure_expanded(plan, "hourly", day_item, when)
+        hourly_item = plan.active_items(when).hourly
+        if hourly_item is not None:
+            plan = self._ensure_expanded(plan, "minute", hourly_item, when)
+
+        lookup = PlanLookup(
+            current=plan.active_items(when),
+            next=plan.next_items(when),
+        )
+        if self._executor is not None:
+            if lookup.next.day is not None:
+                self._schedule(plan, "hourly", lookup.next.day)
+            if lookup.next.hourly is not None:
+                self._schedule(plan, "minute", lookup.next.hourly)
+        return lookup
+
+    def close(self) -> None:
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+
+    def _ensure_expanded(
+        self,
+        plan: StoredDayPlan,
+        level: PlanLevel,
+        parent: _ParentItem,
+        when: datetime.datetime,
+    ) -> StoredDayPlan:
+        key = _window_key(level, parent)
+        if self._is_expanded(plan, key, parent):
+            return plan
+
+        with self._lock:
+            pending = self._pending.get(key)
+        if pending is not None:
+            self._bump("prefetch_waits")
+            # 백그라운드 전개가 실패하면(failures는 이미 셌다) 아래에서 동기로 다시 시도한다.
+            with suppress(*_EXPANSION_ERRORS):
+                pending.result()
+            plan = self.plan_store.get(self.agent_id, plan.date) or plan
+            if self._is_expanded(plan, key, parent):
+                return plan
+
+        try:
+            self._expand(plan.date, level, parent, current_time=when)
+        except _EXPANSION_ERRORS:
+            # 에이전트의 step 전체를 실패시키지 않고 상위 계층 항목으로 진행한다.
+            return plan
+        return self.plan_store.get(self.agent_id, plan.date) or plan
+
+    def _prune_before(self, date: datetime.date) -> None:
+        """지난 날짜 구간의 전개 기록과 대기 중인 전개를 버린다."""
+        with self._lock:
+            self._current_date = date
+            self._expanded = {
+                key for key in self._expanded if key[1].start_time.date() >= date
+            }
+            for key in [
+                key for key in self._pending if key[1].start_time.date() < date
+            ]:
+                _ = self._pending.pop(key).cancel()
+
+    def _schedule(
+        self, plan: StoredDayPlan, level: PlanLevel, parent: _ParentItem
+    ) -> None:
+        key = _window_key(level, parent)
+        if self._executor is None or self._is_expanded(plan, key, parent):
+            return
+        with self._lock:
+            if key in self._pending:
+                return
+            self._pending[key] = self._executor.submit(
+                self._expand,
+                plan.date,
+                level,
+                parent,
+                current_time=parent.start_time,
+            )
+        self._bump("prefetch_scheduled")
+
+    def _is_expanded(
+        self, plan: StoredDayPlan, key: _WindowKey, parent: _ParentItem
+    ) -> bool:
+        with self._lock:
+            if key in self._expanded:
+                return True
+        children = plan.hourly_items if key[0] == "hourly" else plan.minute_items
+        if not _within(children, parent):
+            return False
+        with self._lock:
+            self._expanded.add(key)
+        return True
+
+    def _expand(
+        self,
+        date: datetime.date,
+        level: PlanLevel,
+        parent: _ParentItem,
+        *,
+        current_time: datetime.datetime,
+    ) -> None:
+        key = _window_key(level, parent)
+        try:
+            if level == "hourly":
+                self._expand_hourly(date, cast(DayPlanItem, parent), current_time)
+            else:
+                self._expand_minute(date, cast(HourlyPlanItem, parent), current_time)
+        except Exception:
+            self._bump("failures")
+            with self._lock:
+                self._pending.pop(key, None)
+            raise
+        # 빈 결과여도 같은 구간을 다시 전개하지 않는다(LLM 호출 상한).
+        with self._lock:
+            self._expanded.add(key)
+            self._pending.pop(key, None)
+
+    def _expand_hourly(
+        self,
+        date: datetime.date,
+        parent: DayPlanItem,
+        current_time: datetime.datetime,
+    ) -> None:
+        items = self.expander.generate_hourly_plan(
+            agent_name=self.agent_name,
+            current_time=current_time,
+            day_plan_item=parent,
+        )
+        self._bump("hourly_expansions")
+        items = [item for item in items if _starts_within(item, parent)]
+        if items:
+            self.plan_store.add_hourly_items(self.agent_id, date, items)
+
+    def _expand_minute(
+        self,
+        date: datetime.date,
+        parent: HourlyPlanItem,
+        current_time: datetime.datetime,
+    ) -> None:
+        items = self.expander.generate_minute_plan(
+            agent_name=self.agent_name,
+            current_time=current_time,
+            hourly_plan_item=parent,
+        )
+        self._bump("minute_expansions")
+        items = [item for item in items if _starts_within(item, parent)]
+        if items:
+            self.plan_store.add_minute_items(self.agent_id, date, items)
+
+    def _bump(self, counter: str) -> None:
+        with self._lock:
+            self._stats = replace(
+                self._stats, **{counter: getattr(self._stats, counter) + 1}
+            )
@@ -1,7 +1,15 @@
 import datetime
+from dataclasses import replace
 from typing import Literal, Protocol, cast
 
-from ..graph_support import GRAPH_END, GRAPH_START, GRAPH_STATE_FACTORY
+from ..graph_support import (
+    GRAPH_END,
+    GRAPH_START,
+    GraphBackend,
+    resolve_state_graph_factory,
+    runner_action,
+    shared_graph,
+)
 from llm import prompt_builders
 from llm.clients.types import LlmGenerateOptions
 from llm.governance import (
@@ -17,6 +25,7 @@ from typing_extensions import TypedDict
 from .models import (
     DayPlanBroadStrokesRequest,
     DayPlanItem,
+    DayReplanRequest,
     HourlyPlanItem,
     MinutePlanItem,
 )
@@ -40,6 +49,7 @@ MINUTE_PLAN_GENERATE_OPTIONS = LlmGenerateOptions(
 )
 
 MAX_PARSE_RETRIES = 2
+MAX_REPLAN_ITEMS = 6
 
 
 class PlanningGraphBuilder(Protocol):
@@ -65,7 +75,11 @@ class StateGraphFactory(Protocol):
     def __call__(self, state_schema: type[object]) -> PlanningGraphBuilder: ...
 
 
-STATE_GRAPH = cast(StateGraphFactory, GRAPH_STATE_FACTORY)
+def _state_graph(backend: GraphBackend | None, graph_name: str) -> StateGraphFactory:
+    return cast(
+        StateGraphFactory,
+        resolve_state_graph_factory(backend, graph_name=graph_name),
+    )
 
 
 class PlanningCompletionClient(Protocol):
@@ -85,6 +99,18 @@ class DayPlanningGraphState(TypedDict):
     attempt_count: int
     plan_items: list[DayPlanItem]
     parse_error: str
+    runner: "PlanningGraphRunner"
+
+
+class DayReplanningGraphState(TypedDict):
+    request: DayReplanRequest
+    base_prompt: str
+    current_prompt: str
+    response_text: str
+    attempt_count: int
+    plan_items: list[DayPlanItem]
+    parse_error: str
+    runner: "PlanningGraphRunner"
 
 
 class HourlyPlanningGraphState(TypedDict):
@@ -97,6 +123,7 @@ class HourlyPlanningGraphState(TypedDict):
     attempt_count: int
     plan_items: list[HourlyPlanItem]
     parse_error: str
+    runner: "PlanningGraphRunner"
 
 
 class MinutePlanningGraphState(TypedDict):
@@ -109,14 +136,30 @@ class MinutePlanningGraphState(TypedDict):
     attempt_count: int
     plan_items: list[MinutePlanItem]
     parse_error: str
+    runner: "PlanningGraphRunner"
 
 
 class PlanningGraphRunner:
-    def __init__(self, *, planning_client: PlanningCompletionClient):
+    def __init__(
+        self,
+        *,
+        planning_client: PlanningCompletionClient,
+        graph_backend: GraphBackend | None = None,
+    ):
         self.planning_client: PlanningCompletionClient = planning_client
-        self.day_plan_graph: PlanningGraphInvoker = self._build_day_plan_graph()
-        self.hourly_plan_graph: PlanningGraphInvoker = self._build_hourly_plan_graph()
-        self.minute_plan_graph: PlanningGraphInvoker = self._build_minute_plan_graph()
+        self.graph_backend: GraphBackend | None = graph_backend
+        self.day_plan_graph: PlanningGraphInvoker = shared_graph(
+            "day_plan", graph_backend, self._build_day_plan_graph
+        )
+        self.day_replan_graph: PlanningGraphInvoker = shared_graph(
+            "day_replan", graph_backend, self._build_day_replan_graph
+        )
+        self.hourly_plan_graph: PlanningGraphInvoker = shared_graph(
+            "hourly_plan", graph_backend, self._build_hourly_plan_graph
+        )
+        self.minute_plan_graph: PlanningGraphInvoker = shared_graph(
+            "minute_plan", graph_backend, self._build_minute_plan_graph
+        )
 
     def generate_day_plan(
         self,
@@ -133,6 +176,29 @@ class PlanningGraphRunner:
                     attempt_count=0,
                     plan_items=[],
                     parse_error="",
+                    runner=self,
+                )
+            ),
+        )
+        return final_state["plan_items"]
+
+    def generate_day_replan(
+        self,
+        request: DayReplanRequest,
+    ) -> list[DayPlanItem]:
+        """request.now 이후 구간의 하루 계획 항목만 생성한다."""
+        final_state = cast(
+            DayReplanningGraphState,
+            self.day_replan_graph.invoke(
+                DayReplanningGraphState(
+                    request=request,
+                    base_prompt="",
+                    current_prompt="",
+                    response_text="",
+                    attempt_count=0,
+                    plan_items=[],
+                    parse_error="",
+                    runner=self,
                 )
             ),
         )
@@ -158,6 +224,7 @@ class PlanningGraphRunner:
                     attempt_count=0,
                     plan_items=[],
                     parse_error="",
+                    runner=self,
                 )
             ),
         )
@@ -183,23 +250,27 @@ class PlanningGraphRunner:
                     attempt_count=0,
                     plan_items=[],
                     parse_error="",
+                    runner=self,
                 )
             ),
         )
         return final_state["plan_items"]
 
-    def _build_day_plan_graph(self) -> PlanningGraphInvoker:
-        builder = STATE_GRAPH(DayPlanningGraphState)
-        builder.add_node("build_prompt", self._build_day_plan_prompt)
-        builder.add_node("generate_response", self._generate_day_plan_response)
-        builder.add_node("parse_response", self._parse_day_plan_response)
-        builder.add_node("prepare_retry", self._prepare_day_plan_retry)
+    @staticmethod
+    def _build_day_plan_graph(backend: GraphBackend) -> PlanningGraphInvoker:
+        builder = _state_graph(backend, "day_plan")(DayPlanningGraphState)
+        builder.add_node("build_prompt", runner_action("_build_day_plan_prompt"))
+        builder.add_node(
+            "generate_response", runner_action("_generate_day_plan_response")
+        )
+        builder.add_node("parse_response", runner_action("_parse_day_plan_response"))
+        builder.add_node("prepare_retry", runner_action("_prepare_day_plan_retry"))
         builder.add_edge(GRAPH_START, "build_prompt")
         builder.add_edge("build_prompt", "generate_response")
         builder.add_edge("generate_response", "parse_response")
         builder.add_conditional_edges(
             "parse_response",
-            self._route_day_plan_after_parse,
+            runner_action("_route_day_plan_after_parse"),
             {
                 "prepare_retry": "prepare_retry",
                 "__end__": GRAPH_END,
@@ -208,18 +279,21 @@ class PlanningGraphRunner:
         builder.add_edge("prepare_retry", "generate_response")
         return builder.compile()
 
-    def _build_hourly_plan_graph(self) -> PlanningGraphInvoker:
-        builder = STATE_GRAPH(HourlyPlanningGraphState)
-        builder.add_node("build_prompt", self._build_hourly_plan_prompt)
-        builder.add_node("generate_response", self._generate_hourly_plan_response)
-        builder.add_node("parse_response", self._parse_hourly_plan_response)
-        builder.add_node("prepare_retry", self._prepare_hourly_plan_retry)
+    @staticmethod
+    def _build_day_replan_graph(backend: GraphBackend) -> PlanningGraphInvoker:
+        builder = _state_graph(backend, "day_replan")(DayReplanningGraphState)
+        builder.add_node("build_prompt", runner_action("_build_day_replan_prompt"))
+        builder.add_node(
+            "generate_response", runner_action("_generate_day_replan_response")
+        )
+        builder.add_node("parse_response", runner_action("_parse_day_replan_response"))
+        builder.add_node("prepare_retry", runner_action("_prepare_day_replan_retry"))
         builder.add_edge(GRAPH_START, "build_prompt")
         builder.add_edge("build_prompt", "generate_response")
         builder.add_edge("generate_response", "parse_response")
         builder.add_conditional_edges(
             "parse_response",
-            self._route_hourly_plan_after_parse,
+            runner_action("_route_day_replan_after_parse"),
             {
                 "prepare_retry": "prepare_retry",
                 "__end__": GRAPH_END,
@@ -228,18 +302,44 @@ class PlanningGraphRunner:
         builder.add_edge("prepare_retry", "generate_response")
         return builder.compile()
 
-    def _build_minute_plan_graph(self) -> PlanningGraphInvoker:
-        builder = STATE_GRAPH(MinutePlanningGraphState)
-        builder.add_node("build_prompt", self._build_minute_plan_prompt)
-        builder.add_node("generate_response", self._generate_minute_plan_response)
-        builder.add_node("parse_response", self._parse_minute_plan_response)
-        builder.add_node("prepare_retry", self._prepare_minute_plan_retry)
+    @staticmethod
+    def _build_hourly_plan_graph(backend: GraphBackend) -> PlanningGraphInvoker:
+        builder = _state_graph(backend, "hourly_plan")(HourlyPlanningGraphState)
+        builder.add_node("build_prompt", runner_action("_build_hourly_plan_prompt"))
+        builder.add_node(
+            "generate_response", runner_action("_generate_hourly_plan_response")
+        )
+        builder.add_node("parse_response", runner_action("_parse_hourly_plan_response"))
+        builder.add_node("prepare_retry", runner_action("_prepare_hourly_plan_retry"))
         builder.add_edge(GRAPH_START, "build_prompt")
         builder.add_edge("build_prompt", "generate_response")
         builder.add_edge("generate_response", "parse_response")
         builder.add_conditional_edges(
             "parse_response",
-            self._route_minute_plan_after_parse,
+            runner_action("_route_hourly_plan_after_parse"),
+            {
+                "prepare_retry": "prepare_retry",
+                "__end__": GRAPH_END,
+            },
+        )
+        builder.add_edge("prepare_retry", "generate_response")
+        return builder.compile()
+
+    @staticmethod
+    def _build_minute_plan_graph(backend: GraphBackend) -> PlanningGraphInvoker:
+        builder = _state_graph(backend, "minute_plan")(MinutePlanningGraphState)
+        builder.add_node("build_prompt", runner_action("_build_minute_plan_prompt"))
+        builder.add_node(
+            "generate_response", runner_action("_generate_minute_plan_response")
+        )
+        builder.add_node("parse_response", runner_action("_parse_minute_plan_response"))
+        builder.add_node("prepare_retry", runner_action("_prepare_minute_plan_retry"))
+        builder.add_edge(GRAPH_START, "build_prompt")
+        builder.add_edge("build_prompt", "generate_response")
+        builder.add_edge("generate_response", "parse_response")
+        builder.add_conditional_edges(
+            "parse_response",
+            runner_action("_route_minute_plan_after_parse"),
             {
                 "prepare_retry": "prepare_retry",
                 "__end__": GRAPH_END,
@@ -313,6 +413,82 @@ class PlanningGraphRunner:
             ),
         }
 
+    def _build_day_replan_prompt(
+        self,
+        state: DayReplanningGraphState,
+    ) -> dict[str, str]:
+        request = state["request"]
+        prompt = prompt_builders.build_day_replan_prompt(
+            agent_name=request.day_request.agent_name,
+            age=request.day_request.age,
+            innate_traits=request.day_request.innate_traits,
+            persona_background=request.day_request.persona_background,
+            now=request.now,
+            frozen_items=request.frozen_items,
+            reason=request.reason,
+        )
+        return {"base_prompt": prompt, "current_prompt": prompt}
+
+    def _generate_day_replan_response(
+        self,
+        state: DayReplanningGraphState,
+    ) -> dict[str, str]:
+        return {
+            "response_text": self.planning_client.complete_planning_prompt(
+                prompt=state["current_prompt"],
+                options=DAY_PLAN_GENERATE_OPTIONS,
+            )
+        }
+
+    def _parse_day_replan_response(
+        self,
+        state: DayReplanningGraphState,
+    ) -> dict[str, object]:
+        now = state["request"].now
+        try:
+            parsed = try_parse_day_plan(
+                state["response_text"],
+                min_items=1,
+                max_items=MAX_REPLAN_ITEMS,
+                reference_date=now.date(),
+            )
+        except DayPlanParseError as exc:
+            return {"plan_items": [], "parse_error": exc.reason}
+        # now 이전으로 걸친 항목은 now부터 시작하도록 자르고, 이미 끝난 항목은 버린다.
+        items = [
+            replace(item, start_time=max(item.start_time, now))
+            for item in parsed.items
+            if item.end_time > now
+        ]
+        if not items:
+            return {"plan_items": [], "parse_error": "no_items_after_now"}
+        return {"plan_items": items, "parse_error": ""}
+
+    def _route_day_replan_after_parse(
+        self,
+        state: DayReplanningGraphState,
+    ) -> Literal["prepare_retry", "__end__"]:
+        if state["plan_items"]:
+            return "__end__"
+        if state["attempt_count"] >= MAX_PARSE_RETRIES:
+            return "__end__"
+        return "prepare_retry"
+
+    def _prepare_day_replan_retry(
+        self,
+        state: DayReplanningGraphState,
+    ) -> dict[str, object]:
+        return {
+            "attempt_count": state["attempt_count"] + 1,
+            "current_prompt": _build_plan_retry_prompt(
+                base_prompt=state["base_prompt"],
+                plan_name="day re-plan",
+                json_shape=prompt_builders.DAY_PLAN_JSON_SHAPE,
+                previous_error=state["parse_error"],
+                previous_response=state["response_text"],
+            ),
+        }
+
     def _build_hourly_plan_prompt(
         self,
         state: HourlyPlanningGraphState,
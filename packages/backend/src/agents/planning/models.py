@@ -206,3 +206,28 @@ class DayPlanBroadStrokes:
         filtered_items = [item for item in self.items if item.strip()]
         if len(filtered_items) < 5 or len(filtered_items) > 8:
             raise ValueError("broad strokes must contain between 5 and 8 items")
+
+
+@dataclass(frozen=True)
+class DayReplanRequest:
+    """현재 시각 이후 구간만 다시 계획하기 위한 입력 요청."""
+
+    """원래 하루 계획 요청(페르소나/날짜 정보)."""
+    day_request: DayPlanBroadStrokesRequest
+
+    """재계획 기준 시각. 이 시각 이후 항목만 새로 만든다."""
+    now: datetime.datetime
+
+    """now 이전으로 고정된 하루 계획 항목."""
+    frozen_items: list[DayPlanItem]
+
+    """재계획을 일으킨 사건 요약."""
+    reason: str
+
+    def __post_init__(self) -> None:
+        if not _is_exact_minute(self.now):
+            raise ValueError("replan now must use minute precision")
+        if any(item.end_time > self.now for item in self.frozen_items):
+            raise ValueError("frozen_items must end at or before now")
+        if not self.reason.strip():
+            raise ValueError("reason must not be blank")
@@ -4,6 +4,7 @@ from .graph import PlanningCompletionClient, PlanningGraphRunner
 from .models import (
     DayPlanBroadStrokesRequest,
     DayPlanItem,
+    DayReplanRequest,
     HourlyPlanItem,
     MinutePlanItem,
 )
@@ -24,6 +25,13 @@ class Planner:
         """일일 계획을 생성합니다."""
         return self.planning_graph.generate_day_plan(request)
 
+    def replan_day(
+        self,
+        request: DayReplanRequest,
+    ) -> list[DayPlanItem]:
+        """현재 시각 이후의 일일 계획만 다시 생성합니다."""
+        return self.planning_graph.generate_day_replan(request)
+
     def generate_hourly_plan(
         self,
         *,
@@ -0,0 +1,339 @@
+"""
+에이전트/날짜별 계획 저장소.
+
+- (agent_id, date)마다 day/hourly/minute 계획 항목 전체를 보관하고 시각으로 조회한다.
+- directory가 주어지면 <directory>/<agent_id>/<YYYY-MM-DD>.json으로 영속화해
+  재시작이나 다른 runtime에서도 같은 날의 계획을 다시 생성하지 않는다.
+- 저장된 계획은 재계획(invalidate/put_day_plan) 때만 버린다. replan_from은 now 이전
+  구간과 여전히 유효한 시간/분 단위 전개를 보존하고 나머지만 교체한다.
+"""
+
+import bisect
+import datetime
+import json
+import os
+import threading
+from collections.abc import Callable, Sequence
+from dataclasses import dataclass, field, replace
+from pathlib import Path
+from typing import TypeVar, cast
+
+from .models import DayPlanItem, HourlyPlanItem, MinutePlanItem
+
+TPlanItem = TypeVar("TPlanItem", DayPlanItem, HourlyPlanItem, MinutePlanItem)
+
+
+@dataclass(frozen=True)
+class ActivePlanItems:
+    """특정 시각에 진행 중인 계획 항목."""
+
+    day: DayPlanItem | None
+    hourly: HourlyPlanItem | None
+    minute: MinutePlanItem | None
+
+
+@dataclass(frozen=True)
+class StoredDayPlan:
+    """한 에이전트의 하루 계획과 지금까지 전개된 시간/분 단위 계획."""
+
+    agent_id: str
+    date: datetime.date
+    day_items: list[DayPlanItem]
+    hourly_items: list[HourlyPlanItem] = field(default_factory=list)
+    """start_time 오름차순."""
+    minute_items: list[MinutePlanItem] = field(default_factory=list)
+    """start_time 오름차순."""
+
+    def active_items(self, when: datetime.datetime) -> ActivePlanItems:
+        return ActivePlanItems(
+            day=active_plan_item(self.day_items, when),
+            hourly=active_plan_item(self.hourly_items, when),
+            minute=active_plan_item(self.minute_items, when),
+        )
+
+    def next_items(self, when: datetime.datetime) -> ActivePlanItems:
+        """계층별로 when 이후 처음 시작하는 항목."""
+        return ActivePlanItems(
+            day=next_plan_item(self.day_items, when),
+            hourly=next_plan_item(self.hourly_items, when),
+            minute=next_plan_item(self.minute_items, when),
+        )
+
+    def next_boundary(self, when: datetime.datetime) -> datetime.datetime | None:
+        """when 이후 어느 계층에서든 진행 중인 항목이 끝나거나 새 항목이 시작하는 가장 이른 시각."""
+        current = self.active_items(when)
+        upcoming = self.next_items(when)
+        boundaries = [
+            item.end_time
+            for item in (current.day, current.hourly, current.minute)
+            if item is not None
+        ] + [
+            item.start_time
+            for item in (upcoming.day, upcoming.hourly, upcoming.minute)
+            if item is not None
+        ]
+        return min(boundaries, default=None)
+
+
+def active_plan_item(
+    items: Sequence[TPlanItem], when: datetime.datetime
+) -> TPlanItem | None:
+    """start_time 오름차순 items에서 when을 포함하는 항목을 이분 탐색으로 찾는다."""
+    index = bisect.bisect_right(items, when, key=lambda item: item.start_time) - 1
+    if index < 0:
+        return None
+    item = items[index]
+    return item if when < item.end_time else None
+
+
+def next_plan_item(
+    items: Sequence[TPlanItem], when: datetime.datetime
+) -> TPlanItem | None:
+    """start_time 오름차순 items에서 when 이후에 처음 시작하는 항목."""
+    index = bisect.bisect_right(items, when, key=lambda item: item.start_time)
+    return items[index] if index < len(items) else None
+
+
+def frozen_prefix(
+    items: Sequence[TPlanItem], now: datetime.datetime
+) -> list[TPlanItem]:
+    """now 이전 구간만 남긴다. 진행 중인 항목은 now에서 끊는다."""
+    cutoff = now.replace(second=0, microsecond=0)
+    frozen: list[TPlanItem] = []
+    for item in items:
+        if item.end_time <= cutoff:
+            frozen.append(item)
+        elif item.start_time < cutoff:
+            frozen.append(replace(item, end_time=cutoff))
+    return frozen
+
+
+def _kept_children(
+    children: list[TPlanItem],
+    parents: Sequence[DayPlanItem | HourlyPlanItem],
+    cutoff: datetime.datetime,
+) -> list[TPlanItem]:
+    """이미 끝났거나 부모 항목이 그대로 남은 전개 결과만 유지한다."""
+    return [
+        child
+        for child in children
+        if child.end_time <= cutoff
+        or any(
+            parent.start_time <= child.start_time < parent.end_time
+            for parent in parents
+        )
+    ]
+
+
+def _merge_window(
+    existing: list[TPlanItem], expansion: list[TPlanItem]
+) -> list[TPlanItem]:
+    """expansion이 덮는 구간과 겹치는 기존 항목을 교체한다."""
+    if not expansion:
+        return existing
+    window_start = min(item.start_time for item in expansion)
+    window_end = max(item.end_time for item in expansion)
+    kept = [
+        item
+        for item in existing
+        if item.end_time <= window_start or item.start_time >= window_end
+    ]
+    return sorted([*kept, *expansion], key=lambda item: item.start_time)
+
+
+def _item_to_record(
+    item: DayPlanItem | HourlyPlanItem | MinutePlanItem,
+) -> dict[str, str]:
+    return {
+        "start_time": item.start_time.isoformat(),
+        "end_time": item.end_time.isoformat(),
+        "location": item.location,
+        "action_content": item.action_content,
+    }
+
+
+def _items_from_records(
+    records: object, factory: Callable[..., TPlanItem]
+) -> list[TPlanItem]:
+    return [
+        factory(
+            start_time=datetime.datetime.fromisoformat(record["start_time"]),
+            end_time=datetime.datetime.fromisoformat(record["end_time"]),
+            location=record["location"],
+            action_content=record["action_content"],
+        )
+        for record in cast(list[dict[str, str]], records)
+    ]
+
+
+def plan_to_record(plan: StoredDayPlan) -> dict[str, object]:
+    return {
+        "agent_id": plan.agent_id,
+        "date": plan.date.isoformat(),
+        "day_items": [_item_to_record(item) for item in plan.day_items],
+        "hourly_items": [_item_to_record(item) for item in plan.hourly_items],
+        "minute_items": [_item_to_record(item) for item in plan.minute_items],
+    }
+
+
+def plan_from_record(record: dict[str, object]) -> StoredDayPlan:
+    return StoredDayPlan(
+        agent_id=str(record["agent_id"]),
+        date=datetime.date.fromisoformat(str(record["date"])),
+        day_items=_items_from_records(record["day_items"], DayPlanItem),
+        hourly_items=_items_from_records(record["hourly_items"], HourlyPlanItem),
+        minute_items=_items_from_records(record["minute_items"], MinutePlanItem),
+    )
+
+
+PlanKey = tuple[str, datetime.date]
+"""(agent_id, date)."""
+
+
+class PlanStore:
+    def __init__(self, directory: str | Path | None = None):
+        self.directory: Path | None = Path(directory) if directory else None
+        self._plans: dict[PlanKey, StoredDayPlan | None] = {}
+        self._changed: set[PlanKey] = set()
+        self._lock: threading.Lock = threading.Lock()
+
+    def get(self, agent_id: str, date: datetime.date) -> StoredDayPlan | None:
+        with self._lock:
+            return self._get_locked(agent_id, date)
+
+    def active_items(self, agent_id: str, when: datetime.datetime) -> ActivePlanItems:
+        plan = self.get(agent_id, when.date())
+        if plan is None:
+            return ActivePlanItems(day=None, hourly=None, minute=None)
+        return plan.active_items(when)
+
+    def put_day_plan(
+        self, agent_id: str, date: datetime.date, items: list[DayPlanItem]
+    ) -> StoredDayPlan:
+        """하루 계획을 새로 저장한다. 이전 계획과 그 전개 결과는 버린다."""
+        plan = StoredDayPlan(
+            agent_id=agent_id,
+            date=date,
+            day_items=sorted(items, key=lambda item: item.start_time),
+        )
+        with self._lock:
+            self._save_locked(plan)
+        return plan
+
+    def add_hourly_items(
+        self, agent_id: str, date: datetime.date, items: list[HourlyPlanItem]
+    ) -> StoredDayPlan:
+        with self._lock:
+            plan = self._require_locked(agent_id, date)
+            plan = replace(plan, hourly_items=_merge_window(plan.hourly_items, items))
+            self._save_locked(plan)
+        return plan
+
+    def add_minute_items(
+        self, agent_id: str, date: datetime.date, items: list[MinutePlanItem]
+    ) -> StoredDayPlan:
+        with self._lock:
+            plan = self._require_locked(agent_id, date)
+            plan = replace(plan, minute_items=_merge_window(plan.minute_items, items))
+            self._save_locked(plan)
+        return plan
+
+    def replan_from(
+        self,
+        agent_id: str,
+        date: datetime.date,
+        now: datetime.datetime,
+        items: list[DayPlanItem],
+    ) -> StoredDayPlan:
+        """
+        now 이후 하루 계획을 items로 교체한다.
+        - now 이전 day 항목은 고정하고, 진행 중인 항목은 now에서 끊는다.
+        - 변경되지 않은 day 항목의 hourly 전개와 그 hourly 항목의 minute 전개는 유지한다.
+        """
+        cutoff = now.replace(second=0, microsecond=0)
+        with self._lock:
+            plan = self._require_locked(agent_id, date)
+            new_items = [item for item in items if item.start_time >= cutoff]
+            day_items = sorted(
+                [*frozen_prefix(plan.day_items, cutoff), *new_items],
+                key=lambda item: item.start_time,
+            )
+            unchanged_days = [item for item in plan.day_items if item in new_items]
+            hourly_items = _kept_children(plan.hourly_items, unchanged_days, cutoff)
+            minute_items = _kept_children(plan.minute_items, hourly_items, cutoff)
+            plan = replace(
+                plan,
+                day_items=day_items,
+                hourly_items=hourly_items,
+                minute_items=minute_items,
+            )
+            self._save_locked(plan)
+        return plan
+
+    def invalidate(self, agent_id: str, date: datetime.date) -> None:
+        """재계획이 필요할 때 저장된 계획을 지운다."""
+        with self._lock:
+            self._plans[(agent_id, date)] = None
+            self._changed.add((agent_id, date))
+            path = self._path(agent_id, date)
+            if path is not None:
+                path.unlink(missing_ok=True)
+
+    def plans(self) -> list[StoredDayPlan]:
+        """메모리에 올라와 있는 계획 전체(체크포인트 base용)."""
+        with self._lock:
+            return [plan for plan in self._plans.values() if plan is not None]
+
+    def drain_changes(self) -> dict[PlanKey, StoredDayPlan | None]:
+        """직전 호출 이후 저장/무효화된 계획을 반환하고 변경 기록을 비운다. None은 무효화다."""
+        with self._lock:
+            changes = {key: self._plans.get(key) for key in self._changed}
+            self._changed = set()
+        return changes
+
+    def restore(self, plans: list[StoredDayPlan]) -> None:
+        """체크포인트의 계획을 캐시에 올린다. directory가 있으면 파일에도 쓴다."""
+        with self._lock:
+            for plan in plans:
+                self._save_locked(plan)
+            self._changed = set()
+
+    def _get_locked(self, agent_id: str, date: datetime.date) -> StoredDayPlan | None:
+        key = (agent_id, date)
+        plan = self._plans.get(key)
+        if plan is None and self.directory is not None:
+            # 다른 프로세스가 나중에 쓴 파일도 보이도록 없는 계획은 캐시하지 않고 다시 확인한다.
+            plan = self._load(agent_id, date)
+            if plan is not None:
+                self._plans[key] = plan
+        return plan
+
+    def _require_locked(self, agent_id: str, date: datetime.date) -> StoredDayPlan:
+        plan = self._get_locked(agent_id, date)
+        if plan is None:
+            raise KeyError(f"No day plan stored for {agent_id} on {date.isoformat()}")
+        return plan
+
+    def _save_locked(self, plan: StoredDayPlan) -> None:
+        self._plans[(plan.agent_id, plan.date)] = plan
+        self._changed.add((plan.agent_id, plan.date))
+        path = self._path(plan.agent_id, plan.date)
+        if path is None:
+            return
+        path.parent.mkdir(parents=True, exist_ok=True)
+        payload = plan_to_record(plan)
+        temp_path = path.with_suffix(".json.tmp")
+        temp_path.write_text(json.dumps(payload, ensure_ascii=False), encoding="utf-8")
+        os.replace(temp_path, path)
+
+    def _load(self, agent_id: str, date: datetime.date) -> StoredDayPlan | None:
+        path = self._path(agent_id, date)
+        if path is None or not path.exists():
+            return None
+        payload = cast(dict[str, object], json.loads(path.read_text(encoding="utf-8")))
+        return replace(plan_from_record(payload), agent_id=agent_id, date=date)
+
+    def _path(self, agent_id: str, date: datetime.date) -> Path | None:
+        if self.directory is None:
+            return None
+        return self.directory / agent_id / f"{date.isoformat()}.json"
@@ -5,6 +5,8 @@ from .contracts import (
     ReactionDecisionInput,
     ReactionDecisionTrace,
     ReactionIntent,
+    ReactionMode,
+    ReactionRetryBudget,
     ReactionUtterance,
 )
 
@@ -15,6 +17,8 @@ __all__ = [
     "ReactionDecisionInput",
     "ReactionDecisionTrace",
     "ReactionIntent",
+    "ReactionMode",
+    "ReactionRetryBudget",
     "ReactionUtterance",
 ]
 
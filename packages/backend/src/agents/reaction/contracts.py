@@ -11,6 +11,9 @@ if TYPE_CHECKING:
     from llm.clients.types import LlmGenerateOptions
 
 
+ReactionMode = Literal["two_stage", "fused"]
+
+
 @dataclass(frozen=True)
 class DialogueArc:
     goal: str
@@ -21,6 +24,12 @@ class DialogueArc:
     should_wrap_up: bool = False
 
 
+@dataclass(frozen=True)
+class ReactionRetryBudget:
+    max_calls: int | None = None
+    latency_ms: float | None = None
+
+
 @dataclass(frozen=True)
 class ReactionDecisionInput:
     agent_identity: AgentIdentity
@@ -31,6 +40,10 @@ class ReactionDecisionInput:
     retrieved_memories: list[MemoryObject]
     dialogue_arc: DialogueArc | None = None
     language: Literal["ko", "en"] = "ko"
+    reaction_mode: ReactionMode | None = None
+    """이번 결정에만 쓸 reaction 모드. None이면 runner 기본 모드를 따른다."""
+    semantic_retries: bool = True
+    """False면 의미 유사도 검사와 그에 따른 재생성을 건너뛴다."""
 
 
 @dataclass(frozen=True)
@@ -47,6 +60,11 @@ class ReactionDecisionTrace:
     semantic_hard_threshold: float = 0.92
     semantic_soft_threshold: float = 0.82
     semantic_retry_trigger: str = "none"
+    reaction_mode: str = "two_stage"
+    mode_fallback_reason: str = ""
+    generate_calls: int = 0
+    generation_latency_ms: float = 0.0
+    budget_exhausted_reason: str = ""
 
 
 @dataclass(frozen=True)
@@ -1,3 +1,4 @@
+import time
 from dataclasses import replace
 from typing import Literal, Protocol, cast
 
@@ -18,14 +19,28 @@ from llm.guardrails.similarity import (
     recent_self_utterances,
     semantic_overlap_check,
 )
-from llm.governance.parsing import parse_reaction_intent, parse_reaction_utterance
-
-from ..graph_support import GRAPH_END, GRAPH_START, GRAPH_STATE_FACTORY
+from llm.governance.parsing import (
+    parse_reaction_decision,
+    parse_reaction_intent,
+    parse_reaction_utterance,
+)
+from settings import REACTION_LATENCY_BUDGET_MS, REACTION_MAX_CALLS, REACTION_MODE
+
+from ..graph_support import (
+    GRAPH_END,
+    GRAPH_START,
+    GraphBackend,
+    resolve_state_graph_factory,
+    runner_action,
+    shared_graph,
+)
 from .contracts import (
     GenerateClient,
     ReactionDecision,
     ReactionDecisionInput,
     ReactionIntent,
+    ReactionMode,
+    ReactionRetryBudget,
     ReactionUtterance,
 )
 
@@ -56,6 +71,15 @@ class ReactionGraphBuilder(Protocol):
 
 class ReactionGraphState(TypedDict):
     input: ReactionDecisionInput
+    reaction_mode: Literal["two_stage", "fused", "fused_fallback"]
+    mode_fallback_reason: str
+    generate_calls: int
+    generation_ms: float
+    started_at: float
+    retry_budget: ReactionRetryBudget
+    budget_exhausted_reason: str
+    best_decision: ReactionDecision | None
+    best_score: float
     system_prompt: str
     intent_prompt: str
     intent: ReactionIntent
@@ -73,6 +97,7 @@ class ReactionGraphState(TypedDict):
     overlap_status: Literal["retry", "final"]
     utterance_result: ReactionUtterance
     decision: ReactionDecision
+    runner: "ReactionGraphRunner"
 
 
 class ReactionGraphInvoker(Protocol):
@@ -85,7 +110,11 @@ class StateGraphFactory(Protocol):
     ) -> ReactionGraphBuilder: ...
 
 
-STATE_GRAPH = cast(StateGraphFactory, GRAPH_STATE_FACTORY)
+def _state_graph(backend: GraphBackend | None, graph_name: str) -> StateGraphFactory:
+    return cast(
+        StateGraphFactory,
+        resolve_state_graph_factory(backend, graph_name=graph_name),
+    )
 
 
 class ReactionGraphRunner:
@@ -94,33 +123,90 @@ class ReactionGraphRunner:
         *,
         generation_client: GenerateClient,
         embedding_encoder: EmbeddingEncoder | None,
+        graph_backend: GraphBackend | None = None,
+        reaction_mode: ReactionMode | None = None,
+        retry_budget: ReactionRetryBudget | None = None,
     ):
         self.generation_client: GenerateClient = generation_client
         self.embedding_encoder: EmbeddingEncoder | None = embedding_encoder
-        self.graph: ReactionGraphInvoker = self._build_graph()
+        self.graph_backend: GraphBackend | None = graph_backend
+        self.reaction_mode: ReactionMode = reaction_mode or REACTION_MODE
+        self.retry_budget: ReactionRetryBudget = retry_budget or ReactionRetryBudget(
+            max_calls=REACTION_MAX_CALLS or None,
+            latency_ms=REACTION_LATENCY_BUDGET_MS or None,
+        )
+        self.graph: ReactionGraphInvoker = shared_graph(
+            "reaction", graph_backend, self._build_graph
+        )
 
     def decide_reaction(self, input: ReactionDecisionInput) -> ReactionDecision:
         final_state = self.graph.invoke(self._initial_state(input))
-        return final_state["decision"]
-
-    def _build_graph(self) -> ReactionGraphInvoker:
-        builder = STATE_GRAPH(ReactionGraphState)
-        builder.add_node("initialize_context", self._initialize_context)
-        builder.add_node("generate_intent", self._generate_intent)
-        builder.add_node("finalize_no_reaction", self._finalize_no_reaction)
-        builder.add_node("prepare_utterance_context", self._prepare_utterance_context)
-        builder.add_node("generate_utterance", self._generate_utterance)
-        builder.add_node("apply_partner_nudge", self._apply_partner_nudge)
-        builder.add_node("evaluate_semantic", self._evaluate_semantic)
-        builder.add_node("apply_semantic_retry", self._apply_semantic_retry)
-        builder.add_node("evaluate_overlap", self._evaluate_overlap)
-        builder.add_node("apply_overlap_retry", self._apply_overlap_retry)
+        decision = final_state["decision"]
+        return replace(
+            decision,
+            trace=replace(
+                decision.trace,
+                reaction_mode=final_state["reaction_mode"],
+                mode_fallback_reason=final_state["mode_fallback_reason"],
+                generate_calls=final_state["generate_calls"],
+                generation_latency_ms=final_state["generation_ms"],
+            ),
+        )
+
+    @staticmethod
+    def _build_graph(backend: GraphBackend) -> ReactionGraphInvoker:
+        builder = _state_graph(backend, "reaction")(ReactionGraphState)
+        builder.add_node("initialize_context", runner_action("_initialize_context"))
+        builder.add_node(
+            "generate_fused_reaction", runner_action("_generate_fused_reaction")
+        )
+        builder.add_node(
+            "prepare_fused_utterance", runner_action("_prepare_fused_utterance")
+        )
+        builder.add_node("generate_intent", runner_action("_generate_intent"))
+        builder.add_node("finalize_no_reaction", runner_action("_finalize_no_reaction"))
+        builder.add_node(
+            "prepare_utterance_context", runner_action("_prepare_utterance_context")
+        )
+        builder.add_node("generate_utterance", runner_action("_generate_utterance"))
+        builder.add_node("apply_partner_nudge", runner_action("_apply_partner_nudge"))
+        builder.add_node("evaluate_semantic", runner_action("_evaluate_semantic"))
+        builder.add_node("apply_semantic_retry", runner_action("_apply_semantic_retry"))
+        builder.add_node("evaluate_overlap", runner_action("_evaluate_overlap"))
+        builder.add_node("apply_overlap_retry", runner_action("_apply_overlap_retry"))
+        builder.add_node(
+            "finalize_budget_exhausted", runner_action("_finalize_budget_exhausted")
+        )
 
         builder.add_edge(GRAPH_START, "initialize_context")
-        builder.add_edge("initialize_context", "generate_intent")
+        builder.add_conditional_edges(
+            "initialize_context",
+            runner_action("_route_after_initialize"),
+            {
+                "generate_fused_reaction": "generate_fused_reaction",
+                "generate_intent": "generate_intent",
+            },
+        )
+        builder.add_conditional_edges(
+            "generate_fused_reaction",
+            runner_action("_route_after_fused_reaction"),
+            {
+                "generate_intent": "generate_intent",
+                "finalize_no_reaction": "finalize_no_reaction",
+                "prepare_fused_utterance": "prepare_fused_utterance",
+            },
+        )
+        builder.add_conditional_edges(
+            "prepare_fused_utterance",
+            runner_action("_route_after_utterance"),
+            {
+                "apply_partner_nudge": "apply_partner_nudge",
+                "evaluate_semantic": "evaluate_semantic",
+            },
+        )
         builder.add_conditional_edges(
             "generate_intent",
-            self._route_after_intent,
+            runner_action("_route_after_intent"),
             {
                 "finalize_no_reaction": "finalize_no_reaction",
                 "prepare_utterance_context": "prepare_utterance_context",
@@ -130,38 +216,69 @@ class ReactionGraphRunner:
         builder.add_edge("prepare_utterance_context", "generate_utterance")
         builder.add_conditional_edges(
             "generate_utterance",
-            self._route_after_utterance,
+            runner_action("_route_after_utterance"),
             {
                 "apply_partner_nudge": "apply_partner_nudge",
                 "evaluate_semantic": "evaluate_semantic",
             },
         )
-        builder.add_edge("apply_partner_nudge", "generate_utterance")
+        builder.add_conditional_edges(
+            "apply_partner_nudge",
+            runner_action("_route_after_retry_setup"),
+            {
+                "generate_utterance": "generate_utterance",
+                "finalize_budget_exhausted": "finalize_budget_exhausted",
+            },
+        )
         builder.add_conditional_edges(
             "evaluate_semantic",
-            self._route_after_semantic,
+            runner_action("_route_after_semantic"),
             {
                 "apply_semantic_retry": "apply_semantic_retry",
                 "evaluate_overlap": "evaluate_overlap",
                 "__end__": GRAPH_END,
             },
         )
-        builder.add_edge("apply_semantic_retry", "generate_utterance")
+        builder.add_conditional_edges(
+            "apply_semantic_retry",
+            runner_action("_route_after_retry_setup"),
+            {
+                "generate_utterance": "generate_utterance",
+                "finalize_budget_exhausted": "finalize_budget_exhausted",
+            },
+        )
         builder.add_conditional_edges(
             "evaluate_overlap",
-            self._route_after_overlap,
+            runner_action("_route_after_overlap"),
             {
                 "apply_overlap_retry": "apply_overlap_retry",
                 "__end__": GRAPH_END,
             },
         )
-        builder.add_edge("apply_overlap_retry", "generate_utterance")
+        builder.add_conditional_edges(
+            "apply_overlap_retry",
+            runner_action("_route_after_retry_setup"),
+            {
+                "generate_utterance": "generate_utterance",
+                "finalize_budget_exhausted": "finalize_budget_exhausted",
+            },
+        )
+        builder.add_edge("finalize_budget_exhausted", GRAPH_END)
 
         return builder.compile()
 
     def _initial_state(self, input: ReactionDecisionInput) -> ReactionGraphState:
         return ReactionGraphState(
             input=input,
+            reaction_mode=input.reaction_mode or self.reaction_mode,
+            mode_fallback_reason="",
+            generate_calls=0,
+            generation_ms=0.0,
+            started_at=time.perf_counter(),
+            retry_budget=self.retry_budget,
+            budget_exhausted_reason="",
+            best_decision=None,
+            best_score=float("inf"),
             system_prompt="",
             intent_prompt="",
             intent=ReactionIntent(should_react=False, reason="uninitialized"),
@@ -183,6 +300,7 @@ class ReactionGraphRunner:
                 reaction="",
                 reason="uninitialized",
             ),
+            runner=self,
         )
 
     def _initialize_context(self, state: ReactionGraphState) -> dict[str, str]:
@@ -200,17 +318,87 @@ class ReactionGraphRunner:
             ),
         }
 
-    def _generate_intent(
+    def _route_after_initialize(
         self,
         state: ReactionGraphState,
-    ) -> dict[str, ReactionIntent]:
-        response = self.generation_client.generate(
-            prompt=state["intent_prompt"],
-            system=state["system_prompt"],
-            options=REACTION_GENERATE_OPTIONS,
-            format_json=True,
+    ) -> Literal["generate_fused_reaction", "generate_intent"]:
+        if state["reaction_mode"] == "fused":
+            return "generate_fused_reaction"
+        return "generate_intent"
+
+    def _generate_fused_reaction(
+        self,
+        state: ReactionGraphState,
+    ) -> dict[str, object]:
+        input = state["input"]
+        prompt = prompt_builders.build_reaction_fused_prompt(
+            agent_identity=input.agent_identity,
+            current_time=input.current_time,
+            observation_content=input.observation_content,
+            dialogue_history=input.dialogue_history,
+            profile=input.profile,
+            retrieved_memories=input.retrieved_memories,
+            dialogue_arc=input.dialogue_arc,
         )
-        return {"intent": parse_reaction_intent(response)}
+        response, usage = self._generate(state, prompt=prompt)
+        decision = parse_reaction_decision(response)
+        if not decision.trace.parse_success:
+            # fused JSON을 읽지 못하면 같은 턴을 two-stage 경로로 다시 만든다.
+            return {
+                **usage,
+                "reaction_mode": "fused_fallback",
+                "mode_fallback_reason": "fused_parse_failure",
+            }
+
+        return {
+            **usage,
+            "intent": ReactionIntent(
+                should_react=decision.should_react,
+                reason=decision.reason,
+                end_dialogue=decision.end_dialogue,
+                thought=decision.thought,
+                critique=decision.critique,
+                trace=decision.trace,
+            ),
+            "utterance_result": ReactionUtterance(
+                utterance=decision.reaction,
+                reason=decision.reason,
+                end_dialogue=decision.end_dialogue,
+                thought=decision.thought,
+                critique=decision.critique,
+                trace=decision.trace,
+            ),
+        }
+
+    def _route_after_fused_reaction(
+        self,
+        state: ReactionGraphState,
+    ) -> Literal["generate_intent", "finalize_no_reaction", "prepare_fused_utterance"]:
+        if state["reaction_mode"] == "fused_fallback":
+            return "generate_intent"
+        if not state["intent"].should_react:
+            return "finalize_no_reaction"
+        return "prepare_fused_utterance"
+
+    def _prepare_fused_utterance(
+        self,
+        state: ReactionGraphState,
+    ) -> dict[str, object]:
+        # guardrail 재시도는 two-stage utterance 프롬프트로 진행하므로 그 컨텍스트를 함께 준비한다.
+        return {
+            **self._prepare_utterance_context(state),
+            "decision": self._build_reaction_decision(
+                intent=state["intent"],
+                utterance_result=state["utterance_result"],
+            ),
+        }
+
+    def _generate_intent(
+        self,
+        state: ReactionGraphState,
+    ) -> dict[str, object]:
+        response, usage = self._generate(state, prompt=state["intent_prompt"])
+        return {**usage, "intent": parse_reaction_intent(response)}
 
     def _route_after_intent(
         self,
@@ -260,7 +448,11 @@ class ReactionGraphRunner:
             intent_critique=intent.critique,
             dialogue_arc=input.dialogue_arc,
         )
-        semantic_history = recent_self_utterances(input.dialogue_history, window=5)
+        semantic_history = (
+            recent_self_utterances(input.dialogue_history, window=5)
+            if input.semantic_retries
+            else []
+        )
         return {
             "utterance_prompt": utterance_prompt,
             "working_prompt": utterance_prompt,
@@ -283,14 +475,10 @@ class ReactionGraphRunner:
         self,
         state: ReactionGraphState,
     ) -> dict[str, object]:
-        response = self.generation_client.generate(
-            prompt=state["working_prompt"],
-            system=state["system_prompt"],
-            options=REACTION_GENERATE_OPTIONS,
-            format_json=True,
-        )
+        response, usage = self._generate(state, prompt=state["working_prompt"])
         utterance_result = parse_reaction_utterance(response)
         return {
+            **usage,
             "utterance_result": utterance_result,
             "decision": self._build_reaction_decision(
                 intent=state["intent"],
@@ -314,8 +502,13 @@ class ReactionGraphRunner:
         self,
         state: ReactionGraphState,
     ) -> dict[str, object]:
+        exhausted = self._budget_exhaustion(state, retry="partner_nudge")
+        if exhausted:
+            return {"budget_exhausted_reason": exhausted}
+
         partner_retry_count = state["partner_retry_count"] + 1
         return {
+            **self._fused_guardrail_fallback(state, reason="partner_nudge"),
             "partner_retry_count": partner_retry_count,
             "working_prompt": (
                 f"{state['utterance_prompt']}\n\n"
@@ -329,6 +522,9 @@ class ReactionGraphRunner:
         self,
         state: ReactionGraphState,
     ) -> dict[str, object]:
+        if not state["input"].semantic_retries:
+            return {"semantic_status": "continue"}
+
         semantic_check = semantic_overlap_check(
             candidate_sentence=state["decision"].reaction,
             reference_sentences=state["semantic_history"],
@@ -343,6 +539,9 @@ class ReactionGraphRunner:
         )
 
         if semantic_check.max_similarity >= SEMANTIC_SOFT_PENALTY_THRESHOLD:
+            best = self._record_candidate(
+                state, decision=base_decision, score=semantic_check.max_similarity
+            )
             next_retry_count = state["semantic_retry_count"] + 1
             if next_retry_count > 2:
                 return {
@@ -359,6 +558,7 @@ class ReactionGraphRunner:
                     "semantic_status": "final",
                 }
             return {
+                **best,
                 "semantic_check": semantic_check,
                 "semantic_retry_count": next_retry_count,
                 "semantic_status": "retry",
@@ -385,8 +585,13 @@ class ReactionGraphRunner:
         self,
         state: ReactionGraphState,
     ) -> dict[str, str]:
+        exhausted = self._budget_exhaustion(state, retry="semantic_retry")
+        if exhausted:
+            return {"budget_exhausted_reason": exhausted}
+
         semantic_check = state["semantic_check"]
         return {
+            **self._fused_guardrail_fallback(state, reason="semantic_retry"),
             "working_prompt": (
                 f"{state['utterance_prompt']}\n\n"
                 + prompt_builders.build_semantic_guard_block(
@@ -397,7 +602,7 @@ class ReactionGraphRunner:
                     soft_threshold=SEMANTIC_SOFT_PENALTY_THRESHOLD,
                     hard_threshold=SEMANTIC_HARD_BLOCK_THRESHOLD,
                 )
-            )
+            ),
         }
 
     def _evaluate_overlap(
@@ -418,6 +623,11 @@ class ReactionGraphRunner:
         if not has_overlap:
             return {"overlap_status": "final"}
 
+        best = self._record_candidate(
+            state,
+            decision=decision,
+            score=state["semantic_check"].max_similarity + 1.0,
+        )
         next_retry_count = state["overlap_retry_count"] + 1
         if next_retry_count > 2:
             return {
@@ -434,6 +644,7 @@ class ReactionGraphRunner:
             }
 
         return {
+            **best,
             "overlap_retry_count": next_retry_count,
             "overlap_status": "retry",
         }
@@ -450,16 +661,110 @@ class ReactionGraphRunner:
         self,
         state: ReactionGraphState,
     ) -> dict[str, str]:
+        exhausted = self._budget_exhaustion(state, retry="overlap_retry")
+        if exhausted:
+            return {"budget_exhausted_reason": exhausted}
+
         return {
+            **self._fused_guardrail_fallback(state, reason="overlap_retry"),
             "working_prompt": (
                 f"{state['utterance_prompt']}\n\n"
                 + prompt_builders.build_overlap_guard_block(
                     recent_sentences=state["recent_sentences"],
                     previous_candidate=state["decision"].reaction,
                 )
+            ),
+        }
+
+    def _route_after_retry_setup(
+        self,
+        state: ReactionGraphState,
+    ) -> Literal["generate_utterance", "finalize_budget_exhausted"]:
+        if state["budget_exhausted_reason"]:
+            return "finalize_budget_exhausted"
+        return "generate_utterance"
+
+    def _finalize_budget_exhausted(
+        self,
+        state: ReactionGraphState,
+    ) -> dict[str, ReactionDecision]:
+        decision = state["best_decision"] or replace(
+            state["decision"],
+            trace=replace(
+                state["decision"].trace,
+                partner_retry_count=state["partner_retry_count"],
+            ),
+        )
+        return {
+            "decision": replace(
+                decision,
+                trace=replace(
+                    decision.trace,
+                    budget_exhausted_reason=state["budget_exhausted_reason"],
+                ),
             )
         }
 
+    @staticmethod
+    def _budget_exhaustion(state: ReactionGraphState, *, retry: str) -> str:
+        """
+        다음 재시도(generate 1회)를 하면 예산을 넘는지 판단한다.
+        - latency는 지금까지의 generate 평균 시간을 다음 호출 비용으로 추정한다.
+        - 넘으면 "<call_budget|latency_budget>:<retry>"를 반환한다.
+        """
+        budget = state["retry_budget"]
+        calls = state["generate_calls"]
+        if budget.max_calls is not None and calls + 1 > budget.max_calls:
+            return f"call_budget:{retry}"
+        if budget.latency_ms is not None:
+            elapsed_ms = (time.perf_counter() - state["started_at"]) * 1000
+            next_call_ms = state["generation_ms"] / max(1, calls)
+            if elapsed_ms + next_call_ms > budget.latency_ms:
+                return f"latency_budget:{retry}"
+        return ""
+
+    @staticmethod
+    def _record_candidate(
+        state: ReactionGraphState,
+        *,
+        decision: ReactionDecision,
+        score: float,
+    ) -> dict[str, object]:
+        """guardrail에 걸린 후보 중 가장 나은 것(점수가 낮은 것)을 보관한다."""
+        if not decision.reaction or score >= state["best_score"]:
+            return {}
+        return {"best_decision": decision, "best_score": score}
+
+    def _generate(
+        self,
+        state: ReactionGraphState,
+        *,
+        prompt: str,
+    ) -> tuple[str, dict[str, object]]:
+        started = time.perf_counter()
+        response = self.generation_client.generate(
+            prompt=prompt,
+            system=state["system_prompt"],
+            options=REACTION_GENERATE_OPTIONS,
+            format_json=True,
+        )
+        elapsed_ms = (time.perf_counter() - started) * 1000
+        return response, {
+            "generate_calls": state["generate_calls"] + 1,
+            "generation_ms": state["generation_ms"] + elapsed_ms,
+        }
+
+    @staticmethod
+    def _fused_guardrail_fallback(
+        state: ReactionGraphState,
+        *,
+        reason: str,
+    ) -> dict[str, str]:
+        """fused 결과가 guardrail에 걸려 two-stage 재생성으로 넘어가는 첫 시점을 기록한다."""
+        if state["reaction_mode"] != "fused":
+            return {}
+        return {"reaction_mode": "fused_fallback", "mode_fallback_reason": reason}
+
     @staticmethod
     def _build_reaction_decision(
         *,
@@ -1,8 +1,15 @@
 from .graph import ReflectionGraphRunner
-from .state import Reflection, ReflectionConfig
+from .state import (
+    Reflection,
+    ReflectionConfig,
+    ReflectionRunSummary,
+    ReflectionWatermark,
+)
 
 __all__ = [
     "Reflection",
     "ReflectionConfig",
     "ReflectionGraphRunner",
+    "ReflectionRunSummary",
+    "ReflectionWatermark",
 ]
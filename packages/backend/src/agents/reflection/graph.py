@@ -5,10 +5,17 @@ from typing_extensions import TypedDict
 
 from llm.llm_gateway import InsightWithCitation, LlmGateway
 
-from ..graph_support import GRAPH_END, GRAPH_START, GRAPH_STATE_FACTORY
+from ..graph_support import (
+    GRAPH_END,
+    GRAPH_START,
+    GraphBackend,
+    resolve_state_graph_factory,
+    runner_action,
+    shared_graph,
+)
 from ..memory.memory_manager import MemoryManager, ReflectionContext
 from ..memory.memory_object import MemoryObject
-from .state import Reflection
+from .state import Reflection, ReflectionRunSummary, ReflectionWatermark
 
 
 class ReflectionGraphBuilder(Protocol):
@@ -36,18 +43,26 @@ class StateGraphFactory(Protocol):
     ) -> ReflectionGraphBuilder: ...
 
 
-STATE_GRAPH = cast(StateGraphFactory, GRAPH_STATE_FACTORY)
+def _state_graph(backend: GraphBackend | None, graph_name: str) -> StateGraphFactory:
+    return cast(
+        StateGraphFactory,
+        resolve_state_graph_factory(backend, graph_name=graph_name),
+    )
 
 
 class ReflectionGraphState(TypedDict):
     now: datetime.datetime
     recent_memories: list[MemoryObject]
+    carry_over_reflections: list[MemoryObject]
     questions: list[str]
     question_index: int
     active_question: str
     retrieved_memories: list[MemoryObject]
     generated_insights: list[InsightWithCitation]
     persisted_reflection_count: int
+    merged_reflection_count: int
+    saved_llm_call_count: int
+    runner: "ReflectionGraphRunner"
 
 
 class ReflectionGraphRunner:
@@ -59,13 +74,18 @@ class ReflectionGraphRunner:
         llm_gateway: LlmGateway,
         agent_name: str,
         identity_stable_set: list[str],
+        graph_backend: GraphBackend | None = None,
     ):
         self.reflection: Reflection = reflection
         self.memory_manager: MemoryManager = memory_manager
         self.llm_gateway: LlmGateway = llm_gateway
         self.agent_name: str = agent_name
         self.identity_stable_set: list[str] = list(identity_stable_set)
-        self.graph: ReflectionGraphInvoker = self._build_graph()
+        self.last_run_summary: ReflectionRunSummary | None = None
+        self.graph_backend: GraphBackend | None = graph_backend
+        self.graph: ReflectionGraphInvoker = shared_graph(
+            "reflection", graph_backend, self._build_graph
+        )
 
     def record_observation_importance(self, importance: int) -> None:
         self.reflection.record_observation_importance(importance=importance)
@@ -73,25 +93,54 @@ class ReflectionGraphRunner:
     def should_reflect(self) -> bool:
         return self.reflection.should_reflect()
 
+    @property
+    def watermark(self) -> ReflectionWatermark | None:
+        return self.reflection.watermark
+
     def reflect(self, *, now: datetime.datetime) -> None:
-        _ = self.graph.invoke(self._initial_state(now=now))
+        final_state = self.graph.invoke(self._initial_state(now=now))
         self.reflection.clear_importance()
+        self.last_run_summary = ReflectionRunSummary(
+            persisted_reflection_count=final_state["persisted_reflection_count"],
+            merged_reflection_count=final_state["merged_reflection_count"],
+            saved_llm_call_count=final_state["saved_llm_call_count"],
+        )
+        if not final_state["recent_memories"]:
+            return
+
+        # 이번 reflection이 만든 insight는 다음 delta에서 제외하고 carry-over로만 노출한다.
+        latest_memories = self.memory_manager.get_recent_memories(limit=1)
+        if latest_memories:
+            self.reflection.advance_watermark(
+                ReflectionWatermark(
+                    memory_id=latest_memories[0].id,
+                    created_at=latest_memories[0].created_at,
+                )
+            )
 
-    def _build_graph(self) -> ReflectionGraphInvoker:
-        builder = STATE_GRAPH(ReflectionGraphState)
-        builder.add_node("load_recent_memories", self._load_recent_memories)
-        builder.add_node("generate_questions", self._generate_questions)
-        builder.add_node("prepare_question", self._prepare_question)
-        builder.add_node("retrieve_memories", self._retrieve_memories)
-        builder.add_node("generate_insights", self._generate_insights)
-        builder.add_node("persist_insights", self._persist_insights)
-        builder.add_node("advance_question", self._advance_question)
+    @staticmethod
+    def _build_graph(backend: GraphBackend) -> ReflectionGraphInvoker:
+        builder = _state_graph(backend, "reflection")(ReflectionGraphState)
+        builder.add_node("load_recent_memories", runner_action("_load_recent_memories"))
+        builder.add_node("generate_questions", runner_action("_generate_questions"))
+        builder.add_node("prepare_question", runner_action("_prepare_question"))
+        builder.add_node("retrieve_memories", runner_action("_retrieve_memories"))
+        builder.add_node("generate_insights", runner_action("_generate_insights"))
+        builder.add_node("persist_insights", runner_action("_persist_insights"))
+        builder.add_node("advance_question", runner_action("_advance_question"))
 
         builder.add_edge(GRAPH_START, "load_recent_memories")
-        builder.add_edge("load_recent_memories", "generate_questions")
+        builder.add_conditional_edges(
+            "load_recent_memories",
+            runner_action("_route_after_load_recent_memories"),
+            {
+                "generate_questions": "generate_questions",
+                "__end__": GRAPH_END,
+            },
+        )
         builder.add_conditional_edges(
             "generate_questions",
-            self._route_after_generate_questions,
+            runner_action("_route_after_generate_questions"),
             {
                 "prepare_question": "prepare_question",
                 "__end__": GRAPH_END,
@@ -102,7 +151,7 @@ class ReflectionGraphRunner:
         builder.add_edge("generate_insights", "persist_insights")
         builder.add_conditional_edges(
             "persist_insights",
-            self._route_after_persist_insights,
+            runner_action("_route_after_persist_insights"),
             {
                 "advance_question": "advance_question",
                 "__end__": GRAPH_END,
@@ -110,7 +159,7 @@ class ReflectionGraphRunner:
         )
         builder.add_conditional_edges(
             "advance_question",
-            self._route_after_advance_question,
+            runner_action("_route_after_advance_question"),
             {
                 "prepare_question": "prepare_question",
                 "__end__": GRAPH_END,
@@ -119,17 +168,20 @@ class ReflectionGraphRunner:
 
         return builder.compile()
 
-    @staticmethod
-    def _initial_state(*, now: datetime.datetime) -> ReflectionGraphState:
+    def _initial_state(self, *, now: datetime.datetime) -> ReflectionGraphState:
         return ReflectionGraphState(
             now=now,
             recent_memories=[],
+            carry_over_reflections=[],
             questions=[],
             question_index=0,
             active_question="",
             retrieved_memories=[],
             generated_insights=[],
             persisted_reflection_count=0,
+            merged_reflection_count=0,
+            saved_llm_call_count=0,
+            runner=self,
         )
 
     def _load_recent_memories(
@@ -137,17 +189,46 @@ class ReflectionGraphRunner:
         state: ReflectionGraphState,
     ) -> dict[str, list[MemoryObject]]:
         _ = state
+        config = self.reflection.config
+        watermark = self.reflection.watermark
+        if watermark is None:
+            return {
+                "recent_memories": self.memory_manager.get_recent_memories(
+                    limit=config.recent_memory_limit
+                ),
+                "carry_over_reflections": [],
+            }
+
+        recent_memories = self.memory_manager.get_memories_since(
+            after_memory_id=watermark.memory_id,
+            limit=config.recent_memory_limit,
+        )
+        if not recent_memories:
+            return {"recent_memories": [], "carry_over_reflections": []}
+
         return {
-            "recent_memories": self.memory_manager.get_recent_memories(limit=100),
+            "recent_memories": recent_memories,
+            "carry_over_reflections": self.memory_manager.get_top_reflections(
+                limit=config.carry_over_reflection_limit,
+                max_memory_id=watermark.memory_id,
+            ),
         }
 
+    def _route_after_load_recent_memories(
+        self,
+        state: ReflectionGraphState,
+    ) -> Literal["generate_questions", "__end__"]:
+        if not state["recent_memories"]:
+            return "__end__"
+        return "generate_questions"
+
     def _generate_questions(
         self,
         state: ReflectionGraphState,
     ) -> dict[str, object]:
         questions = self.llm_gateway.generate_salient_high_level_questions(
             agent_name=self.agent_name,
-            memories=state["recent_memories"],
+            memories=state["recent_memories"] + state["carry_over_reflections"],
         )
         return {
             "questions": questions,
@@ -194,20 +275,33 @@ class ReflectionGraphRunner:
         self,
         state: ReflectionGraphState,
     ) -> dict[str, int]:
+        persisted_count = 0
+        merged_count = 0
+        saved_llm_call_count = 0
         for insight in state["generated_insights"]:
-            _ = self.memory_manager.create_reflection(
+            write_result = self.memory_manager.write_reflection(
                 insight,
                 now=state["now"],
                 context=ReflectionContext(
                     agent_name=self.agent_name,
                     identity_stable_set=self.identity_stable_set,
                 ),
+                dedup_threshold=self.reflection.config.dedup_similarity_threshold,
             )
+            if write_result.merged:
+                merged_count += 1
+                saved_llm_call_count += write_result.saved_llm_calls
+            else:
+                persisted_count += 1
 
         return {
             "persisted_reflection_count": (
-                state["persisted_reflection_count"] + len(state["generated_insights"])
-            )
+                state["persisted_reflection_count"] + persisted_count
+            ),
+            "merged_reflection_count": state["merged_reflection_count"] + merged_count,
+            "saved_llm_call_count": (
+                state["saved_llm_call_count"] + saved_llm_call_count
+            ),
         }
 
     def _route_after_persist_insights(
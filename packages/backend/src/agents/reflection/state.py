@@ -1,25 +1,98 @@
+import datetime
 from dataclasses import dataclass
+from typing import cast
 
 
 @dataclass(frozen=True)
 class ReflectionConfig:
     threshold: int = 150
+    recent_memory_limit: int = 100
+    """한 번의 reflection에서 질문 생성에 사용할 신규 메모리 최대 개수."""
+    carry_over_reflection_limit: int = 3
+    """이전 reflection 중 질문 생성 입력에 다시 포함할 상위 reflection 최대 개수."""
+    dedup_similarity_threshold: float = 0.9
+    """기존 REFLECTION과 병합할 cosine similarity 하한."""
+
+
+@dataclass(frozen=True)
+class ReflectionWatermark:
+    """마지막 reflection이 반영한 메모리 위치."""
+
+    memory_id: int
+    """마지막으로 반영된 메모리 ID."""
+    created_at: datetime.datetime
+    """마지막으로 반영된 메모리의 생성 시각."""
+
+
+@dataclass(frozen=True)
+class ReflectionRunSummary:
+    """한 번의 reflection 실행에서 insight 저장 결과."""
+
+    persisted_reflection_count: int
+    """새 REFLECTION 노드로 저장된 insight 수."""
+    merged_reflection_count: int
+    """기존 REFLECTION 노드에 병합되어 저장을 생략한 insight 수."""
+    saved_llm_call_count: int
+    """병합으로 생략된 임베딩/중요도 LLM 호출 수."""
 
 
 class Reflection:
     def __init__(self, config: ReflectionConfig | None = None):
         self.config: ReflectionConfig = config or ReflectionConfig()
         self._accumulated_importance: int = 0
+        self._watermark: ReflectionWatermark | None = None
 
     @property
     def accumulated_importance(self) -> int:
         return self._accumulated_importance
 
+    @property
+    def watermark(self) -> ReflectionWatermark | None:
+        return self._watermark
+
     def record_observation_importance(self, importance: int) -> None:
         self._accumulated_importance += importance
 
     def clear_importance(self) -> None:
         self._accumulated_importance = 0
 
+    def advance_watermark(self, watermark: ReflectionWatermark) -> None:
+        if (
+            self._watermark is not None
+            and watermark.memory_id <= self._watermark.memory_id
+        ):
+            return
+        self._watermark = watermark
+
     def should_reflect(self) -> bool:
         return self._accumulated_importance >= self.config.threshold
+
+    def to_record(self) -> dict[str, object]:
+        """누적 중요도와 watermark를 JSON 직렬화 가능한 dict로 반환한다(체크포인트용)."""
+        watermark = self._watermark
+        return {
+            "accumulated_importance": self._accumulated_importance,
+            "watermark": (
+                {
+                    "memory_id": watermark.memory_id,
+                    "created_at": watermark.created_at.isoformat(),
+                }
+                if watermark is not None
+                else None
+            ),
+        }
+
+    def restore_record(self, record: dict[str, object]) -> None:
+        """to_record 결과로 누적 중요도와 watermark를 되돌린다."""
+        self._accumulated_importance = int(cast(int, record["accumulated_importance"]))
+        watermark = cast(dict[str, object] | None, record.get("watermark"))
+        self._watermark = (
+            ReflectionWatermark(
+                memory_id=int(cast(int, watermark["memory_id"])),
+                created_at=datetime.datetime.fromisoformat(
+                    str(watermark["created_at"])
+                ),
+            )
+            if watermark is not None
+            else None
+        )
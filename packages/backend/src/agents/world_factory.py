@@ -3,7 +3,7 @@ from pathlib import Path
 
 from agents.agent import AgentContext, AgentProfile, ExtendedPersona, FixedPersona
 from agents.agent_brain import AgentBrain
-from agents.planning import Planner
+from agents.planning import PlanEngine, Planner, PlanStore
 from agents.persona_loader import AgentPersona, PersonaLoader, apply_persona_to_brain
 from agents.reflection import Reflection, ReflectionGraphRunner
 from agents.sim_agent import SimAgent
@@ -12,6 +12,9 @@ from llm.embedding_encoder import LlmEmbeddingEncoder
 from llm.importance_scorer import LlmImportanceScorer
 from llm.llm_gateway import LlmGateway
 
+from .memory.archive import MemoryArchive
+from .memory.cold_segment import MemoryTierConfig
+from .memory.consolidation import MemoryConsolidator
 from .memory.memory_manager import MemoryManager
 from .memory.memory_stream import MemoryStream
 
@@ -30,17 +33,42 @@ def _build_agent(
     persona: AgentPersona,
     llm_client: ProviderClient,
     embedding_model: str,
+    memory_archive_dir: str | Path | None = None,
+    memory_segment_dir: str | Path | None = None,
+    plan_store: PlanStore | None = None,
+    plan_expansion: bool = False,
 ) -> SimAgent:
-    memory_stream = MemoryStream()
+    tier_config = None
+    if memory_segment_dir is not None:
+        tier_config = MemoryTierConfig(
+            segment_dir=Path(memory_segment_dir) / persona.agent.id
+        )
+    memory_stream = MemoryStream(tier_config=tier_config)
     importance_scorer = LlmImportanceScorer(client=llm_client)
     embedding_encoder = LlmEmbeddingEncoder(client=llm_client, model=embedding_model)
+    consolidator = None
+    if memory_archive_dir is not None:
+        consolidator = MemoryConsolidator(
+            archive=MemoryArchive(
+                Path(memory_archive_dir) / f"{persona.agent.id}.jsonl"
+            )
+        )
     memory_manager = MemoryManager(
         memory_stream=memory_stream,
         importance_scorer=importance_scorer,
         embedding_encoder=embedding_encoder,
+        consolidator=consolidator,
     )
     llm_gateway = LlmGateway(llm_client, embedding_encoder=embedding_encoder)
     planner = Planner(llm_gateway)
+    plan_engine = None
+    if plan_expansion and plan_store is not None:
+        plan_engine = PlanEngine(
+            expander=planner,
+            plan_store=plan_store,
+            agent_id=persona.agent.id,
+            agent_name=persona.agent.name,
+        )
     reflection_graph = ReflectionGraphRunner(
         reflection=Reflection(),
         memory_manager=memory_manager,
@@ -54,6 +82,8 @@ def _build_agent(
         reflection_graph=reflection_graph,
         llm_gateway=llm_gateway,
         planner=planner,
+        plan_store=plan_store,
+        plan_engine=plan_engine,
     )
     context = AgentContext(
         identity=persona.agent,
@@ -71,17 +101,33 @@ def init_agents(
     llm_client: ProviderClient,
     embedding_model: str,
     now: datetime.datetime,
+    memory_archive_dir: str | Path | None = None,
+    memory_segment_dir: str | Path | None = None,
+    plan_store_dir: str | Path | None = None,
+    plan_expansion: bool = False,
+    seed_memories: bool = True,
 ) -> list[SimAgent]:
+    """seed_memories=False면 persona seed 기억을 넣지 않는다(체크포인트 복원처럼 기억을 따로 채울 때)."""
     if not agent_persona_names:
         raise ValueError("agent_persona_names must not be empty")
 
     persona_loader = PersonaLoader(persona_dir)
+    plan_store = PlanStore(plan_store_dir)
 
     agents: list[SimAgent] = []
     for persona_name in agent_persona_names:
         persona = persona_loader.load(persona_name)
-        agent = _build_agent(persona, llm_client, embedding_model)
-        apply_persona_to_brain(brain=agent.brain, persona=persona, now=now)
+        agent = _build_agent(
+            persona,
+            llm_client,
+            embedding_model,
+            memory_archive_dir=memory_archive_dir,
+            memory_segment_dir=memory_segment_dir,
+            plan_store=plan_store,
+            plan_expansion=plan_expansion,
+        )
+        if seed_memories:
+            apply_persona_to_brain(brain=agent.brain, persona=persona, now=now)
         agents.append(agent)
 
     return agents
@@ -1,14 +1,25 @@
+from dataclasses import asdict
 from pathlib import Path
 from typing import cast
 
 from agents.persona_loader import PersonaLoader
 from api.schemas import (
     StatusResponse,
+    WorldCheckpointRequest,
+    WorldCheckpointResponse,
+    WorldEventRequest,
+    WorldEventResponse,
+    WorldFocusRequest,
+    WorldFocusResponse,
+    WorldLoggedStepResponse,
+    WorldMetricsResponse,
+    WorldMoveRequest,
+    WorldMoveResponse,
     WorldSchedulerResponse,
     WorldStateResponse,
     WorldStepResponse,
+    WorldTickTimingResponse,
 )
-from db import init_db
 from fastapi import FastAPI, HTTPException
 from settings import (
     EMBEDDING_MODEL,
@@ -17,15 +28,40 @@ from settings import (
     LLM_BASE_URL,
     LLM_MODEL,
     LLM_TIMEOUT_SECONDS,
+    MEMORY_ARCHIVE_DIR,
+    MEMORY_SEGMENT_DIR,
+    PLAN_STORE_DIR,
+    WORLD_BROADCAST_SCOPE,
+    WORLD_CHECKPOINT_COMPACT_EVERY,
+    WORLD_CHECKPOINT_PATH,
+    WORLD_COGNITION_TIER,
+    WORLD_CONVERSATION_SIZE,
+    WORLD_HISTORY_WINDOW,
+    WORLD_INSTRUMENTATION_ENABLED,
+    WORLD_OVERRUN_POLICY,
+    WORLD_PERCEPTION_RADIUS,
+    WORLD_PLAN_EXPANSION,
+    WORLD_SCHEDULER_MODE,
+    WORLD_STEP_LOG_DIR,
+    WORLD_STEP_LOG_SEGMENT_MB,
+    WORLD_STEP_SCHEDULING,
+    WORLD_SHARE_TICK_EMBEDDINGS,
+    WORLD_SPATIAL_ENABLED,
+    WORLD_SPECULATIVE_PREFETCH,
+    WORLD_STEP_WORKERS,
     WORLD_TICK_INTERVAL_SECONDS,
 )
 from world.runtime import WorldRuntime, WorldRuntimeConfig, build_world_runtime
+from world.spatial import Position
 
 app = FastAPI(title="Agent Crossing API")
 
 
 @app.on_event("startup")
 def on_startup() -> None:
+    # sqlalchemy/pgvector/psycopg는 서버 기동 시에만 필요하므로 import 시점에 불러오지 않는다.
+    from db import init_db
+
     init_db()
     persona_dir = Path(__file__).resolve().parents[2] / "persona"
     app.state.persona_loader = PersonaLoader(persona_dir)
@@ -35,7 +71,7 @@ def on_startup() -> None:
     if len(persona_names) >= 2:
         app.state.world_runtime = build_world_runtime(
             config=WorldRuntimeConfig(
-                agent_persona_names=persona_names[:2],
+                agent_persona_names=persona_names,
                 base_url=LLM_BASE_URL,
                 api_key=LLM_API_KEY or GOOGLE_AI_STUDIO_API_KEY,
                 llm_model=LLM_MODEL,
@@ -43,6 +79,27 @@ def on_startup() -> None:
                 timeout_seconds=LLM_TIMEOUT_SECONDS,
                 persona_dir=str(persona_dir),
                 tick_interval_seconds=WORLD_TICK_INTERVAL_SECONDS,
+                scheduler_mode=WORLD_SCHEDULER_MODE,
+                overrun_policy=WORLD_OVERRUN_POLICY,
+                step_scheduling=WORLD_STEP_SCHEDULING,
+                cognition_tier=WORLD_COGNITION_TIER,
+                conversation_size=WORLD_CONVERSATION_SIZE,
+                step_workers=WORLD_STEP_WORKERS,
+                broadcast_scope=WORLD_BROADCAST_SCOPE,
+                memory_archive_dir=MEMORY_ARCHIVE_DIR,
+                memory_segment_dir=MEMORY_SEGMENT_DIR,
+                plan_store_dir=PLAN_STORE_DIR,
+                plan_expansion=WORLD_PLAN_EXPANSION,
+                instrumentation_enabled=WORLD_INSTRUMENTATION_ENABLED,
+                share_tick_embeddings=WORLD_SHARE_TICK_EMBEDDINGS,
+                speculative_prefetch=WORLD_SPECULATIVE_PREFETCH,
+                spatial_world=WORLD_SPATIAL_ENABLED,
+                perception_radius=WORLD_PERCEPTION_RADIUS,
+                history_window=WORLD_HISTORY_WINDOW,
+                step_log_dir=WORLD_STEP_LOG_DIR,
+                step_log_segment_bytes=WORLD_STEP_LOG_SEGMENT_MB * 1024 * 1024,
+                checkpoint_path=WORLD_CHECKPOINT_PATH,
+                checkpoint_compact_every=WORLD_CHECKPOINT_COMPACT_EVERY,
             )
         )
 
@@ -52,6 +109,7 @@ async def on_shutdown() -> None:
     runtime = cast(WorldRuntime | None, getattr(app.state, "world_runtime", None))
     if runtime is not None:
         await runtime.stop_scheduler()
+        runtime.close()
 
 
 @app.get("/", response_model=StatusResponse)
@@ -78,6 +136,36 @@ async def get_world_state() -> WorldStateResponse:
         agent_names=[agent.name for agent in runtime.agents],
         scheduler_running=state.scheduler_running,
         tick_interval_seconds=state.tick_interval_seconds,
+        conversations=state.conversations,
+        turns_per_second=state.turns_per_second,
+        tick_timing=WorldTickTimingResponse(
+            mode=state.tick_timing.mode,
+            overrun_policy=state.tick_timing.overrun_policy,
+            ticks=state.tick_timing.ticks,
+            overruns=state.tick_timing.overruns,
+            skipped_ticks=state.tick_timing.skipped_ticks,
+            lag_ms=state.tick_timing.lag_ms,
+            max_lag_ms=state.tick_timing.max_lag_ms,
+            mean_duration_ms=state.tick_timing.mean_duration_ms,
+            max_duration_ms=state.tick_timing.max_duration_ms,
+            duration_histogram=state.tick_timing.duration_histogram,
+            keeping_up=state.tick_timing.keeping_up,
+        ),
+        step_scheduling=state.step_scheduling,
+        pending_wakes=state.pending_wakes,
+        focused_agents=state.focused_agents,
+        cognition_tiers=dict(state.cognition_tiers),
+        agent_positions=dict(state.agent_positions),
+        encounters=state.encounters,
+        fan_out={
+            **asdict(state.fan_out),
+            "mean_recipients": state.fan_out.mean_recipients,
+        },
+        step_log=asdict(state.step_log) if state.step_log is not None else None,
+        checkpoint=(asdict(state.checkpoint) if state.checkpoint is not None else None),
+        reaction_modes={
+            mode: asdict(metrics) for mode, metrics in state.reaction_modes.items()
+        },
     )
 
 
@@ -96,9 +184,111 @@ async def post_world_step() -> WorldStepResponse:
         silent_rate=metrics.silent_rate,
         semantic_repeat_rate=metrics.semantic_repeat_rate,
         topic_progress_rate=metrics.topic_progress_rate,
+        timings=asdict(step_result.timings) if step_result.timings else None,
+        speculation=_speculation_payload(runtime)
+        if step_result.speculation is not None
+        else None,
+    )
+
+
+@app.get("/world/metrics", response_model=WorldMetricsResponse)
+async def get_world_metrics() -> WorldMetricsResponse:
+    runtime = _require_runtime()
+    return WorldMetricsResponse(
+        conversations={
+            conversation_id: asdict(metrics)
+            for conversation_id, metrics in runtime.conversation_metrics().items()
+        },
+        agents={
+            agent_name: asdict(metrics)
+            for agent_name, metrics in runtime.agent_metrics().items()
+        },
+    )
+
+
+@app.get("/world/steps/{turn}", response_model=WorldLoggedStepResponse)
+async def get_world_logged_step(turn: int) -> WorldLoggedStepResponse:
+    runtime = _require_runtime()
+    if runtime.step_log is None:
+        raise HTTPException(status_code=409, detail="step log is not enabled")
+    record = runtime.logged_step(turn)
+    if record is None:
+        raise HTTPException(status_code=404, detail=f"turn {turn} is not logged")
+    return WorldLoggedStepResponse.model_validate(record)
+
+
+@app.post("/world/checkpoint", response_model=WorldCheckpointResponse)
+async def post_world_checkpoint(
+    request: WorldCheckpointRequest,
+) -> WorldCheckpointResponse:
+    runtime = _require_runtime()
+    if runtime.checkpointer is None:
+        raise HTTPException(status_code=409, detail="checkpoint is not enabled")
+    stats = runtime.compact_checkpoint() if request.compact else runtime.checkpoint()
+    return WorldCheckpointResponse(turn=runtime.turn, **asdict(stats))
+
+
+@app.post("/world/events", response_model=WorldEventResponse)
+async def post_world_event(request: WorldEventRequest) -> WorldEventResponse:
+    runtime = _require_runtime()
+    try:
+        scheduled = runtime.inject_event(
+            content=request.content,
+            agent_names=request.agent_names,
+            importance=request.importance,
+        )
+    except ValueError as exc:
+        raise HTTPException(status_code=404, detail=str(exc)) from exc
+    return WorldEventResponse(
+        scheduled=scheduled,
+        step_scheduling=runtime.step_scheduling,
+        current_time=runtime.current_time.isoformat(),
+    )
+
+
+@app.post("/world/focus", response_model=WorldFocusResponse)
+async def post_world_focus(request: WorldFocusRequest) -> WorldFocusResponse:
+    runtime = _require_runtime()
+    try:
+        changed = runtime.set_focus(request.agent_names)
+    except ValueError as exc:
+        raise HTTPException(status_code=404, detail=str(exc)) from exc
+    state = runtime.state()
+    return WorldFocusResponse(
+        focused_agents=state.focused_agents,
+        changed_agents=changed,
+        cognition_tiers=dict(state.cognition_tiers),
     )
 
 
+@app.post("/world/agents/move", response_model=WorldMoveResponse)
+async def post_world_move(request: WorldMoveRequest) -> WorldMoveResponse:
+    runtime = _require_runtime()
+    if runtime.spatial is None:
+        raise HTTPException(status_code=409, detail="spatial world is not enabled")
+    try:
+        nearby = runtime.move_agent(
+            request.agent_name, Position(x=request.x, y=request.y)
+        )
+    except ValueError as exc:
+        raise HTTPException(status_code=404, detail=str(exc)) from exc
+    return WorldMoveResponse(
+        agent_name=request.agent_name,
+        x=request.x,
+        y=request.y,
+        nearby_agents=nearby,
+    )
+
+
+def _speculation_payload(runtime: WorldRuntime) -> dict[str, object]:
+    stats = runtime.speculation_stats
+    return {
+        **asdict(stats),
+        "hit_rate": stats.hit_rate,
+        "saved_ms_per_turn": stats.saved_ms_per_turn,
+    }
+
+
 def _scheduler_response(runtime: WorldRuntime) -> WorldSchedulerResponse:
     state = runtime.state()
     return WorldSchedulerResponse(
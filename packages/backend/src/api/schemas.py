@@ -1,4 +1,4 @@
-from pydantic import BaseModel
+from pydantic import BaseModel, Field
 
 
 class StatusResponse(BaseModel):
@@ -6,6 +6,20 @@ class StatusResponse(BaseModel):
     version: str
 
 
+class WorldTickTimingResponse(BaseModel):
+    mode: str = "interval"
+    overrun_policy: str = "skip"
+    ticks: int = 0
+    overruns: int = 0
+    skipped_ticks: int = 0
+    lag_ms: float = 0.0
+    max_lag_ms: float = 0.0
+    mean_duration_ms: float = 0.0
+    max_duration_ms: float = 0.0
+    duration_histogram: dict[str, int] = Field(default_factory=dict)
+    keeping_up: bool = True
+
+
 class WorldStateResponse(BaseModel):
     available: bool
     turn: int
@@ -14,6 +28,76 @@ class WorldStateResponse(BaseModel):
     agent_names: list[str]
     scheduler_running: bool
     tick_interval_seconds: float
+    conversations: int = 1
+    turns_per_second: float = 0.0
+    tick_timing: WorldTickTimingResponse = Field(
+        default_factory=WorldTickTimingResponse
+    )
+    step_scheduling: str = "every_tick"
+    pending_wakes: int = 0
+    focused_agents: list[str] = Field(default_factory=list)
+    cognition_tiers: dict[str, str] = Field(default_factory=dict)
+    agent_positions: dict[str, tuple[float, float]] = Field(default_factory=dict)
+    encounters: int = 0
+    fan_out: dict[str, float] = Field(default_factory=dict)
+    step_log: dict[str, int] | None = None
+    checkpoint: dict[str, float] | None = None
+    reaction_modes: dict[str, dict[str, float]] = Field(default_factory=dict)
+
+
+class WorldCheckpointRequest(BaseModel):
+    compact: bool = False
+
+
+class WorldCheckpointResponse(BaseModel):
+    turn: int
+    bases: int
+    deltas: int
+    bytes_written: int
+    last_delta_bytes: int
+    last_write_ms: float
+    max_write_ms: float
+    last_base_ms: float
+
+
+class WorldEventRequest(BaseModel):
+    content: str = Field(min_length=1)
+    agent_names: list[str] | None = None
+    importance: int | None = Field(default=None, ge=1, le=10)
+
+
+class WorldEventResponse(BaseModel):
+    scheduled: int
+    step_scheduling: str
+    current_time: str
+
+
+class WorldFocusRequest(BaseModel):
+    agent_names: list[str]
+
+
+class WorldFocusResponse(BaseModel):
+    focused_agents: list[str]
+    changed_agents: list[str]
+    cognition_tiers: dict[str, str]
+
+
+class WorldMoveRequest(BaseModel):
+    agent_name: str
+    x: float
+    y: float
+
+
+class WorldMoveResponse(BaseModel):
+    agent_name: str
+    x: float
+    y: float
+    nearby_agents: list[str]
+
+
+class WorldMetricsResponse(BaseModel):
+    conversations: dict[str, dict[str, float]]
+    agents: dict[str, dict[str, float]]
 
 
 class WorldStepResponse(BaseModel):
@@ -26,6 +110,21 @@ class WorldStepResponse(BaseModel):
     silent_rate: float
     semantic_repeat_rate: float
     topic_progress_rate: float
+    timings: dict[str, object] | None = None
+    speculation: dict[str, object] | None = None
+
+
+class WorldLoggedStepResponse(BaseModel):
+    turn: int
+    conversation_id: str
+    conversation_turn: int
+    now: str
+    speaker_name: str
+    reply: str
+    silent_reason: str
+    parse_failure: bool
+    trace: dict[str, object]
+    observability: dict[str, object]
 
 
 class WorldSchedulerResponse(BaseModel):
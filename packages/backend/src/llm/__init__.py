@@ -6,17 +6,22 @@ from .embedding_encoder import (
 from .clients.litellm_client import LiteLlmClient, LiteLlmClientError
 from .clients.types import JsonObject, LlmGenerateOptions
 from .importance_scorer import (
+    BatchImportanceScorer,
+    HeuristicImportanceScorer,
     ImportanceScorer,
     ImportanceScoringContext,
     LlmImportanceScorer,
     clamp_importance,
+    parse_batch_importance_values,
     parse_importance_value,
 )
 from .clients.provider_factory import build_provider_client
 
 __all__ = [
+    "BatchImportanceScorer",
     "EmbeddingEncoder",
     "EmbeddingEncodingContext",
+    "HeuristicImportanceScorer",
     "ImportanceScoringContext",
     "ImportanceScorer",
     "JsonObject",
@@ -27,5 +32,6 @@ __all__ = [
     "LlmImportanceScorer",
     "build_provider_client",
     "clamp_importance",
+    "parse_batch_importance_values",
     "parse_importance_value",
 ]
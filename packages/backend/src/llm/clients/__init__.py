@@ -1,8 +1,10 @@
+from .instrumented import InstrumentedProviderClient
 from .litellm_client import LiteLlmClient, LiteLlmClientError
 from .provider_factory import ProviderClient, build_provider_client
 from .types import JsonObject, LlmGenerateOptions
 
 __all__ = [
+    "InstrumentedProviderClient",
     "JsonObject",
     "LiteLlmClient",
     "LiteLlmClientError",
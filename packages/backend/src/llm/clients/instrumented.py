@@ -0,0 +1,98 @@
+import time
+
+from utils.instrumentation import active_profile
+
+from .provider_factory import ProviderClient
+from .types import LlmGenerateOptions
+
+
+class InstrumentedProviderClient:
+    """
+    ProviderClient 호출 수, 입력/응답 문자 수, wall time을 활성 StepProfile에 기록한다.
+    - 활성 profile이 없으면 내부 client로 바로 위임한다.
+    """
+
+    def __init__(self, client: ProviderClient):
+        self.client: ProviderClient = client
+
+    def generate(
+        self,
+        *,
+        prompt: str,
+        system: str | None = None,
+        options: LlmGenerateOptions | None = None,
+        format_json: bool = False,
+    ) -> str:
+        profile = active_profile()
+        if profile is None:
+            return self.client.generate(
+                prompt=prompt, system=system, options=options, format_json=format_json
+            )
+
+        prompt_chars = len(prompt) + len(system or "")
+        started = time.perf_counter()
+        try:
+            response = self.client.generate(
+                prompt=prompt, system=system, options=options, format_json=format_json
+            )
+        except Exception:
+            profile.record_llm_call(
+                kind="generate",
+                prompt_chars=prompt_chars,
+                response_chars=0,
+                elapsed_ms=(time.perf_counter() - started) * 1000,
+                failed=True,
+            )
+            raise
+        profile.record_llm_call(
+            kind="generate",
+            prompt_chars=prompt_chars,
+            response_chars=len(response),
+            elapsed_ms=(time.perf_counter() - started) * 1000,
+        )
+        return response
+
+    def embed(
+        self,
+        *,
+        model: str | None = None,
+        input: str,
+        truncate: bool = True,
+        keep_alive: str = "30m",
+        expected_dimension: int | None = None,
+    ) -> list[float]:
+        profile = active_profile()
+        if profile is None:
+            return self.client.embed(
+                model=model,
+                input=input,
+                truncate=truncate,
+                keep_alive=keep_alive,
+                expected_dimension=expected_dimension,
+            )
+
+        started = time.perf_counter()
+        try:
+            vector = self.client.embed(
+                model=model,
+                input=input,
+                truncate=truncate,
+                keep_alive=keep_alive,
+                expected_dimension=expected_dimension,
+            )
+        except Exception:
+            profile.record_llm_call(
+                kind="embed",
+                prompt_chars=len(input),
+                response_chars=0,
+                elapsed_ms=(time.perf_counter() - started) * 1000,
+                failed=True,
+            )
+            raise
+        profile.record_llm_call(
+            kind="embed",
+            prompt_chars=len(input),
+            response_chars=0,
+            elapsed_ms=(time.perf_counter() - started) * 1000,
+        )
+        return vector
@@ -1,7 +1,8 @@
 from dataclasses import dataclass
-from typing import Any, cast
+from functools import cache
+from importlib import import_module
+from typing import Any, Protocol, cast
 
-import litellm
 from settings import EMBEDDING_DIMENSION
 
 from .types import LlmGenerateOptions
@@ -11,6 +12,22 @@ class LiteLlmClientError(RuntimeError):
     pass
 
 
+class LiteLlmModule(Protocol):
+    def completion(self, **kwargs: Any) -> object: ...
+
+    def embedding(self, **kwargs: Any) -> object: ...
+
+
+@cache
+def _litellm() -> LiteLlmModule:
+    """
+    litellm 모듈을 첫 호출 시 한 번만 불러온다.
+    - import만으로 수 초가 걸리고 model cost map을 네트워크로 받아오므로
+      클라이언트를 실제로 쓰는 프로세스만 비용을 낸다.
+    """
+    return cast(LiteLlmModule, cast(object, import_module("litellm")))
+
+
 def _coerce_text(value: object) -> str | None:
     if isinstance(value, str):
         return value
@@ -88,7 +105,7 @@ class LiteLlmClient:
                 kwargs["response_format"] = {"type": "json_object"}
 
         try:
-            response = litellm.completion(**kwargs)
+            response = _litellm().completion(**kwargs)
         except Exception as exc:
             raise LiteLlmClientError(f"LiteLLM completion failed: {exc}") from exc
 
@@ -133,7 +150,7 @@ class LiteLlmClient:
             kwargs["api_key"] = self.api_key
 
         try:
-            response = litellm.embedding(**kwargs)
+            response = _litellm().embedding(**kwargs)
         except Exception as exc:
             raise LiteLlmClientError(f"LiteLLM embedding failed: {exc}") from exc
 
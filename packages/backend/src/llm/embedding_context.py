@@ -0,0 +1,100 @@
+"""
+한 tick 안에서 임베딩을 공유하기 위한 컨텍스트.
+
+- 같은 텍스트는 한 번만 임베딩한다(정확 일치 캐시).
+- share(derived, source)로 등록한 파생 텍스트는 source 텍스트의 벡터를 재사용한다.
+  예) 검색 쿼리 -> 인지 observation, "I decided to react: X"/브로드캐스트 observation -> 발화 X
+- tick_embedding_scope() 밖에서는 아무 것도 캐시하지 않는다.
+"""
+
+from collections.abc import Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass
+
+import numpy as np
+
+
+@dataclass(frozen=True)
+class TickEmbeddingStats:
+    encoded: int = 0
+    """provider로 실제 임베딩한 횟수."""
+    cache_hits: int = 0
+    """같은 텍스트의 벡터를 재사용한 횟수."""
+    shared_hits: int = 0
+    """provider 호출 없이 파생 텍스트에 source 텍스트 벡터를 재사용한 횟수."""
+
+    @property
+    def saved_calls(self) -> int:
+        return self.cache_hits + self.shared_hits
+
+
+class TickEmbeddingContext:
+    def __init__(self) -> None:
+        self._vectors: dict[str, np.ndarray] = {}
+        self._sources: dict[str, str] = {}
+        self._encoded: int = 0
+        self._cache_hits: int = 0
+        self._shared_hits: int = 0
+
+    def share(self, derived_text: str, source_text: str) -> None:
+        """derived_text를 임베딩할 때 source_text의 벡터를 사용하도록 등록한다."""
+        if derived_text == source_text:
+            return
+        self._sources[derived_text] = self._sources.get(source_text, source_text)
+
+    def resolve(self, text: str) -> str:
+        """실제로 임베딩할 텍스트를 반환한다."""
+        return self._sources.get(text, text)
+
+    def lookup(self, text: str) -> np.ndarray | None:
+        source_text = self.resolve(text)
+        vector = self._vectors.get(source_text)
+        if vector is None:
+            return None
+        if source_text == text:
+            self._cache_hits += 1
+        else:
+            self._shared_hits += 1
+        return vector
+
+    def store(self, text: str, vector: np.ndarray) -> None:
+        self._encoded += 1
+        self._vectors[self.resolve(text)] = vector
+
+    def stats(self) -> TickEmbeddingStats:
+        return TickEmbeddingStats(
+            encoded=self._encoded,
+            cache_hits=self._cache_hits,
+            shared_hits=self._shared_hits,
+        )
+
+
+_ACTIVE_CONTEXT: ContextVar[TickEmbeddingContext | None] = ContextVar(
+    "active_tick_embedding_context", default=None
+)
+
+
+def active_tick_embeddings() -> TickEmbeddingContext | None:
+    return _ACTIVE_CONTEXT.get()
+
+
+def share_tick_embedding(derived_text: str, source_text: str) -> None:
+    """활성 tick 컨텍스트가 있을 때만 파생 텍스트를 source 벡터에 연결한다."""
+    context = _ACTIVE_CONTEXT.get()
+    if context is not None:
+        context.share(derived_text, source_text)
+
+
+@contextmanager
+def tick_embedding_scope(
+    context: TickEmbeddingContext | None = None,
+) -> Iterator[TickEmbeddingContext]:
+    """context를 주면 그 컨텍스트를 다시 활성화한다(step이 끝난 뒤 이어지는 전달 등)."""
+    if context is None:
+        context = TickEmbeddingContext()
+    token = _ACTIVE_CONTEXT.set(context)
+    try:
+        yield context
+    finally:
+        _ACTIVE_CONTEXT.reset(token)
@@ -4,6 +4,8 @@ from typing import Protocol
 import numpy as np
 from settings import EMBEDDING_DIMENSION
 
+from .embedding_context import active_tick_embeddings
+
 
 @dataclass(frozen=True)
 class EmbeddingEncodingContext:
@@ -36,9 +38,21 @@ class LlmEmbeddingEncoder:
         self.model: str = model
 
     def encode(self, context: EmbeddingEncodingContext) -> np.ndarray:
+        tick_embeddings = active_tick_embeddings()
+        if tick_embeddings is None:
+            return self._embed(context.text)
+
+        cached = tick_embeddings.lookup(context.text)
+        if cached is not None:
+            return cached
+        embedding = self._embed(tick_embeddings.resolve(context.text))
+        tick_embeddings.store(context.text, embedding)
+        return embedding
+
+    def _embed(self, text: str) -> np.ndarray:
         vector = self.client.embed(
             model=self.model,
-            input=context.text,
+            input=text,
             truncate=True,
             keep_alive="30m",
             expected_dimension=EMBEDDING_DIMENSION,
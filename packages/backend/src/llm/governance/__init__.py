@@ -21,7 +21,13 @@ from .trace_payload import (
 )
 from .metrics import (
     ConversationMetrics,
+    ConversationMetricsAccumulator,
+    ReactionModeCounts,
+    ReactionModeMetrics,
     build_conversation_metrics,
+    merge_agent_metrics,
+    build_reaction_mode_metrics,
+    requested_reaction_mode,
     semantic_repeat_rate,
     semantic_similarity_proxy,
     tokenize,
@@ -38,6 +44,9 @@ from .policies import (
 
 __all__ = [
     "ConversationMetrics",
+    "ConversationMetricsAccumulator",
+    "ReactionModeCounts",
+    "ReactionModeMetrics",
     "DayPlanParseError",
     "HourPlanParseError",
     "HourPlanParseResult",
@@ -48,9 +57,11 @@ __all__ = [
     "apply_reply_policy",
     "attempt_json_repair_once",
     "build_conversation_metrics",
+    "build_reaction_mode_metrics",
     "fallback_reply",
     "is_reaction_parse_failure",
     "is_repetitive_reply",
+    "merge_agent_metrics",
     "merge_policy_trace",
     "normalize_reply_for_repeat_check",
     "parse_json_object",
@@ -59,6 +70,7 @@ __all__ = [
     "parse_reaction_utterance",
     "recent_replies_for_echo_check",
     "reaction_trace_to_payload",
+    "requested_reaction_mode",
     "semantic_repeat_rate",
     "semantic_similarity_proxy",
     "tokenize",
@@ -1,15 +1,31 @@
 from .conversation_metrics import (
     ConversationMetrics,
+    ConversationMetricsAccumulator,
     build_conversation_metrics,
+    merge_agent_metrics,
     semantic_repeat_rate,
     semantic_similarity_proxy,
     tokenize,
     topic_progress_rate,
 )
+from .reaction_mode_metrics import (
+    ReactionModeCounts,
+    ReactionModeMetrics,
+    build_reaction_mode_metrics,
+    is_mode_parse_failure,
+    requested_reaction_mode,
+)
 
 __all__ = [
     "ConversationMetrics",
+    "ConversationMetricsAccumulator",
+    "ReactionModeCounts",
+    "ReactionModeMetrics",
     "build_conversation_metrics",
+    "build_reaction_mode_metrics",
+    "is_mode_parse_failure",
+    "merge_agent_metrics",
+    "requested_reaction_mode",
     "semantic_repeat_rate",
     "semantic_similarity_proxy",
     "tokenize",
@@ -1,5 +1,6 @@
 import re
-from dataclasses import dataclass
+from collections import deque
+from dataclasses import asdict, dataclass, field, replace
 from typing import cast
 
 
@@ -9,8 +10,10 @@ def tokenize(text: str) -> set[str]:
 
 
 def semantic_similarity_proxy(a: str, b: str) -> float:
-    tokens_a = tokenize(a)
-    tokens_b = tokenize(b)
+    return _token_similarity(tokenize(a), tokenize(b))
+
+
+def _token_similarity(tokens_a: set[str], tokens_b: set[str]) -> float:
     if not tokens_a or not tokens_b:
         return 0.0
     intersection = len(tokens_a.intersection(tokens_b))
@@ -92,3 +95,153 @@ def build_conversation_metrics(
         semantic_repeat_rate=semantic_repeat_rate(session_history=session_history),
         topic_progress_rate=topic_progress_rate(session_history),
     )
+
+
+@dataclass
+class _MetricCounts:
+    turns: int = 0
+    parse_failures: int = 0
+    silent_turns: int = 0
+    entries: int = 0
+    repeats: int = 0
+    evaluated: int = 0
+    progressed: int = 0
+
+    def merge(self, other: "_MetricCounts") -> "_MetricCounts":
+        return _MetricCounts(
+            turns=self.turns + other.turns,
+            parse_failures=self.parse_failures + other.parse_failures,
+            silent_turns=self.silent_turns + other.silent_turns,
+            entries=self.entries + other.entries,
+            repeats=self.repeats + other.repeats,
+            evaluated=self.evaluated + other.evaluated,
+            progressed=self.progressed + other.progressed,
+        )
+
+    def metrics(self) -> ConversationMetrics:
+        return ConversationMetrics(
+            parse_failure_rate=self.parse_failures / max(1, self.turns),
+            silent_rate=self.silent_turns / max(1, self.turns),
+            semantic_repeat_rate=self.repeats / max(1, self.entries),
+            topic_progress_rate=self.progressed / max(1, self.evaluated),
+        )
+
+
+@dataclass
+class ConversationMetricsAccumulator:
+    """
+    세션 history에 발화가 쌓일 때마다 지표를 갱신한다.
+    - semantic_repeat_rate/topic_progress_rate를 전체 history로 다시 계산한 값과 같다.
+    - 발화마다 토큰 집합을 한 번만 만들고 최근 window개만 보관하므로 갱신 비용은 O(window)다.
+    - 발화별 판정을 화자에게도 누적해 에이전트별 지표를 낸다. 에이전트별 semantic_repeat은
+      그 에이전트 발화 중 세션 최근 발화와 겹친 비율, topic_progress는 그 에이전트 발화 중
+      직전 발화보다 화제를 진전시킨 비율이다.
+    """
+
+    window: int = 4
+    threshold: float = 0.8
+    _totals: _MetricCounts = field(default_factory=_MetricCounts)
+    _by_agent: dict[str, _MetricCounts] = field(default_factory=dict)
+    _recent_tokens: deque[set[str]] = field(default_factory=deque)
+    _previous_tokens: set[str] = field(default_factory=set)
+
+    def add_reply(self, speaker_name: str, reply: str) -> None:
+        """session.history에 (speaker_name, reply)가 추가될 때 호출한다."""
+        tokens = tokenize(reply)
+        repeated = False
+        if reply.strip() and self._totals.entries > 0:
+            repeated = any(
+                _token_similarity(tokens, previous) >= self.threshold
+                for previous in self._recent_tokens
+            )
+
+        evaluated = False
+        progressed = False
+        if reply.strip() and tokens:
+            evaluated = True
+            if not self._previous_tokens:
+                progressed = True
+            else:
+                new_ratio = len(tokens - self._previous_tokens) / max(1, len(tokens))
+                progressed = new_ratio >= 0.35 or "?" in reply
+            self._previous_tokens = tokens
+
+        self._recent_tokens.append(tokens)
+        if len(self._recent_tokens) > self.window:
+            _ = self._recent_tokens.popleft()
+
+        delta = _MetricCounts(
+            entries=1,
+            repeats=int(repeated),
+            evaluated=int(evaluated),
+            progressed=int(progressed),
+        )
+        self._totals = self._totals.merge(delta)
+        self._by_agent[speaker_name] = self._agent_counts(speaker_name).merge(delta)
+
+    def record_turn(
+        self, speaker_name: str, *, parse_failure: bool, silent: bool
+    ) -> None:
+        """에이전트별 parse_failure_rate/silent_rate 분모와 분자를 누적한다."""
+        self._by_agent[speaker_name] = self._agent_counts(speaker_name).merge(
+            _MetricCounts(
+                turns=1, parse_failures=int(parse_failure), silent_turns=int(silent)
+            )
+        )
+
+    def build(
+        self, *, turns: int, parse_failures: int, silent_turns: int
+    ) -> ConversationMetrics:
+        """build_conversation_metrics(session_history=지금까지의 history)와 같은 결과."""
+        metrics = replace(
+            self._totals.metrics(),
+            parse_failure_rate=parse_failures / max(1, turns),
+            silent_rate=silent_turns / max(1, turns),
+        )
+        if self._totals.entries < 2:
+            return replace(metrics, semantic_repeat_rate=0.0, topic_progress_rate=0.0)
+        return metrics
+
+    def agent_metrics(self) -> dict[str, ConversationMetrics]:
+        """이 세션에서 말하거나 차례를 가진 에이전트별 지표."""
+        return {name: counts.metrics() for name, counts in self._by_agent.items()}
+
+    def to_record(self) -> dict[str, object]:
+        """누적값과 최근 토큰 집합을 JSON 직렬화 가능한 dict로 반환한다(체크포인트용)."""
+        return {
+            "totals": asdict(self._totals),
+            "by_agent": {
+                name: asdict(counts) for name, counts in self._by_agent.items()
+            },
+            "recent_tokens": [sorted(tokens) for tokens in self._recent_tokens],
+            "previous_tokens": sorted(self._previous_tokens),
+        }
+
+    def restore_record(self, record: dict[str, object]) -> None:
+        """to_record 결과로 누적 상태를 되돌린다. 이후 add_reply 결과는 끊김 없이 이어진다."""
+        self._totals = _MetricCounts(**cast(dict[str, int], record["totals"]))
+        self._by_agent = {
+            name: _MetricCounts(**counts)
+            for name, counts in cast(
+                dict[str, dict[str, int]], record["by_agent"]
+            ).items()
+        }
+        self._recent_tokens = deque(
+            set(tokens) for tokens in cast(list[list[str]], record["recent_tokens"])
+        )
+        self._previous_tokens = set(cast(list[str], record["previous_tokens"]))
+
+    def _agent_counts(self, agent_name: str) -> _MetricCounts:
+        return self._by_agent.get(agent_name, _MetricCounts())
+
+
+def merge_agent_metrics(
+    accumulators: list[ConversationMetricsAccumulator],
+) -> dict[str, ConversationMetrics]:
+    """여러 세션의 에이전트별 누적값을 합쳐 에이전트별 지표를 만든다(한 에이전트가 여러 세션에 속할 때)."""
+    # _MetricCounts는 모듈 밖에 내놓지 않으므로 같은 모듈에서 누적값을 직접 합친다.
+    merged: dict[str, _MetricCounts] = {}
+    for accumulator in accumulators:
+        for name, counts in accumulator._by_agent.items():
+            merged[name] = merged.get(name, _MetricCounts()).merge(counts)
+    return {name: counts.metrics() for name, counts in merged.items()}
@@ -0,0 +1,77 @@
+from dataclasses import dataclass
+
+from agents.reaction.contracts import ReactionDecisionTrace
+
+
+@dataclass(frozen=True)
+class ReactionModeMetrics:
+    turns: int
+    parse_failure_rate: float
+    fallback_rate: float
+    mean_generate_calls: float
+    mean_latency_ms: float
+
+
+@dataclass(frozen=True)
+class ReactionModeCounts:
+    """요청 모드 하나의 누적값. 런타임이 턴마다 merge해 모드별 지표를 낸다."""
+
+    turns: int = 0
+    parse_failures: int = 0
+    fallbacks: int = 0
+    generate_calls: int = 0
+    latency_ms: float = 0.0
+
+    @classmethod
+    def from_trace(cls, trace: ReactionDecisionTrace) -> "ReactionModeCounts":
+        return cls(
+            turns=1,
+            parse_failures=int(is_mode_parse_failure(trace)),
+            fallbacks=int(trace.reaction_mode == "fused_fallback"),
+            generate_calls=trace.generate_calls,
+            latency_ms=trace.generation_latency_ms,
+        )
+
+    def merge(self, other: "ReactionModeCounts") -> "ReactionModeCounts":
+        return ReactionModeCounts(
+            turns=self.turns + other.turns,
+            parse_failures=self.parse_failures + other.parse_failures,
+            fallbacks=self.fallbacks + other.fallbacks,
+            generate_calls=self.generate_calls + other.generate_calls,
+            latency_ms=self.latency_ms + other.latency_ms,
+        )
+
+    def metrics(self) -> ReactionModeMetrics:
+        turns = max(1, self.turns)
+        return ReactionModeMetrics(
+            turns=self.turns,
+            parse_failure_rate=self.parse_failures / turns,
+            fallback_rate=self.fallbacks / turns,
+            mean_generate_calls=self.generate_calls / turns,
+            mean_latency_ms=self.latency_ms / turns,
+        )
+
+
+def requested_reaction_mode(trace: ReactionDecisionTrace) -> str:
+    if trace.reaction_mode.startswith("fused"):
+        return "fused"
+    return "two_stage"
+
+
+def is_mode_parse_failure(trace: ReactionDecisionTrace) -> bool:
+    """최종 파싱 실패이거나 fused JSON을 읽지 못해 fallback한 경우."""
+    return (
+        not trace.parse_success or trace.mode_fallback_reason == "fused_parse_failure"
+    )
+
+
+def build_reaction_mode_metrics(
+    traces: list[ReactionDecisionTrace],
+) -> dict[str, ReactionModeMetrics]:
+    counts: dict[str, ReactionModeCounts] = {}
+    for trace in traces:
+        mode = requested_reaction_mode(trace)
+        counts[mode] = counts.get(mode, ReactionModeCounts()).merge(
+            ReactionModeCounts.from_trace(trace)
+        )
+    return {mode: mode_counts.metrics() for mode, mode_counts in counts.items()}
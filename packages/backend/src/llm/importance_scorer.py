@@ -7,7 +7,10 @@ from .clients.types import (
     JsonObject,
     LlmGenerateOptions,
 )
-from .prompt_builders import build_importance_scoring_prompt
+from .prompt_builders import (
+    build_batch_importance_scoring_prompt,
+    build_importance_scoring_prompt,
+)
 
 
 def clamp_importance(value: int) -> int:
@@ -40,8 +43,10 @@ def parse_importance_value(text: str, fallback_importance: int) -> int:
     if payload is None:
         return fallback_importance
 
-    raw_importance = payload.get("importance")
+    return _coerce_importance(payload.get("importance"), fallback_importance)
+
 
+def _coerce_importance(raw_importance: object, fallback_importance: int) -> int:
     if isinstance(raw_importance, bool):
         return fallback_importance
 
@@ -59,6 +64,25 @@ def parse_importance_value(text: str, fallback_importance: int) -> int:
     return fallback_importance
 
 
+def parse_batch_importance_values(
+    text: str, agent_names: list[str], fallback_importance: int
+) -> list[int]:
+    """{"scores": [{"agent", "importance"}]} 응답을 agent_names 순서의 점수로 바꾼다. 빠진 에이전트는 fallback."""
+    payload = _parse_json_object(text)
+    raw_scores = payload.get("scores") if payload is not None else None
+    by_agent: dict[str, int] = {}
+    if isinstance(raw_scores, list):
+        for raw_score in raw_scores:
+            if not isinstance(raw_score, dict):
+                continue
+            agent = raw_score.get("agent")
+            if isinstance(agent, str):
+                by_agent[agent.strip()] = _coerce_importance(
+                    raw_score.get("importance"), fallback_importance
+                )
+    return [by_agent.get(name, fallback_importance) for name in agent_names]
+
+
 @dataclass(frozen=True)
 class ImportanceScoringContext:
     observation: str
@@ -71,6 +95,42 @@ class ImportanceScorer(Protocol):
     def score(self, context: ImportanceScoringContext) -> int: ...
 
 
+class BatchImportanceScorer(Protocol):
+    def score_batch(self, contexts: list[ImportanceScoringContext]) -> list[int]: ...
+
+
+HEURISTIC_IMPORTANCE_CUES: tuple[str, ...] = (
+    "!",
+    "?",
+    "help",
+    "urgent",
+    "emergency",
+    "fire",
+    "accident",
+    "도와",
+    "긴급",
+    "사고",
+    "불이",
+    "위험",
+)
+"""관찰에 포함되면 중요도를 올리는 단서(소문자 비교)."""
+
+
+class HeuristicImportanceScorer:
+    """
+    LLM 호출 없이 관찰 문자열의 단서만으로 중요도를 매긴다(저충실도 인지용).
+    - base_importance에서 시작해 긴급/질문 단서가 하나 나올 때마다 2씩 올린다.
+    """
+
+    def __init__(self, base_importance: int = 2) -> None:
+        self.base_importance: int = clamp_importance(base_importance)
+
+    def score(self, context: ImportanceScoringContext) -> int:
+        observation = context.observation.lower()
+        cues = sum(cue in observation for cue in HEURISTIC_IMPORTANCE_CUES)
+        return clamp_importance(self.base_importance + 2 * cues)
+
+
 class ImportanceGenerateClient(Protocol):
     def generate(
         self,
@@ -107,6 +167,43 @@ class LlmImportanceScorer:
 
         return parse_importance_value(response, self.fallback_importance)
 
+    def score_batch(self, contexts: list[ImportanceScoringContext]) -> list[int]:
+        """
+        여러 에이전트의 관찰을 LLM 호출 한 번으로 채점한다(수신자 묶음 단위 채점).
+        - 한 명이면 score와 같은 프롬프트를 쓴다.
+        - 호출이 실패하거나 응답에서 빠진 에이전트는 fallback_importance로 둔다.
+        """
+        if not contexts:
+            return []
+        if len(contexts) == 1:
+            return [self.score(contexts[0])]
+
+        prompt = build_batch_importance_scoring_prompt(
+            agents=[
+                (
+                    context.agent_name,
+                    context.identity_stable_set,
+                    context.current_plan,
+                    context.observation,
+                )
+                for context in contexts
+            ]
+        )
+        try:
+            response = self.client.generate(
+                prompt=prompt,
+                options=self.options,
+                format_json=True,
+            )
+        except (RuntimeError, TimeoutError, ValueError):
+            return [self.fallback_importance] * len(contexts)
+
+        return parse_batch_importance_values(
+            response,
+            [context.agent_name for context in contexts],
+            self.fallback_importance,
+        )
+
     @staticmethod
     def _build_prompt(context: ImportanceScoringContext) -> str:
         return build_importance_scoring_prompt(
@@ -15,6 +15,8 @@ from agents.reaction import (
     GenerateClient,
     ReactionDecision,
     ReactionDecisionInput,
+    ReactionMode,
+    ReactionRetryBudget,
 )
 from agents.reaction.graph import ReactionGraphRunner
 from llm.clients.types import JsonObject, LlmGenerateOptions
@@ -53,12 +55,16 @@ class LlmGateway:
         generation_client: GenerateClient,
         *,
         embedding_encoder: EmbeddingEncoder | None = None,
+        reaction_mode: ReactionMode | None = None,
+        retry_budget: ReactionRetryBudget | None = None,
     ):
         self.generation_client: GenerateClient = generation_client
         self.embedding_encoder: EmbeddingEncoder | None = embedding_encoder
         self.reaction_graph: ReactionGraphRunner = ReactionGraphRunner(
             generation_client=generation_client,
             embedding_encoder=embedding_encoder,
+            reaction_mode=reaction_mode,
+            retry_budget=retry_budget,
         )
         self.planning_graph: PlanningGraphRunner = PlanningGraphRunner(
             planning_client=self
@@ -21,6 +21,12 @@ REACTION_UTTERANCE_JSON_SHAPE = (
     '"end_dialogue": <boolean>}'
 )
 
+REACTION_DECISION_JSON_SHAPE = (
+    '{"should_react": <boolean>, "utterance": "<string, empty when should_react is false>", '
+    '"thought": "<string>", "critique": "<string>", "reason": "<short string>", '
+    '"end_dialogue": <boolean>}'
+)
+
 SALIENT_QUESTIONS_JSON_SHAPE = (
     '{"questions": ["<question 1>", "<question 2>", "<question 3>"]}'
 )
@@ -34,6 +40,10 @@ INSIGHTS_JSON_SHAPE = (
 
 IMPORTANCE_JSON_SHAPE = '{"importance": <int 1-10>, "reason": "<short>"}'
 
+BATCH_IMPORTANCE_JSON_SHAPE = (
+    '{"scores": [{"agent": "<agent name>", "importance": <int 1-10>}]}'
+)
+
 DAY_PLAN_JSON_SHAPE = (
     '{"items": ['
     '{"start_time": "<ISO-8601 datetime>", "end_time": "<ISO-8601 datetime later than start_time>", '
@@ -146,6 +156,24 @@ def build_importance_scoring_prompt(
     )
 
 
+def build_batch_importance_scoring_prompt(
+    *,
+    agents: Sequence[tuple[str, list[str], str | None, str]],
+) -> str:
+    """agents는 (agent_name, identity_stable_set, current_plan, observation) 목록이다."""
+    agent_lines = "\n".join(
+        f"- Agent: {agent_name} | Identity stable set: "
+        f"{' | '.join(identity_stable_set[:3]) or 'N/A'} | Current plan: "
+        f"{current_plan or 'N/A'} | Observation: {observation}"
+        for agent_name, identity_stable_set, current_plan, observation in agents
+    )
+    return render_template(
+        "importance_scoring_batch.md",
+        json_shape=BATCH_IMPORTANCE_JSON_SHAPE,
+        agent_lines=agent_lines,
+    )
+
+
 def build_day_plan_prompt(
     *,
     agent_name: str,
@@ -171,6 +199,50 @@ def build_day_plan_prompt(
     )
 
 
+# 재계획 프롬프트에 넣는 고정 구간 항목 수 상한. 그보다 이른 항목은 개수만 적는다.
+REPLAN_FROZEN_CONTEXT_ITEMS = 3
+
+
+def build_day_replan_prompt(
+    *,
+    agent_name: str,
+    age: int,
+    innate_traits: list[str],
+    persona_background: str,
+    now: datetime.datetime,
+    frozen_items: Sequence[DayPlanItem],
+    reason: str,
+) -> str:
+    """Build a compact prompt that re-plans only the part of the day after now."""
+    traits_text = ", ".join(trait.strip() for trait in innate_traits if trait.strip())
+    recent_items = list(frozen_items)[-REPLAN_FROZEN_CONTEXT_ITEMS:]
+    frozen_lines = [
+        _format_plan_line(
+            start_time=item.start_time,
+            end_time=item.end_time,
+            location=item.location,
+            action_content=item.action_content,
+        )
+        for item in recent_items
+    ]
+    omitted = len(frozen_items) - len(recent_items)
+    if omitted > 0:
+        frozen_lines.insert(0, f"- ({omitted} earlier items omitted)")
+    return render_template(
+        "day_replan_instruction.md",
+        agent_name=agent_name,
+        age=str(age),
+        innate_traits=traits_text or "N/A",
+        persona_background=persona_background.strip(),
+        frozen_plan_lines="\n".join(frozen_lines) or "- (nothing yet)",
+        current_time=_format_datetime_text(now),
+        current_time_short=_format_time_text(now),
+        reason=reason.strip(),
+        planning_date=now.date().isoformat(),
+        json_shape=DAY_PLAN_JSON_SHAPE,
+    )
+
+
 def build_hourly_plan_prompt(
     *,
     agent_name: str,
@@ -376,6 +448,55 @@ def build_reaction_utterance_prompt(
     return "\n".join(sections)
 
 
+def build_reaction_fused_prompt(
+    *,
+    agent_identity: AgentIdentity,
+    current_time: datetime.datetime,
+    observation_content: str,
+    dialogue_history: list[tuple[str, str]],
+    profile: AgentProfile,
+    retrieved_memories: list[MemoryObject],
+    dialogue_arc: DialogueArc | None = None,
+) -> str:
+    """intent와 utterance를 한 번의 호출로 받는 fused reaction 프롬프트."""
+    summary_description = _build_summary_description(agent_identity, profile)
+    agent_status = _build_agent_status(profile)
+    reflection_anchor = _build_reflection_anchor(profile, retrieved_memories)
+    memory_summary = _summarize_retrieved_memories(retrieved_memories)
+
+    sections: list[str] = _build_reaction_base_sections(
+        agent_identity=agent_identity,
+        current_time=current_time,
+        summary_description=summary_description,
+        agent_status=agent_status,
+        observation_content=observation_content,
+        identity_anchor=reflection_anchor,
+    )
+
+    if dialogue_history:
+        sections.append("Recent dialogue context:")
+        for index, (partner_talk, my_talk) in enumerate(dialogue_history, start=1):
+            sections.append(f"- turn {index} partner: {partner_talk or 'none'}")
+            sections.append(f"- turn {index} self: {my_talk or 'none'}")
+
+    if dialogue_arc is not None:
+        sections.extend(_build_dialogue_arc_section(dialogue_arc=dialogue_arc))
+
+    sections.extend(
+        [
+            (f"Summary of relevant context from [{agent_identity.name}]'s memory:"),
+            memory_summary,
+            render_template("reaction_guidelines.md").strip(),
+            "Few-shot calibration examples:",
+            _few_shot_reaction_examples(),
+            _reaction_decision_question(agent_identity.name),
+            _reaction_decision_shape_line(),
+        ]
+    )
+
+    return "\n".join(sections)
+
+
 def build_reaction_decision_prompt(
     *,
     agent_identity: AgentIdentity,
@@ -552,6 +673,30 @@ def _reaction_intent_shape_line() -> str:
     )
 
 
+def _reaction_decision_question(agent_name: str) -> str:
+    rendered = render_template(
+        "reaction_decision_question.md",
+        agent_name=agent_name,
+        json_shape=REACTION_DECISION_JSON_SHAPE,
+    ).strip()
+    return _first_content_line(rendered)
+
+
+def _reaction_decision_shape_line() -> str:
+    rendered = render_template(
+        "reaction_decision_question.md",
+        agent_name="agent",
+        json_shape=REACTION_DECISION_JSON_SHAPE,
+    ).strip()
+    for line in rendered.splitlines():
+        if line.startswith("Return strict JSON only"):
+            return line
+    return (
+        "Return strict JSON only with this exact shape and no extra text: "
+        f"{REACTION_DECISION_JSON_SHAPE}"
+    )
+
+
 def _reaction_utterance_question(agent_name: str) -> str:
     rendered = render_template(
         "reaction_utterance_question.md",
@@ -695,6 +840,7 @@ def template_file_plan() -> list[str]:
         "insights_instruction.md",
         "importance_scoring.md",
         "day_plan_broad_strokes_instruction.md",
+        "day_replan_instruction.md",
         "hourly_plan_instruction.md",
         "minute_plan_instruction.md",
         "reaction_guidelines.md",
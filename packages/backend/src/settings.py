@@ -47,3 +47,91 @@ LLM_API_KEY: Final[str] = os.getenv(
 WORLD_TICK_INTERVAL_SECONDS: Final[float] = float(
     os.getenv("WORLD_TICK_INTERVAL_SECONDS", "1.0")
 )
+_raw_scheduler_mode = os.getenv("WORLD_SCHEDULER_MODE", "interval")
+if _raw_scheduler_mode not in {"interval", "deadline"}:
+    _raw_scheduler_mode = "interval"
+WORLD_SCHEDULER_MODE: Final[Literal["interval", "deadline"]] = cast(
+    Literal["interval", "deadline"],
+    _raw_scheduler_mode,
+)
+_raw_overrun_policy = os.getenv("WORLD_OVERRUN_POLICY", "skip")
+if _raw_overrun_policy not in {"skip", "catch_up", "stretch"}:
+    _raw_overrun_policy = "skip"
+WORLD_OVERRUN_POLICY: Final[Literal["skip", "catch_up", "stretch"]] = cast(
+    Literal["skip", "catch_up", "stretch"],
+    _raw_overrun_policy,
+)
+_raw_step_scheduling = os.getenv("WORLD_STEP_SCHEDULING", "every_tick")
+if _raw_step_scheduling not in {"every_tick", "event"}:
+    _raw_step_scheduling = "every_tick"
+WORLD_STEP_SCHEDULING: Final[Literal["every_tick", "event"]] = cast(
+    Literal["every_tick", "event"],
+    _raw_step_scheduling,
+)
+_raw_cognition_tier = os.getenv("WORLD_COGNITION_TIER", "full")
+if _raw_cognition_tier not in {"full", "reduced", "background"}:
+    _raw_cognition_tier = "full"
+WORLD_COGNITION_TIER: Final[Literal["full", "reduced", "background"]] = cast(
+    Literal["full", "reduced", "background"],
+    _raw_cognition_tier,
+)
+WORLD_CONVERSATION_SIZE: Final[int] = int(os.getenv("WORLD_CONVERSATION_SIZE", "2"))
+WORLD_STEP_WORKERS: Final[int] = int(os.getenv("WORLD_STEP_WORKERS", "4"))
+_raw_broadcast_scope = os.getenv("WORLD_BROADCAST_SCOPE", "conversation")
+if _raw_broadcast_scope not in {"conversation", "world", "perception"}:
+    _raw_broadcast_scope = "conversation"
+WORLD_BROADCAST_SCOPE: Final[Literal["conversation", "world", "perception"]] = cast(
+    Literal["conversation", "world", "perception"],
+    _raw_broadcast_scope,
+)
+_raw_graph_backend = os.getenv("GRAPH_BACKEND", "langgraph")
+if _raw_graph_backend not in {"langgraph", "compiled"}:
+    _raw_graph_backend = "langgraph"
+GRAPH_BACKEND: Final[Literal["langgraph", "compiled"]] = cast(
+    Literal["langgraph", "compiled"],
+    _raw_graph_backend,
+)
+_raw_reaction_mode = os.getenv("REACTION_MODE", "two_stage")
+if _raw_reaction_mode not in {"two_stage", "fused"}:
+    _raw_reaction_mode = "two_stage"
+REACTION_MODE: Final[Literal["two_stage", "fused"]] = cast(
+    Literal["two_stage", "fused"],
+    _raw_reaction_mode,
+)
+REACTION_MAX_CALLS: Final[int] = int(os.getenv("REACTION_MAX_CALLS", "0"))
+REACTION_LATENCY_BUDGET_MS: Final[float] = float(
+    os.getenv("REACTION_LATENCY_BUDGET_MS", "0")
+)
+WORLD_INSTRUMENTATION_ENABLED: Final[bool] = os.getenv(
+    "WORLD_INSTRUMENTATION_ENABLED", ""
+).lower() in {"1", "true", "yes"}
+WORLD_SHARE_TICK_EMBEDDINGS: Final[bool] = os.getenv(
+    "WORLD_SHARE_TICK_EMBEDDINGS", ""
+).lower() in {"1", "true", "yes"}
+WORLD_SPECULATIVE_PREFETCH: Final[bool] = os.getenv(
+    "WORLD_SPECULATIVE_PREFETCH", ""
+).lower() in {"1", "true", "yes"}
+WORLD_PLAN_EXPANSION: Final[bool] = os.getenv(
+    "WORLD_PLAN_EXPANSION", ""
+).lower() in {"1", "true", "yes"}
+WORLD_SPATIAL_ENABLED: Final[bool] = os.getenv(
+    "WORLD_SPATIAL_ENABLED", ""
+).lower() in {"1", "true", "yes"}
+WORLD_PERCEPTION_RADIUS: Final[float] = float(
+    os.getenv("WORLD_PERCEPTION_RADIUS", "10.0")
+)
+_raw_history_window = os.getenv("WORLD_HISTORY_WINDOW", "")
+WORLD_HISTORY_WINDOW: Final[int | None] = (
+    int(_raw_history_window) if _raw_history_window else None
+)
+WORLD_STEP_LOG_DIR: Final[str | None] = os.getenv("WORLD_STEP_LOG_DIR") or None
+WORLD_STEP_LOG_SEGMENT_MB: Final[int] = int(
+    os.getenv("WORLD_STEP_LOG_SEGMENT_MB", "64")
+)
+WORLD_CHECKPOINT_PATH: Final[str | None] = os.getenv("WORLD_CHECKPOINT_PATH") or None
+WORLD_CHECKPOINT_COMPACT_EVERY: Final[int] = int(
+    os.getenv("WORLD_CHECKPOINT_COMPACT_EVERY", "0")
+)
+MEMORY_ARCHIVE_DIR: Final[str | None] = os.getenv("MEMORY_ARCHIVE_DIR") or None
+MEMORY_SEGMENT_DIR: Final[str | None] = os.getenv("MEMORY_SEGMENT_DIR") or None
+PLAN_STORE_DIR: Final[str | None] = os.getenv("PLAN_STORE_DIR") or None
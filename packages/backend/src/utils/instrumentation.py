@@ -0,0 +1,207 @@
+"""
+그래프 노드/LLM provider 호출 계측.
+
+- profile_step()으로 활성화한 구간 안에서만 기록한다. 비활성 상태에서는
+  ContextVar 조회 한 번만 추가되므로 오버헤드가 거의 없다.
+- 노드 키는 "<graph>.<node>" 형식이며, 같은 그래프 실행 안에서 같은 노드가 다시
+  실행되면 retry로 센다.
+"""
+
+import time
+from collections.abc import Callable, Iterator, Mapping
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field, replace
+from typing import Literal, TypeVar
+
+TResult = TypeVar("TResult")
+
+LlmCallKind = Literal["generate", "embed"]
+
+
+@dataclass(frozen=True)
+class NodeTiming:
+    calls: int = 0
+    """노드 실행 횟수."""
+    retries: int = 0
+    """같은 그래프 실행 안에서 재진입한 횟수."""
+    wall_ms: float = 0.0
+    """노드 실행 누적 wall time(ms). 하위 그래프 시간을 포함한다."""
+    llm_calls: int = 0
+    """노드 안에서 직접 발생한 generate 호출 수."""
+    embed_calls: int = 0
+    """노드 안에서 직접 발생한 embed 호출 수."""
+    prompt_chars: int = 0
+    """generate/embed 입력 문자 수 합계."""
+    response_chars: int = 0
+    """generate 응답 문자 수 합계."""
+
+    def merge(self, other: "NodeTiming") -> "NodeTiming":
+        return NodeTiming(
+            calls=self.calls + other.calls,
+            retries=self.retries + other.retries,
+            wall_ms=self.wall_ms + other.wall_ms,
+            llm_calls=self.llm_calls + other.llm_calls,
+            embed_calls=self.embed_calls + other.embed_calls,
+            prompt_chars=self.prompt_chars + other.prompt_chars,
+            response_chars=self.response_chars + other.response_chars,
+        )
+
+
+@dataclass(frozen=True)
+class ProfileSnapshot:
+    steps: int = 0
+    """집계된 step 수. 단일 step 스냅샷은 1."""
+    wall_ms: float = 0.0
+    """계측 구간 전체 wall time(ms)."""
+    llm_ms: float = 0.0
+    """provider generate/embed 호출에 쓴 wall time(ms)."""
+    llm_calls: int = 0
+    """generate 호출 수."""
+    embed_calls: int = 0
+    """embed 호출 수."""
+    failed_calls: int = 0
+    """예외로 끝난 provider 호출 수."""
+    prompt_chars: int = 0
+    """provider 입력 문자 수 합계."""
+    response_chars: int = 0
+    """generate 응답 문자 수 합계."""
+    retries: int = 0
+    """모든 노드의 retry 합계."""
+    nodes: dict[str, NodeTiming] = field(default_factory=dict)
+    """"<graph>.<node>" 별 노드 계측."""
+
+    def merge(self, other: "ProfileSnapshot") -> "ProfileSnapshot":
+        nodes = dict(self.nodes)
+        for key, timing in other.nodes.items():
+            nodes[key] = nodes[key].merge(timing) if key in nodes else timing
+        return ProfileSnapshot(
+            steps=self.steps + other.steps,
+            wall_ms=self.wall_ms + other.wall_ms,
+            llm_ms=self.llm_ms + other.llm_ms,
+            llm_calls=self.llm_calls + other.llm_calls,
+            embed_calls=self.embed_calls + other.embed_calls,
+            failed_calls=self.failed_calls + other.failed_calls,
+            prompt_chars=self.prompt_chars + other.prompt_chars,
+            response_chars=self.response_chars + other.response_chars,
+            retries=self.retries + other.retries,
+            nodes=nodes,
+        )
+
+
+class StepProfile:
+    """profile_step() 구간 하나의 가변 누산기."""
+
+    def __init__(self) -> None:
+        self.started_at: float = time.perf_counter()
+        self.finished_at: float | None = None
+        self.totals: ProfileSnapshot = ProfileSnapshot(steps=1)
+        self.nodes: dict[str, NodeTiming] = {}
+        self._node_stack: list[str] = []
+        self._graph_runs: list[set[str]] = []
+
+    def snapshot(self) -> ProfileSnapshot:
+        finished_at = self.finished_at or time.perf_counter()
+        return replace(
+            self.totals,
+            wall_ms=(finished_at - self.started_at) * 1000,
+            retries=sum(timing.retries for timing in self.nodes.values()),
+            nodes=dict(self.nodes),
+        )
+
+    @contextmanager
+    def graph_run(self) -> Iterator[None]:
+        self._graph_runs.append(set())
+        try:
+            yield
+        finally:
+            self._graph_runs.pop()
+
+    def run_node(self, key: str, action: Callable[[], TResult]) -> TResult:
+        retried = False
+        if self._graph_runs:
+            visited = self._graph_runs[-1]
+            retried = key in visited
+            visited.add(key)
+        self._node_stack.append(key)
+        started = time.perf_counter()
+        try:
+            return action()
+        finally:
+            elapsed_ms = (time.perf_counter() - started) * 1000
+            self._node_stack.pop()
+            timing = self.nodes.get(key, NodeTiming())
+            self.nodes[key] = replace(
+                timing,
+                calls=timing.calls + 1,
+                retries=timing.retries + int(retried),
+                wall_ms=timing.wall_ms + elapsed_ms,
+            )
+
+    def record_llm_call(
+        self,
+        *,
+        kind: LlmCallKind,
+        prompt_chars: int,
+        response_chars: int,
+        elapsed_ms: float,
+        failed: bool = False,
+    ) -> None:
+        is_generate = kind == "generate"
+        totals = self.totals
+        self.totals = replace(
+            totals,
+            llm_ms=totals.llm_ms + elapsed_ms,
+            llm_calls=totals.llm_calls + int(is_generate),
+            embed_calls=totals.embed_calls + int(not is_generate),
+            failed_calls=totals.failed_calls + int(failed),
+            prompt_chars=totals.prompt_chars + prompt_chars,
+            response_chars=totals.response_chars + response_chars,
+        )
+        if not self._node_stack:
+            return
+        key = self._node_stack[-1]
+        timing = self.nodes.get(key, NodeTiming())
+        self.nodes[key] = replace(
+            timing,
+            llm_calls=timing.llm_calls + int(is_generate),
+            embed_calls=timing.embed_calls + int(not is_generate),
+            prompt_chars=timing.prompt_chars + prompt_chars,
+            response_chars=timing.response_chars + response_chars,
+        )
+
+
+_ACTIVE_PROFILE: ContextVar[StepProfile | None] = ContextVar(
+    "active_step_profile", default=None
+)
+
+
+def active_profile() -> StepProfile | None:
+    return _ACTIVE_PROFILE.get()
+
+
+@contextmanager
+def profile_step() -> Iterator[StepProfile]:
+    profile = StepProfile()
+    token = _ACTIVE_PROFILE.set(profile)
+    try:
+        yield profile
+    finally:
+        profile.finished_at = time.perf_counter()
+        _ACTIVE_PROFILE.reset(token)
+
+
+def instrument_node(
+    graph_name: str,
+    node_name: str,
+    action: Callable[[Mapping[str, object]], TResult],
+) -> Callable[[Mapping[str, object]], TResult]:
+    key = f"{graph_name}.{node_name}"
+
+    def instrumented(state: Mapping[str, object]) -> TResult:
+        profile = _ACTIVE_PROFILE.get()
+        if profile is None:
+            return action(state)
+        return profile.run_node(key, lambda: action(state))
+
+    return instrumented
@@ -1,11 +1,27 @@
 from .runtime import (
+    WorldConversation,
+    WorldReply,
     WorldRuntime,
     WorldRuntimeConfig,
     WorldRuntimeState,
+    WorldTickResult,
     build_world_runtime,
     default_persona_dir,
+    group_conversation_agents,
 )
+from .checkpoint import CheckpointStats, WorldCheckpointer, WorldCheckpointStore
 from .engine import SimulationEngine, SimulationEngineConfig, SimulationStepResult
+from .event_bus import BroadcastScope, FanOutStats, PerceptionEventBus
+from .event_scheduler import AgentWake, AgentWakeQueue, EventSchedulerStats
+from .sharding import (
+    ShardedTickResult,
+    ShardedWorldRuntime,
+    ShardTickReport,
+    partition_persona_names,
+)
+from .spatial import Landmark, Position, SpatialHash, SpatialWorld
+from .step_log import StepLog, StepLogStats
+from .tick_clock import TickDeadlineClock, TickTimingStats
 from .session import (
     WorldConversationSession,
     build_turn_observed_events,
@@ -13,15 +29,40 @@ from .session import (
 )
 
 __all__ = [
+    "AgentWake",
+    "AgentWakeQueue",
+    "BroadcastScope",
+    "CheckpointStats",
+    "EventSchedulerStats",
+    "FanOutStats",
+    "Landmark",
+    "PerceptionEventBus",
+    "Position",
+    "ShardTickReport",
+    "ShardedTickResult",
+    "ShardedWorldRuntime",
     "SimulationEngine",
     "SimulationEngineConfig",
     "SimulationStepResult",
+    "SpatialHash",
+    "SpatialWorld",
+    "StepLog",
+    "StepLogStats",
+    "TickDeadlineClock",
+    "TickTimingStats",
+    "WorldCheckpointStore",
+    "WorldCheckpointer",
+    "WorldConversation",
+    "WorldReply",
     "WorldRuntime",
     "WorldRuntimeConfig",
     "WorldRuntimeState",
     "WorldConversationSession",
+    "WorldTickResult",
     "build_turn_observed_events",
     "build_turn_world_context",
     "build_world_runtime",
     "default_persona_dir",
+    "group_conversation_agents",
+    "partition_persona_names",
 ]
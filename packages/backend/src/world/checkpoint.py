@@ -0,0 +1,485 @@
+"""
+월드 체크포인트와 재개.
+
+- 체크포인트 파일은 append-only JSON lines다. 첫 줄은 월드 전체 base 스냅샷이고, 이후 줄은
+  tick마다 바뀐 부분만 담은 delta다. delta를 base 위에 차례로 접으면(fold) 마지막 상태가 된다.
+- delta에는 런타임 카운터/시각, 그 사이 진행한 대화 세션, 바뀐 에이전트 profile/reflection
+  누적값, 새로 추가되거나 병합으로 바뀐 메모리, 바뀐 계획, 움직인 좌표만 담는다. 검색으로
+  last_accessed_at만 바뀐 메모리는 임베딩 없이 (id, 시각)만 남긴다. background tier가
+  임베딩 없이 쌓아 둔 observation은 새로 쌓인 것만 덧붙이고, 메모리로 옮겨지면 비운다.
+  메모리 스트림과 계획 저장소가 변경 ID를 따로 모으므로 쓰기 비용은 월드 크기가 아니라
+  tick 사이 변경량에 비례한다. 진행한 대화는 세션 상태를 통째로 쓰므로 체크포인트는
+  history_window가 있어야 켤 수 있다(build_world_runtime이 검사한다).
+- compaction은 현재 상태를 base 한 줄로 다시 써서 delta를 없앤다(임시 파일 + os.replace).
+- 복원은 파일만 읽는다. 메모리 임베딩도 체크포인트에 들어 있으므로 LLM/임베딩 호출이 없다.
+- event 스케줄링의 대기 사건, tick 시간 통계, 계측 값은 담지 않는다. 재개한 런타임은 복원
+  시각에 모든 에이전트를 한 번 깨우고 통계를 0부터 다시 쌓는다.
+"""
+
+from __future__ import annotations
+
+import datetime
+import json
+import os
+import time
+from dataclasses import dataclass, replace
+from pathlib import Path
+from typing import TYPE_CHECKING, cast
+
+from agents.brain import DeferredObservation
+from agents.memory.memory_manager import ObservationContext
+from agents.memory.memory_object import memory_from_record, memory_to_record
+from agents.memory.memory_stream import MemoryStream
+from agents.planning import PlanStore, plan_from_record, plan_to_record
+from agents.sim_agent import SimAgent
+
+from .spatial import Position
+
+if TYPE_CHECKING:
+    from .runtime import WorldRuntime
+
+CHECKPOINT_VERSION = 1
+
+WorldCheckpointState = dict[str, object]
+"""base 스냅샷, delta, fold 결과가 모두 쓰는 JSON 직렬화 가능한 구조."""
+
+
+@dataclass(frozen=True)
+class CheckpointStats:
+    bases: int = 0
+    """이번 실행에서 쓴 base 스냅샷 수(시작 시 1회 + compaction)."""
+    deltas: int = 0
+    """마지막 base 이후 덧붙인 delta 수."""
+    bytes_written: int = 0
+    """이번 실행에서 체크포인트 파일에 쓴 바이트 수."""
+    last_delta_bytes: int = 0
+    """마지막 delta 크기."""
+    last_write_ms: float = 0.0
+    """마지막 delta를 만들고 쓰는 데 걸린 시간(ms)."""
+    max_write_ms: float = 0.0
+    """delta 쓰기 최대 시간(ms). base/compaction은 제외한다."""
+    last_base_ms: float = 0.0
+    """마지막 base 스냅샷을 쓰는 데 걸린 시간(ms)."""
+
+
+class WorldCheckpointStore:
+    """base 한 줄 뒤에 delta 줄을 덧붙이는 체크포인트 파일."""
+
+    def __init__(self, path: str | Path) -> None:
+        self.path: Path = Path(path)
+
+    def exists(self) -> bool:
+        return self.path.exists() and self.path.stat().st_size > 0
+
+    def write_base(self, state: WorldCheckpointState) -> int:
+        """파일을 base 스냅샷 한 줄로 교체하고 쓴 바이트 수를 반환한다."""
+        line = _encode({"kind": "base", "state": state})
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        temp_path = self.path.with_suffix(self.path.suffix + ".tmp")
+        temp_path.write_bytes(line)
+        os.replace(temp_path, self.path)
+        return len(line)
+
+    def append_delta(self, delta: WorldCheckpointState) -> int:
+        line = _encode({"kind": "delta", "state": delta})
+        with self.path.open("ab") as checkpoint_file:
+            checkpoint_file.write(line)
+        return len(line)
+
+    def load(self) -> WorldCheckpointState:
+        """base에 delta를 모두 접은 마지막 상태. 쓰다 끊긴 마지막 줄은 버린다."""
+        with self.path.open(encoding="utf-8") as checkpoint_file:
+            lines = [line for line in checkpoint_file if line.strip()]
+        if not lines:
+            raise ValueError(f"checkpoint is empty: {self.path}")
+        state: WorldCheckpointState | None = None
+        for index, line in enumerate(lines):
+            try:
+                entry = cast(dict[str, object], json.loads(line))
+            except json.JSONDecodeError:
+                if index == len(lines) - 1:
+                    break
+                raise
+            payload = cast(WorldCheckpointState, entry["state"])
+            if entry["kind"] == "base":
+                state = _empty_state()
+            if state is None:
+                raise ValueError(f"checkpoint does not start with a base: {self.path}")
+            fold_checkpoint_delta(state, payload)
+        assert state is not None
+        if state.get("version") != CHECKPOINT_VERSION:
+            raise ValueError(f"unsupported checkpoint version: {state.get('version')}")
+        return state
+
+
+def fold_checkpoint_delta(
+    state: WorldCheckpointState, delta: WorldCheckpointState
+) -> None:
+    """delta를 state에 접는다. base도 빈 상태에 접는 delta 하나로 다룬다."""
+    if "version" in delta:
+        state["version"] = delta["version"]
+    if "runtime" in delta:
+        state["runtime"] = delta["runtime"]
+    for key in ("conversations", "agents", "positions"):
+        _section(state, key).update(_section(delta, key))
+    deferred = _section(state, "deferred")
+    for agent_name, changes in cast(
+        dict[str, dict[str, object]], _section(delta, "deferred")
+    ).items():
+        records = cast(list[object], deferred.setdefault(agent_name, []))
+        if changes.get("reset"):
+            records.clear()
+        records.extend(cast(list[object], changes["append"]))
+    plans = _section(state, "plans")
+    for key, plan in _section(delta, "plans").items():
+        if plan is None:
+            plans.pop(key, None)
+        else:
+            plans[key] = plan
+    memories = cast(dict[str, dict[str, object]], _section(state, "memories"))
+    for agent_name, changes in cast(
+        dict[str, dict[str, object]], _section(delta, "memories")
+    ).items():
+        current = memories.setdefault(agent_name, {"records": {}, "next_id": 0})
+        records = cast(dict[int, dict[str, object]], current["records"])
+        for record in cast(list[dict[str, object]], changes.get("upserted", [])):
+            records[int(cast(int, record["id"]))] = record
+        for memory_id, accessed_at in cast(
+            dict[str, str], changes.get("accessed", {})
+        ).items():
+            record = records.get(int(memory_id))
+            if record is not None:
+                record["last_accessed_at"] = accessed_at
+        for memory_id in cast(list[int], changes.get("removed", [])):
+            records.pop(memory_id, None)
+        current["next_id"] = changes["next_id"]
+
+
+class WorldCheckpointer:
+    """
+    런타임 상태를 WorldCheckpointStore에 base/delta로 기록한다.
+    - 호출자(WorldRuntime)가 에이전트 lock을 모두 잡은 상태에서 부른다.
+    - compact_every > 0이면 delta가 그만큼 쌓일 때마다 현재 상태로 base를 다시 쓴다.
+    """
+
+    def __init__(
+        self,
+        *,
+        runtime: WorldRuntime,
+        store: WorldCheckpointStore,
+        compact_every: int = 0,
+    ) -> None:
+        if compact_every < 0:
+            raise ValueError("compact_every must not be negative")
+        self.runtime: WorldRuntime = runtime
+        self.store: WorldCheckpointStore = store
+        self.compact_every: int = compact_every
+        self.stats: CheckpointStats = CheckpointStats()
+        self._conversation_turns: dict[str, int] = {}
+        self._agent_records: dict[str, dict[str, object]] = {}
+        self._positions: dict[str, list[float]] = {}
+        self._deferred_written: dict[str, tuple[int, int]] = {}
+        """에이전트별 (flush 횟수, 기록한 deferred observation 수)."""
+
+    def write_base(self) -> CheckpointStats:
+        """현재 월드 전체를 base 한 줄로 쓴다(시작/compaction). 이전 delta는 사라진다."""
+        started = time.perf_counter()
+        runtime = self.runtime
+        memories: dict[str, object] = {}
+        for name, stream in self._memory_streams().items():
+            _ = stream.drain_changes()
+            memories[name] = {
+                "upserted": [memory_to_record(m) for m in stream.all_memories()],
+                "next_id": stream.next_id,
+            }
+        for store in self._plan_stores():
+            _ = store.drain_changes()
+        self._conversation_turns = {}
+        self._agent_records = {}
+        self._positions = {}
+        self._deferred_written = {}
+        state: WorldCheckpointState = {
+            "version": CHECKPOINT_VERSION,
+            "runtime": runtime.to_record(),
+            "conversations": self._conversation_records(),
+            "agents": self._changed_agent_records(),
+            "memories": memories,
+            "plans": {
+                _plan_key(plan.agent_id, plan.date): plan_to_record(plan)
+                for store in self._plan_stores()
+                for plan in store.plans()
+            },
+            "positions": self._changed_positions(),
+            "deferred": self._deferred_changes(),
+        }
+        written = self.store.write_base(state)
+        self.stats = replace(
+            self.stats,
+            bases=self.stats.bases + 1,
+            deltas=0,
+            bytes_written=self.stats.bytes_written + written,
+            last_base_ms=(time.perf_counter() - started) * 1000,
+        )
+        return self.stats
+
+    def write_delta(self) -> CheckpointStats:
+        """직전 기록 이후 바뀐 부분만 delta 한 줄로 덧붙인다."""
+        started = time.perf_counter()
+        memories: dict[str, object] = {}
+        for name, stream in self._memory_streams().items():
+            changes = stream.drain_changes()
+            if changes.upserted or changes.accessed or changes.removed:
+                memories[name] = {
+                    "upserted": [memory_to_record(m) for m in changes.upserted],
+                    "accessed": {
+                        str(m.id): m.last_accessed_at.isoformat()
+                        for m in changes.accessed
+                    },
+                    "removed": changes.removed,
+                    "next_id": changes.next_id,
+                }
+        plans: dict[str, object] = {}
+        for store in self._plan_stores():
+            for (agent_id, date), plan in store.drain_changes().items():
+                plans[_plan_key(agent_id, date)] = (
+                    plan_to_record(plan) if plan is not None else None
+                )
+        delta: WorldCheckpointState = {
+            "runtime": self.runtime.to_record(),
+            "conversations": self._conversation_records(),
+            "agents": self._changed_agent_records(),
+            "memories": memories,
+            "plans": plans,
+            "positions": self._changed_positions(),
+            "deferred": self._deferred_changes(),
+        }
+        written = self.store.append_delta(delta)
+        elapsed_ms = (time.perf_counter() - started) * 1000
+        self.stats = replace(
+            self.stats,
+            deltas=self.stats.deltas + 1,
+            bytes_written=self.stats.bytes_written + written,
+            last_delta_bytes=written,
+            last_write_ms=elapsed_ms,
+            max_write_ms=max(self.stats.max_write_ms, elapsed_ms),
+        )
+        if self.compact_every and self.stats.deltas >= self.compact_every:
+            return self.write_base()
+        return self.stats
+
+    def _memory_streams(self) -> dict[str, MemoryStream]:
+        return {
+            agent.name: agent.memory_service.memory_stream
+            for agent in self.runtime.agents
+        }
+
+    def _plan_stores(self) -> list[PlanStore]:
+        return _unique_plan_stores(self.runtime.agents)
+
+    def _conversation_records(self) -> dict[str, object]:
+        """직전 기록 이후 turn이 진행된 대화만."""
+        records: dict[str, object] = {}
+        for conversation in self.runtime.conversations:
+            if (
+                self._conversation_turns.get(conversation.conversation_id)
+                == conversation.turn
+            ):
+                continue
+            self._conversation_turns[conversation.conversation_id] = conversation.turn
+            records[conversation.conversation_id] = conversation.to_record()
+        return records
+
+    def _changed_agent_records(self) -> dict[str, object]:
+        records: dict[str, object] = {}
+        for agent in self.runtime.agents:
+            record = _agent_record(agent)
+            if self._agent_records.get(agent.name) != record:
+                self._agent_records[agent.name] = record
+                records[agent.name] = record
+        return records
+
+    def _deferred_changes(self) -> dict[str, object]:
+        """새로 쌓인 deferred observation만. 그 사이 flush됐으면 reset 후 전부 쓴다."""
+        changes: dict[str, object] = {}
+        for agent in self.runtime.agents:
+            runner = agent.brain.brain_graph
+            pending = runner.deferred_observations
+            flushes, written = self._deferred_written.get(agent.name, (-1, 0))
+            reset = flushes != runner.deferred_flushes
+            start = 0 if reset else written
+            if reset and (pending or flushes >= 0):
+                changes[agent.name] = {
+                    "reset": True,
+                    "append": [_deferred_to_record(item) for item in pending],
+                }
+            elif len(pending) > start:
+                changes[agent.name] = {
+                    "append": [_deferred_to_record(item) for item in pending[start:]]
+                }
+            self._deferred_written[agent.name] = (runner.deferred_flushes, len(pending))
+        return changes
+
+    def _changed_positions(self) -> dict[str, object]:
+        spatial = self.runtime.spatial
+        if spatial is None:
+            return {}
+        changed: dict[str, object] = {}
+        for name, position in spatial.positions().items():
+            coordinates = [position.x, position.y]
+            if self._positions.get(name) != coordinates:
+                self._positions[name] = coordinates
+                changed[name] = coordinates
+        return changed
+
+
+def checkpoint_time(state: WorldCheckpointState) -> datetime.datetime:
+    """체크포인트 시점의 런타임 시각(런타임을 만들기 전에 시계를 맞출 때 쓴다)."""
+    runtime_record = cast(dict[str, object], state["runtime"])
+    return datetime.datetime.fromisoformat(str(runtime_record["current_time"]))
+
+
+def restore_world(runtime: WorldRuntime, state: WorldCheckpointState) -> None:
+    """
+    fold한 체크포인트 상태를 같은 구성(에이전트, 대화 묶음)으로 만든 런타임에 적용한다.
+    - 에이전트/대화가 맞지 않으면 ValueError.
+    - 메모리는 임베딩째 복원하므로 LLM/임베딩 호출이 없다.
+    """
+    agents = {agent.name: agent for agent in runtime.agents}
+    unknown = sorted(
+        (
+            set(_section(state, "agents"))
+            | set(_section(state, "memories"))
+            | set(_section(state, "deferred"))
+        )
+        - set(agents)
+    )
+    if unknown:
+        raise ValueError(f"checkpoint agents are not in this runtime: {unknown}")
+    runtime.restore_record(cast(dict[str, object], state["runtime"]))
+    for conversation_id, record in _section(state, "conversations").items():
+        try:
+            conversation = runtime.conversation(conversation_id)
+        except KeyError as exc:
+            raise ValueError(
+                f"checkpoint conversation is not in this runtime: {conversation_id}"
+            ) from exc
+        conversation.restore_record(cast(dict[str, object], record))
+    for name, record in _section(state, "agents").items():
+        _restore_agent(agents[name], cast(dict[str, object], record))
+    for name, memory_state in cast(
+        dict[str, dict[str, object]], _section(state, "memories")
+    ).items():
+        records = cast(dict[int, dict[str, object]], memory_state["records"])
+        agents[name].memory_service.memory_stream.restore(
+            [memory_from_record(records[memory_id]) for memory_id in sorted(records)],
+            next_id=int(cast(int, memory_state["next_id"])),
+        )
+    plans = [
+        plan_from_record(cast(dict[str, object], record))
+        for record in _section(state, "plans").values()
+    ]
+    for store in _unique_plan_stores(runtime.agents):
+        agent_ids = {
+            agent.identity.id
+            for agent in runtime.agents
+            if agent.brain.plan_store is store
+        }
+        store.restore([plan for plan in plans if plan.agent_id in agent_ids])
+    for name, records in cast(
+        dict[str, list[dict[str, object]]], _section(state, "deferred")
+    ).items():
+        agents[name].brain.brain_graph.deferred_observations = [
+            _deferred_from_record(record) for record in records
+        ]
+    if runtime.spatial is not None:
+        for name, (x, y) in cast(
+            dict[str, list[float]], _section(state, "positions")
+        ).items():
+            runtime.spatial.place(name, Position(x, y))
+        # 이미 근처에 있던 쌍을 새 조우로 다시 알리지 않는다.
+        _ = runtime.spatial.detect_encounters()
+
+
+def _agent_record(agent: SimAgent) -> dict[str, object]:
+    profile = agent.profile
+    return {
+        "profile": {
+            "identity_stable_set": list(profile.fixed.identity_stable_set),
+            "lifestyle_and_routine": list(profile.extended.lifestyle_and_routine),
+            "current_plan_context": list(profile.extended.current_plan_context),
+        },
+        "reflection": agent.brain.reflection_graph.reflection.to_record(),
+    }
+
+
+def _restore_agent(agent: SimAgent, record: dict[str, object]) -> None:
+    profile_record = cast(dict[str, list[str]], record["profile"])
+    profile = agent.profile
+    profile.fixed.identity_stable_set = list(profile_record["identity_stable_set"])
+    profile.extended.lifestyle_and_routine = list(
+        profile_record["lifestyle_and_routine"]
+    )
+    profile.extended.current_plan_context = list(profile_record["current_plan_context"])
+    agent.brain.reflection_graph.reflection.restore_record(
+        cast(dict[str, object], record["reflection"])
+    )
+
+
+def _deferred_to_record(observation: DeferredObservation) -> dict[str, object]:
+    context = observation.context
+    return {
+        "content": observation.content,
+        "now": observation.now.isoformat(),
+        "importance": observation.importance,
+        "context": {
+            "agent_name": context.agent_name,
+            "identity_stable_set": list(context.identity_stable_set),
+            "current_plan": context.current_plan,
+        },
+    }
+
+
+def _deferred_from_record(record: dict[str, object]) -> DeferredObservation:
+    context = cast(dict[str, object], record["context"])
+    return DeferredObservation(
+        content=str(record["content"]),
+        now=datetime.datetime.fromisoformat(str(record["now"])),
+        context=ObservationContext(
+            agent_name=str(context["agent_name"]),
+            identity_stable_set=list(cast(list[str], context["identity_stable_set"])),
+            current_plan=cast(str | None, context["current_plan"]),
+        ),
+        importance=int(cast(int, record["importance"])),
+    )
+
+
+def _unique_plan_stores(agents: list[SimAgent]) -> list[PlanStore]:
+    stores: list[PlanStore] = []
+    for agent in agents:
+        store = agent.brain.plan_store
+        if store is not None and all(store is not known for known in stores):
+            stores.append(store)
+    return stores
+
+
+def _plan_key(agent_id: str, date: datetime.date) -> str:
+    return f"{agent_id}/{date.isoformat()}"
+
+
+def _empty_state() -> WorldCheckpointState:
+    return {
+        "conversations": {},
+        "agents": {},
+        "memories": {},
+        "plans": {},
+        "positions": {},
+        "deferred": {},
+    }
+
+
+def _section(state: WorldCheckpointState, key: str) -> dict[str, object]:
+    return cast(dict[str, object], state.setdefault(key, {}))
+
+
+def _encode(entry: dict[str, object]) -> bytes:
+    return (json.dumps(entry, ensure_ascii=False) + "\n").encode("utf-8")
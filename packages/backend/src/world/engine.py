@@ -1,21 +1,31 @@
 import datetime
-from dataclasses import dataclass
+from dataclasses import dataclass, replace
 from typing import Literal
 
-from agents.brain import ActionLoopInput, ActionLoopResult
+from agents.brain import ActionLoopInput, ActionLoopResult, BrainSpeculation
+from agents.reaction import ReactionDecisionTrace
 from agents.sim_agent import SimAgent
+from llm.embedding_context import TickEmbeddingStats, tick_embedding_scope
 from llm.governance import (
     apply_reply_policy,
     is_reaction_parse_failure,
     merge_policy_trace,
     recent_replies_for_echo_check,
 )
+from utils.instrumentation import ProfileSnapshot, profile_step
 
 from .session import (
     WorldConversationSession,
     build_turn_observed_events,
     build_turn_world_context,
 )
+from .spatial import SpatialWorld
+from .speculation import (
+    PrefetchedTurn,
+    SpeculationStats,
+    SpeculativeTurnPrefetcher,
+    step_speculation_stats,
+)
 
 
 @dataclass(frozen=True)
@@ -36,6 +46,14 @@ class SimulationStepResult:
     parse_failure: bool
     """관측/로그 출력용 진단 페이로드."""
     observability: "SimulationStepObservability"
+    """노드별 latency/LLM 호출 계측 결과. 계측이 꺼져 있으면 None."""
+    timings: ProfileSnapshot | None = None
+    """tick 임베딩 공유 통계. 공유가 꺼져 있으면 None."""
+    embedding_stats: TickEmbeddingStats | None = None
+    """다음 턴 speculative prefetch 통계(이번 턴 1건). prefetch가 꺼져 있으면 None."""
+    speculation: SpeculationStats | None = None
+    """이번 턴 reaction 결정 트레이스(모드/생성 호출 수/latency). 결정이 없었으면 None."""
+    reaction_trace: ReactionDecisionTrace | None = None
 
 
 @dataclass(frozen=True)
@@ -69,6 +87,12 @@ class SimulationEngineConfig:
     repetition_window: int
     """최종 응답이 비었을 때 폴백 문장을 주입할지 여부."""
     fallback_on_empty_reply: bool
+    """턴마다 노드/LLM 호출 계측을 수행할지 여부."""
+    instrumentation_enabled: bool = False
+    """perceive/검색 쿼리/finalize/broadcast 간 임베딩을 tick 단위로 공유할지 여부."""
+    share_tick_embeddings: bool = False
+    """발화 확정 직후 다음 화자의 perceive/중요도/검색 쿼리를 백그라운드에서 미리 계산할지 여부."""
+    speculative_prefetch: bool = False
 
 
 class SimulationEngine:
@@ -77,9 +101,19 @@ class SimulationEngine:
         *,
         session: WorldConversationSession,
         config: SimulationEngineConfig,
+        spatial: SpatialWorld | None = None,
     ):
+        """spatial을 주면 화자 위치로 장소를 정하고 지각 반경 안 에이전트를 관찰 대상에 넣는다."""
         self.session: WorldConversationSession = session
         self.config: SimulationEngineConfig = config
+        self.spatial: SpatialWorld | None = spatial
+        self._prefetcher: SpeculativeTurnPrefetcher | None = (
+            SpeculativeTurnPrefetcher() if config.speculative_prefetch else None
+        )
+
+    def close(self) -> None:
+        if self._prefetcher is not None:
+            self._prefetcher.shutdown()
 
     def step(
         self,
@@ -88,6 +122,54 @@ class SimulationEngine:
         current_time: datetime.datetime,
         speaker: SimAgent,
         speaking_partner: SimAgent,
+    ) -> SimulationStepResult:
+        if not self.config.share_tick_embeddings:
+            return self._profiled_step(
+                turn=turn,
+                current_time=current_time,
+                speaker=speaker,
+                speaking_partner=speaking_partner,
+            )
+        with tick_embedding_scope() as tick_embeddings:
+            step_result = self._profiled_step(
+                turn=turn,
+                current_time=current_time,
+                speaker=speaker,
+                speaking_partner=speaking_partner,
+            )
+        return replace(step_result, embedding_stats=tick_embeddings.stats())
+
+    def _profiled_step(
+        self,
+        *,
+        turn: int,
+        current_time: datetime.datetime,
+        speaker: SimAgent,
+        speaking_partner: SimAgent,
+    ) -> SimulationStepResult:
+        if not self.config.instrumentation_enabled:
+            return self._step(
+                turn=turn,
+                current_time=current_time,
+                speaker=speaker,
+                speaking_partner=speaking_partner,
+            )
+        with profile_step() as profile:
+            step_result = self._step(
+                turn=turn,
+                current_time=current_time,
+                speaker=speaker,
+                speaking_partner=speaking_partner,
+            )
+        return replace(step_result, timings=profile.snapshot())
+
+    def _step(
+        self,
+        *,
+        turn: int,
+        current_time: datetime.datetime,
+        speaker: SimAgent,
+        speaking_partner: SimAgent,
     ) -> SimulationStepResult:
         if not self.session.is_active:
             return self._build_inactive_step_result(
@@ -101,12 +183,18 @@ class SimulationEngine:
         now = current_time + datetime.timedelta(
             seconds=self.config.turn_time_step_seconds
         )
+        prefetched = (
+            self._prefetcher.take(agent_name=speaker.name, turn=turn)
+            if self._prefetcher is not None
+            else None
+        )
         action_result = self._run_action_loop(
             turn=turn,
             now=now,
             speaker=speaker,
             speaking_partner=speaking_partner,
             incoming_partner_utterance=incoming_partner_utterance,
+            speculation=prefetched.speculation if prefetched is not None else None,
         )
         raw_reply = (action_result.utterance or action_result.talk or "").strip()
         recent_replies = recent_replies_for_echo_check(
@@ -147,14 +235,21 @@ class SimulationEngine:
                 silent_reason = "unknown"
             if action_result.end_dialogue:
                 self.session.finish_dialogue()
-            return SimulationStepResult(
-                now=now,
-                speaker_name=speaker.name,
-                trace=trace,
-                reply="",
-                silent_reason=silent_reason,
-                parse_failure=parse_failure,
-                observability=observability,
+            return self._with_speculation(
+                SimulationStepResult(
+                    now=now,
+                    speaker_name=speaker.name,
+                    trace=trace,
+                    reply="",
+                    silent_reason=silent_reason,
+                    parse_failure=parse_failure,
+                    observability=observability,
+                    reaction_trace=action_result.reaction_trace,
+                ),
+                turn=turn,
+                speaker=speaker,
+                prefetched=prefetched,
+                action_result=action_result,
             )
 
         self.session.commit_speaker_reply(
@@ -170,16 +265,86 @@ class SimulationEngine:
         )
         if action_result.end_dialogue:
             self.session.finish_dialogue()
-        return SimulationStepResult(
-            now=now,
-            speaker_name=speaker.name,
-            trace=trace,
-            reply=policy_result.reply,
-            silent_reason="",
-            parse_failure=parse_failure,
-            observability=observability,
+        return self._with_speculation(
+            SimulationStepResult(
+                now=now,
+                speaker_name=speaker.name,
+                trace=trace,
+                reply=policy_result.reply,
+                silent_reason="",
+                parse_failure=parse_failure,
+                observability=observability,
+                reaction_trace=action_result.reaction_trace,
+            ),
+            turn=turn,
+            speaker=speaker,
+            prefetched=prefetched,
+            action_result=action_result,
         )
 
+    def _with_speculation(
+        self,
+        step_result: SimulationStepResult,
+        *,
+        turn: int,
+        speaker: SimAgent,
+        prefetched: PrefetchedTurn | None,
+        action_result: ActionLoopResult,
+    ) -> SimulationStepResult:
+        if self._prefetcher is None:
+            return step_result
+
+        scheduled = self._schedule_next_turn(
+            turn=turn, now=step_result.now, speaker=speaker
+        )
+        discarded, failed = self._prefetcher.drain_counters()
+        return replace(
+            step_result,
+            speculation=step_speculation_stats(
+                scheduled=scheduled,
+                prefetched=prefetched,
+                outcome=action_result.speculation,
+                discarded=discarded,
+                failed=failed,
+            ),
+        )
+
+    def _schedule_next_turn(
+        self,
+        *,
+        turn: int,
+        now: datetime.datetime,
+        speaker: SimAgent,
+    ) -> bool:
+        """
+        확정된 세션 상태로 다음 화자의 입력을 예측해 백그라운드 계산을 시작한다.
+        - 다음 화자의 상대(partner_of)는 발화 순서상 직전 화자인 speaker다.
+        """
+        if self._prefetcher is None or not self.session.is_active:
+            return False
+
+        next_speaker = self.session.peek_next_speaker()
+        incoming_partner_utterance = self.session.peek_incoming_partner_utterance(
+            speaker=next_speaker
+        )
+        next_input = self._build_action_input(
+            turn=turn + 1,
+            now=now + datetime.timedelta(seconds=self.config.turn_time_step_seconds),
+            speaker=next_speaker,
+            speaking_partner=speaker,
+            incoming_partner_utterance=incoming_partner_utterance,
+            dialogue_history=self.session.preview_dialogue_context_for(
+                speaker=next_speaker,
+                incoming_partner_utterance=incoming_partner_utterance,
+            ),
+        )
+        self._prefetcher.schedule(
+            agent_name=next_speaker.name,
+            turn=turn + 1,
+            compute=lambda: next_speaker.brain.speculate(next_input),
+        )
+        return True
+
     def _build_observability(
         self,
         *,
@@ -272,26 +437,59 @@ class SimulationEngine:
         speaker: SimAgent,
         speaking_partner: SimAgent,
         incoming_partner_utterance: str | None,
+        speculation: BrainSpeculation | None = None,
     ) -> ActionLoopResult:
+        input = self._build_action_input(
+            turn=turn,
+            now=now,
+            speaker=speaker,
+            speaking_partner=speaking_partner,
+            incoming_partner_utterance=incoming_partner_utterance,
+            dialogue_history=self.session.dialogue_context_for(speaker=speaker),
+        )
+        if speculation is None:
+            return speaker.brain.action_loop(input)
+        return speaker.brain.action_loop(input, speculation=speculation)
+
+    def _build_action_input(
+        self,
+        *,
+        turn: int,
+        now: datetime.datetime,
+        speaker: SimAgent,
+        speaking_partner: SimAgent,
+        incoming_partner_utterance: str | None,
+        dialogue_history: list[tuple[str, str]],
+    ) -> ActionLoopInput:
         observed_events = build_turn_observed_events(
             language=self.config.language,
             speaker_name=speaker.name,
             partner_name=speaking_partner.name,
             incoming_partner_utterance=incoming_partner_utterance,
         )
-        return speaker.brain.action_loop(
-            ActionLoopInput(
-                current_time=now,
-                dialogue_history=self.session.dialogue_context_for(speaker=speaker),
-                profile=speaker.profile,
-                dialogue_arc=self.session.dialogue_arc_for(speaker=speaker),
-                language=self.config.language,
-                world_context=build_turn_world_context(
-                    speaker_name=speaker.name,
-                    partner_name=speaking_partner.name,
-                    turn=turn,
-                ),
-                observed_entities=[speaking_partner.name],
-                observed_events=observed_events,
-            )
+        return ActionLoopInput(
+            current_time=now,
+            dialogue_history=dialogue_history,
+            profile=speaker.profile,
+            dialogue_arc=self.session.dialogue_arc_for(speaker=speaker),
+            language=self.config.language,
+            world_context=build_turn_world_context(
+                speaker_name=speaker.name,
+                partner_name=speaking_partner.name,
+                turn=turn,
+                spatial=self.spatial,
+            ),
+            observed_entities=self._observed_entities(speaker, speaking_partner),
+            observed_events=observed_events,
         )
+
+    def _observed_entities(
+        self, speaker: SimAgent, speaking_partner: SimAgent
+    ) -> list[str]:
+        if self.spatial is None:
+            return [speaking_partner.name]
+        return [speaking_partner.name] + [
+            name
+            for name in self.spatial.nearby_agents(speaker.name)
+            if name != speaking_partner.name
+        ]
@@ -0,0 +1,321 @@
+"""
+지각 반경 기반 발화 전달(event bus).
+
+- 기존 broadcast는 세션 참가자 전원(world 범위면 런타임 전원)에게 observation을 쓰므로
+  발화 하나에 수신자 수만큼 임베딩/중요도 LLM 호출이 든다.
+- bus는 대화 참가자와 화자 지각 반경 안의 구독자에게만 전달한다. 반경 밖 구독자는
+  발화를 관찰하지 않는다.
+- 발화 하나(사건)는 step이 끝난 뒤 한 번에 전달한다. 발화문은 step의 임베딩 컨텍스트를
+  이어 써서 사건마다 한 번만 임베딩하고, full tier 수신자(화자, 참가자, 반경 안 구독자)
+  전원의 중요도를 배치 채점 한 번으로 매긴다. 다른 tier 수신자는 brain이 휴리스틱으로 매긴다.
+- 발화마다 수신자 수, 임베딩 수, 채점 호출 수를 FanOutStats로 누적한다.
+"""
+
+import datetime
+import threading
+from collections.abc import Mapping
+from dataclasses import dataclass
+from typing import Literal
+
+from agents.sim_agent import SimAgent
+from llm.embedding_context import (
+    TickEmbeddingContext,
+    TickEmbeddingStats,
+    active_tick_embeddings,
+    share_tick_embedding,
+    tick_embedding_scope,
+)
+from llm.importance_scorer import BatchImportanceScorer, ImportanceScoringContext
+
+from .observation_builder import format_other_said, format_self_said
+from .spatial import SpatialWorld
+
+BroadcastScope = Literal["conversation", "world", "perception"]
+"""
+확정 발화를 누구에게 전달할지.
+- conversation: 같은 대화 참가자만.
+- world: 런타임의 모든 에이전트.
+- perception: 대화 참가자와 화자 지각 반경 안의 에이전트(PerceptionEventBus).
+"""
+
+
+@dataclass(frozen=True)
+class FanOutStats:
+    events: int = 0
+    """bus로 전달한 발화 수."""
+    recipients: int = 0
+    """observation을 기록한 수신자 수(화자 자신 포함)."""
+    out_of_range: int = 0
+    """지각 반경 밖이라 전달하지 않은 구독자 수."""
+    max_recipients: int = 0
+    """발화 하나가 닿은 최대 수신자 수."""
+    embeddings: int = 0
+    """전달 중 provider로 임베딩한 횟수."""
+    shared_embeddings: int = 0
+    """수신자끼리 벡터를 재사용해 아낀 임베딩 횟수."""
+    importance_batches: int = 0
+    """수신자 묶음 단위 배치 중요도 채점 호출 수."""
+    batched_recipients: int = 0
+    """배치 채점으로 중요도를 매긴 수신자 수."""
+
+    @property
+    def mean_recipients(self) -> float:
+        return self.recipients / self.events if self.events else 0.0
+
+    def merge(self, other: "FanOutStats") -> "FanOutStats":
+        return FanOutStats(
+            events=self.events + other.events,
+            recipients=self.recipients + other.recipients,
+            out_of_range=self.out_of_range + other.out_of_range,
+            max_recipients=max(self.max_recipients, other.max_recipients),
+            embeddings=self.embeddings + other.embeddings,
+            shared_embeddings=self.shared_embeddings + other.shared_embeddings,
+            importance_batches=self.importance_batches + other.importance_batches,
+            batched_recipients=self.batched_recipients + other.batched_recipients,
+        )
+
+
+@dataclass(frozen=True)
+class _PendingEvent:
+    """대화 안에서 확정됐지만 아직 observation으로 기록하지 않은 발화."""
+
+    speaker: SimAgent
+    reply: str
+    now: datetime.datetime
+    language: Literal["ko", "en"]
+    participants: tuple[SimAgent, ...]
+    embeddings: TickEmbeddingContext | None
+    """발화를 확정한 step의 임베딩 컨텍스트. 전달할 때 다시 활성화해 벡터를 재사용한다."""
+
+
+class PerceptionEventBus:
+    """
+    에이전트를 구독자로 두고 확정 발화를 지각 범위 안에만 전달한다. 스레드 안전하다.
+    - publish_to_conversation은 대화 step 안에서 발화를 사건으로 쌓기만 한다.
+    - flush는 tick의 step이 모두 끝난 뒤 사건마다 참가자와 반경 안 구독자 전원에게 한 번에
+      전달한다. 수신자 lock을 하나씩 잡고, 임베딩은 step의 컨텍스트를 이어 쓰며, full tier
+      수신자 전원의 중요도를 배치 채점 한 번으로 매긴다.
+    - publish_nearby는 이 bus에 없는 화자(다른 shard)의 발화를 반경 안 구독자에게 전달한다.
+    """
+
+    def __init__(
+        self,
+        *,
+        agents: list[SimAgent],
+        spatial: SpatialWorld | None = None,
+        importance_scorer: BatchImportanceScorer | None = None,
+    ) -> None:
+        self.spatial: SpatialWorld | None = spatial
+        self.importance_scorer: BatchImportanceScorer | None = importance_scorer
+        self._subscribers: dict[str, SimAgent] = {agent.name: agent for agent in agents}
+        self._pending: list[_PendingEvent] = []
+        self._stats: FanOutStats = FanOutStats()
+        self._lock: threading.Lock = threading.Lock()
+
+    @property
+    def stats(self) -> FanOutStats:
+        with self._lock:
+            return self._stats
+
+    def subscribe(self, agent: SimAgent) -> None:
+        with self._lock:
+            self._subscribers[agent.name] = agent
+
+    def publish_to_conversation(
+        self,
+        *,
+        speaker: SimAgent,
+        reply: str,
+        now: datetime.datetime,
+        language: Literal["ko", "en"],
+        participants: list[SimAgent],
+    ) -> None:
+        """대화 참가자가 확정한 발화를 사건으로 쌓는다. 기록은 flush에서 한다."""
+        event = _PendingEvent(
+            speaker=speaker,
+            reply=reply,
+            now=now,
+            language=language,
+            participants=tuple(participants),
+            embeddings=active_tick_embeddings(),
+        )
+        with self._lock:
+            self._pending.append(event)
+
+    def flush(self, *, locks: Mapping[str, threading.Lock]) -> int:
+        """
+        쌓인 사건을 전달하고 대화 밖 수신자 수의 합을 반환한다.
+        - 화자에게는 자기 발화를, 나머지 참가자와 반경 안 구독자에게는 상대 발화를 기록한다.
+        """
+        with self._lock:
+            events, self._pending = self._pending, []
+            subscribers = dict(self._subscribers)
+        fallback = active_tick_embeddings() or TickEmbeddingContext()
+        delivered = 0
+        for event in events:
+            audience = tuple(agent.name for agent in event.participants)
+            nearby = self._nearby(event.speaker.name, audience, subscribers)
+            other_said = format_other_said(
+                event.language, event.speaker.name, event.reply
+            )
+            deliveries = [
+                (event.speaker, format_self_said(event.language, event.reply))
+            ] + [
+                (agent, other_said)
+                for agent in [*event.participants, *nearby]
+                if agent is not event.speaker
+            ]
+            with tick_embedding_scope(event.embeddings or fallback) as embeddings:
+                before = embeddings.stats()
+                batched = self._deliver(deliveries, event.reply, event.now, locks)
+                after = embeddings.stats()
+            self._record(
+                FanOutStats(
+                    events=1,
+                    recipients=len(deliveries),
+                    out_of_range=self._outside(audience, subscribers) - len(nearby),
+                    max_recipients=len(deliveries),
+                    importance_batches=int(batched > 0),
+                    batched_recipients=batched,
+                ),
+                before,
+                after,
+            )
+            delivered += len(nearby)
+        return delivered
+
+    def publish_nearby(
+        self,
+        *,
+        speaker_name: str,
+        reply: str,
+        now: datetime.datetime,
+        language: Literal["ko", "en"],
+        audience: tuple[str, ...],
+        locks: Mapping[str, threading.Lock],
+    ) -> int:
+        """
+        대화 밖에서 화자 지각 반경 안에 있는 구독자에게 전달하고 수신자 수를 반환한다.
+        - 화자 위치를 모르면(다른 shard의 화자 등) 아무에게도 전달하지 않는다.
+        """
+        with self._lock:
+            subscribers = dict(self._subscribers)
+        recipients = self._nearby(speaker_name, audience, subscribers)
+        content = format_other_said(language, speaker_name, reply)
+        with tick_embedding_scope(active_tick_embeddings()) as embeddings:
+            before = embeddings.stats()
+            batched = self._deliver(
+                [(agent, content) for agent in recipients], reply, now, locks
+            )
+            after = embeddings.stats()
+        self._record(
+            FanOutStats(
+                recipients=len(recipients),
+                out_of_range=self._outside(audience, subscribers) - len(recipients),
+                max_recipients=len(audience) + len(recipients),
+                importance_batches=int(batched > 0),
+                batched_recipients=batched,
+            ),
+            before,
+            after,
+        )
+        return len(recipients)
+
+    def _nearby(
+        self,
+        speaker_name: str,
+        audience: tuple[str, ...],
+        subscribers: Mapping[str, SimAgent],
+    ) -> list[SimAgent]:
+        nearby = (
+            self.spatial.nearby_agents(speaker_name) if self.spatial is not None else []
+        )
+        return [
+            subscribers[name]
+            for name in nearby
+            if name in subscribers and name not in audience
+        ]
+
+    @staticmethod
+    def _outside(audience: tuple[str, ...], subscribers: Mapping[str, SimAgent]) -> int:
+        return sum(1 for name in subscribers if name not in audience)
+
+    def _deliver(
+        self,
+        deliveries: list[tuple[SimAgent, str]],
+        source_text: str,
+        now: datetime.datetime,
+        locks: Mapping[str, threading.Lock],
+    ) -> int:
+        """(수신자, content)마다 observation을 기록하고 배치 채점한 수신자 수를 반환한다."""
+        if not deliveries:
+            return 0
+        importances, batched = self._score(deliveries)
+        for content in {content for _, content in deliveries}:
+            share_tick_embedding(content, source_text)
+        for (agent, content), importance in zip(deliveries, importances, strict=True):
+            with locks[agent.name]:
+                agent.brain.queue_observation(
+                    content=content,
+                    now=now,
+                    profile=agent.profile,
+                    importance=importance,
+                )
+        return batched
+
+    def _score(
+        self, deliveries: list[tuple[SimAgent, str]]
+    ) -> tuple[list[int | None], int]:
+        """full tier 수신자 전원의 중요도를 한 번에 매긴다. 나머지는 None(brain이 직접 매김)."""
+        importances: list[int | None] = [None] * len(deliveries)
+        if self.importance_scorer is None:
+            return importances, 0
+        indexes = [
+            index
+            for index, (agent, _) in enumerate(deliveries)
+            if self._scores_importance(agent)
+        ]
+        if not indexes:
+            return importances, 0
+        contexts: list[ImportanceScoringContext] = []
+        for index in indexes:
+            agent, content = deliveries[index]
+            context = agent.brain.observation_context(profile=agent.profile)
+            contexts.append(
+                ImportanceScoringContext(
+                    observation=content,
+                    agent_name=context.agent_name,
+                    identity_stable_set=context.identity_stable_set,
+                    current_plan=context.current_plan,
+                )
+            )
+        scores = self.importance_scorer.score_batch(contexts)
+        for index, score in zip(indexes, scores, strict=True):
+            importances[index] = score
+        return importances, len(indexes)
+
+    def _scores_importance(self, agent: SimAgent) -> bool:
+        return (
+            self.importance_scorer is not None and agent.brain.cognition_tier == "full"
+        )
+
+    def _record(
+        self,
+        delta: FanOutStats,
+        before: TickEmbeddingStats,
+        after: TickEmbeddingStats,
+    ) -> None:
+        """delta에 이번 전달 동안의 임베딩 호출/재사용 수를 더해 누적한다."""
+        with self._lock:
+            self._stats = self._stats.merge(
+                FanOutStats(
+                    events=delta.events,
+                    recipients=delta.recipients,
+                    out_of_range=delta.out_of_range,
+                    max_recipients=delta.max_recipients,
+                    embeddings=after.encoded - before.encoded,
+                    shared_embeddings=after.saved_calls - before.saved_calls,
+                    importance_batches=delta.importance_batches,
+                    batched_recipients=delta.batched_recipients,
+                )
+            )
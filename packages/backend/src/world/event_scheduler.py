@@ -0,0 +1,84 @@
+"""
+할 일이 생긴 에이전트만 깨우는 이산 사건 스케줄링.
+
+- (next_wake_time, agent) 우선순위 큐에 다음 사건을 넣고, tick마다 기한이 된 사건만 꺼낸다.
+- 사건 종류:
+  - start: 런타임 시작 시 각 대화의 첫 화자.
+  - utterance: 대화 세션의 incoming_utterances_by_agent에 받은 발화가 쌓인 에이전트.
+  - event: 외부에서 주입한 사건(observation 내용 포함).
+  - plan_boundary: 저장된 계획 항목이 바뀌는 시각. 계획만 따라가며 LLM을 호출하지 않는다.
+- 깨울 사건이 없는 에이전트는 perceive/검색/LLM 파이프라인을 전혀 실행하지 않는다.
+"""
+
+import datetime
+import heapq
+import itertools
+import threading
+from dataclasses import dataclass
+from typing import Literal
+
+StepScheduling = Literal["every_tick", "event"]
+WakeReason = Literal["start", "utterance", "event", "plan_boundary"]
+
+
+@dataclass(frozen=True)
+class AgentWake:
+    when: datetime.datetime
+    agent_name: str
+    reason: WakeReason
+    content: str | None = None
+    """event 사건이 깨어날 때 observation으로 기록할 내용."""
+    importance: int | None = None
+    """event 사건의 중요도. None이면 LLM으로 채점한다."""
+
+
+@dataclass(frozen=True)
+class EventSchedulerStats:
+    wakes: int = 0
+    """큐에서 꺼낸 사건 수."""
+    plan_boundaries: int = 0
+    """LLM 없이 계획만 갱신한 plan_boundary 사건 수."""
+    events: int = 0
+    """observation으로 전달한 주입 사건 수."""
+    conversation_steps: int = 0
+    """사건으로 깨어나 실행한 대화 step 수."""
+    idle_conversations: int = 0
+    """tick마다 깨울 사건이 없어 건너뛴 대화 수(아낀 step 수)."""
+
+    def merge(self, other: "EventSchedulerStats") -> "EventSchedulerStats":
+        return EventSchedulerStats(
+            wakes=self.wakes + other.wakes,
+            plan_boundaries=self.plan_boundaries + other.plan_boundaries,
+            events=self.events + other.events,
+            conversation_steps=self.conversation_steps + other.conversation_steps,
+            idle_conversations=self.idle_conversations + other.idle_conversations,
+        )
+
+
+class AgentWakeQueue:
+    """시각 순서 사건 큐. 같은 시각이면 넣은 순서대로 꺼낸다. 스레드 안전하다."""
+
+    def __init__(self) -> None:
+        self._heap: list[tuple[datetime.datetime, int, AgentWake]] = []
+        self._sequence: itertools.count[int] = itertools.count()
+        self._lock: threading.Lock = threading.Lock()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._heap)
+
+    def push(self, wake: AgentWake) -> None:
+        with self._lock:
+            heapq.heappush(self._heap, (wake.when, next(self._sequence), wake))
+
+    def next_wake_time(self) -> datetime.datetime | None:
+        with self._lock:
+            return self._heap[0][0] if self._heap else None
+
+    def pop_due(self, until: datetime.datetime) -> list[AgentWake]:
+        """until 이전(포함)에 기한이 된 사건을 시각 순서로 모두 꺼낸다."""
+        due: list[AgentWake] = []
+        with self._lock:
+            while self._heap and self._heap[0][0] <= until:
+                due.append(heapq.heappop(self._heap)[2])
+        return due
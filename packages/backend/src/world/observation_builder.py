@@ -13,3 +13,9 @@ def format_other_said(
     if language == "ko":
         return f"{speaker_name}가 이렇게 말했다: {reply}"
     return f"{speaker_name} said: {reply}"
+
+
+def format_encountered(language: Literal["ko", "en"], other_name: str) -> str:
+    if language == "ko":
+        return f"근처에서 {other_name}를 마주쳤다."
+    return f"Encountered {other_name} nearby."
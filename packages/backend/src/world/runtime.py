@@ -1,20 +1,63 @@
 import asyncio
 import datetime
 import threading
-from dataclasses import dataclass
+import time
+from collections.abc import Iterator
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import ExitStack, contextmanager
+from dataclasses import dataclass, field
+from functools import partial
 from pathlib import Path
-from typing import Literal
+from typing import Literal, TypeVar, cast
 
+from agents.brain import CognitionTier
 from agents.sim_agent import SimAgent
+from agents.world_factory import init_agents
+from llm.clients.instrumented import InstrumentedProviderClient
+from llm.clients.provider_factory import ProviderClient, build_provider_client
 from llm.governance import (
     ConversationMetrics,
-    build_conversation_metrics,
+    ReactionModeCounts,
+    ReactionModeMetrics,
+    merge_agent_metrics,
+    requested_reaction_mode,
 )
-from llm.clients.provider_factory import build_provider_client
-from agents.world_factory import init_agents
+from llm.importance_scorer import BatchImportanceScorer, LlmImportanceScorer
+from utils.instrumentation import ProfileSnapshot
 
+from .checkpoint import (
+    CheckpointStats,
+    WorldCheckpointer,
+    WorldCheckpointStore,
+    checkpoint_time,
+    restore_world,
+)
 from .engine import SimulationEngine, SimulationEngineConfig, SimulationStepResult
+from .event_bus import BroadcastScope, FanOutStats, PerceptionEventBus
+from .event_scheduler import (
+    AgentWake,
+    AgentWakeQueue,
+    EventSchedulerStats,
+    StepScheduling,
+)
+from .observation_builder import format_encountered, format_other_said
 from .session import WorldConversationSession
+from .spatial import EncounterPair, Position, SpatialWorld
+from .speculation import SpeculationStats
+from .step_log import (
+    DEFAULT_SEGMENT_MAX_BYTES,
+    StepLog,
+    StepLogStats,
+    step_log_record,
+)
+from .tick_clock import (
+    OverrunPolicy,
+    SchedulerMode,
+    TickDeadlineClock,
+    TickTimingStats,
+)
+
+TAgent = TypeVar("TAgent")
 
 
 @dataclass(frozen=True)
@@ -34,6 +77,27 @@ class WorldRuntimeConfig:
     repetition_window: int = 4
     turn_time_step_seconds: int = 45
     tick_interval_seconds: float = 1.0
+    scheduler_mode: SchedulerMode = "interval"
+    overrun_policy: OverrunPolicy = "skip"
+    step_scheduling: StepScheduling = "every_tick"
+    cognition_tier: CognitionTier = "full"
+    conversation_size: int = 2
+    step_workers: int = 1
+    broadcast_scope: BroadcastScope = "conversation"
+    memory_archive_dir: str | None = None
+    memory_segment_dir: str | None = None
+    plan_store_dir: str | None = None
+    plan_expansion: bool = False
+    instrumentation_enabled: bool = False
+    share_tick_embeddings: bool = False
+    speculative_prefetch: bool = False
+    spatial_world: bool = False
+    perception_radius: float = 10.0
+    history_window: int | None = None
+    step_log_dir: str | None = None
+    step_log_segment_bytes: int = DEFAULT_SEGMENT_MAX_BYTES
+    checkpoint_path: str | None = None
+    checkpoint_compact_every: int = 0
 
 
 @dataclass(frozen=True)
@@ -45,6 +109,89 @@ class WorldRuntimeState:
     history_size: int
     scheduler_running: bool
     tick_interval_seconds: float
+    conversations: int = 1
+    """동시에 진행 중인 대화 세션 수."""
+    step_workers: int = 1
+    """tick마다 대화 step을 병렬로 실행하는 worker 수."""
+    turns_per_second: float = 0.0
+    """tick 실행 시간 기준 누적 처리량(대화 step 수 / 초)."""
+    tick_timing: TickTimingStats = field(default_factory=TickTimingStats)
+    """스케줄러 tick 소요 시간 히스토그램, overrun 수, 시작 지연."""
+    step_scheduling: StepScheduling = "every_tick"
+    """every_tick은 tick마다 모든 대화를, event는 사건으로 깨어난 대화만 진행한다."""
+    pending_wakes: int = 0
+    """event 스케줄링에서 아직 기한이 되지 않은 사건 수."""
+    event_scheduler: EventSchedulerStats = field(default_factory=EventSchedulerStats)
+    focused_agents: list[str] = field(default_factory=list)
+    """클라이언트가 보고 있어 full tier로 올린 에이전트."""
+    cognition_tiers: dict[str, CognitionTier] = field(default_factory=dict)
+    """에이전트별 현재 인지 tier. 기본 tier(full)와 다른 에이전트만 담는다."""
+    agent_positions: dict[str, tuple[float, float]] = field(default_factory=dict)
+    """좌표 월드가 켜져 있을 때 에이전트별 (x, y) 위치."""
+    encounters: int = 0
+    """지금까지 감지한 새 조우 쌍 수(같은 대화 참가자끼리는 제외)."""
+    fan_out: FanOutStats = field(default_factory=FanOutStats)
+    """broadcast_scope="perception"일 때 발화 전달 비용(수신자/임베딩/배치 채점) 누적."""
+    step_log: StepLogStats | None = None
+    """step 로그가 켜져 있을 때 기록 수/segment 수/압축 바이트 수."""
+    checkpoint: CheckpointStats | None = None
+    """체크포인트가 켜져 있을 때 base/delta 수와 쓰기 시간."""
+    reaction_modes: dict[str, ReactionModeMetrics] = field(default_factory=dict)
+    """요청한 reaction 모드(two_stage/fused)별 파싱 실패율/fallback율/생성 호출 수/latency."""
+
+
+@dataclass
+class WorldConversation:
+    """런타임이 동시에 진행하는 대화 세션 하나와 그 세션 전용 엔진/카운터."""
+
+    conversation_id: str
+    session: WorldConversationSession
+    engine: SimulationEngine
+    turn: int = 0
+    parse_failures: int = 0
+    silent_turns: int = 0
+
+    def to_record(self) -> dict[str, object]:
+        return {
+            "turn": self.turn,
+            "parse_failures": self.parse_failures,
+            "silent_turns": self.silent_turns,
+            "session": self.session.to_record(),
+        }
+
+    def restore_record(self, record: dict[str, object]) -> None:
+        self.turn = int(cast(int, record["turn"]))
+        self.parse_failures = int(cast(int, record["parse_failures"]))
+        self.silent_turns = int(cast(int, record["silent_turns"]))
+        self.session.restore_record(cast(dict[str, object], record["session"]))
+
+
+@dataclass(frozen=True)
+class WorldReply:
+    """broadcast_scope가 "world"/"perception"일 때 대화 밖 에이전트에게 전달할 확정 발화."""
+
+    speaker_name: str
+    reply: str
+    now: datetime.datetime
+    language: Literal["ko", "en"]
+    audience: tuple[str, ...]
+    """이미 대화 안에서 발화를 관찰한 참가자 이름."""
+
+
+@dataclass(frozen=True)
+class WorldTickResult:
+    """모든 대화 세션을 한 step씩 진행한 tick 결과."""
+
+    now: datetime.datetime
+    """tick 이후의 런타임 시각."""
+    steps: list[SimulationStepResult]
+    """대화 세션 등록 순서대로의 step 결과."""
+    wall_ms: float
+    """tick 전체 실행 시간(ms)."""
+    replies: list[WorldReply] = field(default_factory=list)
+    """이번 tick에 대화 밖으로 전달한 발화. broadcast_scope가 "conversation"이면 비어 있다."""
+    encounters: list[EncounterPair] = field(default_factory=list)
+    """이번 tick에 지각 반경 안으로 새로 들어온 에이전트 쌍. 좌표 월드가 꺼져 있으면 비어 있다."""
 
 
 class WorldRuntime:
@@ -56,48 +203,687 @@ class WorldRuntime:
         engine: SimulationEngine,
         current_time: datetime.datetime,
         tick_interval_seconds: float = 1.0,
+        step_workers: int = 1,
+        broadcast_scope: BroadcastScope = "conversation",
+        scheduler_mode: SchedulerMode = "interval",
+        overrun_policy: OverrunPolicy = "skip",
+        step_scheduling: StepScheduling = "every_tick",
+        spatial: SpatialWorld | None = None,
+        importance_scorer: BatchImportanceScorer | None = None,
     ) -> None:
-        if len(agents) != 2:
-            raise ValueError("WorldRuntime currently supports exactly two agents")
+        """
+        broadcast_scope="perception"이면 PerceptionEventBus로 발화를 대화 참가자와 spatial
+        지각 반경 안 에이전트에게만 전달한다. importance_scorer를 주면 수신자 묶음마다 중요도를
+        배치로 채점한다.
+        """
+        if len(agents) < 2:
+            raise ValueError("WorldRuntime requires at least two agents")
         if tick_interval_seconds <= 0:
             raise ValueError("tick_interval_seconds must be greater than 0")
+        if step_workers < 1:
+            raise ValueError("step_workers must be at least 1")
 
         self.agents: list[SimAgent] = agents
         self.session: WorldConversationSession = session
         self.engine: SimulationEngine = engine
         self.current_time: datetime.datetime = current_time
         self.tick_interval_seconds: float = tick_interval_seconds
+        self.step_workers: int = step_workers
+        self.broadcast_scope: BroadcastScope = broadcast_scope
+        self.step_scheduling: StepScheduling = step_scheduling
+        self.spatial: SpatialWorld | None = spatial
+        self.event_bus: PerceptionEventBus | None = (
+            PerceptionEventBus(
+                agents=agents, spatial=spatial, importance_scorer=importance_scorer
+            )
+            if broadcast_scope == "perception"
+            else None
+        )
         self.turn: int = 0
+        self.encounters: int = 0
         self.parse_failures: int = 0
         self.silent_turns: int = 0
-        self._initiator: SimAgent = agents[0]
-        self._partner: SimAgent = agents[1]
-        self._step_lock: threading.Lock = threading.Lock()
+        self.agent_timings: dict[str, ProfileSnapshot] = {}
+        self.speculation_stats: SpeculationStats = SpeculationStats()
+        self.reaction_mode_counts: dict[str, ReactionModeCounts] = {}
+        self.event_stats: EventSchedulerStats = EventSchedulerStats()
+        self.conversations: list[WorldConversation] = []
+        self.step_log: StepLog | None = None
+        self.checkpointer: WorldCheckpointer | None = None
+        self._agents_by_name: dict[str, SimAgent] = {
+            agent.name: agent for agent in agents
+        }
+        self._agent_locks: dict[str, threading.Lock] = {
+            agent.name: threading.Lock() for agent in agents
+        }
+        self._state_lock: threading.Lock = threading.Lock()
+        self._executor: ThreadPoolExecutor | None = None
+        self._tick_turns: int = 0
+        self._tick_seconds: float = 0.0
+        self._world_replies: list[WorldReply] = []
+        self._pending_step_records: list[dict[str, object]] = []
+        self._step_log_lock: threading.Lock = threading.Lock()
         self._scheduler_task: asyncio.Task[None] | None = None
+        self._tick_clock: TickDeadlineClock = TickDeadlineClock(
+            interval_seconds=tick_interval_seconds,
+            mode=scheduler_mode,
+            overrun_policy=overrun_policy,
+        )
+        self._wake_queue: AgentWakeQueue | None = (
+            AgentWakeQueue() if step_scheduling == "event" else None
+        )
+        self._plan_wake_pending: set[str] = set()
+        self._base_tiers: dict[str, CognitionTier] = {}
+        self._focused: set[str] = set()
+        self._conversation_ids_by_agent: dict[str, set[str]] = {
+            agent.name: set() for agent in agents
+        }
+        if self._wake_queue is not None:
+            for agent in agents:
+                self._schedule_plan_wake(agent.name, current_time)
+        _ = self.add_conversation(session=session, engine=engine)
 
-    def step(self) -> SimulationStepResult:
-        with self._step_lock:
-            self.turn += 1
-            speaker = self.session.next_speaker()
-            speaking_partner = (
-                self._partner if speaker is self._initiator else self._initiator
+    def add_conversation(
+        self,
+        *,
+        session: WorldConversationSession,
+        engine: SimulationEngine,
+    ) -> WorldConversation:
+        """
+        대화 세션을 추가한다. 참가자는 이 런타임의 에이전트여야 한다.
+        - 같은 에이전트가 여러 세션에 속할 수 있지만, 에이전트 lock 때문에 그 세션들의
+          step은 동시에 실행되지 않는다.
+        """
+        unknown = [
+            agent.name
+            for agent in session.agents
+            if agent.name not in self._agent_locks
+        ]
+        if unknown:
+            raise ValueError(f"session agents are not in this runtime: {unknown}")
+        conversation = WorldConversation(
+            conversation_id=f"c{len(self.conversations)}",
+            session=session,
+            engine=engine,
+        )
+        if self.broadcast_scope != "conversation":
+            session.reply_listener = partial(self._on_world_reply, session)
+        session.event_bus = self.event_bus
+        if self._wake_queue is not None:
+            self._wake_queue.push(
+                AgentWake(
+                    when=self.current_time,
+                    agent_name=session.peek_next_speaker().name,
+                    reason="start",
+                )
+            )
+        for agent in session.agents:
+            self._conversation_ids_by_agent[agent.name].add(
+                conversation.conversation_id
             )
-            step_result = self.engine.step(
-                turn=self.turn,
-                current_time=self.current_time,
+        self.conversations.append(conversation)
+        return conversation
+
+    def conversation(self, conversation_id: str) -> WorldConversation:
+        for conversation in self.conversations:
+            if conversation.conversation_id == conversation_id:
+                return conversation
+        raise KeyError(f"Unknown conversation: {conversation_id}")
+
+    def step(self, conversation_id: str | None = None) -> SimulationStepResult:
+        """대화 세션 하나(기본: 첫 번째 세션)를 한 턴 진행한다."""
+        conversation = (
+            self.conversations[0]
+            if conversation_id is None
+            else self.conversation(conversation_id)
+        )
+        step_result = self._step_conversation(conversation, current_time=None)
+        _ = self.deliver_replies(self._take_world_replies())
+        self._persist()
+        return step_result
+
+    def tick(self) -> WorldTickResult:
+        """
+        모든 대화 세션을 같은 시각 기준으로 한 step씩 진행한다.
+        - step_workers > 1이면 세션 step을 bounded worker pool에서 동시에 실행한다.
+        - 런타임 시각은 이번 tick의 가장 늦은 step 시각으로 맞춘다.
+        - step_scheduling="event"이면 기한이 된 사건으로 깨어난 대화만 진행한다.
+          깨어난 대화가 없어도 시각은 한 턴만큼 흐른다.
+        """
+        started = time.perf_counter()
+        tick_time = self.current_time
+        conversations = (
+            list(self.conversations)
+            if self._wake_queue is None
+            else self._wake_due_conversations(tick_time)
+        )
+        executor = self._step_executor(len(conversations))
+        if executor is None:
+            steps = [
+                self._step_conversation(conversation, current_time=tick_time)
+                for conversation in conversations
+            ]
+        else:
+            futures = [
+                executor.submit(
+                    self._step_conversation, conversation, current_time=tick_time
+                )
+                for conversation in conversations
+            ]
+            steps = [future.result() for future in futures]
+        replies = self._take_world_replies()
+        _ = self.deliver_replies(replies)
+        encounters = self._detect_encounters()
+        elapsed = time.perf_counter() - started
+        with self._state_lock:
+            self._tick_turns += len(steps)
+            self._tick_seconds += elapsed
+            if self._wake_queue is not None:
+                self.current_time = max(
+                    self.current_time, tick_time + self._turn_time_step()
+                )
+            now = self.current_time
+        self._persist()
+        return WorldTickResult(
+            now=now,
+            steps=steps,
+            wall_ms=elapsed * 1000,
+            replies=replies,
+            encounters=encounters,
+        )
+
+    def inject_event(
+        self,
+        *,
+        content: str,
+        agent_names: list[str] | None = None,
+        at: datetime.datetime | None = None,
+        importance: int | None = None,
+    ) -> int:
+        """
+        외부 사건을 에이전트(기본: 전원)에게 전달하고 대상 수를 반환한다.
+        - event 스케줄링이면 at(기본: 현재 시각)에 깨어날 사건으로 큐에 넣는다. 깨어날 때
+          observation을 기록하고 그 에이전트의 대화를 진행한다.
+        - every_tick 스케줄링이면 observation을 바로 기록한다.
+        """
+        names = (
+            [agent.name for agent in self.agents]
+            if agent_names is None
+            else agent_names
+        )
+        self._require_agents(names)
+        when = at or self.current_time
+        for name in names:
+            if self._wake_queue is None:
+                self._observe_event(name, content, when, importance)
+                continue
+            self._wake_queue.push(
+                AgentWake(
+                    when=when,
+                    agent_name=name,
+                    reason="event",
+                    content=content,
+                    importance=importance,
+                )
+            )
+        return len(names)
+
+    def move_agent(self, agent_name: str, position: Position) -> list[str]:
+        """
+        에이전트를 position으로 옮기고 지각 반경 안의 다른 에이전트를 반환한다.
+        - 새 조우는 다음 tick이 끝날 때 한꺼번에 감지한다.
+        """
+        spatial = self._require_spatial()
+        self._require_agents([agent_name])
+        spatial.place(agent_name, position)
+        return spatial.nearby_agents(agent_name)
+
+    def agents_within(self, agent_name: str, radius: float | None = None) -> list[str]:
+        """agent_name 주변 radius(기본: 지각 반경) 이내의 다른 에이전트를 가까운 순으로 반환한다."""
+        spatial = self._require_spatial()
+        self._require_agents([agent_name])
+        return spatial.nearby_agents(agent_name, radius)
+
+    def set_cognition_tier(self, agent_name: str, tier: CognitionTier) -> None:
+        """에이전트의 기본 인지 tier를 바꾼다. 포커스 중이면 포커스가 풀릴 때 적용된다."""
+        self._require_agents([agent_name])
+        with self._state_lock:
+            self._base_tiers[agent_name] = tier
+        self._apply_cognition_tier(agent_name)
+
+    def set_focus(self, agent_names: list[str]) -> list[str]:
+        """
+        클라이언트가 보고 있는 에이전트를 full tier로 올리고, 포커스에서 빠진 에이전트는
+        기본 tier로 되돌린다. tier가 바뀐 에이전트 이름을 반환한다.
+        """
+        self._require_agents(agent_names)
+        with self._state_lock:
+            changed = self._focused.symmetric_difference(agent_names)
+            self._focused = set(agent_names)
+        return [name for name in sorted(changed) if self._apply_cognition_tier(name)]
+
+    def cognition_tier(self, agent_name: str) -> CognitionTier:
+        with self._state_lock:
+            if agent_name in self._focused:
+                return "full"
+            return self._base_tiers.get(agent_name, "full")
+
+    def deliver_replies(self, replies: list[WorldReply]) -> int:
+        """
+        대화 밖 에이전트에게 발화를 observation으로 전달하고 전달 건수를 반환한다.
+        - tick의 모든 step이 끝난 뒤 호출해 진행 중인 step과 기억 쓰기가 겹치지 않게 한다.
+        - 다른 shard에서 넘어온 발화도 같은 경로로 전달한다.
+        - event bus가 있으면 쌓인 사건을 참가자와 화자 지각 반경 안의 에이전트에게 한 번에
+          전달한다. replies 중 이 런타임 화자의 발화는 그 사건에 포함되므로 다른 shard에서
+          넘어온 발화만 따로 전달한다.
+        """
+        if self.event_bus is not None:
+            return self.event_bus.flush(locks=self._agent_locks) + sum(
+                self.event_bus.publish_nearby(
+                    speaker_name=reply.speaker_name,
+                    reply=reply.reply,
+                    now=reply.now,
+                    language=reply.language,
+                    audience=reply.audience,
+                    locks=self._agent_locks,
+                )
+                for reply in replies
+                if reply.speaker_name not in self._agents_by_name
+            )
+        delivered = 0
+        for reply in replies:
+            for observer in self.agents:
+                if observer.name in reply.audience:
+                    continue
+                with self._agent_locks[observer.name]:
+                    observer.brain.queue_observation(
+                        content=format_other_said(
+                            reply.language, reply.speaker_name, reply.reply
+                        ),
+                        now=reply.now,
+                        profile=observer.profile,
+                    )
+                delivered += 1
+        return delivered
+
+    def attach_step_log(self, step_log: StepLog) -> None:
+        """
+        이후 확정하는 step을 step_log에 남긴다. tick(또는 step) 하나의 레코드를 묶어 한 번에 쓴다.
+        - 로그의 마지막 turn이 런타임 turn보다 크면(다른 실행의 로그) 거부한다.
+        """
+        last_turn = step_log.stats.last_turn
+        if last_turn > self.turn:
+            raise ValueError(
+                f"step log already has turn {last_turn}; runtime is at turn {self.turn}"
+            )
+        with self._step_log_lock:
+            self.step_log = step_log
+
+    def attach_checkpointer(self, checkpointer: WorldCheckpointer) -> CheckpointStats:
+        """
+        현재 상태를 base로 쓰고 이후 tick(또는 step)마다 바뀐 부분을 delta로 덧붙인다.
+        - 복원 직후에 붙이면 읽어 들인 base+delta를 base 한 줄로 다시 쓴다(compaction).
+        """
+        with self._all_agent_locks():
+            stats = checkpointer.write_base()
+            self.checkpointer = checkpointer
+        return stats
+
+    def checkpoint(self) -> CheckpointStats:
+        """직전 체크포인트 이후 바뀐 부분을 delta로 쓴다. 체크포인트가 꺼져 있으면 ValueError."""
+        checkpointer = self._require_checkpointer()
+        with self._all_agent_locks():
+            return checkpointer.write_delta()
+
+    def compact_checkpoint(self) -> CheckpointStats:
+        """현재 상태를 base 한 줄로 다시 써서 쌓인 delta를 없앤다."""
+        checkpointer = self._require_checkpointer()
+        with self._all_agent_locks():
+            return checkpointer.write_base()
+
+    def to_record(self) -> dict[str, object]:
+        """런타임 카운터, 시각, 인지 tier를 JSON 직렬화 가능한 dict로 반환한다(체크포인트용)."""
+        with self._state_lock:
+            return {
+                "turn": self.turn,
+                "current_time": self.current_time.isoformat(),
+                "parse_failures": self.parse_failures,
+                "silent_turns": self.silent_turns,
+                "encounters": self.encounters,
+                "base_tiers": dict(self._base_tiers),
+                "focused": sorted(self._focused),
+            }
+
+    def restore_record(self, record: dict[str, object]) -> None:
+        """to_record 결과로 런타임 카운터, 시각, 인지 tier를 되돌린다."""
+        base_tiers = cast(dict[str, CognitionTier], record["base_tiers"])
+        focused = cast(list[str], record["focused"])
+        self._require_agents([*base_tiers, *focused])
+        with self._state_lock:
+            self.turn = int(cast(int, record["turn"]))
+            self.current_time = datetime.datetime.fromisoformat(
+                str(record["current_time"])
+            )
+            self.parse_failures = int(cast(int, record["parse_failures"]))
+            self.silent_turns = int(cast(int, record["silent_turns"]))
+            self.encounters = int(cast(int, record["encounters"]))
+        for agent_name, tier in base_tiers.items():
+            self.set_cognition_tier(agent_name, tier)
+        _ = self.set_focus(focused)
+
+    def logged_step(self, turn: int) -> dict[str, object] | None:
+        """step 로그에서 turn 레코드를 읽는다. 로그가 꺼져 있으면 ValueError."""
+        if self.step_log is None:
+            raise ValueError("step log is not enabled")
+        return self.step_log.read(turn)
+
+    def close(self) -> None:
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+        for conversation in self.conversations:
+            conversation.engine.close()
+        for agent in self.agents:
+            agent.brain.close()
+
+    def _require_agents(self, agent_names: list[str]) -> None:
+        unknown = [name for name in agent_names if name not in self._agents_by_name]
+        if unknown:
+            raise ValueError(f"unknown agents: {unknown}")
+
+    def _require_checkpointer(self) -> WorldCheckpointer:
+        if self.checkpointer is None:
+            raise ValueError("checkpoint is not enabled")
+        return self.checkpointer
+
+    @contextmanager
+    def _all_agent_locks(self) -> Iterator[None]:
+        # step과 같은 이름 순서로 잡아 진행 중인 step이 끝난 뒤의 일관된 상태를 기록한다.
+        with ExitStack() as stack:
+            for name in sorted(self._agent_locks):
+                stack.enter_context(self._agent_locks[name])
+            yield
+
+    def _require_spatial(self) -> SpatialWorld:
+        if self.spatial is None:
+            raise ValueError("spatial world is not enabled")
+        return self.spatial
+
+    def _detect_encounters(self) -> list[EncounterPair]:
+        """
+        지각 반경 안으로 새로 들어온 쌍을 감지해 양쪽에 조우 사건으로 전달한다.
+        - 이미 같은 대화에 있는 참가자끼리는 조우로 보지 않는다.
+        - 전달은 inject_event와 같은 경로라 event 스케줄링이면 두 에이전트를 깨운다.
+        """
+        if self.spatial is None:
+            return []
+        encounters = [
+            (first, second)
+            for first, second in self.spatial.detect_encounters()
+            if not (
+                self._conversation_ids_by_agent.get(first, set())
+                & self._conversation_ids_by_agent.get(second, set())
+            )
+        ]
+        if not encounters:
+            return []
+        language = self.conversations[0].engine.config.language
+        for first, second in encounters:
+            for observer, other in ((first, second), (second, first)):
+                _ = self.inject_event(
+                    content=format_encountered(language, other),
+                    agent_names=[observer],
+                )
+        with self._state_lock:
+            self.encounters += len(encounters)
+        return encounters
+
+    def _apply_cognition_tier(self, agent_name: str) -> bool:
+        """유효 tier를 에이전트 brain에 반영하고, 실제로 바뀌었으면 True."""
+        brain = self._agents_by_name[agent_name].brain
+        tier = self.cognition_tier(agent_name)
+        if brain.cognition_tier == tier:
+            return False
+        brain.set_cognition_tier(tier)
+        return True
+
+    def _wake_due_conversations(
+        self, tick_time: datetime.datetime
+    ) -> list[WorldConversation]:
+        """
+        tick_time까지 기한이 된 사건을 처리하고 이번 tick에 진행할 대화를 고른다.
+        - plan_boundary는 계획만 따라가고(LLM 없음) 다음 경계를 다시 예약한다.
+        - utterance는 받은 발화가 아직 남은 대화만, start/event는 그 에이전트의 모든 대화를 깨운다.
+        """
+        assert self._wake_queue is not None
+        due = self._wake_queue.pop_due(tick_time)
+        plan_boundaries = 0
+        events = 0
+        woken: set[str] = set()
+        heard: set[str] = set()
+        for wake in due:
+            if wake.reason == "plan_boundary":
+                self._follow_plan(wake)
+                plan_boundaries += 1
+                continue
+            if wake.reason == "utterance":
+                heard.add(wake.agent_name)
+                continue
+            if wake.content is not None:
+                self._observe_event(
+                    wake.agent_name, wake.content, wake.when, wake.importance
+                )
+                events += 1
+            woken.add(wake.agent_name)
+
+        selected = [
+            conversation
+            for conversation in self.conversations
+            if any(
+                agent.name in woken
+                or (
+                    agent.name in heard
+                    and conversation.session.incoming_utterances_by_agent.get(
+                        agent.name
+                    )
+                )
+                for agent in conversation.session.agents
+            )
+        ]
+        with self._state_lock:
+            self.event_stats = self.event_stats.merge(
+                EventSchedulerStats(
+                    wakes=len(due),
+                    plan_boundaries=plan_boundaries,
+                    events=events,
+                    conversation_steps=len(selected),
+                    idle_conversations=len(self.conversations) - len(selected),
+                )
+            )
+        return selected
+
+    def _follow_plan(self, wake: AgentWake) -> None:
+        agent = self._agents_by_name[wake.agent_name]
+        with self._agent_locks[agent.name]:
+            boundary = agent.brain.follow_plan(now=wake.when, profile=agent.profile)
+        with self._state_lock:
+            self._plan_wake_pending.discard(agent.name)
+        if boundary is not None:
+            self._schedule_plan_wake(agent.name, boundary)
+
+    def _schedule_plan_wake(self, agent_name: str, when: datetime.datetime) -> None:
+        """에이전트마다 plan_boundary 사건은 하나만 큐에 둔다."""
+        assert self._wake_queue is not None
+        with self._state_lock:
+            if agent_name in self._plan_wake_pending:
+                return
+            self._plan_wake_pending.add(agent_name)
+        self._wake_queue.push(
+            AgentWake(when=when, agent_name=agent_name, reason="plan_boundary")
+        )
+
+    def _observe_event(
+        self,
+        agent_name: str,
+        content: str,
+        now: datetime.datetime,
+        importance: int | None,
+    ) -> None:
+        agent = self._agents_by_name[agent_name]
+        with self._agent_locks[agent_name]:
+            agent.brain.queue_observation(
+                content=content,
+                now=now,
+                profile=agent.profile,
+                importance=importance,
+            )
+
+    def _schedule_follow_ups(
+        self, conversation: WorldConversation, step_result: SimulationStepResult
+    ) -> None:
+        """
+        step 직후 세션 상태로 다음 사건을 예약한다. 참가자 lock을 잡은 채 호출한다.
+        - 받은 발화가 남은 참가자는 발화 시각에 깨운다. 침묵이나 대화 종료로 발화가 없으면
+          대화는 다음 사건까지 쉰다.
+        - 이번 step에서 오늘 계획이 처음 생겼을 수 있으므로 화자의 계획 경계를 예약한다.
+        """
+        assert self._wake_queue is not None
+        session = conversation.session
+        for agent in session.agents:
+            if session.incoming_utterances_by_agent.get(agent.name):
+                self._wake_queue.push(
+                    AgentWake(
+                        when=step_result.now,
+                        agent_name=agent.name,
+                        reason="utterance",
+                    )
+                )
+        self._schedule_plan_wake(step_result.speaker_name, step_result.now)
+
+    def _turn_time_step(self) -> datetime.timedelta:
+        return datetime.timedelta(
+            seconds=self.conversations[0].engine.config.turn_time_step_seconds
+        )
+
+    def _step_executor(self, conversations: int) -> ThreadPoolExecutor | None:
+        if self.step_workers <= 1 or conversations <= 1:
+            return None
+        with self._state_lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self.step_workers, thread_name_prefix="world-step"
+                )
+            return self._executor
+
+    def _step_conversation(
+        self,
+        conversation: WorldConversation,
+        *,
+        current_time: datetime.datetime | None,
+    ) -> SimulationStepResult:
+        # step은 화자 기억과 세션 참가자 전원의 observation을 갱신하므로 참가자 lock을
+        # 모두 잡는다. 이름 순서로 잡아 세션끼리 교착하지 않게 한다.
+        with ExitStack() as stack:
+            for name in sorted({agent.name for agent in conversation.session.agents}):
+                stack.enter_context(self._agent_locks[name])
+            conversation.turn += 1
+            speaker = conversation.session.next_speaker()
+            step_result = conversation.engine.step(
+                turn=conversation.turn,
+                current_time=(
+                    self.current_time if current_time is None else current_time
+                ),
                 speaker=speaker,
-                speaking_partner=speaking_partner,
+                speaking_partner=conversation.session.partner_of(speaker),
+            )
+            if step_result.parse_failure:
+                conversation.parse_failures += 1
+            if not step_result.reply:
+                conversation.silent_turns += 1
+            conversation.session.metrics.record_turn(
+                step_result.speaker_name,
+                parse_failure=step_result.parse_failure,
+                silent=not step_result.reply,
+            )
+            if self._wake_queue is not None:
+                self._schedule_follow_ups(conversation, step_result)
+        self._record_step(conversation, step_result)
+        return step_result
+
+    def _on_world_reply(
+        self,
+        session: WorldConversationSession,
+        speaker: SimAgent,
+        reply: str,
+        now: datetime.datetime,
+        language: Literal["ko", "en"],
+    ) -> None:
+        with self._state_lock:
+            self._world_replies.append(
+                WorldReply(
+                    speaker_name=speaker.name,
+                    reply=reply,
+                    now=now,
+                    language=language,
+                    audience=tuple(agent.name for agent in session.agents),
+                )
             )
-            self.current_time = step_result.now
+
+    def _take_world_replies(self) -> list[WorldReply]:
+        with self._state_lock:
+            replies, self._world_replies = self._world_replies, []
+        return replies
+
+    def _record_step(
+        self, conversation: WorldConversation, step_result: SimulationStepResult
+    ) -> None:
+        with self._state_lock:
+            self.turn += 1
+            if self.step_log is not None:
+                self._pending_step_records.append(
+                    step_log_record(
+                        turn=self.turn,
+                        conversation_id=conversation.conversation_id,
+                        conversation_turn=conversation.turn,
+                        step_result=step_result,
+                    )
+                )
+            self.current_time = max(self.current_time, step_result.now)
             if step_result.parse_failure:
                 self.parse_failures += 1
             if not step_result.reply:
                 self.silent_turns += 1
-            return step_result
+            if step_result.timings is not None:
+                previous = self.agent_timings.get(step_result.speaker_name)
+                self.agent_timings[step_result.speaker_name] = (
+                    step_result.timings
+                    if previous is None
+                    else previous.merge(step_result.timings)
+                )
+            if step_result.speculation is not None:
+                self.speculation_stats = self.speculation_stats.merge(
+                    step_result.speculation
+                )
+            if step_result.reaction_trace is not None:
+                mode = requested_reaction_mode(step_result.reaction_trace)
+                self.reaction_mode_counts[mode] = self.reaction_mode_counts.get(
+                    mode, ReactionModeCounts()
+                ).merge(ReactionModeCounts.from_trace(step_result.reaction_trace))
 
-    def tick(self) -> SimulationStepResult:
-        """Advance the single runtime clock by one perceive-plan-act tick."""
-        return self.step()
+    def _persist(self) -> None:
+        # 체크포인트를 step 로그보다 먼저 쓴다. 둘 사이에서 멈추면 로그가 뒤처질 뿐
+        # 복원한 turn보다 앞서지 않는다.
+        if self.checkpointer is not None:
+            _ = self.checkpoint()
+        self._flush_step_log()
+
+    def _flush_step_log(self) -> None:
+        # 레코드를 꺼내는 일과 쓰는 일을 같은 lock 안에서 해 turn 순서대로 기록한다.
+        with self._step_log_lock:
+            if self.step_log is None:
+                return
+            with self._state_lock:
+                records, self._pending_step_records = self._pending_step_records, []
+            self.step_log.append(records)
 
     @property
     def scheduler_running(self) -> bool:
@@ -124,16 +910,46 @@ class WorldRuntime:
         return True
 
     async def _run_scheduler(self) -> None:
+        """
+        tick 마감 시각에 맞춰 tick을 실행한다.
+        - interval 모드는 tick 후 interval만큼 쉬고, deadline 모드는 절대 마감 시각을
+          목표로 하며 overrun은 overrun_policy로 처리한다(tick_clock 참고).
+        """
+        clock = self._tick_clock
+        clock.start(time.monotonic())
         while True:
+            await asyncio.sleep(clock.delay_until_next(time.monotonic()))
+            clock.begin_tick(time.monotonic())
             await asyncio.to_thread(self.tick)
-            await asyncio.sleep(self.tick_interval_seconds)
+            clock.finish_tick(time.monotonic())
 
-    def metrics(self) -> ConversationMetrics:
-        return build_conversation_metrics(
-            turns=self.turn,
-            parse_failures=self.parse_failures,
-            silent_turns=self.silent_turns,
-            session_history=self.session.history,
+    def metrics(self, conversation_id: str | None = None) -> ConversationMetrics:
+        """
+        대화 세션 하나(기본: 첫 번째 세션)의 대화 품질 지표.
+        - 세션이 발화마다 갱신한 누적값으로 만들므로 history 길이와 무관하게 비용이 일정하다.
+        """
+        conversation = (
+            self.conversations[0]
+            if conversation_id is None
+            else self.conversation(conversation_id)
+        )
+        return conversation.session.metrics.build(
+            turns=conversation.turn,
+            parse_failures=conversation.parse_failures,
+            silent_turns=conversation.silent_turns,
+        )
+
+    def conversation_metrics(self) -> dict[str, ConversationMetrics]:
+        """대화 세션별 지표(conversation_id 기준)."""
+        return {
+            conversation.conversation_id: self.metrics(conversation.conversation_id)
+            for conversation in self.conversations
+        }
+
+    def agent_metrics(self) -> dict[str, ConversationMetrics]:
+        """에이전트별 지표. 여러 세션에 속한 에이전트는 세션 누적값을 합친다."""
+        return merge_agent_metrics(
+            [conversation.session.metrics for conversation in self.conversations]
         )
 
     def state(self) -> WorldRuntimeState:
@@ -142,50 +958,201 @@ class WorldRuntime:
             current_time=self.current_time,
             parse_failures=self.parse_failures,
             silent_turns=self.silent_turns,
-            history_size=len(self.session.history),
+            history_size=sum(
+                conversation.session.committed_replies
+                for conversation in self.conversations
+            ),
             scheduler_running=self.scheduler_running,
             tick_interval_seconds=self.tick_interval_seconds,
+            conversations=len(self.conversations),
+            step_workers=self.step_workers,
+            turns_per_second=(
+                self._tick_turns / self._tick_seconds if self._tick_seconds else 0.0
+            ),
+            tick_timing=self._tick_clock.stats,
+            step_scheduling=self.step_scheduling,
+            pending_wakes=len(self._wake_queue) if self._wake_queue is not None else 0,
+            event_scheduler=self.event_stats,
+            focused_agents=sorted(self._focused),
+            cognition_tiers={
+                agent.name: tier
+                for agent in self.agents
+                if (tier := self.cognition_tier(agent.name)) != "full"
+            },
+            agent_positions=(
+                {
+                    name: (position.x, position.y)
+                    for name, position in self.spatial.positions().items()
+                }
+                if self.spatial is not None
+                else {}
+            ),
+            encounters=self.encounters,
+            fan_out=(
+                self.event_bus.stats if self.event_bus is not None else FanOutStats()
+            ),
+            step_log=self.step_log.stats if self.step_log is not None else None,
+            checkpoint=(
+                self.checkpointer.stats if self.checkpointer is not None else None
+            ),
+            reaction_modes={
+                mode: counts.metrics()
+                for mode, counts in self.reaction_mode_counts.items()
+            },
         )
 
 
-def build_world_runtime(*, config: WorldRuntimeConfig) -> WorldRuntime:
-    now = datetime.datetime.now()
-    llm_client = build_provider_client(
-        timeout_seconds=config.timeout_seconds,
-        generation_model=config.llm_model,
-        embedding_model=config.embedding_model,
-        base_url=config.base_url,
-        api_key=config.api_key,
-    )
+def build_world_runtime(
+    *,
+    config: WorldRuntimeConfig,
+    llm_client: ProviderClient | None = None,
+    now: datetime.datetime | None = None,
+) -> WorldRuntime:
+    """
+    config로 에이전트/세션/엔진을 구성한다.
+    - llm_client를 주면 provider를 새로 만들지 않고 그대로 사용한다(벤치마크/테스트용).
+    - now를 주면 그 시각에서 시작한다(여러 shard의 시계를 맞출 때 사용).
+    - checkpoint_path에 체크포인트가 있으면 persona seed 기억 대신 체크포인트 상태로
+      복원하고(LLM/임베딩 호출 없음) 그 시각에서 이어 간다.
+    """
+    if (
+        config.history_window is not None
+        and config.history_window < config.repetition_window
+    ):
+        # 반복 억제는 세션 history의 최근 repetition_window개와 비교한다.
+        raise ValueError("history_window must be at least repetition_window")
+    if config.checkpoint_path is not None and config.history_window is None:
+        # 진행한 대화는 세션 history째 delta에 들어간다. history가 무한히 자라면
+        # tick마다 쓰는 delta도 실행 길이에 비례해 커진다.
+        raise ValueError("checkpoint_path requires history_window")
+    if config.broadcast_scope == "perception" and not config.spatial_world:
+        # 지각 반경은 좌표 월드의 위치로 계산한다. 좌표가 없으면 대화 밖 누구에게도
+        # 전달되지 않고 모두 반경 밖으로 집계된다.
+        raise ValueError('broadcast_scope="perception" requires spatial_world')
+    checkpoint_store: WorldCheckpointStore | None = None
+    checkpoint_state: dict[str, object] | None = None
+    if config.checkpoint_path is not None:
+        checkpoint_store = WorldCheckpointStore(config.checkpoint_path)
+        if checkpoint_store.exists():
+            checkpoint_state = checkpoint_store.load()
+            now = checkpoint_time(checkpoint_state)
+    now = now or datetime.datetime.now()
+    if llm_client is None:
+        llm_client = build_provider_client(
+            timeout_seconds=config.timeout_seconds,
+            generation_model=config.llm_model,
+            embedding_model=config.embedding_model,
+            base_url=config.base_url,
+            api_key=config.api_key,
+        )
+    if config.instrumentation_enabled:
+        llm_client = InstrumentedProviderClient(llm_client)
     agents = init_agents(
         persona_dir=config.persona_dir,
         agent_persona_names=config.agent_persona_names,
         llm_client=llm_client,
         embedding_model=config.embedding_model,
         now=now,
+        memory_archive_dir=config.memory_archive_dir,
+        memory_segment_dir=config.memory_segment_dir,
+        plan_store_dir=config.plan_store_dir,
+        plan_expansion=config.plan_expansion,
+        seed_memories=checkpoint_state is None,
     )
-    session = WorldConversationSession(
-        agents=agents,
-        dialogue_turn_window=config.dialogue_turn_window,
-        dialogue_target_turns=config.dialogue_target_turns,
-    )
-    engine = SimulationEngine(
-        session=session,
-        config=SimulationEngineConfig(
-            language=config.language,
-            turn_time_step_seconds=config.turn_time_step_seconds,
-            suppress_repeated_replies=config.suppress_repeated_replies,
-            repetition_window=config.repetition_window,
-            fallback_on_empty_reply=config.fallback_on_empty_reply,
-        ),
+    engine_config = SimulationEngineConfig(
+        language=config.language,
+        turn_time_step_seconds=config.turn_time_step_seconds,
+        suppress_repeated_replies=config.suppress_repeated_replies,
+        repetition_window=config.repetition_window,
+        fallback_on_empty_reply=config.fallback_on_empty_reply,
+        instrumentation_enabled=config.instrumentation_enabled,
+        share_tick_embeddings=config.share_tick_embeddings,
+        speculative_prefetch=config.speculative_prefetch,
     )
-    return WorldRuntime(
+    groups = group_conversation_agents(agents, config.conversation_size)
+    spatial: SpatialWorld | None = None
+    if config.spatial_world:
+        spatial = SpatialWorld(perception_radius=config.perception_radius)
+        spatial.layout_groups([[agent.name for agent in group] for group in groups])
+    sessions = [
+        WorldConversationSession(
+            agents=group,
+            dialogue_turn_window=config.dialogue_turn_window,
+            dialogue_target_turns=config.dialogue_target_turns,
+            history_window=config.history_window,
+        )
+        for group in groups
+    ]
+    runtime = WorldRuntime(
         agents=agents,
-        session=session,
-        engine=engine,
+        session=sessions[0],
+        engine=SimulationEngine(
+            session=sessions[0], config=engine_config, spatial=spatial
+        ),
         current_time=now,
         tick_interval_seconds=config.tick_interval_seconds,
+        step_workers=config.step_workers,
+        scheduler_mode=config.scheduler_mode,
+        overrun_policy=config.overrun_policy,
+        step_scheduling=config.step_scheduling,
+        broadcast_scope=config.broadcast_scope,
+        spatial=spatial,
+        importance_scorer=(
+            LlmImportanceScorer(client=llm_client)
+            if config.broadcast_scope == "perception"
+            else None
+        ),
     )
+    for session in sessions[1:]:
+        _ = runtime.add_conversation(
+            session=session,
+            engine=SimulationEngine(
+                session=session, config=engine_config, spatial=spatial
+            ),
+        )
+    if config.cognition_tier != "full":
+        for agent in agents:
+            runtime.set_cognition_tier(agent.name, config.cognition_tier)
+    if checkpoint_state is not None:
+        # step 로그는 복원한 turn 이후부터 이어 붙이므로 turn을 먼저 되돌린다.
+        restore_world(runtime, checkpoint_state)
+    if config.step_log_dir is not None:
+        step_log = StepLog(
+            config.step_log_dir, segment_max_bytes=config.step_log_segment_bytes
+        )
+        if checkpoint_state is None:
+            # 체크포인트 없이 다시 시작하면 새 실행을 기존 로그 뒤에 이어 붙이도록
+            # turn 번호를 로그의 마지막 turn부터 센다.
+            runtime.turn = step_log.stats.last_turn
+        else:
+            # 로그를 체크포인트보다 먼저 쓴 실행이 그 사이에 멈췄다면 복원한 turn 뒤의
+            # 기록은 다시 진행할 step이므로 지운다.
+            _ = step_log.truncate_after(runtime.turn)
+        runtime.attach_step_log(step_log)
+    if checkpoint_store is not None:
+        _ = runtime.attach_checkpointer(
+            WorldCheckpointer(
+                runtime=runtime,
+                store=checkpoint_store,
+                compact_every=config.checkpoint_compact_every,
+            )
+        )
+    return runtime
+
+
+def group_conversation_agents(
+    agents: list[TAgent], conversation_size: int
+) -> list[list[TAgent]]:
+    """에이전트를 conversation_size명씩 묶는다. 혼자 남는 에이전트는 마지막 묶음에 합친다."""
+    if conversation_size < 2:
+        raise ValueError("conversation_size must be at least 2")
+    groups = [
+        agents[index : index + conversation_size]
+        for index in range(0, len(agents), conversation_size)
+    ]
+    if len(groups) > 1 and len(groups[-1]) < 2:
+        groups[-2].extend(groups.pop())
+    return groups
 
 
 def default_persona_dir() -> str:
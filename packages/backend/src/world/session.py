@@ -1,12 +1,20 @@
 import datetime
-from typing import Literal
+from collections.abc import Callable
+from typing import Literal, cast
 
 from agents.reaction import DialogueArc
 from agents.sim_agent import SimAgent
+from llm.embedding_context import share_tick_embedding
+from llm.governance import ConversationMetricsAccumulator
+from world.event_bus import PerceptionEventBus
 from world.observation_builder import format_other_said, format_self_said
+from world.spatial import SpatialWorld
 
 DEFAULT_DIALOGUE_TARGET_TURNS = 5
 
+ReplyListener = Callable[[SimAgent, str, datetime.datetime, Literal["ko", "en"]], None]
+"""세션 밖에서 확정 발화를 받아야 하는 구독자(speaker, reply, now, language)."""
+
 
 def infer_dialogue_goal(*, speaker: SimAgent) -> str:
     profile = getattr(speaker, "profile", None)
@@ -26,8 +34,31 @@ def infer_dialogue_goal(*, speaker: SimAgent) -> str:
 
 
 def build_turn_world_context(
-    *, speaker_name: str, partner_name: str, turn: int
+    *,
+    speaker_name: str,
+    partner_name: str,
+    turn: int,
+    spatial: SpatialWorld | None = None,
 ) -> dict[str, str]:
+    """
+    화자의 장소/시선 맥락.
+    - spatial에 화자 위치가 있으면 가장 가까운 landmark를 장소로 쓰고, 지각 반경 안의
+      다른 에이전트를 nearby로 덧붙인다.
+    - 없으면 turn에 따라 고정 장소 네 곳을 돌려 쓴다.
+    """
+    place = spatial.location_of(speaker_name) if spatial is not None else None
+    if spatial is not None and place is not None:
+        context = {
+            "location": f"{place} near {partner_name}",
+            "focus": f"{speaker_name} is facing {partner_name}",
+        }
+        nearby = [
+            name for name in spatial.nearby_agents(speaker_name) if name != partner_name
+        ]
+        if nearby:
+            context["nearby"] = ", ".join(nearby)
+        return context
+
     locations = [
         "town square",
         "cafe entrance",
@@ -67,20 +98,32 @@ class WorldConversationSession:
         agents: list[SimAgent],
         dialogue_turn_window: int | None,
         dialogue_target_turns: int = DEFAULT_DIALOGUE_TARGET_TURNS,
+        history_window: int | None = None,
     ):
+        """
+        history_window를 주면 세션 history와 에이전트별 대화 기록을 최근 그 개수만 메모리에
+        남긴다. 대화 맥락은 dialogue_turn_window와 history_window 중 작은 쪽으로 잘린다.
+        전체 기록은 런타임 step 로그(world.step_log)에 남긴다.
+        """
         if len(agents) < 2:
             raise ValueError("At least two agents are required")
         if dialogue_turn_window is not None and dialogue_turn_window < 1:
             raise ValueError("dialogue_turn_window must be at least 1")
         if dialogue_target_turns < 2:
             raise ValueError("dialogue_target_turns must be at least 2")
+        if history_window is not None and history_window < 1:
+            raise ValueError("history_window must be at least 1")
 
         self.agents: list[SimAgent] = agents
         self.dialogue_turn_window: int | None = dialogue_turn_window
         self.dialogue_target_turns: int = dialogue_target_turns
+        self.history_window: int | None = history_window
         self.is_active: bool = True
         self.turn_index: int = 0
         self.history: list[tuple[str, str]] = []
+        self.committed_replies: int = 0
+        """history_window로 잘려 나간 것까지 포함해 지금까지 확정한 발화 수."""
+        self.metrics: ConversationMetricsAccumulator = ConversationMetricsAccumulator()
         self.dialogue_turns_taken: int = 0
         self.dialogue_goal: str | None = None
         self.dialogue_history_by_agent: dict[str, list[tuple[str, str]]] = {
@@ -89,12 +132,33 @@ class WorldConversationSession:
         self.incoming_utterances_by_agent: dict[str, list[str]] = {
             agent.name: [] for agent in agents
         }
+        self.reply_listener: ReplyListener | None = None
+        self.event_bus: PerceptionEventBus | None = None
 
     def next_speaker(self) -> SimAgent:
-        speaker = self.agents[self.turn_index % len(self.agents)]
+        speaker = self.peek_next_speaker()
         self.turn_index += 1
         return speaker
 
+    def peek_next_speaker(self) -> SimAgent:
+        return self.agents[self.turn_index % len(self.agents)]
+
+    def partner_of(self, speaker: SimAgent) -> SimAgent:
+        """발화 순서상 speaker 직전 차례의 참가자. 2인 대화에서는 상대방이다."""
+        index = next(i for i, agent in enumerate(self.agents) if agent is speaker)
+        return self.agents[index - 1]
+
+    def peek_incoming_partner_utterance(
+        self,
+        *,
+        speaker: SimAgent,
+    ) -> str | None:
+        """consume_incoming_partner_utterance가 다음에 돌려줄 발화를 상태 변경 없이 반환한다."""
+        if not self.is_active:
+            return None
+        incoming_queue = self.incoming_utterances_by_agent[speaker.name]
+        return incoming_queue[0] if incoming_queue else None
+
     def consume_incoming_partner_utterance(
         self,
         *,
@@ -108,8 +172,9 @@ class WorldConversationSession:
             return None
 
         incoming_partner_utterance = incoming_queue.pop(0)
-        self.dialogue_history_by_agent[speaker.name].append(
-            (incoming_partner_utterance, "")
+        self._append_bounded(
+            self.dialogue_history_by_agent[speaker.name],
+            (incoming_partner_utterance, ""),
         )
         return incoming_partner_utterance
 
@@ -121,10 +186,32 @@ class WorldConversationSession:
         if not self.is_active:
             return []
 
-        history = self.dialogue_history_by_agent[speaker.name]
-        if self.dialogue_turn_window is None:
+        return self._windowed(self.dialogue_history_by_agent[speaker.name])
+
+    def preview_dialogue_context_for(
+        self,
+        *,
+        speaker: SimAgent,
+        incoming_partner_utterance: str | None,
+    ) -> list[tuple[str, str]]:
+        """incoming 발화를 소비한 뒤의 dialogue_context_for 결과를 상태 변경 없이 반환한다."""
+        if not self.is_active:
+            return []
+
+        history = list(self.dialogue_history_by_agent[speaker.name])
+        if incoming_partner_utterance is not None:
+            history.append((incoming_partner_utterance, ""))
+        return self._windowed(history)
+
+    def _windowed(self, history: list[tuple[str, str]]) -> list[tuple[str, str]]:
+        windows = [
+            window
+            for window in (self.dialogue_turn_window, self.history_window)
+            if window is not None
+        ]
+        if not windows:
             return history
-        return history[-self.dialogue_turn_window :]
+        return history[-min(windows) :]
 
     def dialogue_arc_for(
         self,
@@ -173,11 +260,22 @@ class WorldConversationSession:
                 reply,
             )
         else:
-            self.dialogue_history_by_agent[speaker.name].append(("", reply))
+            self._append_bounded(
+                self.dialogue_history_by_agent[speaker.name], ("", reply)
+            )
 
-        self.history.append((speaker.name, reply))
+        self._append_bounded(self.history, (speaker.name, reply))
+        self.committed_replies += 1
+        self.metrics.add_reply(speaker.name, reply)
         self.dialogue_turns_taken += 1
 
+    def _append_bounded(
+        self, history: list[tuple[str, str]], entry: tuple[str, str]
+    ) -> None:
+        history.append(entry)
+        if self.history_window is not None and len(history) > self.history_window:
+            del history[: len(history) - self.history_window]
+
     def finish_dialogue(self) -> None:
         self.is_active = False
         self.dialogue_turns_taken = 0
@@ -185,6 +283,61 @@ class WorldConversationSession:
         self.dialogue_history_by_agent = {agent.name: [] for agent in self.agents}
         self.incoming_utterances_by_agent = {agent.name: [] for agent in self.agents}
 
+    def to_record(self) -> dict[str, object]:
+        """
+        세션 진행 상태를 JSON 직렬화 가능한 dict로 반환한다(체크포인트용).
+        - history_window가 있으면 보관 중인 최근 history만 담기므로 크기가 일정하다.
+        """
+        return {
+            "is_active": self.is_active,
+            "turn_index": self.turn_index,
+            "history": [list(entry) for entry in self.history],
+            "committed_replies": self.committed_replies,
+            "dialogue_turns_taken": self.dialogue_turns_taken,
+            "dialogue_goal": self.dialogue_goal,
+            "dialogue_history_by_agent": {
+                name: [list(entry) for entry in history]
+                for name, history in self.dialogue_history_by_agent.items()
+            },
+            "incoming_utterances_by_agent": {
+                name: list(queue)
+                for name, queue in self.incoming_utterances_by_agent.items()
+            },
+            "metrics": self.metrics.to_record(),
+        }
+
+    def restore_record(self, record: dict[str, object]) -> None:
+        """to_record 결과로 세션 진행 상태를 되돌린다. 참가자 구성은 같아야 한다."""
+        names = {agent.name for agent in self.agents}
+        dialogue_history = cast(
+            dict[str, list[list[str]]], record["dialogue_history_by_agent"]
+        )
+        if set(dialogue_history) != names:
+            raise ValueError(
+                f"checkpoint session agents {sorted(dialogue_history)} "
+                f"do not match {sorted(names)}"
+            )
+        self.is_active = bool(record["is_active"])
+        self.turn_index = int(cast(int, record["turn_index"]))
+        self.history = [
+            (speaker, reply)
+            for speaker, reply in cast(list[list[str]], record["history"])
+        ]
+        self.committed_replies = int(cast(int, record["committed_replies"]))
+        self.dialogue_turns_taken = int(cast(int, record["dialogue_turns_taken"]))
+        self.dialogue_goal = cast(str | None, record["dialogue_goal"])
+        self.dialogue_history_by_agent = {
+            name: [(incoming, reply) for incoming, reply in history]
+            for name, history in dialogue_history.items()
+        }
+        self.incoming_utterances_by_agent = {
+            name: list(queue)
+            for name, queue in cast(
+                dict[str, list[str]], record["incoming_utterances_by_agent"]
+            ).items()
+        }
+        self.metrics.restore_record(cast(dict[str, object], record["metrics"]))
+
     def broadcast_reply(
         self,
         *,
@@ -192,19 +345,53 @@ class WorldConversationSession:
         reply: str,
         now: datetime.datetime,
         language: Literal["ko", "en"],
+    ) -> None:
+        """
+        확정 발화를 참가자 전원의 observation으로 기록하고 다른 참가자의 수신 큐에 넣는다.
+        - event_bus가 있으면 기록을 bus에 맡긴다. bus는 step이 끝난 뒤(flush) 임베딩 공유와
+          배치 중요도 채점을 적용해 기록한다.
+        """
+        if self.event_bus is not None:
+            self.event_bus.publish_to_conversation(
+                speaker=speaker,
+                reply=reply,
+                now=now,
+                language=language,
+                participants=self.agents,
+            )
+        else:
+            self._observe_reply(
+                speaker=speaker, reply=reply, now=now, language=language
+            )
+        for observer in self.agents:
+            if observer is not speaker:
+                self.incoming_utterances_by_agent[observer.name].append(reply)
+        if self.reply_listener is not None:
+            self.reply_listener(speaker, reply, now, language)
+
+    def _observe_reply(
+        self,
+        *,
+        speaker: SimAgent,
+        reply: str,
+        now: datetime.datetime,
+        language: Literal["ko", "en"],
     ) -> None:
         for observer in self.agents:
             if observer is speaker:
+                self_said = format_self_said(language, reply)
+                share_tick_embedding(self_said, reply)
                 observer.brain.queue_observation(
-                    content=format_self_said(language, reply),
+                    content=self_said,
                     now=now,
                     profile=observer.profile,
                 )
                 continue
 
+            other_said = format_other_said(language, speaker.name, reply)
+            share_tick_embedding(other_said, reply)
             observer.brain.queue_observation(
-                content=format_other_said(language, speaker.name, reply),
+                content=other_said,
                 now=now,
                 profile=observer.profile,
             )
-            self.incoming_utterances_by_agent[observer.name].append(reply)
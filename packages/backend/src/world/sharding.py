@@ -0,0 +1,249 @@
+"""
+에이전트를 여러 worker 프로세스에 나눠 실행하는 shard 런타임.
+
+- 검색 점수 계산, guardrail n-gram 검사, 프롬프트 조립/파싱, 그래프 실행 같은 LLM 외
+  작업은 GIL에 묶인 CPU 작업이라 한 프로세스에서는 코어 하나를 넘지 못한다.
+- 대화 단위로 에이전트를 shard에 배정한다. 각 shard 프로세스는 자기 에이전트의
+  MemoryStream과 WorldRuntime을 소유하고, 대화 step은 shard 안에서 끝난다.
+- 다른 shard 에이전트가 받아야 하는 발화(broadcast_scope="world")는 부모 프로세스가
+  shard 간 채널로 중계해 다음 tick 시작 시 전달한다(한 tick 지연).
+"""
+
+import datetime
+import multiprocessing
+import time
+from collections.abc import Callable
+from dataclasses import dataclass, field, replace
+from multiprocessing.connection import Connection
+from typing import Literal, cast
+
+from llm.clients.provider_factory import ProviderClient
+
+from .runtime import (
+    WorldReply,
+    WorldRuntime,
+    WorldRuntimeConfig,
+    build_world_runtime,
+    group_conversation_agents,
+)
+
+ShardCommand = Literal["tick", "close"]
+LlmClientFactory = Callable[[], ProviderClient]
+
+
+@dataclass(frozen=True)
+class ShardTickReport:
+    """shard 하나의 tick 결과 요약(프로세스 간 전달용)."""
+
+    shard_index: int
+    turns: int
+    """이번 tick에 진행한 대화 step 수."""
+    now: datetime.datetime
+    """tick 이후 shard 시각."""
+    busy_ms: float
+    """shard 프로세스가 tick 처리(수신 발화 전달 포함)에 쓴 시간(ms)."""
+    outbound: list[WorldReply] = field(default_factory=list)
+    """다른 shard 에이전트에게 전달할 발화."""
+    delivered: int = 0
+    """다른 shard에서 받은 발화를 observation으로 전달한 건수."""
+
+
+@dataclass(frozen=True)
+class ShardedTickResult:
+    now: datetime.datetime
+    """모든 shard 중 가장 늦은 시각."""
+    turns: int
+    wall_ms: float
+    shards: list[ShardTickReport]
+    cross_shard_messages: int
+    """이번 tick에 shard 간 채널로 보낸 발화 수(수신 shard 기준)."""
+
+
+def partition_persona_names(
+    persona_names: list[str], *, conversation_size: int, shards: int
+) -> list[list[str]]:
+    """
+    대화 묶음 단위로 페르소나를 shard에 round-robin 배정한다.
+    - 한 대화의 참가자는 항상 같은 shard에 있어 대화 상태가 프로세스를 넘지 않는다.
+    - 각 shard에서 conversation_size로 다시 묶어도 같은 대화 묶음이 나온다.
+    """
+    if shards < 1:
+        raise ValueError("shards must be at least 1")
+    groups = group_conversation_agents(persona_names, conversation_size)
+    assigned: list[list[str]] = [[] for _ in range(min(shards, len(groups)))]
+    for index, group in enumerate(groups):
+        assigned[index % len(assigned)].extend(group)
+    return assigned
+
+
+class ShardedWorldRuntime:
+    def __init__(
+        self,
+        *,
+        config: WorldRuntimeConfig,
+        shards: int,
+        llm_client_factory: LlmClientFactory | None = None,
+        current_time: datetime.datetime | None = None,
+    ) -> None:
+        """
+        shard 프로세스를 띄우고 각자 WorldRuntime을 구성할 때까지 기다린다.
+        - llm_client_factory는 shard 프로세스 안에서 호출되므로 pickle 가능해야 한다.
+          None이면 config로 provider를 만든다.
+        """
+        self.config: WorldRuntimeConfig = config
+        self.current_time: datetime.datetime = current_time or datetime.datetime.now()
+        self.shard_persona_names: list[list[str]] = partition_persona_names(
+            config.agent_persona_names,
+            conversation_size=config.conversation_size,
+            shards=shards,
+        )
+        self.turn: int = 0
+        self.cross_shard_messages: int = 0
+        self._pending: list[list[WorldReply]] = [[] for _ in self.shard_persona_names]
+        self._connections: list[Connection] = []
+        self._processes: list[multiprocessing.process.BaseProcess] = []
+
+        context = multiprocessing.get_context("spawn")
+        for index, persona_names in enumerate(self.shard_persona_names):
+            parent_end, child_end = context.Pipe()
+            process = context.Process(
+                target=_run_shard,
+                args=(
+                    child_end,
+                    index,
+                    replace(config, agent_persona_names=persona_names),
+                    self.current_time,
+                    llm_client_factory,
+                ),
+                name=f"world-shard-{index}",
+                daemon=True,
+            )
+            process.start()
+            child_end.close()
+            self._connections.append(parent_end)
+            self._processes.append(process)
+        for connection in self._connections:
+            _ = _receive(connection)
+
+    @property
+    def shards(self) -> int:
+        return len(self._connections)
+
+    def tick(self) -> ShardedTickResult:
+        """모든 shard를 동시에 한 tick 진행하고 shard 밖으로 나간 발화를 중계한다."""
+        started = time.perf_counter()
+        # 한 shard가 실패해도 나머지 shard의 보고는 모두 읽어 파이프에 남기지 않는다.
+        # 실패한 shard는 이미 종료했으므로 런타임 전체를 닫고 첫 오류를 올린다.
+        failures: list[RuntimeError] = []
+        sent: list[Connection] = []
+        for index, connection in enumerate(self._connections):
+            try:
+                connection.send(("tick", self._pending[index]))
+            except (BrokenPipeError, OSError) as exc:
+                failures.append(RuntimeError(f"world shard {index} is gone: {exc}"))
+                continue
+            sent.append(connection)
+        reports: list[ShardTickReport] = []
+        for connection in sent:
+            try:
+                reports.append(cast(ShardTickReport, _receive(connection)))
+            except RuntimeError as exc:
+                failures.append(exc)
+        if failures:
+            self.close()
+            raise failures[0]
+
+        self._pending = [[] for _ in self._connections]
+        routed = 0
+        for report in reports:
+            for index in range(self.shards):
+                if index == report.shard_index or not report.outbound:
+                    continue
+                self._pending[index].extend(report.outbound)
+                routed += len(report.outbound)
+
+        self.turn += sum(report.turns for report in reports)
+        self.cross_shard_messages += routed
+        self.current_time = max(report.now for report in reports)
+        return ShardedTickResult(
+            now=self.current_time,
+            turns=sum(report.turns for report in reports),
+            wall_ms=(time.perf_counter() - started) * 1000,
+            shards=reports,
+            cross_shard_messages=routed,
+        )
+
+    def close(self) -> None:
+        for connection in self._connections:
+            try:
+                connection.send(("close", []))
+            except (BrokenPipeError, OSError):
+                continue
+        for process in self._processes:
+            process.join(timeout=10)
+            if process.is_alive():
+                process.terminate()
+        for connection in self._connections:
+            connection.close()
+        self._connections = []
+        self._processes = []
+
+
+def _receive(connection: Connection) -> object:
+    try:
+        message = cast(tuple[str, object], connection.recv())
+    except EOFError as exc:
+        raise RuntimeError("world shard exited without a reply") from exc
+    kind, payload = message
+    if kind == "error":
+        raise RuntimeError(f"world shard failed: {payload}")
+    return payload
+
+
+def _run_shard(
+    connection: Connection,
+    shard_index: int,
+    config: WorldRuntimeConfig,
+    current_time: datetime.datetime,
+    llm_client_factory: LlmClientFactory | None,
+) -> None:
+    """shard 프로세스 진입점. 부모가 close를 보낼 때까지 tick 명령을 처리한다."""
+    runtime: WorldRuntime | None = None
+    try:
+        runtime = build_world_runtime(
+            config=config,
+            llm_client=llm_client_factory() if llm_client_factory else None,
+            now=current_time,
+        )
+        connection.send(("ready", shard_index))
+        while True:
+            command, inbound = cast(
+                tuple[ShardCommand, list[WorldReply]], connection.recv()
+            )
+            if command == "close":
+                break
+            connection.send(("tick", _tick_shard(runtime, shard_index, inbound)))
+    except Exception as exc:
+        # 부모가 기다리지 않도록 오류를 알린 뒤 traceback과 함께 프로세스를 끝낸다.
+        connection.send(("error", f"{type(exc).__name__}: {exc}"))
+        raise
+    finally:
+        if runtime is not None:
+            runtime.close()
+        connection.close()
+
+
+def _tick_shard(
+    runtime: WorldRuntime, shard_index: int, inbound: list[WorldReply]
+) -> ShardTickReport:
+    started = time.perf_counter()
+    delivered = runtime.deliver_replies(inbound)
+    result = runtime.tick()
+    return ShardTickReport(
+        shard_index=shard_index,
+        turns=len(result.steps),
+        now=result.now,
+        busy_ms=(time.perf_counter() - started) * 1000,
+        outbound=result.replies,
+        delivered=delivered,
+    )
@@ -0,0 +1,253 @@
+"""
+좌표 기반 월드 상태와 균일 격자 spatial hash.
+
+- 에이전트 위치를 cell_size 격자 칸에 나눠 담는다. 반경 r 질의는 중심 칸 주변
+  ceil(r / cell_size) 칸만 훑으므로 비용이 전체 에이전트 수가 아니라 근처 에이전트 수에
+  비례한다.
+- cell_size를 지각 반경과 같게 두면 지각/조우 질의는 주변 3x3 칸만 본다.
+- 조우(encounter)는 반경 안에 새로 들어온 에이전트 쌍이다. 쌍 검사도 같은 칸과 이웃 칸만
+  비교해 tick마다 O(N²) 전수 비교를 하지 않는다.
+- 장소 이름은 가장 가까운 landmark로 정한다. Tiled 맵/A* 경로 탐색은 이 좌표계 위에 얹는다.
+"""
+
+import math
+import threading
+from collections.abc import Iterable, Iterator
+from dataclasses import dataclass
+
+Cell = tuple[int, int]
+EncounterPair = tuple[str, str]
+"""이름 순서로 정렬한 에이전트 쌍."""
+
+
+@dataclass(frozen=True)
+class Position:
+    x: float
+    y: float
+
+    def distance_to(self, other: "Position") -> float:
+        return math.hypot(self.x - other.x, self.y - other.y)
+
+
+@dataclass(frozen=True)
+class Landmark:
+    name: str
+    position: Position
+
+
+DEFAULT_LANDMARKS: tuple[Landmark, ...] = (
+    Landmark(name="town square", position=Position(0.0, 0.0)),
+    Landmark(name="cafe entrance", position=Position(40.0, 0.0)),
+    Landmark(name="library walkway", position=Position(0.0, 40.0)),
+    Landmark(name="park bench", position=Position(40.0, 40.0)),
+)
+"""기존 build_turn_world_context가 돌려 쓰던 네 장소를 좌표에 배치한 기본 맵."""
+
+
+class SpatialHash:
+    """이름 → 위치와 격자 칸 → 이름 집합을 함께 유지하는 균일 격자 색인."""
+
+    def __init__(self, *, cell_size: float) -> None:
+        if cell_size <= 0:
+            raise ValueError("cell_size must be greater than 0")
+        self.cell_size: float = cell_size
+        self._positions: dict[str, Position] = {}
+        self._cells: dict[Cell, set[str]] = {}
+
+    def __len__(self) -> int:
+        return len(self._positions)
+
+    def __contains__(self, name: object) -> bool:
+        return name in self._positions
+
+    def cell_of(self, position: Position) -> Cell:
+        return (
+            math.floor(position.x / self.cell_size),
+            math.floor(position.y / self.cell_size),
+        )
+
+    def place(self, name: str, position: Position) -> None:
+        """이름을 position에 놓는다. 이미 있으면 옮기고, 칸이 같으면 색인은 그대로 둔다."""
+        previous = self._positions.get(name)
+        self._positions[name] = position
+        cell = self.cell_of(position)
+        if previous is not None:
+            previous_cell = self.cell_of(previous)
+            if previous_cell == cell:
+                return
+            self._discard_from_cell(name, previous_cell)
+        self._cells.setdefault(cell, set()).add(name)
+
+    def remove(self, name: str) -> None:
+        position = self._positions.pop(name, None)
+        if position is not None:
+            self._discard_from_cell(name, self.cell_of(position))
+
+    def position_of(self, name: str) -> Position | None:
+        return self._positions.get(name)
+
+    def positions(self) -> dict[str, Position]:
+        return dict(self._positions)
+
+    def within(
+        self, center: Position, radius: float, *, exclude: str | None = None
+    ) -> list[str]:
+        """center에서 radius 이내(경계 포함) 이름을 거리, 이름 순으로 반환한다."""
+        if radius < 0:
+            raise ValueError("radius must not be negative")
+        found: list[tuple[float, str]] = []
+        for name in self._candidates(center, radius):
+            if name == exclude:
+                continue
+            distance = center.distance_to(self._positions[name])
+            if distance <= radius:
+                found.append((distance, name))
+        return [name for _, name in sorted(found)]
+
+    def pairs_within(self, radius: float) -> set[EncounterPair]:
+        """
+        서로 radius 이내인 모든 쌍. 칸마다 자기 칸과 "앞쪽" 이웃 칸만 비교해 각 쌍을
+        한 번씩만 본다.
+        """
+        reach = self._reach(radius)
+        pairs: set[EncounterPair] = set()
+        for (cx, cy), members in self._cells.items():
+            for dx in range(-reach, reach + 1):
+                for dy in range(-reach, reach + 1):
+                    if (dx, dy) < (0, 0):
+                        continue
+                    others = self._cells.get((cx + dx, cy + dy))
+                    if not others:
+                        continue
+                    for name in members:
+                        position = self._positions[name]
+                        for other in others:
+                            if (dx, dy) == (0, 0) and other <= name:
+                                continue
+                            if position.distance_to(self._positions[other]) <= radius:
+                                pairs.add(
+                                    (name, other) if name < other else (other, name)
+                                )
+        return pairs
+
+    def _reach(self, radius: float) -> int:
+        return max(1, math.ceil(radius / self.cell_size))
+
+    def _candidates(self, center: Position, radius: float) -> Iterator[str]:
+        cx, cy = self.cell_of(center)
+        reach = self._reach(radius)
+        for dx in range(-reach, reach + 1):
+            for dy in range(-reach, reach + 1):
+                yield from self._cells.get((cx + dx, cy + dy), ())
+
+    def _discard_from_cell(self, name: str, cell: Cell) -> None:
+        members = self._cells.get(cell)
+        if members is None:
+            return
+        members.discard(name)
+        if not members:
+            del self._cells[cell]
+
+
+class SpatialWorld:
+    """
+    에이전트 위치, 지각 반경, landmark를 묶은 월드 상태.
+    - agents_within/nearby_agents로 지각 대상을, detect_encounters로 새 조우를 구한다.
+    - 대화 step worker와 런타임 이동/조우 검사가 동시에 호출하므로 내부 lock으로 보호한다.
+    """
+
+    def __init__(
+        self,
+        *,
+        perception_radius: float,
+        cell_size: float | None = None,
+        landmarks: Iterable[Landmark] = DEFAULT_LANDMARKS,
+    ) -> None:
+        if perception_radius <= 0:
+            raise ValueError("perception_radius must be greater than 0")
+        self.perception_radius: float = perception_radius
+        self.landmarks: tuple[Landmark, ...] = tuple(landmarks)
+        if not self.landmarks:
+            raise ValueError("at least one landmark is required")
+        self._hash: SpatialHash = SpatialHash(cell_size=cell_size or perception_radius)
+        self._encounters: set[EncounterPair] = set()
+        self._lock: threading.Lock = threading.Lock()
+
+    def __contains__(self, name: object) -> bool:
+        with self._lock:
+            return name in self._hash
+
+    def place(self, name: str, position: Position) -> None:
+        with self._lock:
+            self._hash.place(name, position)
+
+    def remove(self, name: str) -> None:
+        with self._lock:
+            self._hash.remove(name)
+            self._encounters = {pair for pair in self._encounters if name not in pair}
+
+    def position_of(self, name: str) -> Position | None:
+        with self._lock:
+            return self._hash.position_of(name)
+
+    def positions(self) -> dict[str, Position]:
+        with self._lock:
+            return self._hash.positions()
+
+    def agents_within(self, center: Position, radius: float) -> list[str]:
+        with self._lock:
+            return self._hash.within(center, radius)
+
+    def nearby_agents(self, name: str, radius: float | None = None) -> list[str]:
+        """name 주변 radius(기본: 지각 반경) 이내의 다른 에이전트. 위치가 없으면 빈 목록."""
+        with self._lock:
+            position = self._hash.position_of(name)
+            if position is None:
+                return []
+            return self._hash.within(
+                position,
+                self.perception_radius if radius is None else radius,
+                exclude=name,
+            )
+
+    def location_of(self, name: str) -> str | None:
+        """가장 가까운 landmark 이름. 위치가 없으면 None."""
+        position = self.position_of(name)
+        if position is None:
+            return None
+        return min(
+            self.landmarks,
+            key=lambda landmark: position.distance_to(landmark.position),
+        ).name
+
+    def landmark_position(self, index: int) -> Position:
+        """index번째 landmark 좌표(landmark 수로 순환)."""
+        return self.landmarks[index % len(self.landmarks)].position
+
+    def detect_encounters(self) -> list[EncounterPair]:
+        """직전 호출 이후 지각 반경 안으로 새로 들어온 쌍을 이름 순으로 반환한다."""
+        with self._lock:
+            current = self._hash.pairs_within(self.perception_radius)
+            new_pairs = current - self._encounters
+            self._encounters = current
+        return sorted(new_pairs)
+
+    def layout_groups(self, groups: list[list[str]]) -> None:
+        """
+        대화 묶음마다 landmark 하나에 모여 서도록 배치한다.
+        - landmark 수보다 묶음이 많으면 지각 반경의 3배씩 대각선으로 밀어 다음 바퀴에 놓는다.
+        - 묶음 안에서는 지각 반경의 1/4 간격으로 나란히 서서 서로를 지각한다.
+        """
+        spacing = self.perception_radius / 4
+        ring_offset = self.perception_radius * 3
+        for index, group in enumerate(groups):
+            ring = index // len(self.landmarks)
+            anchor = self.landmark_position(index)
+            for member_index, name in enumerate(group):
+                self.place(
+                    name,
+                    Position(
+                        anchor.x + ring * ring_offset + member_index * spacing,
+                        anchor.y + ring * ring_offset,
+                    ),
+                )
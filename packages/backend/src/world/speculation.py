@@ -0,0 +1,158 @@
+"""
+다음 화자의 턴을 미리 계산하는 speculative prefetch.
+
+- 발화가 확정/브로드캐스트된 직후, 다음 화자의 예측 입력으로 brain.speculate를
+  백그라운드 스레드에서 실행한다(perceive 임베딩, 중요도, 검색 쿼리 임베딩).
+- 다음 engine.step이 같은 (화자, 턴)으로 take하면 결과를 brain에 넘기고,
+  brain은 실제 입력과 일치하는 부분만 재사용한다. 일치하지 않으면 버린다.
+"""
+
+import threading
+import time
+from collections.abc import Callable
+from concurrent.futures import CancelledError, Future, ThreadPoolExecutor
+from dataclasses import dataclass
+
+from agents.brain import BrainSpeculation, SpeculationOutcome
+
+
+@dataclass(frozen=True)
+class PrefetchedTurn:
+    speculation: BrainSpeculation
+    wait_ms: float
+    """take 시점에 백그라운드 계산이 끝나길 기다린 시간(ms)."""
+
+
+@dataclass(frozen=True)
+class SpeculationStats:
+    scheduled: int = 0
+    """백그라운드 계산을 시작한 횟수."""
+    consumed: int = 0
+    """다음 턴에 전달된 횟수."""
+    observation_hits: int = 0
+    """observation 임베딩/중요도를 재사용한 턴 수."""
+    retrieval_hits: int = 0
+    """검색 쿼리 임베딩을 재사용한 턴 수."""
+    discarded: int = 0
+    """화자/턴이 달라 버려진 횟수."""
+    failed: int = 0
+    """백그라운드 계산이 예외로 끝난 횟수."""
+    turns: int = 0
+    """집계에 포함된 턴 수."""
+    saved_ms: float = 0.0
+    """재사용으로 줄어든 턴 시간의 합(ms). take 대기 시간은 뺀다."""
+
+    @property
+    def hit_rate(self) -> float:
+        if not self.scheduled:
+            return 0.0
+        return self.observation_hits / self.scheduled
+
+    @property
+    def saved_ms_per_turn(self) -> float:
+        if not self.turns:
+            return 0.0
+        return self.saved_ms / self.turns
+
+    def merge(self, other: "SpeculationStats") -> "SpeculationStats":
+        return SpeculationStats(
+            scheduled=self.scheduled + other.scheduled,
+            consumed=self.consumed + other.consumed,
+            observation_hits=self.observation_hits + other.observation_hits,
+            retrieval_hits=self.retrieval_hits + other.retrieval_hits,
+            discarded=self.discarded + other.discarded,
+            failed=self.failed + other.failed,
+            turns=self.turns + other.turns,
+            saved_ms=self.saved_ms + other.saved_ms,
+        )
+
+
+def step_speculation_stats(
+    *,
+    scheduled: bool,
+    prefetched: PrefetchedTurn | None,
+    outcome: SpeculationOutcome | None,
+    discarded: int,
+    failed: int,
+) -> SpeculationStats:
+    """한 턴의 prefetch 결과를 SpeculationStats 한 건으로 만든다."""
+    observation_hit = outcome is not None and outcome.observation_hit
+    retrieval_hit = outcome is not None and outcome.retrieval_hit
+    saved_ms = 0.0
+    if prefetched is not None and outcome is not None:
+        saved_ms = max(0.0, outcome.reused_ms - prefetched.wait_ms)
+    return SpeculationStats(
+        scheduled=int(scheduled),
+        consumed=int(prefetched is not None),
+        observation_hits=int(observation_hit),
+        retrieval_hits=int(retrieval_hit),
+        discarded=discarded,
+        failed=failed,
+        turns=1,
+        saved_ms=saved_ms,
+    )
+
+
+class SpeculativeTurnPrefetcher:
+    def __init__(self) -> None:
+        self._executor: ThreadPoolExecutor = ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix="speculative-turn"
+        )
+        self._lock: threading.Lock = threading.Lock()
+        self._pending: tuple[str, int, Future[BrainSpeculation]] | None = None
+        self._discarded: int = 0
+        self._failed: int = 0
+
+    def schedule(
+        self,
+        *,
+        agent_name: str,
+        turn: int,
+        compute: Callable[[], BrainSpeculation],
+    ) -> None:
+        future = self._executor.submit(compute)
+        with self._lock:
+            previous = self._pending
+            self._pending = (agent_name, turn, future)
+        if previous is not None:
+            previous[2].cancel()
+            self._discarded += 1
+
+    def take(self, *, agent_name: str, turn: int) -> PrefetchedTurn | None:
+        with self._lock:
+            pending = self._pending
+            self._pending = None
+        if pending is None:
+            return None
+
+        pending_agent, pending_turn, future = pending
+        if pending_agent != agent_name or pending_turn != turn:
+            future.cancel()
+            self._discarded += 1
+            return None
+
+        started = time.perf_counter()
+        try:
+            speculation = future.result()
+        except (RuntimeError, TimeoutError, ValueError, CancelledError):
+            self._failed += 1
+            return None
+        return PrefetchedTurn(
+            speculation=speculation,
+            wait_ms=(time.perf_counter() - started) * 1000,
+        )
+
+    def drain_counters(self) -> tuple[int, int]:
+        """마지막 호출 이후 버려진/실패한 예측 수를 반환하고 초기화한다."""
+        counters = (self._discarded, self._failed)
+        self._discarded = 0
+        self._failed = 0
+        return counters
+
+    def shutdown(self) -> None:
+        with self._lock:
+            pending = self._pending
+            self._pending = None
+        if pending is not None:
+            pending[2].cancel()
+        self._executor.shutdown(wait=False, cancel_futures=True)
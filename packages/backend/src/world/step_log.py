@@ -0,0 +1,313 @@
+"""
+append-only, 압축 step 로그.
+
+- 런타임이 확정한 step마다 발화, trace, observability를 JSON 한 줄로 남긴다. 메모리에는
+  세션의 최근 history만 두고(history_window) 전체 실행 기록은 디스크에서 읽는다.
+- 한 번에 쓰는 묶음(보통 tick 하나)을 gzip member 하나로 segment 파일 끝에 덧붙인다.
+  여러 member를 이어 붙인 파일도 gzip 파일 하나로 그대로 읽힌다.
+- segment가 segment_max_bytes를 넘으면 다음 묶음부터 새 segment에 쓴다(크기 기반 회전).
+- index 파일은 turn마다 (turn, segment 번호, member 시작 위치) 고정 길이 레코드다.
+  turn이 늘어나는 순서로 쌓이므로 이진 탐색으로 turn 하나를 찾아 member 하나만 푼다.
+"""
+
+import gzip
+import json
+import struct
+import threading
+import zlib
+from collections.abc import Iterator, Mapping
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import BinaryIO, cast
+
+from .engine import SimulationStepResult
+
+DEFAULT_SEGMENT_MAX_BYTES = 64 * 1024 * 1024
+
+_INDEX_ENTRY = struct.Struct("<QIQ")
+"""(turn, segment 번호, segment 안 gzip member 시작 위치)."""
+_SEGMENT_PATTERN = "steps-{:05d}.jsonl.gz"
+_INDEX_NAME = "steps.idx"
+_READ_CHUNK = 64 * 1024
+
+
+@dataclass(frozen=True)
+class StepLogStats:
+    records: int = 0
+    """로그에 기록된 step 수(이전 실행분 포함)."""
+    segments: int = 0
+    """segment 파일 수."""
+    bytes_written: int = 0
+    """이번 실행에서 segment에 쓴 압축 바이트 수."""
+    last_turn: int = 0
+    """마지막으로 기록한 turn. 비어 있으면 0."""
+
+
+class StepLog:
+    """
+    step 레코드를 디렉터리 하나에 append-only로 쌓는다. 스레드 안전하다.
+    - 레코드는 "turn"(int) 키를 가져야 하고, turn은 append 순서대로 증가해야 한다.
+    - 이미 있는 디렉터리를 열면 마지막 segment와 index 끝에서 이어 쓴다.
+    """
+
+    def __init__(
+        self,
+        log_dir: str | Path,
+        *,
+        segment_max_bytes: int = DEFAULT_SEGMENT_MAX_BYTES,
+    ) -> None:
+        if segment_max_bytes < 1:
+            raise ValueError("segment_max_bytes must be at least 1")
+        self.log_dir: Path = Path(log_dir)
+        self.segment_max_bytes: int = segment_max_bytes
+        self.log_dir.mkdir(parents=True, exist_ok=True)
+        self._index_path: Path = self.log_dir / _INDEX_NAME
+        self._lock: threading.Lock = threading.Lock()
+        self._segment: int = max(self._segment_numbers(), default=0)
+        self._records: int = self._index_size() // _INDEX_ENTRY.size
+        self._last_turn: int = self._read_index_entry(self._records - 1)[0]
+        self._bytes_written: int = 0
+        self._drop_unindexed_tail()
+
+    @property
+    def stats(self) -> StepLogStats:
+        with self._lock:
+            return StepLogStats(
+                records=self._records,
+                segments=len(self._segment_numbers()),
+                bytes_written=self._bytes_written,
+                last_turn=self._last_turn,
+            )
+
+    def segment_path(self, segment: int) -> Path:
+        return self.log_dir / _SEGMENT_PATTERN.format(segment)
+
+    def append(self, records: list[Mapping[str, object]]) -> None:
+        """records를 gzip member 하나로 압축해 현재 segment 끝에 붙이고 index를 갱신한다."""
+        if not records:
+            return
+        turns = [cast(int, record["turn"]) for record in records]
+        payload = "".join(
+            json.dumps(record, ensure_ascii=False, default=str) + "\n"
+            for record in records
+        ).encode("utf-8")
+        member = gzip.compress(payload, compresslevel=6)
+        with self._lock:
+            if turns[0] <= self._last_turn or turns != sorted(set(turns)):
+                raise ValueError("step log turns must be strictly increasing")
+            path = self.segment_path(self._segment)
+            if path.exists() and path.stat().st_size >= self.segment_max_bytes:
+                self._segment += 1
+                path = self.segment_path(self._segment)
+            with path.open("ab") as segment_file:
+                offset = segment_file.tell()
+                segment_file.write(member)
+            # index는 데이터를 쓴 뒤에 덧붙인다. 중간에 멈추면 index에 없는 member나 잘린
+            # index 항목이 남고, 다음에 열 때 _drop_unindexed_tail이 잘라낸다.
+            with self._index_path.open("ab") as index_file:
+                index_file.write(
+                    b"".join(
+                        _INDEX_ENTRY.pack(turn, self._segment, offset) for turn in turns
+                    )
+                )
+            self._records += len(records)
+            self._last_turn = turns[-1]
+            self._bytes_written += len(member)
+
+    def truncate_after(self, turn: int) -> int:
+        """
+        turn보다 뒤의 레코드를 지우고 지운 수를 반환한다(체크포인트로 되돌린 실행용).
+        - 남길 레코드와 같은 gzip member에 있으면 member째 잘라낸 뒤 남길 레코드만 다시 쓴다.
+        """
+        with self._lock:
+            position = self._lower_bound(turn + 1, self._records)
+            removed = self._records - position
+            if removed == 0:
+                return 0
+            _, segment, offset = self._read_index_entry(position)
+            member = (segment, offset)
+            start = position
+            while start > 0 and self._read_index_entry(start - 1)[1:] == member:
+                start -= 1
+            kept: list[dict[str, object]] = []
+            if start < position:
+                with self.segment_path(segment).open("rb") as segment_file:
+                    segment_file.seek(offset)
+                    payload = _read_member(segment_file)
+                member_records = [
+                    cast(dict[str, object], json.loads(line))
+                    for line in payload.decode("utf-8").splitlines()
+                ]
+                kept = [
+                    record
+                    for record in member_records
+                    if cast(int, record["turn"]) <= turn
+                ]
+            self._truncate_locked(start, segment, offset)
+        self.append(kept)
+        return removed
+
+    def read(self, turn: int) -> dict[str, object] | None:
+        """turn 레코드 하나. index 이진 탐색 후 해당 gzip member만 푼다."""
+        with self._lock:
+            position = self._find(turn)
+            if position is None:
+                return None
+            _, segment, offset = self._read_index_entry(position)
+        with self.segment_path(segment).open("rb") as segment_file:
+            segment_file.seek(offset)
+            payload = _read_member(segment_file)
+        for line in payload.decode("utf-8").splitlines():
+            record = cast(dict[str, object], json.loads(line))
+            if record.get("turn") == turn:
+                return record
+        return None
+
+    def iter_records(self, start_turn: int = 0) -> Iterator[dict[str, object]]:
+        """start_turn 이상의 레코드를 기록 순서대로 하나씩 읽는다(재생/분석용)."""
+        with self._lock:
+            records = self._records
+            position = self._lower_bound(start_turn, records)
+            if position >= records:
+                return
+            _, first_segment, offset = self._read_index_entry(position)
+            last_segment = self._segment
+        for segment in range(first_segment, last_segment + 1):
+            path = self.segment_path(segment)
+            if not path.exists():
+                continue
+            with path.open("rb") as segment_file:
+                segment_file.seek(offset if segment == first_segment else 0)
+                with gzip.GzipFile(fileobj=segment_file, mode="rb") as stream:
+                    for line in stream:
+                        record = cast(dict[str, object], json.loads(line))
+                        if cast(int, record["turn"]) >= start_turn:
+                            yield record
+
+    def _drop_unindexed_tail(self) -> None:
+        """
+        중간에 멈춘 append의 흔적을 지운다.
+        - index 끝의 잘린 항목을 지워 이후 항목이 고정 길이 경계에 맞게 한다.
+        - 마지막으로 index된 member 뒤의 바이트(잘렸을 수 있는 member)와 뒤 segment를 지운다.
+        """
+        with self._lock:
+            _, segment, offset = self._read_index_entry(self._records - 1)
+            end = 0
+            path = self.segment_path(segment)
+            if self._records and path.exists():
+                with path.open("rb") as segment_file:
+                    segment_file.seek(offset)
+                    end = offset + _member_size(segment_file)
+            index_size = (
+                self._index_path.stat().st_size if self._index_path.exists() else 0
+            )
+            segment_size = path.stat().st_size if path.exists() else 0
+            if (
+                index_size != self._records * _INDEX_ENTRY.size
+                or segment_size != end
+                or self._segment != segment
+            ):
+                self._truncate_locked(self._records, segment, end)
+
+    def _truncate_locked(self, records: int, segment: int, offset: int) -> None:
+        """index를 records개로, segment를 offset까지로 줄이고 뒤 segment는 지운다."""
+        with self._index_path.open("r+b" if self._index_path.exists() else "wb") as (
+            index_file
+        ):
+            _ = index_file.truncate(records * _INDEX_ENTRY.size)
+        path = self.segment_path(segment)
+        if path.exists():
+            with path.open("r+b") as segment_file:
+                _ = segment_file.truncate(offset)
+        for later in self._segment_numbers():
+            if later > segment:
+                self.segment_path(later).unlink()
+        self._segment = segment
+        self._records = records
+        self._last_turn = self._read_index_entry(records - 1)[0]
+
+    def _segment_numbers(self) -> list[int]:
+        return [
+            int(path.name.split("-")[1].split(".")[0])
+            for path in self.log_dir.glob("steps-*.jsonl.gz")
+        ]
+
+    def _index_size(self) -> int:
+        if not self._index_path.exists():
+            return 0
+        size = self._index_path.stat().st_size
+        return size - size % _INDEX_ENTRY.size
+
+    def _read_index_entry(self, position: int) -> tuple[int, int, int]:
+        if position < 0:
+            return 0, 0, 0
+        with self._index_path.open("rb") as index_file:
+            index_file.seek(position * _INDEX_ENTRY.size)
+            return cast(
+                tuple[int, int, int],
+                _INDEX_ENTRY.unpack(index_file.read(_INDEX_ENTRY.size)),
+            )
+
+    def _lower_bound(self, turn: int, records: int) -> int:
+        """turn 이상인 첫 index 위치. index 파일을 이진 탐색해 메모리에 올리지 않는다."""
+        low, high = 0, records
+        while low < high:
+            middle = (low + high) // 2
+            if self._read_index_entry(middle)[0] < turn:
+                low = middle + 1
+            else:
+                high = middle
+        return low
+
+    def _find(self, turn: int) -> int | None:
+        position = self._lower_bound(turn, self._records)
+        if position < self._records and self._read_index_entry(position)[0] == turn:
+            return position
+        return None
+
+
+def _read_member(stream: BinaryIO) -> bytes:
+    """stream의 현재 위치에서 시작하는 gzip member 하나를 푼다."""
+    decompressor = zlib.decompressobj(wbits=16 + zlib.MAX_WBITS)
+    chunks: list[bytes] = []
+    while not decompressor.eof:
+        chunk = stream.read(_READ_CHUNK)
+        if not chunk:
+            break
+        chunks.append(decompressor.decompress(chunk))
+    return b"".join(chunks)
+
+
+def _member_size(stream: BinaryIO) -> int:
+    """stream의 현재 위치에서 시작하는 gzip member의 압축 바이트 수. 잘린 member면 0."""
+    decompressor = zlib.decompressobj(wbits=16 + zlib.MAX_WBITS)
+    consumed = 0
+    while not decompressor.eof:
+        chunk = stream.read(_READ_CHUNK)
+        if not chunk:
+            return 0
+        consumed += len(chunk)
+        _ = decompressor.decompress(chunk)
+    return consumed - len(decompressor.unused_data)
+
+
+def step_log_record(
+    *,
+    turn: int,
+    conversation_id: str,
+    conversation_turn: int,
+    step_result: SimulationStepResult,
+) -> dict[str, object]:
+    """런타임 step 하나를 로그 레코드로 만든다. turn은 런타임 전체 기준 번호다."""
+    return {
+        "turn": turn,
+        "conversation_id": conversation_id,
+        "conversation_turn": conversation_turn,
+        "now": step_result.now.isoformat(),
+        "speaker_name": step_result.speaker_name,
+        "reply": step_result.reply,
+        "silent_reason": step_result.silent_reason,
+        "parse_failure": step_result.parse_failure,
+        "trace": step_result.trace,
+        "observability": asdict(step_result.observability),
+    }
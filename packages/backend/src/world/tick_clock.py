@@ -0,0 +1,166 @@
+"""
+tick 스케줄러의 마감 시각 계산과 overrun 계측.
+
+- interval 모드: tick이 끝난 뒤 interval만큼 쉰다. 실제 주기는 tick 시간 + interval이다.
+- deadline 모드: start + n * interval 절대 마감 시각에 맞춰 tick을 시작한다.
+  tick이 다음 마감 시각을 넘기면(overrun) overrun_policy에 따라 처리한다.
+  - skip: 놓친 마감 시각은 건너뛰고 다음 격자 시각에 시작한다.
+  - catch_up: 격자를 유지한 채 밀린 tick을 쉬지 않고 연달아 실행한다.
+  - stretch: 이번 주기를 늘려 곧바로 다음 tick을 시작하고, 그 시각을 새 격자 기준으로 삼는다.
+- 시간은 호출자가 넘겨주는 monotonic 초 단위 값만 쓴다(테스트에서 시계를 주입하기 쉽다).
+"""
+
+import bisect
+from dataclasses import dataclass, field, replace
+from typing import Literal
+
+SchedulerMode = Literal["interval", "deadline"]
+OverrunPolicy = Literal["skip", "catch_up", "stretch"]
+
+TICK_DURATION_BUCKETS_MS: tuple[float, ...] = (
+    10.0,
+    25.0,
+    50.0,
+    100.0,
+    250.0,
+    500.0,
+    1000.0,
+    2500.0,
+    5000.0,
+    10000.0,
+)
+"""tick 소요 시간 히스토그램 버킷 상한(ms). 마지막 버킷 이후는 "le_inf"로 센다."""
+
+LAG_TOLERANCE_FRACTION = 0.1
+"""시작 지연을 제시간으로 보는 한도(interval 대비 비율). sleep은 마감 직후에 깨어난다."""
+
+
+def _bucket_labels() -> list[str]:
+    return [f"le_{bound:g}ms" for bound in TICK_DURATION_BUCKETS_MS] + ["le_inf"]
+
+
+@dataclass(frozen=True)
+class TickTimingStats:
+    mode: SchedulerMode = "interval"
+    overrun_policy: OverrunPolicy = "skip"
+    ticks: int = 0
+    """스케줄러가 실행한 tick 수."""
+    overruns: int = 0
+    """다음 마감 시각을 넘겨 끝난 tick 수(deadline 모드)."""
+    skipped_ticks: int = 0
+    """skip 정책으로 건너뛴 마감 시각 수."""
+    lag_ms: float = 0.0
+    """가장 최근 tick이 마감 시각보다 늦게 시작한 정도(ms)."""
+    lag_tolerance_ms: float = 0.0
+    """keeping_up이 허용하는 시작 지연(ms). interval * LAG_TOLERANCE_FRACTION."""
+    last_overran: bool = False
+    """가장 최근 tick이 다음 마감 시각을 넘겨 끝났는지 여부."""
+    max_lag_ms: float = 0.0
+    """지금까지의 최대 시작 지연(ms)."""
+    last_duration_ms: float = 0.0
+    """가장 최근 tick 소요 시간(ms)."""
+    max_duration_ms: float = 0.0
+    """지금까지의 최대 tick 소요 시간(ms)."""
+    total_duration_ms: float = 0.0
+    """tick 소요 시간 합계(ms)."""
+    duration_histogram: dict[str, int] = field(default_factory=dict)
+    """"le_<상한>ms" 버킷별 tick 수(누적 아님)."""
+
+    @property
+    def mean_duration_ms(self) -> float:
+        return self.total_duration_ms / self.ticks if self.ticks else 0.0
+
+    @property
+    def keeping_up(self) -> bool:
+        """
+        실시간을 따라가고 있는지 여부. 마지막 tick이 overrun했거나 시작 지연이
+        lag_tolerance_ms를 넘으면 False. sleep의 깨어남 오차(수 ms 미만)는 무시한다.
+        """
+        return not self.last_overran and self.lag_ms <= self.lag_tolerance_ms
+
+
+class TickDeadlineClock:
+    def __init__(
+        self,
+        *,
+        interval_seconds: float,
+        mode: SchedulerMode = "interval",
+        overrun_policy: OverrunPolicy = "skip",
+    ):
+        if interval_seconds <= 0:
+            raise ValueError("interval_seconds must be greater than 0")
+        self.interval_seconds: float = interval_seconds
+        self.mode: SchedulerMode = mode
+        self.overrun_policy: OverrunPolicy = overrun_policy
+        self._anchor: float = 0.0
+        self._index: int = 0
+        self._next_deadline: float = 0.0
+        self._tick_started: float = 0.0
+        self._histogram: list[int] = [0] * (len(TICK_DURATION_BUCKETS_MS) + 1)
+        self._stats: TickTimingStats = TickTimingStats(
+            mode=mode,
+            overrun_policy=overrun_policy,
+            lag_tolerance_ms=interval_seconds * LAG_TOLERANCE_FRACTION * 1000,
+        )
+
+    @property
+    def stats(self) -> TickTimingStats:
+        return self._stats
+
+    def start(self, now: float) -> None:
+        """스케줄러 시작 시각을 격자 기준으로 잡는다. 첫 tick은 바로 시작한다."""
+        self._anchor = now
+        self._index = 0
+        self._next_deadline = now
+
+    def delay_until_next(self, now: float) -> float:
+        """다음 tick 시작까지 기다릴 초. 이미 지났으면 0."""
+        return max(0.0, self._next_deadline - now)
+
+    def begin_tick(self, now: float) -> None:
+        self._tick_started = now
+        lag_ms = max(0.0, now - self._next_deadline) * 1000
+        if self.mode == "interval":
+            lag_ms = 0.0
+        self._stats = replace(
+            self._stats,
+            lag_ms=lag_ms,
+            max_lag_ms=max(self._stats.max_lag_ms, lag_ms),
+        )
+
+    def finish_tick(self, now: float) -> None:
+        duration_ms = (now - self._tick_started) * 1000
+        self._histogram[bisect.bisect_left(TICK_DURATION_BUCKETS_MS, duration_ms)] += 1
+        overran = False
+        skipped = 0
+        if self.mode == "interval":
+            self._next_deadline = now + self.interval_seconds
+        else:
+            self._index += 1
+            deadline = self._anchor + self._index * self.interval_seconds
+            overran = now > deadline
+            if overran and self.overrun_policy == "skip":
+                missed = int((now - deadline) // self.interval_seconds) + 1
+                skipped = missed
+                self._index += missed
+                deadline = self._anchor + self._index * self.interval_seconds
+            elif overran and self.overrun_policy == "stretch":
+                self._anchor = now
+                self._index = 0
+                deadline = now
+            self._next_deadline = deadline
+
+        stats = self._stats
+        self._stats = replace(
+            stats,
+            ticks=stats.ticks + 1,
+            overruns=stats.overruns + int(overran),
+            skipped_ticks=stats.skipped_ticks + skipped,
+            last_overran=overran,
+            last_duration_ms=duration_ms,
+            max_duration_ms=max(stats.max_duration_ms, duration_ms),
+            total_duration_ms=stats.total_duration_ms + duration_ms,
+            duration_histogram=dict(
+                zip(_bucket_labels(), self._histogram, strict=True)
+            ),
+        )
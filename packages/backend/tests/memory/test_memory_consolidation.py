@@ -0,0 +1,158 @@
+import datetime
+
+import numpy as np
+
+from agents.memory.archive import MemoryArchive
+from agents.memory.consolidation import ConsolidationConfig, MemoryConsolidator
+from agents.memory.memory_manager import MemoryManager, ObservationContext
+from agents.memory.memory_object import NodeType
+from agents.memory.memory_stream import MemoryStream
+from llm import ImportanceScoringContext
+from llm.embedding_encoder import EmbeddingEncodingContext
+from settings import EMBEDDING_DIMENSION
+
+
+class StubScorer:
+    def score(self, context: ImportanceScoringContext) -> int:
+        _ = context
+        return 2
+
+
+class StubEmbeddingEncoder:
+    def encode(self, context: EmbeddingEncodingContext) -> np.ndarray:
+        _ = context
+        return np.zeros(EMBEDDING_DIMENSION)
+
+
+def unit_vector(index: int) -> np.ndarray:
+    vector = np.zeros(EMBEDDING_DIMENSION, dtype=np.float32)
+    vector[index] = 1.0
+    return vector
+
+
+def _add_observation(
+    stream: MemoryStream,
+    *,
+    content: str,
+    now: datetime.datetime,
+    importance: int,
+    embedding: np.ndarray,
+) -> None:
+    stream.add_memory(
+        node_type=NodeType.OBSERVATION,
+        citations=None,
+        content=content,
+        now=now,
+        importance=importance,
+        embedding=embedding,
+    )
+
+
+def test_consolidate_replaces_similar_old_observations_with_summary(tmp_path) -> None:
+    stream = MemoryStream()
+    start = datetime.datetime(2026, 3, 1, 9, 0, 0)
+    for minute in range(4):
+        _add_observation(
+            stream,
+            content=f"지호가 광장을 지나갔다 {minute}",
+            now=start + datetime.timedelta(minutes=10 * minute),
+            importance=2,
+            embedding=unit_vector(0),
+        )
+    _add_observation(
+        stream,
+        content="중요한 계약을 맺었다",
+        now=start + datetime.timedelta(hours=1),
+        importance=9,
+        embedding=unit_vector(0),
+    )
+    _add_observation(
+        stream,
+        content="다른 주제의 관찰",
+        now=start + datetime.timedelta(hours=2),
+        importance=1,
+        embedding=unit_vector(1),
+    )
+    archive = MemoryArchive(tmp_path / "jiho.jsonl")
+    consolidator = MemoryConsolidator(archive=archive)
+
+    result = consolidator.consolidate(stream, now=start + datetime.timedelta(days=3))
+
+    assert result.archived_count == 4
+    assert len(result.summary_ids) == 1
+    summary = stream.memories[-1]
+    assert summary.id == result.summary_ids[0] == 6
+    assert summary.node_type == NodeType.SUMMARY
+    assert summary.citations == [0, 1, 2, 3]
+    assert summary.importance == 2
+    assert [m.id for m in stream.memories] == [4, 5, 6]
+    assert archive.archived_count == 4
+    restored = archive.load({1, 3})
+    assert [m.id for m in restored] == [1, 3]
+    assert np.array_equal(restored[0].embedding, unit_vector(0))
+
+    _add_observation(
+        stream,
+        content="새 관찰",
+        now=start + datetime.timedelta(days=3),
+        importance=5,
+        embedding=unit_vector(2),
+    )
+    assert stream.memories[-1].id == 7
+
+
+def test_consolidate_keeps_recent_or_recently_accessed_observations(tmp_path) -> None:
+    stream = MemoryStream()
+    now = datetime.datetime(2026, 3, 3, 9, 0, 0)
+    for index in range(3):
+        _add_observation(
+            stream,
+            content=f"최근 관찰 {index}",
+            now=now - datetime.timedelta(hours=1),
+            importance=1,
+            embedding=unit_vector(0),
+        )
+    consolidator = MemoryConsolidator(archive=MemoryArchive(tmp_path / "a.jsonl"))
+
+    result = consolidator.consolidate(stream, now=now)
+
+    assert result.archived_count == 0
+    assert len(stream.memories) == 3
+
+
+def test_memory_manager_triggers_consolidation_on_interval(tmp_path) -> None:
+    stream = MemoryStream()
+    start = datetime.datetime(2026, 3, 1, 9, 0, 0)
+    for index in range(3):
+        _add_observation(
+            stream,
+            content=f"오래된 관찰 {index}",
+            now=start + datetime.timedelta(minutes=index),
+            importance=1,
+            embedding=unit_vector(0),
+        )
+    manager = MemoryManager(
+        memory_stream=stream,
+        importance_scorer=StubScorer(),
+        embedding_encoder=StubEmbeddingEncoder(),
+        consolidator=MemoryConsolidator(
+            archive=MemoryArchive(tmp_path / "b.jsonl"),
+            config=ConsolidationConfig(check_interval=2),
+        ),
+    )
+    context = ObservationContext(agent_name="Jiho Park", identity_stable_set=[])
+    later = start + datetime.timedelta(days=2)
+
+    first = manager.create_observation_from_text(
+        content="새 관찰 1", now=later, context=context
+    )
+    assert manager.last_consolidation is None
+
+    second = manager.create_observation_from_text(
+        content="새 관찰 2", now=later, context=context
+    )
+
+    assert manager.last_consolidation is not None
+    assert manager.last_consolidation.archived_count == 3
+    assert second.id == 4
+    assert [m.id for m in stream.memories] == [first.id, second.id, 5]
@@ -260,6 +260,136 @@ def test_reflection_can_reference_prior_reflection_memory() -> None:
     assert second_reflection.citations == [first_reflection.id, observation.id]
 
 
+def test_get_memories_since_and_top_reflections_respect_watermark() -> None:
+    stream = MemoryStream()
+    service = MemoryManager(
+        memory_stream=stream,
+        importance_scorer=StubScorer(score_value=5),
+        embedding_encoder=StubEmbeddingEncoder(),
+    )
+    now = datetime.datetime(2026, 2, 13, 12, 0, 0)
+
+    observation = service.create_observation(
+        content="오전 관찰",
+        now=now,
+        embedding=np.zeros(EMBEDDING_DIMENSION),
+        context=ObservationContext(agent_name="Jiho Park", identity_stable_set=[]),
+        importance=4,
+    )
+    low_reflection = service.create_reflection(
+        InsightWithCitation(context="낮은 통찰", citation_memory_ids=[]),
+        now=now + datetime.timedelta(minutes=1),
+        context=ReflectionContext(agent_name="Jiho Park", identity_stable_set=[]),
+        importance=3,
+    )
+    high_reflection = service.create_reflection(
+        InsightWithCitation(context="높은 통찰", citation_memory_ids=[]),
+        now=now + datetime.timedelta(minutes=2),
+        context=ReflectionContext(agent_name="Jiho Park", identity_stable_set=[]),
+        importance=9,
+    )
+    later = service.create_observation(
+        content="오후 관찰",
+        now=now + datetime.timedelta(minutes=3),
+        embedding=np.zeros(EMBEDDING_DIMENSION),
+        context=ObservationContext(agent_name="Jiho Park", identity_stable_set=[]),
+        importance=4,
+    )
+
+    assert service.get_memories_since(after_memory_id=high_reflection.id) == [later]
+    assert service.get_memories_since(after_memory_id=None, limit=1) == [later]
+    assert service.get_top_reflections(limit=5, max_memory_id=observation.id) == []
+    assert service.get_top_reflections(limit=1) == [high_reflection]
+    assert service.get_top_reflections(limit=5) == [high_reflection, low_reflection]
+
+
+class CountingEmbeddingEncoder:
+    def __init__(self, vectors_by_text: dict[str, np.ndarray]):
+        self.vectors_by_text: dict[str, np.ndarray] = vectors_by_text
+        self.calls: list[str] = []
+
+    def encode(self, context: EmbeddingEncodingContext) -> np.ndarray:
+        self.calls.append(context.text)
+        return self.vectors_by_text[context.text]
+
+
+def _unit_vector(index: int) -> np.ndarray:
+    vector = np.zeros(EMBEDDING_DIMENSION)
+    vector[index] = 1.0
+    return vector
+
+
+def test_write_reflection_merges_near_duplicate_into_existing_node() -> None:
+    stream = MemoryStream()
+    scorer = StubScorer(score_value=6)
+    encoder = CountingEmbeddingEncoder(
+        {
+            "지호는 수진을 자주 돕는다.": _unit_vector(0),
+            "지호는 수진을 늘 돕는 편이다.": _unit_vector(0) * 0.98
+            + _unit_vector(1) * 0.05,
+            "지호는 음악을 좋아한다.": _unit_vector(2),
+        }
+    )
+    service = MemoryManager(
+        memory_stream=stream,
+        importance_scorer=scorer,
+        embedding_encoder=encoder,
+    )
+    now = datetime.datetime(2026, 2, 13, 12, 0, 0)
+    context = ReflectionContext(agent_name="Jiho Park", identity_stable_set=[])
+    for content in ["관찰 A", "관찰 B"]:
+        _ = service.create_observation(
+            content=content,
+            now=now,
+            embedding=np.zeros(EMBEDDING_DIMENSION),
+            context=ObservationContext(agent_name="Jiho Park", identity_stable_set=[]),
+            importance=5,
+        )
+
+    first = service.write_reflection(
+        InsightWithCitation(
+            context="지호는 수진을 자주 돕는다.", citation_memory_ids=[0]
+        ),
+        now=now,
+        context=context,
+        dedup_threshold=0.9,
+    )
+    near_duplicate = service.write_reflection(
+        InsightWithCitation(
+            context="지호는 수진을 늘 돕는 편이다.", citation_memory_ids=[1, 0]
+        ),
+        now=now + datetime.timedelta(hours=1),
+        context=context,
+        dedup_threshold=0.9,
+    )
+    exact_duplicate = service.write_reflection(
+        InsightWithCitation(
+            context="지호는  수진을 자주 돕는다.", citation_memory_ids=[]
+        ),
+        now=now + datetime.timedelta(hours=2),
+        context=context,
+        dedup_threshold=0.9,
+    )
+    distinct = service.write_reflection(
+        InsightWithCitation(context="지호는 음악을 좋아한다.", citation_memory_ids=[]),
+        now=now,
+        context=context,
+        dedup_threshold=0.9,
+    )
+
+    assert first.merged is False
+    assert near_duplicate.merged is True
+    assert near_duplicate.memory is first.memory
+    assert near_duplicate.saved_llm_calls == 1
+    assert exact_duplicate.merged is True
+    assert exact_duplicate.saved_llm_calls == 2
+    assert distinct.merged is False
+    assert first.memory.citations == [0, 1]
+    assert first.memory.last_accessed_at == now + datetime.timedelta(hours=2)
+    assert [m.node_type for m in stream.memories].count(NodeType.REFLECTION) == 2
+    assert "지호는  수진을 자주 돕는다." not in encoder.calls
+
+
 # class StubReflectionService:
 #     def __init__(self):
 #         self.recorded_importance: list[int] = []
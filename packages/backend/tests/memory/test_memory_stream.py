@@ -2,6 +2,7 @@ import datetime
 
 import numpy as np
 import pytest
+from agents.memory.cold_segment import MemoryTierConfig
 from agents.memory.memory_object import NodeType
 from agents.memory.memory_stream import MemoryStream
 from settings import EMBEDDING_DIMENSION
@@ -233,3 +234,175 @@ def test_retrieve_with_query_dimension_mismatch_keeps_system_usable(stream, now)
 
     assert len(top) == 1
     assert top[0].content == "높은 중요도"
+
+
+def _tiered_stream(tmp_path, **overrides) -> MemoryStream:
+    config = {
+        "segment_dir": tmp_path,
+        "hot_capacity": 3,
+        "segment_size": 2,
+        "hot_importance_floor": 8,
+        "cold_relevance_bound": 0.5,
+    }
+    config.update(overrides)
+    return MemoryStream(tier_config=MemoryTierConfig(**config))
+
+
+def test_tiered_stream_demotes_old_low_importance_memories_to_mmap_segment(
+    tmp_path, now
+):
+    stream = _tiered_stream(tmp_path)
+    for index in range(4):
+        _add_memory(
+            stream,
+            now=now + datetime.timedelta(minutes=index),
+            content=f"관찰 {index}",
+            importance=9 if index == 0 else 2,
+            embedding=unit_vector(index),
+        )
+
+    stats = stream.tier_stats()
+    assert [m.id for m in stream.memories] == [0, 3]
+    assert stats.hot_count == 2
+    assert stats.cold_count == 2
+    assert stats.cold_segment_count == 1
+    assert stats.demotions == 2
+    assert stream.memory_ids() == {0, 1, 2, 3}
+    segment_files = list(tmp_path.glob("*.npy"))
+    assert len(segment_files) == 1
+    assert isinstance(stream._cold_segments[0].embeddings, np.memmap)
+
+
+def test_tiered_stream_searches_cold_only_when_hot_relevance_is_low(tmp_path, now):
+    stream = _tiered_stream(tmp_path)
+    for index in range(4):
+        _add_memory(
+            stream,
+            now=now + datetime.timedelta(minutes=index),
+            content=f"관찰 {index}",
+            importance=9 if index == 0 else 2,
+            embedding=unit_vector(index),
+        )
+    later = now + datetime.timedelta(hours=1)
+
+    hot_hit = stream.retrieve(
+        query_embedding=unit_vector(3), current_time=later, top_k=1
+    )
+    assert [m.id for m in hot_hit] == [3]
+    assert stream.tier_stats().hot_only_searches == 1
+    assert stream.tier_stats().cold_searches == 0
+
+    cold_hit = stream.retrieve(
+        query_embedding=unit_vector(1), current_time=later, top_k=1
+    )
+
+    stats = stream.tier_stats()
+    assert [m.id for m in cold_hit] == [1]
+    assert cold_hit[0].last_accessed_at == later
+    assert stats.cold_searches == 1
+    assert stats.promotions == 1
+    assert [m.id for m in stream.memories] == [0, 1, 3]
+    assert not isinstance(stream.memories[1].embedding, np.memmap)
+    assert stats.cold_count == 1
+
+
+def test_tiered_stream_remove_memories_releases_empty_segments(tmp_path, now):
+    stream = _tiered_stream(tmp_path)
+    for index in range(4):
+        _add_memory(
+            stream,
+            now=now + datetime.timedelta(minutes=index),
+            content=f"관찰 {index}",
+            importance=2,
+            embedding=unit_vector(index),
+        )
+
+    removed = stream.remove_memories({0, 1})
+
+    assert sorted(m.id for m in removed) == [0, 1]
+    assert stream.tier_stats().cold_segment_count == 0
+    assert list(tmp_path.glob("*.npy")) == []
+    assert stream.memory_ids() == {2, 3}
+
+
+def test_tiered_stream_drains_changes_and_restores_without_reembedding(tmp_path, now):
+    stream = _tiered_stream(tmp_path / "source")
+    for index in range(4):
+        _add_memory(
+            stream,
+            now=now + datetime.timedelta(minutes=index),
+            content=f"관찰 {index}",
+            importance=9 if index == 0 else 2,
+            embedding=unit_vector(index),
+        )
+    first = stream.drain_changes()
+    assert [m.id for m in first.upserted] == [0, 1, 2, 3]
+    assert first.next_id == 4
+
+    later = now + datetime.timedelta(hours=1)
+    _ = stream.retrieve(query_embedding=unit_vector(1), current_time=later, top_k=1)
+    _ = stream.remove_memories({2})
+    changes = stream.drain_changes()
+    assert changes.upserted == []
+    assert [m.id for m in changes.accessed] == [1]
+    assert changes.removed == [2]
+    assert stream.drain_changes().accessed == []
+
+    restored = _tiered_stream(tmp_path / "restored", hot_capacity=1)
+    restored.restore(stream.all_memories(), next_id=stream.next_id)
+
+    assert restored.memory_ids() == {0, 1, 3}
+    assert [m.id for m in restored.memories] == [0]
+    assert restored.tier_stats().cold_count == 2
+    cold_memory = restored.get_memory(1)
+    assert cold_memory is not None
+    assert cold_memory.last_accessed_at == later
+    assert restored.drain_changes().upserted == []
+    _add_memory(
+        restored, now=later, content="관찰 4", importance=2, embedding=unit_vector(4)
+    )
+    assert [m.id for m in restored.drain_changes().upserted] == [4]
+
+
+def test_tiered_stream_waits_for_a_full_segment_before_sealing(tmp_path, now):
+    stream = _tiered_stream(tmp_path, hot_capacity=2, segment_size=2)
+    for index in range(2):
+        _add_memory(
+            stream,
+            now=now,
+            content=f"중요한 기억 {index}",
+            importance=9,
+            embedding=unit_vector(index),
+        )
+    _add_memory(
+        stream, now=now, content="사소한 관찰 2", importance=2, embedding=unit_vector(2)
+    )
+    _add_memory(
+        stream, now=now, content="사소한 관찰 3", importance=2, embedding=unit_vector(3)
+    )
+    # 내릴 수 있는 메모리가 하나뿐이면 1개짜리 segment를 만들지 않는다.
+    assert stream.tier_stats().cold_segment_count == 0
+    assert list(tmp_path.glob("*.npy")) == []
+
+    _add_memory(
+        stream, now=now, content="사소한 관찰 4", importance=2, embedding=unit_vector(4)
+    )
+    stats = stream.tier_stats()
+    assert stats.cold_segment_count == 1
+    assert stats.cold_count == 2
+
+
+def test_tiered_stream_does_not_overwrite_segments_from_a_previous_run(tmp_path, now):
+    for run in range(2):
+        stream = _tiered_stream(tmp_path)
+        for index in range(4):
+            _add_memory(
+                stream,
+                now=now + datetime.timedelta(minutes=index),
+                content=f"실행 {run} 관찰 {index}",
+                importance=2,
+                embedding=unit_vector(index),
+            )
+        assert stream.tier_stats().cold_segment_count == 1
+
+    assert len(list(tmp_path.glob("segment-*.npy"))) == 2
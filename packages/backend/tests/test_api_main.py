@@ -1,10 +1,14 @@
 import datetime
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 
 import pytest
 from fastapi import HTTPException
-from llm.governance import ConversationMetrics
+from llm.governance import ConversationMetrics, ReactionModeMetrics
+from world.checkpoint import CheckpointStats
 from world.engine import SimulationStepObservability, SimulationStepResult
+from world.event_bus import FanOutStats
+from world.step_log import StepLogStats
+from world.tick_clock import TickTimingStats
 
 from api.main import (
     _require_runtime,
@@ -25,6 +29,19 @@ class DummyState:
     history_size: int
     scheduler_running: bool
     tick_interval_seconds: float
+    conversations: int = 1
+    turns_per_second: float = 0.0
+    tick_timing: TickTimingStats = field(default_factory=TickTimingStats)
+    step_scheduling: str = "every_tick"
+    pending_wakes: int = 0
+    focused_agents: list[str] = field(default_factory=list)
+    cognition_tiers: dict[str, str] = field(default_factory=dict)
+    agent_positions: dict[str, tuple[float, float]] = field(default_factory=dict)
+    encounters: int = 0
+    fan_out: FanOutStats = field(default_factory=FanOutStats)
+    step_log: StepLogStats | None = None
+    checkpoint: CheckpointStats | None = None
+    reaction_modes: dict[str, ReactionModeMetrics] = field(default_factory=dict)
 
 
 @dataclass
@@ -125,6 +142,7 @@ async def test_get_world_state_returns_runtime_snapshot() -> None:
     assert response.agent_names == ["Jiho", "Sujin"]
     assert response.scheduler_running is False
     assert response.tick_interval_seconds == 1.0
+    assert response.conversations == 1
 
 
 @pytest.mark.anyio
@@ -1,12 +1,29 @@
 import datetime
+from dataclasses import replace
 from typing import Literal, cast
 
 import numpy as np
+import pytest
 from agents.agent import AgentIdentity, AgentProfile, ExtendedPersona, FixedPersona
-from agents.brain import ActionLoopInput, ActionLoopResult, AgentBrainGraphRunner
-from agents.planning.models import DayPlanBroadStrokesRequest, DayPlanItem
+from agents.brain import (
+    ActionLoopInput,
+    ActionLoopResult,
+    AgentBrainGraphRunner,
+    CognitionTier,
+)
+from agents.planning import PlanEngine, PlanStore
+from agents.planning.models import (
+    DayPlanBroadStrokesRequest,
+    DayPlanItem,
+    HourlyPlanItem,
+    MinutePlanItem,
+)
 from agents.memory.memory_object import MemoryObject, NodeType
-from agents.reaction import ReactionDecision, ReactionDecisionTrace
+from agents.reaction import (
+    ReactionDecision,
+    ReactionDecisionInput,
+    ReactionDecisionTrace,
+)
 
 
 class StubEmbeddingEncoder:
@@ -23,6 +40,8 @@ class StubMemoryManager:
     def __init__(self, calls: list[str]):
         self.calls: list[str] = calls
         self.embedding_encoder: StubEmbeddingEncoder = StubEmbeddingEncoder(calls)
+        self.persisted_importances: list[int | None] = []
+        self.query_embeddings: list[np.ndarray | None] = []
 
     def create_observation(
         self,
@@ -33,8 +52,9 @@ class StubMemoryManager:
         context: object,
         importance: int | None,
     ) -> MemoryObject:
-        _ = content, now, embedding, context, importance
+        _ = content, now, embedding, context
         self.calls.append("create_observation")
+        self.persisted_importances.append(importance)
         return MemoryObject(
             id=1,
             node_type=NodeType.OBSERVATION,
@@ -46,15 +66,22 @@ class StubMemoryManager:
             embedding=np.zeros(2, dtype=np.float32),
         )
 
+    def score_observation_importance(self, *, content: str, context: object) -> int:
+        _ = content, context
+        self.calls.append("score_observation_importance")
+        return 6
+
     def get_retrieval_memories(
         self,
         *,
         query: str,
         current_time: datetime.datetime,
         top_k: int = 3,
+        query_embedding: np.ndarray | None = None,
     ) -> list[MemoryObject]:
         _ = query, current_time, top_k
         self.calls.append("get_retrieval_memories")
+        self.query_embeddings.append(query_embedding)
         return []
 
 
@@ -110,6 +137,16 @@ class StubPlanner:
         ]
 
 
+class NoExpansionPlanner(StubPlanner):
+    def generate_hourly_plan(self, **_: object) -> list[HourlyPlanItem]:
+        self.calls.append("generate_hourly_plan")
+        return []
+
+    def generate_minute_plan(self, **_: object) -> list[MinutePlanItem]:
+        self.calls.append("generate_minute_plan")
+        return []
+
+
 def _profile() -> AgentProfile:
     return AgentProfile(
         fixed=FixedPersona(identity_stable_set=["kind"]),
@@ -267,3 +304,221 @@ def test_brain_graph_seeds_plan_context_with_planner_when_missing() -> None:
 
     assert profile.extended.current_plan_context == ["Draft a composition exercise."]
     assert calls[0] == "generate_day_plan:Jiho"
+
+
+def test_brain_graph_reuses_stored_day_plan_across_runners(tmp_path) -> None:
+    calls: list[str] = []
+    profiles: list[AgentProfile] = []
+    for _ in range(2):
+        memory = StubMemoryManager(calls)
+        graph = AgentBrainGraphRunner(
+            agent_identity=AgentIdentity(
+                id="jiho",
+                name="Jiho",
+                age=29,
+                traits=["kind"],
+            ),
+            memory_manager=memory,
+            embedding_encoder=memory.embedding_encoder,
+            reflection_graph=StubReflectionGraph(calls, should_reflect=False),
+            llm_gateway=StubLlmGateway(calls),
+            observation_writer=_ignore_observation,
+            planner=StubPlanner(calls),
+            plan_store=PlanStore(tmp_path),
+        )
+        profile = _profile()
+        profiles.append(profile)
+        _ = graph.run(
+            ActionLoopInput(
+                current_time=datetime.datetime(2026, 3, 3, 12, 0, 0),
+                dialogue_history=[],
+                profile=profile,
+                language=cast(Literal["ko", "en"], "ko"),
+            )
+        )
+
+    assert calls.count("generate_day_plan:Jiho") == 1
+    assert profiles[1].extended.current_plan_context == [
+        "Draft a composition exercise."
+    ]
+
+
+def test_brain_graph_refreshes_plan_context_from_plan_engine() -> None:
+    calls: list[str] = []
+    memory = StubMemoryManager(calls)
+    planner = NoExpansionPlanner(calls)
+    profile = _profile()
+    profile.extended.current_plan_context = ["Seeded persona plan."]
+    graph = AgentBrainGraphRunner(
+        agent_identity=AgentIdentity(
+            id="jiho",
+            name="Jiho",
+            age=29,
+            traits=["kind"],
+        ),
+        memory_manager=memory,
+        embedding_encoder=memory.embedding_encoder,
+        reflection_graph=StubReflectionGraph(calls, should_reflect=False),
+        llm_gateway=StubLlmGateway(calls),
+        observation_writer=_ignore_observation,
+        planner=planner,
+        plan_engine=PlanEngine(
+            expander=planner,
+            plan_store=PlanStore(),
+            agent_id="jiho",
+            agent_name="Jiho",
+            prefetch=False,
+        ),
+    )
+
+    _ = graph.run(
+        ActionLoopInput(
+            current_time=datetime.datetime(2026, 3, 3, 9, 30, 0),
+            dialogue_history=[],
+            profile=profile,
+            language=cast(Literal["ko", "en"], "ko"),
+        )
+    )
+
+    assert profile.extended.current_plan_context == ["Draft a composition exercise."]
+    assert calls[:2] == ["generate_day_plan:Jiho", "generate_hourly_plan"]
+
+
+def test_brain_graph_reuses_matching_speculation_and_rejects_stale_one() -> None:
+    calls: list[str] = []
+    memory = StubMemoryManager(calls)
+    graph = AgentBrainGraphRunner(
+        agent_identity=AgentIdentity(
+            id="jiho",
+            name="Jiho",
+            age=29,
+            traits=["kind"],
+        ),
+        memory_manager=memory,
+        embedding_encoder=memory.embedding_encoder,
+        reflection_graph=StubReflectionGraph(calls, should_reflect=False),
+        llm_gateway=StubLlmGateway(calls),
+        observation_writer=_ignore_observation,
+    )
+
+    speculation = graph.speculate(_input())
+    assert calls == [
+        "encode_observation",
+        "score_observation_importance",
+        "encode_observation",
+    ]
+    assert speculation.importance == 6
+
+    calls.clear()
+    result = graph.run(_input(), speculation=speculation)
+
+    assert "encode_observation" not in calls
+    assert memory.persisted_importances == [6]
+    assert memory.query_embeddings[-1] is speculation.retrieval_query_embedding
+    assert result.speculation is not None
+    assert result.speculation.observation_hit is True
+    assert result.speculation.retrieval_hit is True
+    assert result.speculation.reused_ms == pytest.approx(
+        speculation.observation_ms + speculation.retrieval_ms
+    )
+
+    calls.clear()
+    later_input = replace(
+        _input(), current_time=datetime.datetime(2026, 3, 3, 12, 0, 45)
+    )
+    stale = graph.run(later_input, speculation=speculation)
+
+    assert calls[0] == "encode_observation"
+    assert memory.persisted_importances[-1] is None
+    assert memory.query_embeddings[-1] is None
+    assert stale.speculation is not None
+    assert stale.speculation.observation_hit is False
+    assert stale.speculation.retrieval_hit is False
+    assert stale.speculation.reused_ms == 0.0
+
+
+class CapturingLlmGateway(StubLlmGateway):
+    def __init__(self, calls: list[str]):
+        super().__init__(calls)
+        self.inputs: list[ReactionDecisionInput] = []
+
+    def decide_reaction(self, input: object) -> ReactionDecision:
+        self.inputs.append(cast(ReactionDecisionInput, input))
+        return super().decide_reaction(input)
+
+
+def _tiered_graph(
+    calls: list[str],
+    memory: StubMemoryManager,
+    gateway: StubLlmGateway,
+    tier: CognitionTier,
+    plan_store: PlanStore | None = None,
+) -> AgentBrainGraphRunner:
+    return AgentBrainGraphRunner(
+        agent_identity=AgentIdentity(
+            id="jiho",
+            name="Jiho",
+            age=29,
+            traits=["kind"],
+        ),
+        memory_manager=memory,
+        embedding_encoder=memory.embedding_encoder,
+        reflection_graph=StubReflectionGraph(calls, should_reflect=True),
+        llm_gateway=gateway,
+        observation_writer=_ignore_observation,
+        planner=StubPlanner(calls),
+        plan_store=plan_store,
+        cognition_tier=tier,
+    )
+
+
+def test_brain_graph_reduced_tier_uses_heuristic_importance_and_fused_reaction() -> (
+    None
+):
+    calls: list[str] = []
+    memory = StubMemoryManager(calls)
+    gateway = CapturingLlmGateway(calls)
+    graph = _tiered_graph(calls, memory, gateway, "reduced")
+
+    _ = graph.run(_input())
+
+    assert "score_observation_importance" not in calls
+    assert isinstance(memory.persisted_importances[0], int)
+    assert gateway.inputs[0].reaction_mode == "fused"
+    assert gateway.inputs[0].semantic_retries is False
+    assert "decide_reaction" in calls
+
+
+def test_brain_graph_background_tier_follows_plan_and_defers_memory_embedding() -> None:
+    calls: list[str] = []
+    memory = StubMemoryManager(calls)
+    store = PlanStore()
+    store.put_day_plan(
+        "jiho",
+        datetime.date(2026, 3, 3),
+        [
+            DayPlanItem(
+                start_time=datetime.datetime(2026, 3, 3, 11, 0, 0),
+                end_time=datetime.datetime(2026, 3, 3, 13, 0, 0),
+                location="Town > Cafe",
+                action_content="Eat lunch at the cafe.",
+            )
+        ],
+    )
+    graph = _tiered_graph(calls, memory, StubLlmGateway(calls), "background", store)
+    input = _input()
+
+    result = graph.run(input)
+
+    assert result.silent_reason == "background_tier"
+    assert result.talk is None
+    assert input.profile.extended.current_plan_context == ["Eat lunch at the cafe."]
+    # 임베딩 없이 쌓아 두고 reflection 누적값만 반영한다.
+    assert calls == ["record_observation_importance"]
+    assert len(graph.deferred_observations) == 1
+
+    graph.cognition_tier = "full"
+    assert graph.flush_deferred_observations() == 1
+    assert calls[1:] == ["encode_observation", "create_observation"]
+    assert isinstance(memory.persisted_importances[0], int)
+    assert graph.deferred_observations == []
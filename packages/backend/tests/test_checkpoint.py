@@ -0,0 +1,220 @@
+import datetime
+import json
+import zlib
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from settings import EMBEDDING_DIMENSION
+from world.checkpoint import WorldCheckpointStore
+from world.runtime import (
+    WorldRuntime,
+    WorldRuntimeConfig,
+    build_world_runtime,
+    default_persona_dir,
+)
+from world.step_log import StepLog
+
+START = datetime.datetime(2026, 3, 4, 9, 0, 0)
+
+
+class CountingProviderClient:
+    """모든 파서가 읽을 수 있는 JSON과 텍스트 해시 임베딩을 돌려주고 호출 수를 센다."""
+
+    def __init__(self) -> None:
+        self.generate_calls: int = 0
+        self.embed_calls: int = 0
+
+    def generate(self, *, prompt: str, **_: object) -> str:
+        self.generate_calls += 1
+        return json.dumps(
+            {
+                "should_react": True,
+                "reason": "stub",
+                "utterance": f"이야기 {self.generate_calls}",
+                "end_dialogue": False,
+                "importance": 1 + zlib.crc32(prompt.encode()) % 9,
+                "questions": [],
+                "insights": [],
+            },
+            ensure_ascii=False,
+        )
+
+    def embed(self, *, input: str, **_: object) -> list[float]:
+        self.embed_calls += 1
+        vector = np.zeros(EMBEDDING_DIMENSION, dtype=np.float32)
+        vector[zlib.crc32(input.encode()) % EMBEDDING_DIMENSION] = 1.0
+        return vector.tolist()
+
+
+def _build(
+    path: Path, client: CountingProviderClient, *, step_log_dir: Path | None = None
+) -> WorldRuntime:
+    return build_world_runtime(
+        config=WorldRuntimeConfig(
+            agent_persona_names=["Jiho", "Sujin"],
+            base_url=None,
+            api_key=None,
+            llm_model="stub",
+            embedding_model="stub",
+            timeout_seconds=1.0,
+            persona_dir=default_persona_dir(),
+            spatial_world=True,
+            history_window=4,
+            checkpoint_path=str(path),
+            step_log_dir=str(step_log_dir) if step_log_dir is not None else None,
+        ),
+        llm_client=client,  # pyright: ignore[reportArgumentType]
+        now=START,
+    )
+
+
+def _snapshot(runtime: WorldRuntime) -> dict[str, object]:
+    return {
+        "runtime": runtime.to_record(),
+        "conversations": [c.to_record() for c in runtime.conversations],
+        "memories": {
+            agent.name: [
+                (m.id, m.content, m.importance, m.last_accessed_at)
+                for m in agent.memory_service.memory_stream.all_memories()
+            ]
+            for agent in runtime.agents
+        },
+        "reflection": {
+            agent.name: agent.brain.reflection_graph.reflection.to_record()
+            for agent in runtime.agents
+        },
+        "positions": runtime.state().agent_positions,
+        "deferred": {
+            agent.name: agent.brain.brain_graph.deferred_observations
+            for agent in runtime.agents
+        },
+    }
+
+
+def test_checkpoint_store_folds_deltas_and_drops_a_torn_last_line(
+    tmp_path: Path,
+) -> None:
+    store = WorldCheckpointStore(tmp_path / "world.ckpt")
+    record = {"id": 0, "content": "관찰", "last_accessed_at": "2026-03-04T09:00:00"}
+    _ = store.write_base(
+        {
+            "version": 1,
+            "runtime": {"turn": 0},
+            "memories": {"A": {"upserted": [record], "next_id": 1}},
+            "plans": {"a/2026-03-04": {"date": "2026-03-04"}},
+        }
+    )
+    _ = store.append_delta(
+        {
+            "runtime": {"turn": 2},
+            "memories": {
+                "A": {
+                    "upserted": [{**record, "id": 1}],
+                    "accessed": {"0": "2026-03-04T10:00:00"},
+                    "removed": [],
+                    "next_id": 2,
+                }
+            },
+            "plans": {"a/2026-03-04": None},
+        }
+    )
+    with store.path.open("a", encoding="utf-8") as checkpoint_file:
+        _ = checkpoint_file.write('{"kind": "delta", "state": {"runt')
+
+    state = store.load()
+
+    assert state["runtime"] == {"turn": 2}
+    assert state["plans"] == {}
+    memories = state["memories"]
+    assert isinstance(memories, dict)
+    assert memories["A"]["next_id"] == 2
+    assert sorted(memories["A"]["records"]) == [0, 1]
+    assert memories["A"]["records"][0]["last_accessed_at"] == "2026-03-04T10:00:00"
+
+
+def test_world_resumes_from_checkpoint_without_llm_or_embedding_calls(
+    tmp_path: Path,
+) -> None:
+    path = tmp_path / "world.ckpt"
+    runtime = _build(path, CountingProviderClient())
+    background = runtime.agents[1]
+    runtime.set_cognition_tier(background.name, "background")
+    for _ in range(4):
+        _ = runtime.tick()
+    # background 에이전트가 임베딩 없이 쌓아 둔 기억도 체크포인트에 들어간다.
+    assert background.brain.brain_graph.deferred_observations
+    stats = runtime.state().checkpoint
+    assert stats is not None
+    assert stats.bases == 1
+    assert stats.deltas == 4
+    size_with_deltas = path.stat().st_size
+
+    client = CountingProviderClient()
+    resumed = _build(path, client)
+
+    assert client.generate_calls == 0
+    assert client.embed_calls == 0
+    assert _snapshot(resumed) == _snapshot(runtime)
+    # 복원 직후 base 한 줄로 compaction한다.
+    resumed_stats = resumed.state().checkpoint
+    assert resumed_stats is not None
+    assert resumed_stats.deltas == 0
+    assert path.stat().st_size < size_with_deltas
+
+    _ = resumed.tick()
+    assert resumed.turn == runtime.turn + 1
+
+    # 승격되면 쌓아 둔 기억을 임베딩해 메모리로 옮기고 체크포인트에서도 비운다.
+    resumed.set_cognition_tier(background.name, "full")
+    _ = resumed.tick()
+    assert resumed.agents[1].brain.brain_graph.deferred_observations == []
+    assert client.embed_calls > 0
+    deferred = WorldCheckpointStore(path).load()["deferred"]
+    assert isinstance(deferred, dict)
+    assert deferred[background.name] == []
+    with pytest.raises(ValueError):
+        resumed.restore_record({**resumed.to_record(), "focused": ["Nobody"]})
+
+
+def test_checkpoint_requires_a_bounded_session_history(tmp_path: Path) -> None:
+    with pytest.raises(ValueError, match="history_window"):
+        _ = build_world_runtime(
+            config=WorldRuntimeConfig(
+                agent_persona_names=["Jiho", "Sujin"],
+                base_url=None,
+                api_key=None,
+                llm_model="stub",
+                embedding_model="stub",
+                timeout_seconds=1.0,
+                persona_dir=default_persona_dir(),
+                checkpoint_path=str(tmp_path / "world.ckpt"),
+            ),
+            llm_client=CountingProviderClient(),  # pyright: ignore[reportArgumentType]
+        )
+
+
+def test_resume_drops_step_log_records_past_the_checkpoint(tmp_path: Path) -> None:
+    path = tmp_path / "world.ckpt"
+    log_dir = tmp_path / "steps"
+    runtime = _build(path, CountingProviderClient(), step_log_dir=log_dir)
+    for _ in range(2):
+        _ = runtime.tick()
+    turn = runtime.turn
+    runtime.close()
+    # 로그를 쓰고 체크포인트 delta를 쓰기 전에 멈춘 실행: 로그가 한 turn 앞선다.
+    StepLog(log_dir).append([{"turn": turn + 1, "reply": "되돌릴 발화"}])
+
+    resumed = _build(path, CountingProviderClient(), step_log_dir=log_dir)
+
+    assert resumed.turn == turn
+    log = resumed.step_log
+    assert log is not None
+    assert log.stats.last_turn == turn
+    assert log.read(turn + 1) is None
+    _ = resumed.tick()
+    assert [entry["turn"] for entry in log.iter_records()] == list(
+        range(1, resumed.turn + 1)
+    )
+    resumed.close()
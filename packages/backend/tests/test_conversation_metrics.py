@@ -0,0 +1,71 @@
+import random
+
+from llm.governance import (
+    ConversationMetricsAccumulator,
+    build_conversation_metrics,
+    merge_agent_metrics,
+)
+
+PHRASES = [
+    "오늘은 커피 이야기하자",
+    "좋아, 나는 디카프 추출도 궁금해",
+    "그럼 원두 로스팅 차이도 같이 보자",
+    "커피 이야기 좋아",
+    "도서관에 갈까?",
+    "",
+    "   ",
+    "!!!",
+]
+
+
+def test_accumulator_matches_full_history_metrics_at_every_step() -> None:
+    rng = random.Random(11)
+    for _ in range(20):
+        accumulator = ConversationMetricsAccumulator()
+        history: list[tuple[str, str]] = []
+        for turn in range(1, 30):
+            speaker = rng.choice(["Jiho", "Sujin", "Minseo"])
+            reply = rng.choice(PHRASES)
+            history.append((speaker, reply))
+            accumulator.add_reply(speaker, reply)
+
+            expected = build_conversation_metrics(
+                turns=turn + 2,
+                parse_failures=1,
+                silent_turns=2,
+                session_history=history,
+            )
+            assert (
+                accumulator.build(turns=turn + 2, parse_failures=1, silent_turns=2)
+                == expected
+            )
+
+
+def test_accumulator_breaks_metrics_down_by_agent() -> None:
+    first = ConversationMetricsAccumulator()
+    for speaker, reply in [
+        ("Jiho", "오늘은 커피 이야기하자"),
+        ("Sujin", "오늘은 커피 이야기하자"),
+        ("Jiho", "도서관에 갈까?"),
+    ]:
+        first.add_reply(speaker, reply)
+    first.record_turn("Jiho", parse_failure=False, silent=False)
+    first.record_turn("Sujin", parse_failure=True, silent=False)
+    first.record_turn("Jiho", parse_failure=False, silent=False)
+    first.record_turn("Sujin", parse_failure=False, silent=True)
+    second = ConversationMetricsAccumulator()
+    second.add_reply("Jiho", "오늘은 커피 이야기하자")
+    second.record_turn("Jiho", parse_failure=False, silent=False)
+
+    per_session = first.agent_metrics()
+    merged = merge_agent_metrics([first, second])
+
+    assert per_session["Sujin"].semantic_repeat_rate == 1.0
+    assert per_session["Sujin"].topic_progress_rate == 0.0
+    assert per_session["Sujin"].parse_failure_rate == 0.5
+    assert per_session["Sujin"].silent_rate == 0.5
+    assert per_session["Jiho"].semantic_repeat_rate == 0.0
+    assert per_session["Jiho"].topic_progress_rate == 1.0
+    assert merged["Jiho"].semantic_repeat_rate == 0.0
+    assert merged["Jiho"].topic_progress_rate == 1.0
+    assert merged["Sujin"] == per_session["Sujin"]
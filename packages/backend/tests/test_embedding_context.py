@@ -0,0 +1,80 @@
+import numpy as np
+
+from llm.embedding_context import (
+    active_tick_embeddings,
+    share_tick_embedding,
+    tick_embedding_scope,
+)
+from llm.embedding_encoder import EmbeddingEncodingContext, LlmEmbeddingEncoder
+from settings import EMBEDDING_DIMENSION
+
+
+class CountingEmbeddingClient:
+    def __init__(self) -> None:
+        self.inputs: list[str] = []
+
+    def embed(self, *, input: str, **_: object) -> list[float]:
+        self.inputs.append(input)
+        vector = [0.0] * EMBEDDING_DIMENSION
+        vector[len(self.inputs) % EMBEDDING_DIMENSION] = 1.0
+        return vector
+
+
+def _encode(encoder: LlmEmbeddingEncoder, text: str) -> np.ndarray:
+    return encoder.encode(EmbeddingEncodingContext(text=text))
+
+
+def test_encoder_embeds_every_call_without_tick_scope() -> None:
+    client = CountingEmbeddingClient()
+    encoder = LlmEmbeddingEncoder(client=client)
+
+    share_tick_embedding("derived", "source")
+    _encode(encoder, "source")
+    _encode(encoder, "source")
+    _encode(encoder, "derived")
+
+    assert client.inputs == ["source", "source", "derived"]
+    assert active_tick_embeddings() is None
+
+
+def test_tick_scope_reuses_exact_and_shared_embeddings() -> None:
+    client = CountingEmbeddingClient()
+    encoder = LlmEmbeddingEncoder(client=client)
+
+    with tick_embedding_scope() as tick_embeddings:
+        utterance = _encode(encoder, "좋아요, 같이 가요.")
+        share_tick_embedding(
+            "I decided to react: 좋아요, 같이 가요.", "좋아요, 같이 가요."
+        )
+        share_tick_embedding("지호: 좋아요, 같이 가요.", "좋아요, 같이 가요.")
+        decided = _encode(encoder, "I decided to react: 좋아요, 같이 가요.")
+        broadcast = _encode(encoder, "지호: 좋아요, 같이 가요.")
+        repeated = _encode(encoder, "좋아요, 같이 가요.")
+
+    stats = tick_embeddings.stats()
+    assert client.inputs == ["좋아요, 같이 가요."]
+    assert np.array_equal(decided, utterance)
+    assert np.array_equal(broadcast, utterance)
+    assert np.array_equal(repeated, utterance)
+    assert stats.encoded == 1
+    assert stats.shared_hits == 2
+    assert stats.cache_hits == 1
+    assert stats.saved_calls == 3
+    assert active_tick_embeddings() is None
+
+
+def test_shared_text_embeds_source_once_when_source_is_not_cached() -> None:
+    client = CountingEmbeddingClient()
+    encoder = LlmEmbeddingEncoder(client=client)
+
+    with tick_embedding_scope() as tick_embeddings:
+        share_tick_embedding("retrieval query", "observation")
+        share_tick_embedding("query alias", "retrieval query")
+        query = _encode(encoder, "retrieval query")
+        observation = _encode(encoder, "observation")
+        alias = _encode(encoder, "query alias")
+
+    assert client.inputs == ["observation"]
+    assert np.array_equal(query, observation)
+    assert np.array_equal(alias, observation)
+    assert tick_embeddings.stats().encoded == 1
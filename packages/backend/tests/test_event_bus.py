@@ -0,0 +1,268 @@
+import datetime
+import threading
+from dataclasses import dataclass, field
+from typing import cast
+
+import numpy as np
+import pytest
+
+from agents.memory.memory_manager import ObservationContext
+from agents.sim_agent import SimAgent
+from llm.embedding_context import tick_embedding_scope
+from llm.embedding_encoder import EmbeddingEncodingContext, LlmEmbeddingEncoder
+from llm.importance_scorer import ImportanceScoringContext
+from world.engine import (
+    SimulationEngine,
+    SimulationEngineConfig,
+    SimulationStepObservability,
+    SimulationStepResult,
+)
+from world.event_bus import PerceptionEventBus
+from world.runtime import (
+    WorldRuntime,
+    WorldRuntimeConfig,
+    build_world_runtime,
+    default_persona_dir,
+)
+from world.session import WorldConversationSession
+from world.spatial import Position, SpatialWorld
+
+NOW = datetime.datetime(2026, 3, 4, 9, 0, 0)
+
+
+@dataclass
+class CountingEmbeddingClient:
+    inputs: list[str] = field(default_factory=list)
+
+    def embed(self, **kwargs: object) -> list[float]:
+        self.inputs.append(str(kwargs["input"]))
+        return [0.1] * int(cast(int, kwargs["expected_dimension"]))
+
+
+@dataclass
+class RecordingBatchScorer:
+    calls: list[list[str]] = field(default_factory=list)
+
+    def score_batch(self, contexts: list[ImportanceScoringContext]) -> list[int]:
+        self.calls.append([context.agent_name for context in contexts])
+        return [7] * len(contexts)
+
+
+@dataclass
+class EncodingBrain:
+    name: str
+    encoder: LlmEmbeddingEncoder
+    cognition_tier: str = "full"
+    observations: list[tuple[str, int | None]] = field(default_factory=list)
+
+    def observation_context(self, *, profile: object) -> ObservationContext:
+        _ = profile
+        return ObservationContext(
+            agent_name=self.name, identity_stable_set=[], current_plan=None
+        )
+
+    def queue_observation(
+        self,
+        *,
+        content: str,
+        now: datetime.datetime,
+        profile: object,
+        importance: int | None = None,
+    ) -> None:
+        _ = now
+        _ = profile
+        _ = self.encoder.encode(EmbeddingEncodingContext(text=content))
+        self.observations.append((content, importance))
+
+
+@dataclass
+class BusAgent:
+    name: str
+    brain: EncodingBrain
+    profile: object = None
+
+
+def _agents(
+    names: list[str], client: CountingEmbeddingClient
+) -> tuple[list[BusAgent], list[SimAgent]]:
+    encoder = LlmEmbeddingEncoder(client=client)
+    agents = [
+        BusAgent(name=name, brain=EncodingBrain(name=name, encoder=encoder))
+        for name in names
+    ]
+    return agents, cast(list[SimAgent], agents)
+
+
+def test_event_bus_delivers_only_in_range_and_shares_embedding() -> None:
+    client = CountingEmbeddingClient()
+    agents, sim_agents = _agents(["A", "B", "C", "D", "E"], client)
+    agents[4].brain.cognition_tier = "background"
+    spatial = SpatialWorld(perception_radius=5.0)
+    for name, position in {
+        "A": Position(0.0, 0.0),
+        "B": Position(1.0, 0.0),
+        "C": Position(3.0, 0.0),
+        "D": Position(30.0, 0.0),
+        "E": Position(0.0, 4.0),
+    }.items():
+        spatial.place(name, position)
+    scorer = RecordingBatchScorer()
+    bus = PerceptionEventBus(
+        agents=sim_agents, spatial=spatial, importance_scorer=scorer
+    )
+    session = WorldConversationSession(agents=sim_agents[:2], dialogue_turn_window=None)
+    session.event_bus = bus
+
+    session.broadcast_reply(
+        speaker=sim_agents[0], reply="불이야!", now=NOW, language="ko"
+    )
+    # 참가자 기록도 flush까지 미룬다.
+    assert agents[0].brain.observations == []
+    delivered = bus.flush(
+        locks={name: threading.Lock() for name in ["A", "B", "C", "D", "E"]}
+    )
+
+    assert delivered == 2
+    assert session.incoming_utterances_by_agent["B"] == ["불이야!"]
+    assert agents[0].brain.observations == [("나는 이렇게 말했다: 불이야!", 7)]
+    assert agents[2].brain.observations == [("A가 이렇게 말했다: 불이야!", 7)]
+    # background tier는 배치 채점에서 빠지고 brain이 직접(휴리스틱) 매긴다.
+    assert agents[4].brain.observations == [("A가 이렇게 말했다: 불이야!", None)]
+    assert agents[3].brain.observations == []
+    # 화자, 참가자, 반경 안 구독자 중 full tier 전원을 한 번에 채점한다.
+    assert scorer.calls == [["A", "B", "C"]]
+    # 발화 하나에 수신자 4명이지만 발화문만 한 번 임베딩한다.
+    assert client.inputs == ["불이야!"]
+
+    stats = bus.stats
+    assert stats.events == 1
+    assert stats.recipients == 4
+    assert stats.out_of_range == 1
+    assert stats.importance_batches == 1
+    assert stats.batched_recipients == 3
+    assert stats.embeddings == 1
+    assert stats.shared_embeddings == 3
+    assert np.isclose(stats.mean_recipients, 4.0)
+
+
+def test_event_bus_reuses_the_embedding_context_of_the_step() -> None:
+    client = CountingEmbeddingClient()
+    agents, sim_agents = _agents(["A", "B"], client)
+    bus = PerceptionEventBus(agents=sim_agents)
+    session = WorldConversationSession(agents=sim_agents, dialogue_turn_window=None)
+    session.event_bus = bus
+
+    with tick_embedding_scope():
+        # step 안에서 발화문을 이미 임베딩했다(예: "I decided to react: ..." 기억).
+        _ = agents[0].brain.encoder.encode(EmbeddingEncodingContext(text="안녕"))
+        session.broadcast_reply(
+            speaker=sim_agents[0], reply="안녕", now=NOW, language="ko"
+        )
+    _ = bus.flush(locks={name: threading.Lock() for name in ["A", "B"]})
+
+    assert client.inputs == ["안녕"]
+    assert agents[1].brain.observations == [("A가 이렇게 말했다: 안녕", None)]
+    assert bus.stats.embeddings == 0
+
+
+@dataclass
+class BroadcastingEngine:
+    session: WorldConversationSession
+    config: SimulationEngineConfig = field(
+        default_factory=lambda: SimulationEngineConfig(
+            language="ko",
+            turn_time_step_seconds=45,
+            suppress_repeated_replies=False,
+            repetition_window=4,
+            fallback_on_empty_reply=False,
+        )
+    )
+
+    def step(
+        self,
+        *,
+        turn: int,
+        current_time: datetime.datetime,
+        speaker: SimAgent,
+        speaking_partner: SimAgent,
+    ) -> SimulationStepResult:
+        _ = speaking_partner
+        now = current_time + datetime.timedelta(seconds=45)
+        reply = f"{speaker.name}의 {turn}번째 말"
+        self.session.broadcast_reply(
+            speaker=speaker, reply=reply, now=now, language="ko"
+        )
+        return SimulationStepResult(
+            now=now,
+            speaker_name=speaker.name,
+            trace={},
+            reply=reply,
+            silent_reason="",
+            parse_failure=False,
+            observability=SimulationStepObservability(
+                thought="",
+                model_thought="",
+                self_critique="",
+                decision_reason="",
+                action_summary="",
+                decision_process={},
+            ),
+        )
+
+
+def test_perception_scope_runtime_skips_out_of_range_agents() -> None:
+    agents, sim_agents = _agents(["A", "B", "C", "D"], CountingEmbeddingClient())
+    spatial = SpatialWorld(perception_radius=5.0)
+    spatial.layout_groups([["A", "B"], ["C", "D"]])
+    spatial.place("C", Position(2.0, 2.0))
+    sessions = [
+        WorldConversationSession(agents=sim_agents[:2], dialogue_turn_window=None),
+        WorldConversationSession(agents=sim_agents[2:], dialogue_turn_window=None),
+    ]
+    runtime = WorldRuntime(
+        agents=sim_agents,
+        session=sessions[0],
+        engine=cast(
+            SimulationEngine, cast(object, BroadcastingEngine(session=sessions[0]))
+        ),
+        current_time=NOW,
+        broadcast_scope="perception",
+        spatial=spatial,
+    )
+    _ = runtime.add_conversation(
+        session=sessions[1],
+        engine=cast(
+            SimulationEngine, cast(object, BroadcastingEngine(session=sessions[1]))
+        ),
+    )
+
+    result = runtime.tick()
+
+    assert [reply.speaker_name for reply in result.replies] == ["A", "C"]
+    # C는 A/B 곁으로 옮겨 A의 말을 듣지만, 멀리 남은 D는 듣지 못한다.
+    assert "A가 이렇게 말했다: A의 1번째 말" in [
+        content for content, _ in agents[2].brain.observations
+    ]
+    assert not any(
+        content.startswith("A가") for content, _ in agents[3].brain.observations
+    )
+    stats = runtime.state().fan_out
+    assert stats.events == 2
+    assert stats.out_of_range == 1
+    assert stats.recipients == 7
+
+
+def test_perception_scope_requires_the_spatial_world() -> None:
+    with pytest.raises(ValueError, match="spatial_world"):
+        _ = build_world_runtime(
+            config=WorldRuntimeConfig(
+                agent_persona_names=["Jiho", "Sujin"],
+                base_url=None,
+                api_key=None,
+                llm_model="stub",
+                embedding_model="stub",
+                timeout_seconds=1.0,
+                persona_dir=default_persona_dir(),
+                broadcast_scope="perception",
+            )
+        )
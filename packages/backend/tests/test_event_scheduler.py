@@ -0,0 +1,183 @@
+import datetime
+from dataclasses import dataclass, field
+from typing import cast
+
+from agents.sim_agent import SimAgent
+from world.engine import (
+    SimulationEngine,
+    SimulationEngineConfig,
+    SimulationStepObservability,
+    SimulationStepResult,
+)
+from world.event_scheduler import AgentWake, AgentWakeQueue
+from world.runtime import WorldRuntime
+from world.session import WorldConversationSession
+
+START = datetime.datetime(2026, 3, 4, 9, 0, 0)
+
+
+@dataclass
+class WakeBrain:
+    boundaries: list[datetime.datetime] = field(default_factory=list)
+    observations: list[str] = field(default_factory=list)
+    plan_calls: list[datetime.datetime] = field(default_factory=list)
+
+    def queue_observation(
+        self,
+        *,
+        content: str,
+        now: datetime.datetime,
+        profile: object,
+        importance: int | None = None,
+    ) -> None:
+        _ = now
+        _ = profile
+        _ = importance
+        self.observations.append(content)
+
+    def follow_plan(
+        self, *, now: datetime.datetime, profile: object
+    ) -> datetime.datetime | None:
+        _ = profile
+        self.plan_calls.append(now)
+        return self.boundaries.pop(0) if self.boundaries else None
+
+
+@dataclass
+class WakeAgent:
+    name: str
+    brain: WakeBrain = field(default_factory=WakeBrain)
+    profile: object = None
+
+
+@dataclass
+class ScriptedEngine:
+    """화자별 대본대로 답하고, 답이 있으면 세션에 방송한다. 빈 문자열은 침묵이다."""
+
+    session: WorldConversationSession
+    script: dict[str, list[str]]
+    speakers: list[str] = field(default_factory=list)
+    config: SimulationEngineConfig = field(
+        default_factory=lambda: SimulationEngineConfig(
+            language="ko",
+            turn_time_step_seconds=45,
+            suppress_repeated_replies=False,
+            repetition_window=4,
+            fallback_on_empty_reply=False,
+        )
+    )
+
+    def step(
+        self,
+        *,
+        turn: int,
+        current_time: datetime.datetime,
+        speaker: SimAgent,
+        speaking_partner: SimAgent,
+    ) -> SimulationStepResult:
+        _ = turn
+        _ = speaking_partner
+        self.speakers.append(speaker.name)
+        _ = self.session.consume_incoming_partner_utterance(speaker=speaker)
+        now = current_time + datetime.timedelta(seconds=45)
+        reply = self.script[speaker.name].pop(0)
+        if reply:
+            self.session.broadcast_reply(
+                speaker=speaker, reply=reply, now=now, language="ko"
+            )
+        return SimulationStepResult(
+            now=now,
+            speaker_name=speaker.name,
+            trace={},
+            reply=reply,
+            silent_reason="" if reply else "llm_declined",
+            parse_failure=False,
+            observability=SimulationStepObservability(
+                thought="",
+                model_thought="",
+                self_critique="",
+                decision_reason="",
+                action_summary="",
+                decision_process={},
+            ),
+        )
+
+
+def _event_runtime(
+    agents: list[WakeAgent], script: dict[str, list[str]]
+) -> tuple[WorldRuntime, list[ScriptedEngine]]:
+    sim_agents = cast(list[SimAgent], agents)
+    sessions = [
+        WorldConversationSession(agents=sim_agents[:2], dialogue_turn_window=None),
+        WorldConversationSession(agents=sim_agents[2:], dialogue_turn_window=None),
+    ]
+    engines = [ScriptedEngine(session=session, script=script) for session in sessions]
+    runtime = WorldRuntime(
+        agents=sim_agents,
+        session=sessions[0],
+        engine=cast(SimulationEngine, cast(object, engines[0])),
+        current_time=START,
+        step_scheduling="event",
+    )
+    _ = runtime.add_conversation(
+        session=sessions[1],
+        engine=cast(SimulationEngine, cast(object, engines[1])),
+    )
+    return runtime, engines
+
+
+def test_agent_wake_queue_pops_due_wakes_in_time_order() -> None:
+    queue = AgentWakeQueue()
+    queue.push(AgentWake(when=START.replace(minute=5), agent_name="B", reason="event"))
+    queue.push(AgentWake(when=START, agent_name="A", reason="start"))
+    queue.push(AgentWake(when=START, agent_name="C", reason="utterance"))
+
+    due = queue.pop_due(START.replace(minute=1))
+
+    assert [wake.agent_name for wake in due] == ["A", "C"]
+    assert queue.next_wake_time() == START.replace(minute=5)
+    assert len(queue) == 1
+
+
+def test_event_scheduling_steps_only_woken_conversations() -> None:
+    agents = [WakeAgent(name=name) for name in ["A", "B", "C", "D"]]
+    runtime, engines = _event_runtime(
+        agents,
+        {"A": ["좋은 아침이에요"], "B": [""], "C": [""], "D": ["무슨 소리죠?"]},
+    )
+
+    first = runtime.tick()
+    second = runtime.tick()
+    quiet = [runtime.tick() for _ in range(3)]
+
+    # A의 발화가 B를 깨우고, B가 침묵하면 두 대화 모두 다음 사건까지 쉰다.
+    assert [step.speaker_name for step in first.steps] == ["A", "C"]
+    assert [step.speaker_name for step in second.steps] == ["B"]
+    assert all(not result.steps for result in quiet)
+    assert runtime.current_time == START + datetime.timedelta(seconds=45 * 5)
+
+    assert (
+        runtime.inject_event(content="창밖에서 큰 소리가 났다", agent_names=["D"]) == 1
+    )
+    woken = runtime.tick()
+
+    assert [step.speaker_name for step in woken.steps] == ["D"]
+    assert agents[3].brain.observations[0] == "창밖에서 큰 소리가 났다"
+    assert engines[0].speakers == ["A", "B"]
+    assert engines[1].speakers == ["C", "D"]
+    stats = runtime.state().event_scheduler
+    assert stats.conversation_steps == 4
+    assert stats.idle_conversations == 8
+    assert stats.events == 1
+
+
+def test_event_scheduling_follows_plan_boundaries_without_stepping() -> None:
+    agents = [WakeAgent(name=name) for name in ["A", "B", "C", "D"]]
+    agents[0].brain.boundaries = [START.replace(minute=2), START.replace(minute=30)]
+    runtime, _ = _event_runtime(agents, {"A": [""], "B": [], "C": [""], "D": []})
+
+    results = [runtime.tick() for _ in range(4)]
+
+    assert sum(len(result.steps) for result in results) == 2
+    assert agents[0].brain.plan_calls == [START, START.replace(minute=2)]
+    assert runtime.state().pending_wakes >= 1
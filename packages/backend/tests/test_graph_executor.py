@@ -0,0 +1,183 @@
+import json
+from dataclasses import replace
+from typing import Literal, cast
+
+import pytest
+from test_reaction_graph import StubGenerationClient, _input
+from typing_extensions import TypedDict
+
+from agents.graph_executor import CompiledStateGraph
+from agents.graph_support import (
+    GRAPH_END,
+    GRAPH_START,
+    GraphBackend,
+    resolve_state_graph_factory,
+)
+from agents.reaction import ReactionGraphRunner
+
+BACKENDS: list[GraphBackend] = ["langgraph", "compiled"]
+
+
+class CounterState(TypedDict):
+    count: int
+    trail: list[str]
+    status: Literal["retry", "done"]
+
+
+def _builder(backend: GraphBackend):
+    factory = cast(type, resolve_state_graph_factory(backend))
+    return factory(CounterState)
+
+
+def _increment(state: CounterState) -> dict[str, object]:
+    count = state["count"] + 1
+    return {
+        "count": count,
+        "trail": [*state["trail"], f"inc{count}"],
+        "status": "done" if count >= 3 else "retry",
+    }
+
+
+def _route(state: CounterState) -> str:
+    return state["status"]
+
+
+def _initial() -> CounterState:
+    return CounterState(count=0, trail=[], status="retry")
+
+
+def test_resolve_state_graph_factory_selects_backend() -> None:
+    assert resolve_state_graph_factory("compiled") is CompiledStateGraph
+    assert resolve_state_graph_factory("langgraph") is not CompiledStateGraph
+
+
+@pytest.mark.parametrize("backend", BACKENDS)
+def test_linear_graph_merges_partial_updates_without_mutating_input(
+    backend: GraphBackend,
+) -> None:
+    builder = _builder(backend)
+    builder.add_node("first", lambda state: {"count": state["count"] + 1})
+    builder.add_node("noop", lambda state: {})
+    builder.add_node("second", lambda state: {"trail": ["second"]})
+    builder.add_edge(GRAPH_START, "first")
+    builder.add_edge("first", "noop")
+    builder.add_edge("noop", "second")
+    builder.add_edge("second", GRAPH_END)
+    initial = _initial()
+
+    final = builder.compile().invoke(initial)
+
+    assert final == {"count": 1, "trail": ["second"], "status": "retry"}
+    assert initial == _initial()
+
+
+@pytest.mark.parametrize("backend", BACKENDS)
+def test_conditional_edges_loop_until_route_reaches_end(
+    backend: GraphBackend,
+) -> None:
+    builder = _builder(backend)
+    builder.add_node("increment", _increment)
+    builder.add_edge(GRAPH_START, "increment")
+    builder.add_conditional_edges(
+        "increment",
+        _route,
+        {"retry": "increment", "done": GRAPH_END},
+    )
+
+    final = builder.compile().invoke(_initial())
+
+    assert final["count"] == 3
+    assert final["trail"] == ["inc1", "inc2", "inc3"]
+
+
+@pytest.mark.parametrize("backend", BACKENDS)
+def test_unbounded_loop_hits_recursion_limit(backend: GraphBackend) -> None:
+    builder = _builder(backend)
+    builder.add_node("spin", lambda state: {"count": state["count"] + 1})
+    builder.add_edge(GRAPH_START, "spin")
+    builder.add_conditional_edges("spin", lambda state: "again", {"again": "spin"})
+
+    with pytest.raises(RecursionError):
+        builder.compile().invoke(_initial())
+
+
+@pytest.mark.parametrize("backend", BACKENDS)
+def test_update_outside_state_schema_is_dropped(backend: GraphBackend) -> None:
+    builder = _builder(backend)
+    builder.add_node("extra", lambda state: {"unknown": 1, "count": 5})
+    builder.add_edge(GRAPH_START, "extra")
+    builder.add_edge("extra", GRAPH_END)
+
+    final = builder.compile().invoke(_initial())
+
+    assert final == {"count": 5, "trail": [], "status": "retry"}
+
+
+def test_compiled_graph_rejects_edges_to_unknown_nodes() -> None:
+    builder = CompiledStateGraph(CounterState)
+    builder.add_node("only", lambda state: {})
+    builder.add_edge(GRAPH_START, "only")
+    builder.add_edge("only", "missing")
+
+    with pytest.raises(ValueError, match="unknown node"):
+        builder.compile()
+
+
+def _reaction_responses() -> list[str]:
+    return [
+        json.dumps({"should_react": True, "reason": "react"}),
+        json.dumps({"utterance": "", "reason": "silent"}),
+        json.dumps({"utterance": "좋아요, 더 들려주세요.", "reason": "respond"}),
+    ]
+
+
+def test_reaction_graph_runner_matches_across_backends() -> None:
+    decisions = []
+    call_counts = []
+    for backend in BACKENDS:
+        client = StubGenerationClient(responses=_reaction_responses())
+        runner = ReactionGraphRunner(
+            generation_client=client,
+            embedding_encoder=None,
+            graph_backend=backend,
+        )
+        decision = runner.decide_reaction(_input())
+        # 실측 latency는 백엔드와 무관하게 매번 달라지므로 비교에서 제외한다.
+        decisions.append(
+            replace(decision, trace=replace(decision.trace, generation_latency_ms=0.0))
+        )
+        call_counts.append(client.calls)
+
+    assert decisions[0] == decisions[1]
+    assert call_counts[0] == call_counts[1]
+
+
+@pytest.mark.parametrize("backend", BACKENDS)
+def test_reaction_graph_is_compiled_once_and_shared_across_runners(
+    backend: GraphBackend,
+) -> None:
+    first_client = StubGenerationClient(responses=_reaction_responses())
+    second_client = StubGenerationClient(
+        responses=[json.dumps({"should_react": False, "reason": "busy"})]
+    )
+    first = ReactionGraphRunner(
+        generation_client=first_client,
+        embedding_encoder=None,
+        graph_backend=backend,
+    )
+    second = ReactionGraphRunner(
+        generation_client=second_client,
+        embedding_encoder=None,
+        graph_backend=backend,
+    )
+
+    first_decision = first.decide_reaction(_input())
+    second_decision = second.decide_reaction(_input())
+
+    assert first.graph is second.graph
+    assert first_decision.should_react is True
+    assert first_decision.reason == "silent"
+    assert second_decision.should_react is False
+    assert second_decision.reason == "busy"
+    assert first_client.calls == 2
+    assert second_client.calls == 1
@@ -0,0 +1,49 @@
+import json
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+SRC_DIR = Path(__file__).resolve().parents[1] / "src"
+HEAVY_MODULES = ["litellm", "langgraph", "sqlalchemy", "pgvector", "psycopg"]
+
+# cold import 누적 시간 상한(ms). 현재 값(world.runtime ~0.35s, api.main ~0.9s)에
+# 느린 CI를 감안한 여유를 둔다. heavy 모듈이 다시 eager import되면 수 초가 걸려 실패한다.
+IMPORT_BUDGET_MS = {
+    "world.runtime": 1500.0,
+    "api.main": 3000.0,
+}
+
+
+def _cold_import(target: str) -> tuple[float, list[str]]:
+    env = {**os.environ, "PYTHONPATH": str(SRC_DIR)}
+    env.setdefault("LITELLM_LOCAL_MODEL_COST_MAP", "True")
+    probe = (
+        f"import sys, json, {target}; "
+        f"print(json.dumps([m for m in {HEAVY_MODULES!r} if m in sys.modules]))"
+    )
+    completed = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", probe],
+        check=True,
+        capture_output=True,
+        text=True,
+        env=env,
+        timeout=120,
+    )
+    cumulative_us = 0
+    for line in completed.stderr.splitlines():
+        _, _, columns = line.partition("import time:")
+        fields = columns.split("|")
+        if len(fields) == 3 and fields[2].rstrip() == f" {target}":
+            cumulative_us = int(fields[1])
+    return cumulative_us / 1000, json.loads(completed.stdout.strip().splitlines()[-1])
+
+
+@pytest.mark.parametrize("target", sorted(IMPORT_BUDGET_MS))
+def test_cold_import_stays_within_budget_without_heavy_providers(target: str) -> None:
+    cumulative_ms, heavy_loaded = _cold_import(target)
+
+    assert heavy_loaded == []
+    assert 0 < cumulative_ms <= IMPORT_BUDGET_MS[target]
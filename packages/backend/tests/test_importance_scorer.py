@@ -1,6 +1,7 @@
 import json
 
 from llm import (
+    HeuristicImportanceScorer,
     ImportanceScoringContext,
     LlmImportanceScorer,
     clamp_importance,
@@ -72,3 +73,51 @@ def test_llm_importance_scorer_fallback_on_client_error() -> None:
         )
     )
     assert score == 3
+
+
+def test_heuristic_importance_scorer_raises_score_for_urgent_cues() -> None:
+    scorer = HeuristicImportanceScorer()
+
+    routine = scorer.score(
+        ImportanceScoringContext(
+            observation="Jiho is reading at the desk.",
+            agent_name="Jiho",
+            identity_stable_set=[],
+        )
+    )
+    urgent = scorer.score(
+        ImportanceScoringContext(
+            observation="카페에 불이 났어요! 도와주세요",
+            agent_name="Jiho",
+            identity_stable_set=[],
+        )
+    )
+
+    assert routine == 2
+    assert urgent == 8
+
+
+def test_llm_importance_scorer_batches_a_recipient_group_in_one_call() -> None:
+    client = StubGenerationClient(
+        json.dumps(
+            {
+                "scores": [
+                    {"agent": "Jiho", "importance": 6},
+                    {"agent": "Sujin", "importance": "12"},
+                ]
+            }
+        )
+    )
+    scorer = LlmImportanceScorer(client=client, fallback_importance=3)
+    contexts = [
+        ImportanceScoringContext(
+            observation="Minseo said: the cafe is on fire!",
+            agent_name=name,
+            identity_stable_set=[],
+        )
+        for name in ["Jiho", "Sujin", "Daeun"]
+    ]
+
+    assert scorer.score_batch(contexts) == [6, 10, 3]
+    assert client.calls == 1
+    assert client.last_format_json is True
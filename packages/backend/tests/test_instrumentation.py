@@ -0,0 +1,91 @@
+import json
+from typing import cast
+
+import pytest
+from test_reaction_graph import StubGenerationClient, _input
+
+from agents.graph_support import GraphBackend
+from agents.reaction import ReactionGraphRunner
+from agents.reaction.contracts import GenerateClient
+from llm.clients.instrumented import InstrumentedProviderClient
+from llm.clients.provider_factory import ProviderClient
+from utils.instrumentation import ProfileSnapshot, active_profile, profile_step
+
+
+class StubProviderClient(StubGenerationClient):
+    def embed(self, **_: object) -> list[float]:
+        return [0.0]
+
+
+def _runner(client: StubProviderClient, backend: GraphBackend) -> ReactionGraphRunner:
+    return ReactionGraphRunner(
+        generation_client=cast(
+            GenerateClient,
+            InstrumentedProviderClient(cast(ProviderClient, cast(object, client))),
+        ),
+        embedding_encoder=None,
+        graph_backend=backend,
+    )
+
+
+def _responses() -> list[str]:
+    return [
+        json.dumps({"should_react": True, "reason": "react"}),
+        json.dumps({"utterance": "", "reason": "silent"}),
+        json.dumps({"utterance": "좋아요, 더 들려주세요.", "reason": "respond"}),
+    ]
+
+
+@pytest.mark.parametrize("backend", ["langgraph", "compiled"])
+def test_profile_step_records_node_calls_llm_chars_and_retries(
+    backend: GraphBackend,
+) -> None:
+    client = StubProviderClient(responses=_responses())
+    runner = _runner(client, backend)
+
+    with profile_step() as profile:
+        runner.decide_reaction(_input())
+    snapshot = profile.snapshot()
+
+    assert snapshot.steps == 1
+    assert snapshot.llm_calls == client.calls
+    assert snapshot.embed_calls == 0
+    assert snapshot.prompt_chars > 0
+    assert snapshot.response_chars == sum(len(r) for r in _responses()[: client.calls])
+    generate_utterance = snapshot.nodes["reaction.generate_utterance"]
+    assert generate_utterance.calls == client.calls - 1
+    assert generate_utterance.retries == generate_utterance.calls - 1
+    assert snapshot.nodes["reaction.generate_intent"].llm_calls == 1
+    assert snapshot.nodes["reaction.generate_intent"].retries == 0
+    assert snapshot.retries == generate_utterance.retries + sum(
+        timing.retries
+        for key, timing in snapshot.nodes.items()
+        if key != "reaction.generate_utterance"
+    )
+    assert snapshot.wall_ms >= generate_utterance.wall_ms
+
+
+def test_instrumentation_is_inactive_outside_profile_step() -> None:
+    client = StubProviderClient(responses=_responses())
+    runner = _runner(client, "compiled")
+
+    runner.decide_reaction(_input())
+
+    assert active_profile() is None
+
+
+def test_profile_snapshot_merge_accumulates_steps_and_nodes() -> None:
+    client = StubProviderClient(responses=_responses())
+    runner = _runner(client, "compiled")
+    snapshots: list[ProfileSnapshot] = []
+    for _ in range(2):
+        client.calls = 0
+        with profile_step() as profile:
+            runner.decide_reaction(_input())
+        snapshots.append(profile.snapshot())
+
+    merged = snapshots[0].merge(snapshots[1])
+
+    assert merged.steps == 2
+    assert merged.llm_calls == snapshots[0].llm_calls * 2
+    assert merged.nodes["reaction.generate_intent"].calls == 2
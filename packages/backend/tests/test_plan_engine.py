@@ -0,0 +1,190 @@
+import datetime
+import threading
+
+from agents.planning import PlanEngine, PlanStore
+from agents.planning.models import DayPlanItem, HourlyPlanItem, MinutePlanItem
+
+DAY = datetime.date(2026, 3, 3)
+
+
+def _at(hour: int, minute: int = 0) -> datetime.datetime:
+    return datetime.datetime(2026, 3, 3, hour, minute)
+
+
+class StubExpander:
+    def __init__(self) -> None:
+        self.calls: list[str] = []
+        self._lock: threading.Lock = threading.Lock()
+
+    def generate_hourly_plan(
+        self,
+        *,
+        agent_name: str,
+        current_time: datetime.datetime,
+        day_plan_item: DayPlanItem,
+    ) -> list[HourlyPlanItem]:
+        _ = agent_name
+        _ = current_time
+        with self._lock:
+            self.calls.append(f"hourly:{day_plan_item.start_time:%H:%M}")
+        items: list[HourlyPlanItem] = []
+        start = day_plan_item.start_time
+        while start < day_plan_item.end_time:
+            items.append(
+                HourlyPlanItem(
+                    start_time=start,
+                    end_time=start + datetime.timedelta(hours=1),
+                    location=day_plan_item.location,
+                    action_content=f"{day_plan_item.action_content} @{start:%H}",
+                )
+            )
+            start += datetime.timedelta(hours=1)
+        return items
+
+    def generate_minute_plan(
+        self,
+        *,
+        agent_name: str,
+        current_time: datetime.datetime,
+        hourly_plan_item: HourlyPlanItem,
+    ) -> list[MinutePlanItem]:
+        _ = agent_name
+        _ = current_time
+        with self._lock:
+            self.calls.append(f"minute:{hourly_plan_item.start_time:%H:%M}")
+        return [
+            MinutePlanItem(
+                start_time=hourly_plan_item.start_time
+                + datetime.timedelta(minutes=offset),
+                end_time=hourly_plan_item.start_time
+                + datetime.timedelta(minutes=offset + 15),
+                location=hourly_plan_item.location,
+                action_content=f"step {offset}",
+            )
+            for offset in range(0, 60, 15)
+        ]
+
+
+def _store() -> PlanStore:
+    store = PlanStore()
+    store.put_day_plan(
+        "jiho",
+        DAY,
+        [
+            DayPlanItem(
+                start_time=_at(9),
+                end_time=_at(12),
+                location="Town > Home > Desk",
+                action_content="Compose",
+            ),
+            DayPlanItem(
+                start_time=_at(13),
+                end_time=_at(15),
+                location="Town > Cafe",
+                action_content="Cafe shift",
+            ),
+        ],
+    )
+    return store
+
+
+def test_plan_engine_expands_only_the_current_windows() -> None:
+    expander = StubExpander()
+    engine = PlanEngine(
+        expander=expander,
+        plan_store=_store(),
+        agent_id="jiho",
+        agent_name="Jiho",
+        prefetch=False,
+    )
+
+    lookup = engine.lookup(_at(10, 20))
+    again = engine.lookup(_at(10, 40))
+
+    assert expander.calls == ["hourly:09:00", "minute:10:00"]
+    assert lookup.current_action == "step 15"
+    assert lookup.next_action == "step 30"
+    assert lookup.current.hourly is not None
+    assert lookup.current.hourly.action_content == "Compose @10"
+    assert lookup.next.day is not None
+    assert lookup.next.day.action_content == "Cafe shift"
+    assert again.current_action == "step 30"
+    assert engine.stats.hourly_expansions == 1
+    assert engine.stats.minute_expansions == 1
+
+
+def test_plan_engine_prefetches_next_windows_once() -> None:
+    expander = StubExpander()
+    engine = PlanEngine(
+        expander=expander,
+        plan_store=_store(),
+        agent_id="jiho",
+        agent_name="Jiho",
+    )
+    try:
+        _ = engine.lookup(_at(10, 20))
+        next_hour = engine.lookup(_at(11, 5))
+        next_day_item = engine.lookup(_at(13, 30))
+    finally:
+        engine.close()
+
+    assert next_hour.current_action == "step 0"
+    assert next_day_item.current.hourly is not None
+    assert next_day_item.current.hourly.action_content == "Cafe shift @13"
+    assert sorted(expander.calls).count("hourly:13:00") == 1
+    assert sorted(expander.calls).count("minute:11:00") == 1
+    assert engine.stats.prefetch_scheduled >= 2
+
+
+class FailingMinuteExpander(StubExpander):
+    def generate_minute_plan(self, **kwargs: object) -> list[MinutePlanItem]:
+        _ = kwargs
+        raise TimeoutError("provider timed out")
+
+
+def test_plan_engine_falls_back_to_the_parent_item_when_expansion_fails() -> None:
+    engine = PlanEngine(
+        expander=FailingMinuteExpander(),
+        plan_store=_store(),
+        agent_id="jiho",
+        agent_name="Jiho",
+        prefetch=False,
+    )
+
+    lookup = engine.lookup(_at(10, 20))
+
+    assert lookup.current.minute is None
+    assert lookup.current_action == "Compose @10"
+    assert engine.stats.failures == 1
+    assert engine.stats.hourly_expansions == 1
+
+
+def test_plan_engine_prunes_expansions_of_past_days() -> None:
+    store = _store()
+    next_day = DAY + datetime.timedelta(days=1)
+    store.put_day_plan(
+        "jiho",
+        next_day,
+        [
+            DayPlanItem(
+                start_time=datetime.datetime(2026, 3, 4, 9),
+                end_time=datetime.datetime(2026, 3, 4, 10),
+                location="Town > Park",
+                action_content="Walk",
+            )
+        ],
+    )
+    engine = PlanEngine(
+        expander=StubExpander(),
+        plan_store=store,
+        agent_id="jiho",
+        agent_name="Jiho",
+        prefetch=False,
+    )
+
+    _ = engine.lookup(_at(10, 20))
+    assert len(engine._expanded) == 2
+    lookup = engine.lookup(datetime.datetime(2026, 3, 4, 9, 30))
+
+    assert lookup.current_action == "step 30"
+    assert all(key[1].start_time.date() == next_day for key in engine._expanded)
@@ -0,0 +1,177 @@
+import datetime
+from pathlib import Path
+
+from agents.planning import PlanStore
+from agents.planning.models import DayPlanItem, HourlyPlanItem, MinutePlanItem
+
+DAY = datetime.date(2026, 3, 3)
+
+
+def _at(hour: int, minute: int = 0) -> datetime.datetime:
+    return datetime.datetime(2026, 3, 3, hour, minute)
+
+
+def _day_items() -> list[DayPlanItem]:
+    return [
+        DayPlanItem(
+            start_time=_at(13),
+            end_time=_at(15),
+            location="Town > Cafe",
+            action_content="Run the afternoon shift.",
+        ),
+        DayPlanItem(
+            start_time=_at(9),
+            end_time=_at(12),
+            location="Town > Home > Desk",
+            action_content="Draft a composition exercise.",
+        ),
+    ]
+
+
+def _hourly(start: int, action: str) -> HourlyPlanItem:
+    return HourlyPlanItem(
+        start_time=_at(start),
+        end_time=_at(start + 1),
+        location="Town > Home > Desk",
+        action_content=action,
+    )
+
+
+def test_plan_store_persists_full_plan_and_answers_time_queries(
+    tmp_path: Path,
+) -> None:
+    store = PlanStore(tmp_path)
+    store.put_day_plan("jiho", DAY, _day_items())
+    store.add_hourly_items("jiho", DAY, [_hourly(9, "Warm up."), _hourly(10, "Write.")])
+    store.add_minute_items(
+        "jiho",
+        DAY,
+        [
+            MinutePlanItem(
+                start_time=_at(9),
+                end_time=_at(9, 10),
+                location="Town > Home > Desk",
+                action_content="Tune the piano.",
+            )
+        ],
+    )
+
+    reloaded = PlanStore(tmp_path)
+    plan = reloaded.get("jiho", DAY)
+    active = reloaded.active_items("jiho", _at(9, 5))
+
+    assert plan is not None
+    assert [item.start_time.hour for item in plan.day_items] == [9, 13]
+    assert [item.action_content for item in plan.hourly_items] == ["Warm up.", "Write."]
+    assert active.day is not None
+    assert active.day.action_content == "Draft a composition exercise."
+    assert active.hourly is not None and active.hourly.action_content == "Warm up."
+    assert (
+        active.minute is not None and active.minute.action_content == "Tune the piano."
+    )
+    assert reloaded.active_items("jiho", _at(12, 30)).day is None
+    assert reloaded.get("sujin", DAY) is None
+
+
+def test_plan_store_replaces_overlapping_expansions_and_invalidates(
+    tmp_path: Path,
+) -> None:
+    store = PlanStore(tmp_path)
+    store.put_day_plan("jiho", DAY, _day_items())
+    store.add_hourly_items("jiho", DAY, [_hourly(9, "Warm up."), _hourly(10, "Write.")])
+    plan = store.add_hourly_items("jiho", DAY, [_hourly(10, "Revise.")])
+
+    assert [item.action_content for item in plan.hourly_items] == [
+        "Warm up.",
+        "Revise.",
+    ]
+
+    store.invalidate("jiho", DAY)
+
+    assert store.get("jiho", DAY) is None
+    assert PlanStore(tmp_path).get("jiho", DAY) is None
+
+
+def test_plan_store_sees_a_plan_written_after_a_miss(tmp_path: Path) -> None:
+    reader = PlanStore(tmp_path)
+    assert reader.get("jiho", DAY) is None
+
+    _ = PlanStore(tmp_path).put_day_plan("jiho", DAY, _day_items())
+
+    plan = reader.get("jiho", DAY)
+    assert plan is not None
+    assert len(plan.day_items) == 2
+
+
+def test_plan_store_replan_keeps_frozen_prefix_and_valid_expansions(
+    tmp_path: Path,
+) -> None:
+    store = PlanStore(tmp_path)
+    store.put_day_plan("jiho", DAY, _day_items())
+    store.add_hourly_items(
+        "jiho",
+        DAY,
+        [_hourly(9, "Warm up."), _hourly(10, "Write."), _hourly(11, "Revise.")],
+    )
+    afternoon = _day_items()[0]
+    store.add_hourly_items("jiho", DAY, [_hourly(13, "Open the cafe.")])
+
+    plan = store.replan_from(
+        "jiho",
+        DAY,
+        _at(10, 30),
+        [
+            DayPlanItem(
+                start_time=_at(10, 30),
+                end_time=_at(12),
+                location="Town > Hospital",
+                action_content="Visit a friend.",
+            ),
+            afternoon,
+        ],
+    )
+
+    assert [
+        (item.start_time, item.end_time, item.action_content)
+        for item in plan.day_items
+    ] == [
+        (_at(9), _at(10, 30), "Draft a composition exercise."),
+        (_at(10, 30), _at(12), "Visit a friend."),
+        (_at(13), _at(15), "Run the afternoon shift."),
+    ]
+    assert [item.action_content for item in plan.hourly_items] == [
+        "Warm up.",
+        "Open the cafe.",
+    ]
+    assert PlanStore(tmp_path).get("jiho", DAY) == plan
+
+
+def test_stored_plan_next_boundary_uses_the_finest_expanded_level() -> None:
+    store = PlanStore()
+    store.put_day_plan("jiho", DAY, _day_items())
+    plan = store.add_hourly_items("jiho", DAY, [_hourly(9, "Warm up.")])
+
+    assert plan.next_boundary(_at(9, 30)) == _at(10)
+    assert plan.next_boundary(_at(10, 30)) == _at(12)
+    assert plan.next_boundary(_at(12, 30)) == _at(13)
+    assert plan.next_boundary(_at(15)) is None
+    assert plan.next_items(_at(10)).day is not None
+    assert plan.next_items(_at(10)).day.start_time == _at(13)
+
+
+def test_plan_store_drains_changes_and_restores_plans() -> None:
+    store = PlanStore()
+    store.put_day_plan("jiho", DAY, _day_items())
+    store.put_day_plan("sujin", DAY, _day_items())
+    assert set(store.drain_changes()) == {("jiho", DAY), ("sujin", DAY)}
+
+    store.invalidate("sujin", DAY)
+    assert store.drain_changes() == {("sujin", DAY): None}
+    assert store.drain_changes() == {}
+
+    restored = PlanStore()
+    restored.restore(store.plans())
+
+    assert restored.get("jiho", DAY) == store.get("jiho", DAY)
+    assert restored.get("sujin", DAY) is None
+    assert restored.drain_changes() == {}
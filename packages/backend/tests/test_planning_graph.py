@@ -4,6 +4,7 @@ import json
 from agents.planning.graph import PlanningGraphRunner
 from agents.planning.models import (
     DayPlanBroadStrokesRequest,
+    DayReplanRequest,
 )
 from agents.planning.planner import Planner
 from llm.clients.types import LlmGenerateOptions
@@ -12,6 +13,7 @@ from llm.clients.types import LlmGenerateOptions
 class StubPlanningClient:
     def __init__(self) -> None:
         self.call_labels: list[str] = []
+        self.prompts: list[str] = []
         self.responses_by_label: dict[str, list[str]] = {
             "day": [
                 json.dumps(
@@ -51,6 +53,32 @@ class StubPlanningClient:
                     }
                 )
             ],
+            "replan": [
+                json.dumps(
+                    {
+                        "items": [
+                            {
+                                "start_time": "2026-02-13T10:00:00",
+                                "end_time": "2026-02-13T11:00:00",
+                                "location": "Town > Home > Desk",
+                                "action_content": "Already over before now.",
+                            },
+                            {
+                                "start_time": "2026-02-13T11:30:00",
+                                "end_time": "2026-02-13T12:30:00",
+                                "location": "Town > Hospital",
+                                "action_content": "Visit a friend in the hospital.",
+                            },
+                            {
+                                "start_time": "2026-02-13T12:30:00",
+                                "end_time": "2026-02-13T13:30:00",
+                                "location": "Town > Home > Kitchen",
+                                "action_content": "Eat a late lunch.",
+                            },
+                        ]
+                    }
+                )
+            ],
             "hour": [
                 json.dumps(
                     {
@@ -90,6 +118,8 @@ class StubPlanningClient:
         normalized_prompt = prompt.lower()
         if options.num_predict == 3072:
             label = "minute"
+        elif "re-plan" in normalized_prompt:
+            label = "replan"
         elif "hourly plan" in normalized_prompt:
             label = "hour"
         elif "day plan" in normalized_prompt:
@@ -97,6 +127,7 @@ class StubPlanningClient:
         else:
             raise AssertionError(f"Unknown planning prompt: {prompt[:120]!r}")
         self.call_labels.append(label)
+        self.prompts.append(prompt)
         return self.responses_by_label[label].pop(0)
 
 
@@ -168,3 +199,32 @@ def test_planner_uses_planning_graph_for_existing_entrypoints() -> None:
     assert len(hourly_items) == 1
     assert len(minute_items) == 1
     assert client.call_labels == ["day", "hour", "minute"]
+
+
+def test_planning_graph_runner_replans_only_after_now_with_frozen_prefix() -> None:
+    client = StubPlanningClient()
+    graph = PlanningGraphRunner(planning_client=client)
+    day_items = graph.generate_day_plan(_day_plan_request())
+    now = datetime.datetime(2026, 2, 13, 12, 0)
+
+    items = graph.generate_day_replan(
+        DayReplanRequest(
+            day_request=_day_plan_request(),
+            now=now,
+            frozen_items=[item for item in day_items if item.end_time <= now],
+            reason="A friend was admitted to the hospital.",
+        )
+    )
+
+    replan_prompt = client.prompts[-1]
+    assert client.call_labels == ["day", "replan"]
+    assert "Sketch melodic ideas." in replan_prompt
+    assert "(1 earlier items omitted)" in replan_prompt
+    assert "Plan the morning composition session." not in replan_prompt
+    assert "A friend was admitted to the hospital." in replan_prompt
+    assert len(replan_prompt) < len(client.prompts[0])
+    assert [(item.start_time.hour, item.start_time.minute) for item in items] == [
+        (12, 0),
+        (12, 30),
+    ]
+    assert items[0].action_content == "Visit a friend in the hospital."
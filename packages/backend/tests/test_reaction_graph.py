@@ -1,11 +1,15 @@
 import datetime
 import json
+import time
+from dataclasses import replace
 
 from agents.agent import AgentIdentity, AgentProfile, ExtendedPersona, FixedPersona
 from agents.reaction import (
     ReactionDecisionInput,
     ReactionGraphRunner,
+    ReactionRetryBudget,
 )
+from llm.governance import build_reaction_mode_metrics
 
 
 class StubGenerationClient:
@@ -92,3 +96,249 @@ def test_reaction_graph_runner_retries_partner_nudge_once() -> None:
     assert result.should_react is True
     assert result.reaction == "좋아요, 더 들려주세요."
     assert result.trace.partner_retry_count == 1
+
+
+def _fused_json(*, should_react: bool, utterance: str, reason: str) -> str:
+    return json.dumps(
+        {"should_react": should_react, "utterance": utterance, "reason": reason}
+    )
+
+
+def test_reaction_graph_runner_fused_mode_uses_single_call() -> None:
+    client = StubGenerationClient(
+        responses=[
+            _fused_json(
+                should_react=True, utterance="반가워요, 수진 씨.", reason="greet"
+            )
+        ]
+    )
+    runner = ReactionGraphRunner(
+        generation_client=client,
+        embedding_encoder=None,
+        reaction_mode="fused",
+    )
+
+    decision = runner.decide_reaction(_input())
+
+    assert client.calls == 1
+    assert decision.should_react is True
+    assert decision.reaction == "반가워요, 수진 씨."
+    assert decision.trace.reaction_mode == "fused"
+    assert decision.trace.mode_fallback_reason == ""
+    assert decision.trace.generate_calls == 1
+    assert decision.trace.generation_latency_ms >= 0.0
+
+
+def test_reaction_graph_runner_honours_per_input_mode_and_semantic_opt_out() -> None:
+    client = StubGenerationClient(
+        responses=[
+            _fused_json(
+                should_react=True, utterance="반가워요, 수진 씨.", reason="greet"
+            )
+        ]
+    )
+    runner = ReactionGraphRunner(
+        generation_client=client,
+        embedding_encoder=None,
+        reaction_mode="two_stage",
+    )
+
+    decision = runner.decide_reaction(
+        replace(_input(), reaction_mode="fused", semantic_retries=False)
+    )
+
+    assert client.calls == 1
+    assert decision.reaction == "반가워요, 수진 씨."
+    assert decision.trace.reaction_mode == "fused"
+    assert decision.trace.semantic_retry_trigger == "none"
+
+
+def test_reaction_graph_runner_fused_mode_declines_without_utterance_call() -> None:
+    client = StubGenerationClient(
+        responses=[_fused_json(should_react=False, utterance="", reason="busy")]
+    )
+    runner = ReactionGraphRunner(
+        generation_client=client,
+        embedding_encoder=None,
+        reaction_mode="fused",
+    )
+
+    decision = runner.decide_reaction(_input())
+
+    assert client.calls == 1
+    assert decision.should_react is False
+    assert decision.reason == "busy"
+    assert decision.trace.reaction_mode == "fused"
+
+
+def test_reaction_graph_runner_fused_mode_falls_back_on_parse_failure() -> None:
+    client = StubGenerationClient(
+        responses=[
+            "not json at all",
+            _intent_json(should_react=True, reason="react"),
+            _utterance_json(utterance="좋아요, 같이 가요.", reason="respond"),
+        ]
+    )
+    runner = ReactionGraphRunner(
+        generation_client=client,
+        embedding_encoder=None,
+        reaction_mode="fused",
+    )
+
+    decision = runner.decide_reaction(_input())
+
+    assert client.calls == 3
+    assert decision.reaction == "좋아요, 같이 가요."
+    assert decision.trace.parse_success is True
+    assert decision.trace.reaction_mode == "fused_fallback"
+    assert decision.trace.mode_fallback_reason == "fused_parse_failure"
+    assert decision.trace.generate_calls == 3
+
+
+def test_reaction_graph_runner_fused_mode_falls_back_when_guardrail_trips() -> None:
+    client = StubGenerationClient(
+        responses=[
+            _fused_json(should_react=True, utterance="", reason="silent"),
+            _utterance_json(utterance="좋아요, 더 들려주세요.", reason="respond"),
+        ]
+    )
+    runner = ReactionGraphRunner(
+        generation_client=client,
+        embedding_encoder=None,
+        reaction_mode="fused",
+    )
+
+    decision = runner.decide_reaction(
+        ReactionDecisionInput(
+            agent_identity=_input().agent_identity,
+            current_time=_input().current_time,
+            observation_content=_input().observation_content,
+            dialogue_history=[("수진 씨, 오늘 테스트 어땠어요?", "none")],
+            profile=_input().profile,
+            retrieved_memories=[],
+            language="ko",
+        )
+    )
+
+    assert client.calls == 2
+    assert decision.reaction == "좋아요, 더 들려주세요."
+    assert decision.trace.partner_retry_count == 1
+    assert decision.trace.reaction_mode == "fused_fallback"
+    assert decision.trace.mode_fallback_reason == "partner_nudge"
+
+
+def test_reaction_mode_metrics_compare_parse_failures_per_mode() -> None:
+    traces = []
+    for mode, responses in [
+        ("two_stage", [_intent_json(should_react=False, reason="busy")]),
+        ("fused", [_fused_json(should_react=False, utterance="", reason="busy")]),
+        (
+            "fused",
+            [
+                "{broken",
+                _intent_json(should_react=True, reason="react"),
+                _utterance_json(utterance="좋아요.", reason="respond"),
+            ],
+        ),
+    ]:
+        runner = ReactionGraphRunner(
+            generation_client=StubGenerationClient(responses=responses),
+            embedding_encoder=None,
+            reaction_mode=mode,
+        )
+        traces.append(runner.decide_reaction(_input()).trace)
+
+    metrics = build_reaction_mode_metrics(traces)
+
+    assert metrics["two_stage"].turns == 1
+    assert metrics["two_stage"].parse_failure_rate == 0.0
+    assert metrics["fused"].turns == 2
+    assert metrics["fused"].parse_failure_rate == 0.5
+    assert metrics["fused"].fallback_rate == 0.5
+    assert metrics["fused"].mean_generate_calls == 2.0
+
+
+class SlowGenerationClient(StubGenerationClient):
+    def generate(self, **kwargs: object) -> str:
+        time.sleep(0.02)
+        return super().generate(**kwargs)
+
+
+def _input_with_history(history: list[tuple[str, str]]) -> ReactionDecisionInput:
+    return replace(_input(), dialogue_history=history)
+
+
+def test_reaction_graph_runner_stops_overlap_retries_at_call_budget() -> None:
+    client = StubGenerationClient(
+        responses=[
+            _intent_json(should_react=True, reason="react"),
+            _utterance_json(utterance="오늘 카페 원두 향이 정말 좋네요", reason="echo"),
+            _utterance_json(
+                utterance="오늘 카페 원두 향이 정말 좋네요 그쵸", reason="echo"
+            ),
+        ]
+    )
+    runner = ReactionGraphRunner(
+        generation_client=client,
+        embedding_encoder=None,
+        reaction_mode="two_stage",
+        retry_budget=ReactionRetryBudget(max_calls=3),
+    )
+
+    decision = runner.decide_reaction(
+        _input_with_history([("오늘 카페 원두 향이 정말 좋네요", "")])
+    )
+
+    assert client.calls == 3
+    assert decision.reaction == "오늘 카페 원두 향이 정말 좋네요"
+    assert decision.trace.budget_exhausted_reason == "call_budget:overlap_retry"
+    assert decision.trace.generate_calls == 3
+
+
+def test_reaction_graph_runner_skips_partner_nudge_past_latency_budget() -> None:
+    client = SlowGenerationClient(
+        responses=[
+            _intent_json(should_react=True, reason="react"),
+            _utterance_json(utterance="", reason="silent"),
+            _utterance_json(utterance="좋아요, 더 들려주세요.", reason="respond"),
+        ]
+    )
+    runner = ReactionGraphRunner(
+        generation_client=client,
+        embedding_encoder=None,
+        reaction_mode="two_stage",
+        retry_budget=ReactionRetryBudget(latency_ms=50.0),
+    )
+
+    decision = runner.decide_reaction(
+        _input_with_history([("수진 씨, 오늘 테스트 어땠어요?", "none")])
+    )
+
+    assert client.calls == 2
+    assert decision.reaction == ""
+    assert decision.trace.partner_retry_count == 0
+    assert decision.trace.budget_exhausted_reason == "latency_budget:partner_nudge"
+
+
+def test_reaction_graph_runner_without_budget_runs_all_retries() -> None:
+    client = StubGenerationClient(
+        responses=[
+            _intent_json(should_react=True, reason="react"),
+            _utterance_json(utterance="오늘 카페 원두 향이 정말 좋네요", reason="echo"),
+        ]
+    )
+    runner = ReactionGraphRunner(
+        generation_client=client,
+        embedding_encoder=None,
+        reaction_mode="two_stage",
+        retry_budget=ReactionRetryBudget(),
+    )
+
+    decision = runner.decide_reaction(
+        _input_with_history([("오늘 카페 원두 향이 정말 좋네요", "")])
+    )
+
+    assert client.calls == 4
+    assert decision.trace.overlap_retry_count == 3
+    assert decision.trace.fallback_reason == "overlap_retry_exhausted"
+    assert decision.trace.budget_exhausted_reason == ""
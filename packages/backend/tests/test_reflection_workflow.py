@@ -2,9 +2,14 @@ import datetime
 from typing import cast
 
 import numpy as np
-from agents.memory.memory_manager import MemoryManager
+from agents.memory.memory_manager import MemoryManager, ReflectionWriteResult
 from agents.memory.memory_object import MemoryObject, NodeType
-from agents.reflection import Reflection, ReflectionGraphRunner
+from agents.reflection import (
+    Reflection,
+    ReflectionConfig,
+    ReflectionGraphRunner,
+    ReflectionRunSummary,
+)
 from llm.llm_gateway import InsightWithCitation, LlmGateway
 
 
@@ -15,7 +20,34 @@ class StubMemoryService:
         self.created_reflections: list[InsightWithCitation] = []
 
     def get_recent_memories(self, limit: int) -> list[MemoryObject]:
-        return self.recent_memories[:limit]
+        ordered = sorted(self.recent_memories, key=lambda m: m.id, reverse=True)
+        return ordered[:limit]
+
+    def get_memories_since(
+        self,
+        *,
+        after_memory_id: int | None,
+        limit: int | None = None,
+    ) -> list[MemoryObject]:
+        ordered = sorted(self.recent_memories, key=lambda m: m.id, reverse=True)
+        if after_memory_id is not None:
+            ordered = [m for m in ordered if m.id > after_memory_id]
+        return ordered if limit is None else ordered[:limit]
+
+    def get_top_reflections(
+        self,
+        *,
+        limit: int,
+        max_memory_id: int | None = None,
+    ) -> list[MemoryObject]:
+        reflections = [
+            m
+            for m in self.recent_memories
+            if m.node_type == NodeType.REFLECTION
+            and (max_memory_id is None or m.id <= max_memory_id)
+        ]
+        reflections.sort(key=lambda m: m.importance, reverse=True)
+        return reflections[:limit]
 
     def get_retrieval_memories(
         self,
@@ -39,6 +71,25 @@ class StubMemoryService:
         self.created_reflections.append(insight)
         return insight
 
+    def write_reflection(
+        self,
+        insight: InsightWithCitation,
+        *,
+        now: datetime.datetime,
+        context: object,
+        dedup_threshold: float,
+    ) -> ReflectionWriteResult:
+        _ = dedup_threshold
+        merged = insight in self.created_reflections
+        if not merged:
+            _ = self.create_reflection(insight, now=now, context=context)
+        return ReflectionWriteResult(
+            memory=_memory(memory_id=99, content=insight.context),
+            merged=merged,
+            similarity=1.0 if merged else 0.0,
+            saved_llm_calls=2 if merged else 0,
+        )
+
 
 class StubLlmService:
     def __init__(
@@ -52,6 +103,7 @@ class StubLlmService:
             insights_by_question
         )
         self.current_question_index: int = 0
+        self.question_inputs: list[list[int]] = []
 
     def generate_salient_high_level_questions(
         self,
@@ -60,7 +112,7 @@ class StubLlmService:
         memories: list[MemoryObject],
     ) -> list[str]:
         _ = agent_name
-        _ = memories
+        self.question_inputs.append([memory.id for memory in memories])
         return self.questions
 
     def generate_insights_with_citation_key(
@@ -71,21 +123,27 @@ class StubLlmService:
     ) -> list[InsightWithCitation]:
         _ = agent_name
         _ = memories
-        question = self.questions[self.current_question_index]
+        question = self.questions[self.current_question_index % len(self.questions)]
         self.current_question_index += 1
         return self.insights_by_question[question]
 
 
-def _memory(*, memory_id: int, content: str) -> MemoryObject:
+def _memory(
+    *,
+    memory_id: int,
+    content: str,
+    node_type: NodeType = NodeType.OBSERVATION,
+    importance: int = 5,
+) -> MemoryObject:
     now = datetime.datetime(2026, 3, 9, 10, 0, 0)
     return MemoryObject(
         id=memory_id,
-        node_type=NodeType.OBSERVATION,
-        citations=None,
+        node_type=node_type,
+        citations=None if node_type == NodeType.OBSERVATION else [],
         content=content,
-        created_at=now,
+        created_at=now + datetime.timedelta(minutes=memory_id),
         last_accessed_at=now,
-        importance=5,
+        importance=importance,
         embedding=np.zeros(2, dtype=np.float32),
     )
 
@@ -165,3 +223,99 @@ def test_reflection_graph_runner_processes_multiple_questions() -> None:
 
     assert memory_service.retrieval_queries == [question_one, question_two]
     assert memory_service.created_reflections == [first_insight, second_insight]
+
+
+def test_reflection_graph_runner_reflects_only_on_delta_since_watermark() -> None:
+    question = "What pattern matters most from the recent events?"
+    memory_service = StubMemoryService(
+        recent_memories=[
+            _memory(memory_id=0, content="Eddy practiced composition."),
+            _memory(
+                memory_id=1,
+                content="Eddy values focused practice.",
+                node_type=NodeType.REFLECTION,
+                importance=8,
+            ),
+            _memory(memory_id=2, content="Eddy skipped lunch to practice."),
+        ]
+    )
+    llm_service = StubLlmService(
+        questions=[question],
+        insights_by_question={question: []},
+    )
+    reflection_graph = ReflectionGraphRunner(
+        reflection=Reflection(ReflectionConfig(carry_over_reflection_limit=1)),
+        memory_manager=cast(MemoryManager, cast(object, memory_service)),
+        llm_gateway=cast(LlmGateway, cast(object, llm_service)),
+        agent_name="Eddy Lin",
+        identity_stable_set=["composer"],
+    )
+
+    reflection_graph.reflect(now=datetime.datetime(2026, 3, 9, 10, 30, 0))
+
+    assert llm_service.question_inputs == [[2, 1, 0]]
+    assert reflection_graph.watermark is not None
+    assert reflection_graph.watermark.memory_id == 2
+
+    memory_service.recent_memories.append(
+        _memory(memory_id=3, content="Eddy met a new classmate.")
+    )
+    reflection_graph.reflect(now=datetime.datetime(2026, 3, 9, 11, 30, 0))
+
+    assert llm_service.question_inputs[1] == [3, 1]
+    assert reflection_graph.watermark.memory_id == 3
+
+
+def test_reflection_graph_runner_skips_llm_when_delta_is_empty() -> None:
+    question = "What pattern matters most from the recent events?"
+    memory_service = StubMemoryService(
+        recent_memories=[_memory(memory_id=0, content="Eddy practiced composition.")]
+    )
+    llm_service = StubLlmService(
+        questions=[question],
+        insights_by_question={question: []},
+    )
+    reflection_graph = ReflectionGraphRunner(
+        reflection=Reflection(),
+        memory_manager=cast(MemoryManager, cast(object, memory_service)),
+        llm_gateway=cast(LlmGateway, cast(object, llm_service)),
+        agent_name="Eddy Lin",
+        identity_stable_set=["composer"],
+    )
+
+    reflection_graph.reflect(now=datetime.datetime(2026, 3, 9, 10, 30, 0))
+    reflection_graph.reflect(now=datetime.datetime(2026, 3, 9, 11, 30, 0))
+
+    assert llm_service.question_inputs == [[0]]
+
+
+def test_reflection_graph_runner_reports_merged_insights() -> None:
+    question_one = "What pattern matters most from the recent events?"
+    question_two = "What should Eddy remember for later?"
+    insight = InsightWithCitation(
+        context="Eddy keeps prioritizing composition practice over errands.",
+        citation_memory_ids=[0],
+    )
+    memory_service = StubMemoryService(
+        recent_memories=[_memory(memory_id=0, content="Eddy practiced composition.")]
+    )
+    llm_service = StubLlmService(
+        questions=[question_one, question_two],
+        insights_by_question={question_one: [insight], question_two: [insight]},
+    )
+    reflection_graph = ReflectionGraphRunner(
+        reflection=Reflection(),
+        memory_manager=cast(MemoryManager, cast(object, memory_service)),
+        llm_gateway=cast(LlmGateway, cast(object, llm_service)),
+        agent_name="Eddy Lin",
+        identity_stable_set=["composer"],
+    )
+
+    reflection_graph.reflect(now=datetime.datetime(2026, 3, 9, 10, 30, 0))
+
+    assert memory_service.created_reflections == [insight]
+    assert reflection_graph.last_run_summary == ReflectionRunSummary(
+        persisted_reflection_count=1,
+        merged_reflection_count=1,
+        saved_llm_call_count=2,
+    )
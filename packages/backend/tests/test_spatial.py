@@ -0,0 +1,204 @@
+import datetime
+import random
+from dataclasses import dataclass, field
+from typing import cast
+
+import pytest
+
+from agents.sim_agent import SimAgent
+from world.engine import (
+    SimulationEngine,
+    SimulationEngineConfig,
+    SimulationStepObservability,
+    SimulationStepResult,
+)
+from world.runtime import WorldRuntime
+from world.session import WorldConversationSession, build_turn_world_context
+from world.spatial import Position, SpatialHash, SpatialWorld
+
+START = datetime.datetime(2026, 3, 4, 9, 0, 0)
+
+
+def test_spatial_hash_within_matches_brute_force() -> None:
+    rng = random.Random(7)
+    grid = SpatialHash(cell_size=10.0)
+    positions = {
+        f"a{index}": Position(rng.uniform(-100, 100), rng.uniform(-100, 100))
+        for index in range(300)
+    }
+    for name, position in positions.items():
+        grid.place(name, position)
+    # 옮긴 에이전트도 새 칸에서 찾아야 한다.
+    positions["a0"] = Position(55.0, -12.5)
+    grid.place("a0", positions["a0"])
+
+    for radius in (3.0, 10.0, 25.0):
+        center = Position(rng.uniform(-100, 100), rng.uniform(-100, 100))
+        expected = sorted(
+            (center.distance_to(position), name)
+            for name, position in positions.items()
+            if center.distance_to(position) <= radius
+        )
+        assert grid.within(center, radius) == [name for _, name in expected]
+
+    expected_pairs = {
+        (first, second)
+        for first in positions
+        for second in positions
+        if first < second and positions[first].distance_to(positions[second]) <= 10.0
+    }
+    assert grid.pairs_within(10.0) == expected_pairs
+
+
+def test_spatial_world_detects_only_new_encounters() -> None:
+    world = SpatialWorld(perception_radius=5.0)
+    world.place("A", Position(0.0, 0.0))
+    world.place("B", Position(3.0, 0.0))
+    world.place("C", Position(20.0, 0.0))
+
+    assert world.detect_encounters() == [("A", "B")]
+    assert world.detect_encounters() == []
+
+    world.place("C", Position(4.0, 3.0))
+    assert world.detect_encounters() == [("A", "C"), ("B", "C")]
+    assert world.nearby_agents("C") == ["B", "A"]
+
+    world.place("C", Position(30.0, 0.0))
+    assert world.detect_encounters() == []
+    world.place("C", Position(2.0, 0.0))
+    assert world.detect_encounters() == [("A", "C"), ("B", "C")]
+
+
+def test_build_turn_world_context_uses_nearest_landmark_and_nearby_agents() -> None:
+    world = SpatialWorld(perception_radius=10.0)
+    world.place("Jiho", Position(38.0, 1.0))
+    world.place("Sujin", Position(40.0, 1.0))
+    world.place("Minseo", Position(41.0, 6.0))
+
+    context = build_turn_world_context(
+        speaker_name="Jiho", partner_name="Sujin", turn=1, spatial=world
+    )
+
+    assert context["location"] == "cafe entrance near Sujin"
+    assert context["nearby"] == "Minseo"
+
+
+@dataclass
+class ObservingBrain:
+    observations: list[str] = field(default_factory=list)
+
+    def queue_observation(
+        self,
+        *,
+        content: str,
+        now: datetime.datetime,
+        profile: object,
+        importance: int | None = None,
+    ) -> None:
+        _ = now
+        _ = profile
+        _ = importance
+        self.observations.append(content)
+
+
+@dataclass
+class ObservingAgent:
+    name: str
+    brain: ObservingBrain = field(default_factory=ObservingBrain)
+    profile: object = None
+
+
+@dataclass
+class SilentEngine:
+    config: SimulationEngineConfig = field(
+        default_factory=lambda: SimulationEngineConfig(
+            language="ko",
+            turn_time_step_seconds=45,
+            suppress_repeated_replies=False,
+            repetition_window=4,
+            fallback_on_empty_reply=False,
+        )
+    )
+
+    def step(
+        self,
+        *,
+        turn: int,
+        current_time: datetime.datetime,
+        speaker: SimAgent,
+        speaking_partner: SimAgent,
+    ) -> SimulationStepResult:
+        _ = turn
+        _ = speaking_partner
+        return SimulationStepResult(
+            now=current_time + datetime.timedelta(seconds=45),
+            speaker_name=speaker.name,
+            trace={},
+            reply="",
+            silent_reason="llm_declined",
+            parse_failure=False,
+            observability=SimulationStepObservability(
+                thought="",
+                model_thought="",
+                self_critique="",
+                decision_reason="",
+                action_summary="",
+                decision_process={},
+            ),
+        )
+
+
+def test_runtime_reports_encounters_between_conversations() -> None:
+    agents = [ObservingAgent(name=name) for name in ["A", "B", "C", "D"]]
+    sim_agents = cast(list[SimAgent], agents)
+    world = SpatialWorld(perception_radius=5.0)
+    world.layout_groups([["A", "B"], ["C", "D"]])
+    sessions = [
+        WorldConversationSession(agents=sim_agents[:2], dialogue_turn_window=None),
+        WorldConversationSession(agents=sim_agents[2:], dialogue_turn_window=None),
+    ]
+    runtime = WorldRuntime(
+        agents=sim_agents,
+        session=sessions[0],
+        engine=cast(SimulationEngine, cast(object, SilentEngine())),
+        current_time=START,
+        spatial=world,
+    )
+    _ = runtime.add_conversation(
+        session=sessions[1],
+        engine=cast(SimulationEngine, cast(object, SilentEngine())),
+    )
+
+    # 같은 대화 참가자끼리는 조우로 보지 않는다.
+    assert runtime.tick().encounters == []
+    assert runtime.agents_within("A") == ["B"]
+
+    landmark = world.landmark_position(0)
+    assert runtime.move_agent("C", Position(landmark.x, landmark.y + 1.0)) == [
+        "A",
+        "B",
+    ]
+    result = runtime.tick()
+
+    assert result.encounters == [("A", "C"), ("B", "C")]
+    assert agents[0].brain.observations == ["근처에서 C를 마주쳤다."]
+    assert agents[2].brain.observations == [
+        "근처에서 A를 마주쳤다.",
+        "근처에서 B를 마주쳤다.",
+    ]
+    state = runtime.state()
+    assert state.encounters == 2
+    assert state.agent_positions["C"] == (landmark.x, landmark.y + 1.0)
+
+
+def test_runtime_spatial_queries_require_spatial_world() -> None:
+    agents = cast(list[SimAgent], [ObservingAgent(name="A"), ObservingAgent(name="B")])
+    runtime = WorldRuntime(
+        agents=agents,
+        session=WorldConversationSession(agents=agents, dialogue_turn_window=None),
+        engine=cast(SimulationEngine, cast(object, SilentEngine())),
+        current_time=START,
+    )
+
+    with pytest.raises(ValueError):
+        _ = runtime.agents_within("A")
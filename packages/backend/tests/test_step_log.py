@@ -0,0 +1,259 @@
+import datetime
+import gzip
+import json
+import zlib
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import cast
+
+import numpy as np
+import pytest
+
+from agents.sim_agent import SimAgent
+from settings import EMBEDDING_DIMENSION
+from world.engine import (
+    SimulationEngine,
+    SimulationEngineConfig,
+    SimulationStepObservability,
+    SimulationStepResult,
+)
+from world.runtime import (
+    WorldRuntime,
+    WorldRuntimeConfig,
+    build_world_runtime,
+    default_persona_dir,
+)
+from world.session import WorldConversationSession
+from world.step_log import StepLog
+
+START = datetime.datetime(2026, 3, 4, 9, 0, 0)
+
+
+def _records(turns: range) -> list[dict[str, object]]:
+    return [
+        {"turn": turn, "reply": f"발화 {turn}", "trace": {"tokens": [turn] * 50}}
+        for turn in turns
+    ]
+
+
+def test_step_log_rotates_segments_and_reads_any_turn(tmp_path: Path) -> None:
+    log = StepLog(tmp_path, segment_max_bytes=200)
+    for start in range(1, 41, 4):
+        log.append(_records(range(start, start + 4)))
+
+    stats = log.stats
+    assert stats.records == 40
+    assert stats.last_turn == 40
+    assert stats.segments > 1
+    assert log.read(1) == _records(range(1, 2))[0]
+    assert log.read(27) == _records(range(27, 28))[0]
+    assert log.read(41) is None
+    assert [record["turn"] for record in log.iter_records(start_turn=35)] == list(
+        range(35, 41)
+    )
+
+    with pytest.raises(ValueError):
+        log.append(_records(range(40, 41)))
+
+    # 다시 열면 마지막 segment와 index 끝에서 이어 쓴다.
+    reopened = StepLog(tmp_path, segment_max_bytes=200)
+    reopened.append(_records(range(41, 43)))
+    assert reopened.stats.records == 42
+    assert reopened.read(42) == _records(range(42, 43))[0]
+    assert sum(1 for _ in reopened.iter_records()) == 42
+
+
+def test_step_log_truncates_inside_a_member_and_keeps_earlier_turns(
+    tmp_path: Path,
+) -> None:
+    log = StepLog(tmp_path)
+    log.append(_records(range(1, 4)))
+    log.append(_records(range(4, 6)))
+
+    assert log.truncate_after(2) == 3
+
+    assert log.stats.last_turn == 2
+    assert log.read(3) is None
+    log.append(_records(range(3, 5)))
+    assert [record["turn"] for record in log.iter_records()] == [1, 2, 3, 4]
+    assert StepLog(tmp_path).read(4) == _records(range(4, 5))[0]
+
+
+def test_step_log_drops_a_torn_append_when_reopened(tmp_path: Path) -> None:
+    log = StepLog(tmp_path)
+    log.append(_records(range(1, 3)))
+    torn_member = gzip.compress(b'{"turn": 3}\n')
+    with log.segment_path(0).open("ab") as segment_file:
+        _ = segment_file.write(torn_member[: len(torn_member) // 2])
+    with (tmp_path / "steps.idx").open("ab") as index_file:
+        _ = index_file.write(b"\x03\x00\x00")
+
+    reopened = StepLog(tmp_path)
+    reopened.append(_records(range(3, 5)))
+
+    assert reopened.stats.records == 4
+    assert reopened.read(2) == _records(range(2, 3))[0]
+    assert reopened.read(4) == _records(range(4, 5))[0]
+    assert [record["turn"] for record in reopened.iter_records()] == [1, 2, 3, 4]
+
+
+@dataclass
+class ReplyingAgent:
+    name: str
+    profile: object = None
+
+
+@dataclass
+class CommittingEngine:
+    """발화를 세션 history에 확정하고 trace에 turn을 남긴다."""
+
+    session: WorldConversationSession
+    config: SimulationEngineConfig = field(
+        default_factory=lambda: SimulationEngineConfig(
+            language="ko",
+            turn_time_step_seconds=45,
+            suppress_repeated_replies=False,
+            repetition_window=2,
+            fallback_on_empty_reply=False,
+        )
+    )
+
+    def step(
+        self,
+        *,
+        turn: int,
+        current_time: datetime.datetime,
+        speaker: SimAgent,
+        speaking_partner: SimAgent,
+    ) -> SimulationStepResult:
+        _ = speaking_partner
+        reply = f"{speaker.name} {turn}"
+        self.session.commit_speaker_reply(
+            speaker=speaker, incoming_partner_utterance=None, reply=reply
+        )
+        return SimulationStepResult(
+            now=current_time + datetime.timedelta(seconds=45),
+            speaker_name=speaker.name,
+            trace={"turn": turn, "parse_success": True},
+            reply=reply,
+            silent_reason="",
+            parse_failure=False,
+            observability=SimulationStepObservability(
+                thought="생각",
+                model_thought="",
+                self_critique="",
+                decision_reason="",
+                action_summary="talk",
+                decision_process={},
+            ),
+        )
+
+
+def test_runtime_keeps_bounded_history_and_logs_every_step(tmp_path: Path) -> None:
+    agents = cast(
+        list[SimAgent],
+        [ReplyingAgent(name=name) for name in ["A", "B", "C", "D"]],
+    )
+    sessions = [
+        WorldConversationSession(
+            agents=agents[:2], dialogue_turn_window=None, history_window=2
+        ),
+        WorldConversationSession(
+            agents=agents[2:], dialogue_turn_window=None, history_window=2
+        ),
+    ]
+    runtime = WorldRuntime(
+        agents=agents,
+        session=sessions[0],
+        engine=cast(SimulationEngine, cast(object, CommittingEngine(sessions[0]))),
+        current_time=START,
+    )
+    _ = runtime.add_conversation(
+        session=sessions[1],
+        engine=cast(SimulationEngine, cast(object, CommittingEngine(sessions[1]))),
+    )
+    runtime.attach_step_log(StepLog(tmp_path / "steps"))
+
+    for _ in range(6):
+        _ = runtime.tick()
+    _ = runtime.step("c1")
+
+    assert all(len(session.history) == 2 for session in sessions)
+    state = runtime.state()
+    assert state.history_size == 13
+    assert state.step_log is not None
+    assert state.step_log.records == 13
+    record = runtime.logged_step(12)
+    assert record is not None
+    assert record["conversation_id"] == "c1"
+    assert record["conversation_turn"] == 6
+    assert record["reply"] == "D 6"
+    assert record["trace"] == {"turn": 6, "parse_success": True}
+    assert cast(dict[str, object], record["observability"])["thought"] == "생각"
+    logged = list(cast(StepLog, runtime.step_log).iter_records())
+    assert [entry["turn"] for entry in logged] == list(range(1, 14))
+
+    # 다른 실행의 로그(더 앞선 turn)는 붙일 수 없다.
+    fresh = WorldRuntime(
+        agents=agents[:2],
+        session=WorldConversationSession(agents=agents[:2], dialogue_turn_window=None),
+        engine=cast(SimulationEngine, cast(object, CommittingEngine(sessions[0]))),
+        current_time=START,
+    )
+    with pytest.raises(ValueError):
+        fresh.attach_step_log(StepLog(tmp_path / "steps"))
+
+
+class StubProviderClient:
+    """모든 파서가 읽을 수 있는 JSON과 텍스트 해시 임베딩을 돌려준다."""
+
+    def generate(self, *, prompt: str, **_: object) -> str:
+        return json.dumps(
+            {
+                "should_react": True,
+                "reason": "stub",
+                "utterance": f"이야기 {zlib.crc32(prompt.encode()) % 97}",
+                "end_dialogue": False,
+                "importance": 3,
+                "questions": [],
+                "insights": [],
+            },
+            ensure_ascii=False,
+        )
+
+    def embed(self, *, input: str, **_: object) -> list[float]:
+        vector = np.zeros(EMBEDDING_DIMENSION, dtype=np.float32)
+        vector[zlib.crc32(input.encode()) % EMBEDDING_DIMENSION] = 1.0
+        return vector.tolist()
+
+
+def test_restart_without_checkpoint_continues_the_step_log(tmp_path: Path) -> None:
+    def build() -> WorldRuntime:
+        return build_world_runtime(
+            config=WorldRuntimeConfig(
+                agent_persona_names=["Jiho", "Sujin"],
+                base_url=None,
+                api_key=None,
+                llm_model="stub",
+                embedding_model="stub",
+                timeout_seconds=1.0,
+                persona_dir=default_persona_dir(),
+                suppress_repeated_replies=False,
+                step_log_dir=str(tmp_path / "steps"),
+            ),
+            llm_client=StubProviderClient(),  # pyright: ignore[reportArgumentType]
+            now=START,
+        )
+
+    first = build()
+    for _ in range(3):
+        _ = first.tick()
+    first.close()
+
+    restarted = build()
+    assert restarted.turn == 3
+    _ = restarted.tick()
+
+    log = cast(StepLog, restarted.step_log)
+    assert [entry["turn"] for entry in log.iter_records()] == [1, 2, 3, 4]
+    restarted.close()
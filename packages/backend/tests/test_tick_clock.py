@@ -0,0 +1,117 @@
+import pytest
+
+from world.tick_clock import TickDeadlineClock
+
+
+def _run_tick(clock: TickDeadlineClock, start: float, duration: float) -> float:
+    clock.begin_tick(start)
+    clock.finish_tick(start + duration)
+    return start + duration
+
+
+def test_interval_mode_sleeps_full_interval_after_each_tick() -> None:
+    clock = TickDeadlineClock(interval_seconds=1.0)
+    clock.start(0.0)
+
+    finished = _run_tick(clock, 0.0, 0.3)
+
+    assert clock.delay_until_next(finished) == pytest.approx(1.0)
+    assert clock.stats.overruns == 0
+    assert clock.stats.keeping_up
+
+
+def test_deadline_mode_keeps_fixed_rate_when_ticks_fit() -> None:
+    clock = TickDeadlineClock(interval_seconds=1.0, mode="deadline")
+    clock.start(0.0)
+
+    finished = _run_tick(clock, 0.0, 0.3)
+    assert clock.delay_until_next(finished) == pytest.approx(0.7)
+    finished = _run_tick(clock, 1.0, 0.6)
+    assert clock.delay_until_next(finished) == pytest.approx(0.4)
+
+    assert clock.stats.ticks == 2
+    assert clock.stats.overruns == 0
+    assert clock.stats.lag_ms == 0.0
+
+
+def test_deadline_skip_policy_drops_missed_deadlines() -> None:
+    clock = TickDeadlineClock(interval_seconds=1.0, mode="deadline")
+    clock.start(0.0)
+
+    finished = _run_tick(clock, 0.0, 2.5)
+
+    # 1.0, 2.0은 건너뛰고 3.0에 다음 tick을 시작한다.
+    assert clock.delay_until_next(finished) == pytest.approx(0.5)
+    assert clock.stats.overruns == 1
+    assert clock.stats.skipped_ticks == 2
+
+
+def test_deadline_catch_up_policy_runs_missed_ticks_back_to_back() -> None:
+    clock = TickDeadlineClock(
+        interval_seconds=1.0, mode="deadline", overrun_policy="catch_up"
+    )
+    clock.start(0.0)
+
+    finished = _run_tick(clock, 0.0, 2.5)
+    assert clock.delay_until_next(finished) == 0.0
+    finished = _run_tick(clock, finished, 0.1)
+    assert clock.stats.lag_ms == pytest.approx(1500.0)
+    assert clock.delay_until_next(finished) == 0.0
+    finished = _run_tick(clock, finished, 0.1)
+
+    assert clock.delay_until_next(finished) == pytest.approx(0.3)
+    assert clock.stats.skipped_ticks == 0
+    assert clock.stats.max_lag_ms == pytest.approx(1500.0)
+
+
+def test_deadline_stretch_policy_reanchors_grid_at_late_tick() -> None:
+    clock = TickDeadlineClock(
+        interval_seconds=1.0, mode="deadline", overrun_policy="stretch"
+    )
+    clock.start(0.0)
+
+    finished = _run_tick(clock, 0.0, 2.5)
+    assert clock.delay_until_next(finished) == 0.0
+    finished = _run_tick(clock, finished, 0.2)
+
+    assert clock.delay_until_next(finished) == pytest.approx(0.8)
+    assert clock.stats.overruns == 1
+    assert clock.stats.skipped_ticks == 0
+
+
+def test_tick_duration_histogram_counts_each_bucket() -> None:
+    clock = TickDeadlineClock(interval_seconds=1.0, mode="deadline")
+    clock.start(0.0)
+
+    _ = _run_tick(clock, 0.0, 0.005)
+    _ = _run_tick(clock, 1.0, 0.2)
+    _ = _run_tick(clock, 2.0, 20.0)
+
+    histogram = clock.stats.duration_histogram
+    assert histogram["le_10ms"] == 1
+    assert histogram["le_250ms"] == 1
+    assert histogram["le_inf"] == 1
+    assert sum(histogram.values()) == 3
+    assert clock.stats.max_duration_ms == pytest.approx(20000.0)
+
+
+def test_tick_clock_rejects_non_positive_interval() -> None:
+    with pytest.raises(ValueError):
+        _ = TickDeadlineClock(interval_seconds=0)
+
+
+def test_deadline_mode_keeps_up_despite_sleep_wakeup_jitter() -> None:
+    clock = TickDeadlineClock(interval_seconds=0.05, mode="deadline")
+    clock.start(0.0)
+
+    # asyncio.sleep은 마감 시각보다 수 마이크로초~수백 마이크로초 늦게 깨어난다.
+    for index, jitter in enumerate([0.0, 0.00002, 0.0007, 0.000005]):
+        _ = _run_tick(clock, index * 0.05 + jitter, 0.005)
+        assert clock.stats.lag_ms > 0.0 or jitter == 0.0
+        assert clock.stats.keeping_up
+
+    assert clock.stats.overruns == 0
+    _ = _run_tick(clock, 0.2, 0.08)
+    assert not clock.stats.keeping_up
+    _ = _run_tick(clock, 0.3 + 0.02, 0.005)
+    assert not clock.stats.keeping_up
@@ -1,13 +1,22 @@
 import datetime
-from dataclasses import dataclass
+from dataclasses import dataclass, replace
 from typing import Literal, cast
 
-from agents.brain import ActionLoopInput, ActionLoopResult
+import numpy as np
+
+from agents.brain import (
+    ActionLoopInput,
+    ActionLoopResult,
+    BrainSpeculation,
+    SpeculationOutcome,
+)
 from agents.decision_diagnostics import ActionDiagnostics
+from agents.memory.memory_manager import ObservationContext
 from agents.reaction import ReactionDecisionTrace
 from agents.sim_agent import SimAgent
 from world.engine import SimulationEngine, SimulationEngineConfig
 from world.session import WorldConversationSession
+from world.speculation import SpeculativeTurnPrefetcher
 
 
 @dataclass
@@ -32,6 +41,44 @@ class DummyBrain:
         self.queued.append(content)
 
 
+@dataclass
+class SpeculatingBrain(DummyBrain):
+    speculated_inputs: list[ActionLoopInput] | None = None
+    received_speculation: BrainSpeculation | None = None
+
+    def speculate(self, input: ActionLoopInput) -> BrainSpeculation:
+        self.speculated_inputs = [*(self.speculated_inputs or []), input]
+        return BrainSpeculation(
+            observation_content="observation",
+            observation_context=ObservationContext(
+                agent_name="Sujin", identity_stable_set=[]
+            ),
+            observation_embedding=np.zeros(2, dtype=np.float32),
+            importance=4,
+            retrieval_query="query",
+            retrieval_query_embedding=np.zeros(2, dtype=np.float32),
+            observation_ms=8.0,
+            retrieval_ms=4.0,
+        )
+
+    def action_loop(
+        self,
+        input: ActionLoopInput,
+        *,
+        speculation: BrainSpeculation | None = None,
+    ) -> ActionLoopResult:
+        self.received_speculation = speculation
+        result = super().action_loop(input)
+        if speculation is None:
+            return result
+        return replace(
+            result,
+            speculation=SpeculationOutcome(
+                observation_hit=True, retrieval_hit=True, reused_ms=12.0
+            ),
+        )
+
+
 @dataclass
 class DummyAgent:
     name: str
@@ -325,9 +372,10 @@ def test_step_finishes_session_when_action_marks_dialogue_end() -> None:
 
     assert result.reply == "그럼 난 이만 가볼게."
     assert session.is_active is False
-    assert session.dialogue_context_for(
-        speaker=cast(SimAgent, cast(object, speaker))
-    ) == []
+    assert (
+        session.dialogue_context_for(speaker=cast(SimAgent, cast(object, speaker)))
+        == []
+    )
 
     follow_up = engine.step(
         turn=2,
@@ -339,3 +387,76 @@ def test_step_finishes_session_when_action_marks_dialogue_end() -> None:
     assert follow_up.reply == ""
     assert follow_up.silent_reason == "dialogue_session_ended"
     assert partner.brain.last_input is None
+
+
+def test_step_prefetches_next_speaker_turn_and_hands_it_over() -> None:
+    brains = [
+        SpeculatingBrain(
+            next_result=ActionLoopResult(
+                current_time=datetime.datetime(2026, 3, 3, 12, 0, 0),
+                talk=talk,
+                utterance=talk,
+                reaction_trace=ReactionDecisionTrace(
+                    raw_response="",
+                    parse_success=True,
+                ),
+            ),
+            queued=[],
+        )
+        for talk in ["안녕하세요", "반가워요"]
+    ]
+    speaker = DummyAgent(name="Jiho", profile=object(), brain=brains[0])
+    partner = DummyAgent(name="Sujin", profile=object(), brain=brains[1])
+    agents = cast(list[SimAgent], cast(object, [speaker, partner]))
+    session = WorldConversationSession(agents=agents, dialogue_turn_window=None)
+    engine = SimulationEngine(
+        session=session,
+        config=replace(_engine_config(), speculative_prefetch=True),
+    )
+
+    first = engine.step(
+        turn=1,
+        current_time=datetime.datetime(2026, 3, 3, 12, 0, 0),
+        speaker=session.next_speaker(),
+        speaking_partner=agents[1],
+    )
+    second = engine.step(
+        turn=2,
+        current_time=first.now,
+        speaker=session.next_speaker(),
+        speaking_partner=agents[0],
+    )
+    engine.close()
+
+    assert first.speculation is not None
+    assert first.speculation.scheduled == 1
+    assert first.speculation.consumed == 0
+    assert partner.brain.speculated_inputs is not None
+    assert partner.brain.last_input is not None
+    predicted = partner.brain.speculated_inputs[0]
+    actual = partner.brain.last_input
+    assert predicted.current_time == actual.current_time
+    assert predicted.dialogue_history == [("안녕하세요", "")]
+    assert predicted.dialogue_arc == actual.dialogue_arc
+    assert predicted.world_context == actual.world_context
+    assert predicted.observed_events == actual.observed_events
+    assert partner.brain.received_speculation is not None
+    assert second.speculation is not None
+    assert second.speculation.consumed == 1
+    assert second.speculation.observation_hits == 1
+    assert second.speculation.retrieval_hits == 1
+    assert 0.0 < second.speculation.saved_ms <= 12.0
+    assert second.speculation.scheduled == 1
+    assert first.speculation.merge(second.speculation).hit_rate == 0.5
+
+
+def test_prefetcher_counts_a_provider_error_as_a_failed_speculation() -> None:
+    def compute() -> BrainSpeculation:
+        raise TimeoutError("embedding timed out")
+
+    prefetcher = SpeculativeTurnPrefetcher()
+    prefetcher.schedule(agent_name="Jiho", turn=2, compute=compute)
+
+    assert prefetcher.take(agent_name="Jiho", turn=2) is None
+    assert prefetcher.drain_counters() == (0, 1)
+    prefetcher.shutdown()
@@ -1,15 +1,19 @@
 import asyncio
 import datetime
-from dataclasses import dataclass
+import threading
+import time
+from dataclasses import dataclass, field
 from typing import cast
 
+from agents.reaction import ReactionDecisionTrace
 from agents.sim_agent import SimAgent
+from utils.instrumentation import NodeTiming, ProfileSnapshot
 from world.engine import (
     SimulationEngine,
     SimulationStepObservability,
     SimulationStepResult,
 )
-from world.runtime import WorldRuntime
+from world.runtime import WorldRuntime, group_conversation_agents
 from world.session import WorldConversationSession
 
 
@@ -37,6 +41,57 @@ class DummyEngine:
         return self.result
 
 
+@dataclass
+class ActiveAgentTracker:
+    active: set[str] = field(default_factory=set)
+    max_active: int = 0
+    overlaps: int = 0
+    lock: threading.Lock = field(default_factory=threading.Lock)
+
+
+@dataclass
+class TrackingEngine:
+    participants: list[str]
+    tracker: ActiveAgentTracker
+
+    def step(
+        self,
+        *,
+        turn: int,
+        current_time: datetime.datetime,
+        speaker: SimAgent,
+        speaking_partner: SimAgent,
+    ) -> SimulationStepResult:
+        _ = turn
+        _ = speaking_partner
+        with self.tracker.lock:
+            if self.tracker.active & set(self.participants):
+                self.tracker.overlaps += 1
+            self.tracker.active |= set(self.participants)
+            self.tracker.max_active = max(
+                self.tracker.max_active, len(self.tracker.active)
+            )
+        time.sleep(0.02)
+        with self.tracker.lock:
+            self.tracker.active -= set(self.participants)
+        return SimulationStepResult(
+            now=current_time + datetime.timedelta(seconds=45),
+            speaker_name=speaker.name,
+            trace={},
+            reply="안녕",
+            silent_reason="",
+            parse_failure=False,
+            observability=SimulationStepObservability(
+                thought="",
+                model_thought="",
+                self_critique="",
+                decision_reason="",
+                action_summary="",
+                decision_process={},
+            ),
+        )
+
+
 def test_world_runtime_updates_counters_on_step() -> None:
     agents = cast(list[SimAgent], [DummyAgent(name="Jiho"), DummyAgent(name="Sujin")])
     session = WorldConversationSession(agents=agents, dialogue_turn_window=None)
@@ -76,6 +131,115 @@ def test_world_runtime_updates_counters_on_step() -> None:
     assert runtime.turn == 1
     assert runtime.parse_failures == 1
     assert runtime.silent_turns == 1
+    assert runtime.conversation_metrics()["c0"].silent_rate == 1.0
+    assert runtime.agent_metrics()["Jiho"].parse_failure_rate == 1.0
+
+
+def test_world_runtime_aggregates_step_timings_per_agent() -> None:
+    agents = cast(list[SimAgent], [DummyAgent(name="Jiho"), DummyAgent(name="Sujin")])
+    session = WorldConversationSession(agents=agents, dialogue_turn_window=None)
+    timings = ProfileSnapshot(
+        steps=1,
+        wall_ms=12.0,
+        llm_calls=2,
+        prompt_chars=300,
+        response_chars=40,
+        retries=1,
+        nodes={"reaction.generate_utterance": NodeTiming(calls=2, retries=1)},
+    )
+    runtime = WorldRuntime(
+        agents=agents,
+        session=session,
+        engine=cast(
+            SimulationEngine,
+            cast(
+                object,
+                DummyEngine(
+                    result=SimulationStepResult(
+                        now=datetime.datetime(2026, 3, 4, 10, 0, 0),
+                        speaker_name="Jiho",
+                        trace={"parse_success": True},
+                        reply="안녕",
+                        silent_reason="",
+                        parse_failure=False,
+                        observability=SimulationStepObservability(
+                            thought="",
+                            model_thought="",
+                            self_critique="",
+                            decision_reason="",
+                            action_summary="",
+                            decision_process={},
+                        ),
+                        timings=timings,
+                    )
+                ),
+            ),
+        ),
+        current_time=datetime.datetime(2026, 3, 4, 9, 0, 0),
+    )
+
+    runtime.step()
+    runtime.step()
+
+    jiho = runtime.agent_timings["Jiho"]
+    assert jiho.steps == 2
+    assert jiho.llm_calls == 4
+    assert jiho.wall_ms == 24.0
+    assert jiho.nodes["reaction.generate_utterance"].retries == 2
+    assert "Sujin" not in runtime.agent_timings
+
+
+def test_world_runtime_counts_reaction_modes() -> None:
+    agents = cast(list[SimAgent], [DummyAgent(name="Jiho"), DummyAgent(name="Sujin")])
+    session = WorldConversationSession(agents=agents, dialogue_turn_window=None)
+    runtime = WorldRuntime(
+        agents=agents,
+        session=session,
+        engine=cast(
+            SimulationEngine,
+            cast(
+                object,
+                DummyEngine(
+                    result=SimulationStepResult(
+                        now=datetime.datetime(2026, 3, 4, 10, 0, 0),
+                        speaker_name="Jiho",
+                        trace={"parse_success": True},
+                        reply="안녕",
+                        silent_reason="",
+                        parse_failure=False,
+                        observability=SimulationStepObservability(
+                            thought="",
+                            model_thought="",
+                            self_critique="",
+                            decision_reason="",
+                            action_summary="",
+                            decision_process={},
+                        ),
+                        reaction_trace=ReactionDecisionTrace(
+                            raw_response="{}",
+                            parse_success=True,
+                            reaction_mode="fused_fallback",
+                            mode_fallback_reason="fused_parse_failure",
+                            generate_calls=3,
+                            generation_latency_ms=30.0,
+                        ),
+                    )
+                ),
+            ),
+        ),
+        current_time=datetime.datetime(2026, 3, 4, 9, 0, 0),
+    )
+
+    runtime.step()
+    runtime.step()
+
+    fused = runtime.state().reaction_modes["fused"]
+    assert fused.turns == 2
+    assert fused.fallback_rate == 1.0
+    assert fused.parse_failure_rate == 1.0
+    assert fused.mean_generate_calls == 3.0
+    assert fused.mean_latency_ms == 30.0
+    assert "two_stage" not in runtime.state().reaction_modes
 
 
 def test_world_runtime_tick_uses_single_step_clock() -> None:
@@ -113,7 +277,8 @@ def test_world_runtime_tick_uses_single_step_clock() -> None:
 
     result = runtime.tick()
 
-    assert result.reply == "안녕"
+    assert [step.reply for step in result.steps] == ["안녕"]
+    assert result.now == datetime.datetime(2026, 3, 4, 10, 15, 0)
     assert runtime.turn == 1
     assert runtime.current_time == datetime.datetime(2026, 3, 4, 10, 15, 0)
     assert runtime.state().scheduler_running is False
@@ -168,3 +333,163 @@ async def _assert_world_runtime_scheduler_starts_and_stops() -> None:
 
     assert stopped is True
     assert runtime.scheduler_running is False
+
+
+def test_world_runtime_steps_conversations_concurrently_with_agent_locks() -> None:
+    agents = cast(
+        list[SimAgent], [DummyAgent(name=name) for name in ["A", "B", "C", "D", "E"]]
+    )
+    tracker = ActiveAgentTracker()
+    groups = [[agents[0], agents[1]], [agents[2], agents[3]], [agents[0], agents[4]]]
+    sessions = [
+        WorldConversationSession(agents=group, dialogue_turn_window=None)
+        for group in groups
+    ]
+    engines = [
+        cast(
+            SimulationEngine,
+            cast(
+                object,
+                TrackingEngine(
+                    participants=[agent.name for agent in group], tracker=tracker
+                ),
+            ),
+        )
+        for group in groups
+    ]
+    runtime = WorldRuntime(
+        agents=agents,
+        session=sessions[0],
+        engine=engines[0],
+        current_time=datetime.datetime(2026, 3, 4, 9, 0, 0),
+        step_workers=3,
+    )
+    for session, engine in zip(sessions[1:], engines[1:], strict=True):
+        _ = runtime.add_conversation(session=session, engine=engine)
+
+    results = [runtime.tick() for _ in range(3)]
+
+    # c0과 c2는 A를 공유하므로 직렬화되고, c1은 그 사이 동시에 실행된다.
+    assert tracker.overlaps == 0
+    assert tracker.max_active == 4
+    assert [len(result.steps) for result in results] == [3, 3, 3]
+    assert runtime.turn == 9
+    assert runtime.conversation("c2").turn == 3
+    assert runtime.current_time == datetime.datetime(2026, 3, 4, 9, 2, 15)
+    assert runtime.state().conversations == 3
+    assert runtime.state().turns_per_second > 0
+
+
+def test_group_conversation_agents_merges_leftover_agent() -> None:
+    agents = cast(list[SimAgent], [DummyAgent(name=str(index)) for index in range(5)])
+
+    groups = group_conversation_agents(agents, 2)
+
+    assert [[agent.name for agent in group] for group in groups] == [
+        ["0", "1"],
+        ["2", "3", "4"],
+    ]
+
+
+@dataclass
+class RecordingBrain:
+    observations: list[str] = field(default_factory=list)
+
+    def queue_observation(
+        self,
+        *,
+        content: str,
+        now: datetime.datetime,
+        profile: object,
+    ) -> None:
+        _ = now
+        _ = profile
+        self.observations.append(content)
+
+
+@dataclass
+class ObservingAgent:
+    name: str
+    brain: RecordingBrain = field(default_factory=RecordingBrain)
+    profile: object = None
+
+
+def test_world_broadcast_scope_delivers_replies_outside_the_conversation() -> None:
+    agents = [ObservingAgent(name=name) for name in ["A", "B", "C"]]
+    sim_agents = cast(list[SimAgent], agents)
+    session = WorldConversationSession(agents=sim_agents[:2], dialogue_turn_window=None)
+    runtime = WorldRuntime(
+        agents=sim_agents,
+        session=session,
+        engine=cast(
+            SimulationEngine,
+            cast(
+                object,
+                TrackingEngine(participants=["A", "B"], tracker=ActiveAgentTracker()),
+            ),
+        ),
+        current_time=datetime.datetime(2026, 3, 4, 9, 0, 0),
+        broadcast_scope="world",
+    )
+
+    session.broadcast_reply(
+        speaker=sim_agents[0],
+        reply="좋은 아침이에요",
+        now=datetime.datetime(2026, 3, 4, 9, 0, 45),
+        language="ko",
+    )
+    result = runtime.tick()
+
+    assert [reply.audience for reply in result.replies] == [("A", "B")]
+    assert agents[2].brain.observations == ["A가 이렇게 말했다: 좋은 아침이에요"]
+    assert len(agents[1].brain.observations) == 1
+
+
+@dataclass
+class TieredBrain:
+    cognition_tier: str = "full"
+
+    def set_cognition_tier(self, tier: str) -> None:
+        self.cognition_tier = tier
+
+
+@dataclass
+class TieredAgent:
+    name: str
+    brain: TieredBrain = field(default_factory=TieredBrain)
+
+
+def test_world_runtime_promotes_focused_agents_and_demotes_the_rest() -> None:
+    agents = [TieredAgent(name=name) for name in ["A", "B", "C"]]
+    sim_agents = cast(list[SimAgent], agents)
+    runtime = WorldRuntime(
+        agents=sim_agents,
+        session=WorldConversationSession(
+            agents=sim_agents[:2], dialogue_turn_window=None
+        ),
+        engine=cast(
+            SimulationEngine,
+            cast(
+                object,
+                TrackingEngine(participants=["A", "B"], tracker=ActiveAgentTracker()),
+            ),
+        ),
+        current_time=datetime.datetime(2026, 3, 4, 9, 0, 0),
+    )
+    for agent in agents:
+        runtime.set_cognition_tier(agent.name, "background")
+    runtime.set_cognition_tier("C", "reduced")
+
+    promoted = runtime.set_focus(["A", "C"])
+    moved = runtime.set_focus(["B"])
+
+    assert promoted == ["A", "C"]
+    assert moved == ["A", "B", "C"]
+    assert [agent.brain.cognition_tier for agent in agents] == [
+        "background",
+        "full",
+        "reduced",
+    ]
+    state = runtime.state()
+    assert state.focused_agents == ["B"]
+    assert state.cognition_tiers == {"A": "background", "C": "reduced"}
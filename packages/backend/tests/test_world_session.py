@@ -259,3 +259,31 @@ def test_broadcast_reply_enqueues_observations_and_incoming_queue() -> None:
     assert speaker.brain.queued == ["나는 이렇게 말했다: 안녕하세요"]
     assert observer.brain.queued == ["Jiho가 이렇게 말했다: 안녕하세요"]
     assert session.incoming_utterances_by_agent["Sujin"] == ["안녕하세요"]
+
+
+def test_history_window_bounds_session_and_dialogue_history() -> None:
+    agents = cast(list[SimAgent], [DummyAgent(name="Jiho"), DummyAgent(name="Sujin")])
+    jiho, sujin = agents
+    session = WorldConversationSession(
+        agents=agents, dialogue_turn_window=None, history_window=2
+    )
+
+    for index in range(5):
+        session.incoming_utterances_by_agent["Jiho"].append(f"질문{index}")
+        incoming = session.consume_incoming_partner_utterance(speaker=jiho)
+        session.commit_speaker_reply(
+            speaker=jiho, incoming_partner_utterance=incoming, reply=f"답{index}"
+        )
+        session.commit_speaker_reply(
+            speaker=sujin, incoming_partner_utterance=None, reply=f"말{index}"
+        )
+
+    assert session.history == [("Jiho", "답4"), ("Sujin", "말4")]
+    assert session.committed_replies == 10
+    assert session.dialogue_context_for(speaker=jiho) == [
+        ("질문3", "답3"),
+        ("질문4", "답4"),
+    ]
+    assert session.preview_dialogue_context_for(
+        speaker=jiho, incoming_partner_utterance="질문5"
+    ) == [("질문4", "답4"), ("질문5", "")]
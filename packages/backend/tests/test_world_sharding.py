@@ -0,0 +1,137 @@
+import datetime
+import json
+import zlib
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from settings import EMBEDDING_DIMENSION
+from world.runtime import WorldRuntimeConfig, default_persona_dir
+from world.sharding import ShardedWorldRuntime, partition_persona_names
+
+
+class ChattyProviderClient:
+    """항상 반응하는 JSON과 텍스트 해시 임베딩을 돌려준다(shard 프로세스 안에서 만든다)."""
+
+    def __init__(self) -> None:
+        self.generate_calls: int = 0
+
+    def generate(self, *, prompt: str, **_: object) -> str:
+        self.generate_calls += 1
+        return json.dumps(
+            {
+                "should_react": True,
+                "reason": "stub",
+                "utterance": f"이야기 {self.generate_calls}",
+                "end_dialogue": False,
+                "importance": 1 + zlib.crc32(prompt.encode()) % 9,
+                "questions": [],
+                "insights": [],
+            },
+            ensure_ascii=False,
+        )
+
+    def embed(self, *, input: str, **_: object) -> list[float]:
+        vector = np.zeros(EMBEDDING_DIMENSION, dtype=np.float32)
+        vector[zlib.crc32(input.encode()) % EMBEDDING_DIMENSION] = 1.0
+        return vector.tolist()
+
+
+def _write_personas(directory: Path) -> list[str]:
+    names: list[str] = []
+    for index, template in enumerate(["Jiho", "Sujin", "Jiho", "Sujin"]):
+        payload = json.loads(
+            (Path(default_persona_dir()) / f"{template}.json").read_text("utf-8")
+        )
+        persona_name = f"{template}{index}"
+        payload["agent"]["agent_id"] = persona_name.lower()
+        payload["agent"]["name"] = f"{payload['agent']['name']} {index}"
+        (directory / f"{persona_name}.json").write_text(
+            json.dumps(payload, ensure_ascii=False), encoding="utf-8"
+        )
+        names.append(persona_name)
+    return names
+
+
+def test_partition_keeps_conversations_on_one_shard() -> None:
+    names = [f"agent{index}" for index in range(9)]
+
+    shards = partition_persona_names(names, conversation_size=2, shards=3)
+
+    assert shards == [
+        ["agent0", "agent1", "agent6", "agent7", "agent8"],
+        ["agent2", "agent3"],
+        ["agent4", "agent5"],
+    ]
+    assert partition_persona_names(names[:4], conversation_size=2, shards=8) == [
+        ["agent0", "agent1"],
+        ["agent2", "agent3"],
+    ]
+
+
+def test_sharded_runtime_relays_world_replies_to_other_shards(
+    tmp_path: Path,
+) -> None:
+    runtime = ShardedWorldRuntime(
+        config=WorldRuntimeConfig(
+            agent_persona_names=_write_personas(tmp_path),
+            base_url=None,
+            api_key=None,
+            llm_model="stub",
+            embedding_model="stub",
+            timeout_seconds=1.0,
+            persona_dir=str(tmp_path),
+            suppress_repeated_replies=False,
+            broadcast_scope="world",
+        ),
+        shards=2,
+        llm_client_factory=ChattyProviderClient,
+        current_time=datetime.datetime(2026, 3, 4, 9, 0, 0),
+    )
+    try:
+        assert runtime.shards == 2
+        first = runtime.tick()
+        second = runtime.tick()
+    finally:
+        runtime.close()
+
+    assert first.turns == 2
+    assert all(report.outbound for report in first.shards)
+    # 각 shard의 발화는 다른 shard로 중계되고 다음 tick에 그 shard 에이전트 2명에게 전달된다.
+    assert first.cross_shard_messages == sum(
+        len(report.outbound) for report in first.shards
+    )
+    assert all(report.delivered == 0 for report in first.shards)
+    outbound = [len(report.outbound) for report in first.shards]
+    assert [report.delivered for report in second.shards] == [
+        2 * outbound[1],
+        2 * outbound[0],
+    ]
+    assert runtime.cross_shard_messages == (
+        first.cross_shard_messages + second.cross_shard_messages
+    )
+
+
+def test_sharded_runtime_closes_every_shard_when_one_fails(tmp_path: Path) -> None:
+    runtime = ShardedWorldRuntime(
+        config=WorldRuntimeConfig(
+            agent_persona_names=_write_personas(tmp_path),
+            base_url=None,
+            api_key=None,
+            llm_model="stub",
+            embedding_model="stub",
+            timeout_seconds=1.0,
+            persona_dir=str(tmp_path),
+        ),
+        shards=2,
+        llm_client_factory=ChattyProviderClient,
+        current_time=datetime.datetime(2026, 3, 4, 9, 0, 0),
+    )
+    runtime._processes[0].kill()
+    runtime._processes[0].join()
+
+    with pytest.raises(RuntimeError, match="world shard"):
+        _ = runtime.tick()
+
+    assert runtime.shards == 0